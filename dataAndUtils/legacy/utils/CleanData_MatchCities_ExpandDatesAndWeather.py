@@ -15,6 +15,8 @@ INPUT FORMAT:
         - lat/long: Station coordinates (decimal degrees)
         - name: Station name
         - AVG: Average value across years (temperatures in tenths of degrees C)
+    
+    Built from raw GHCN-Daily .dly files by ghcn_ingest.py.
 
 OUTPUT FORMAT:
     CSV/JSON with columns: city, country, state, suburb, lat, long, date, name, 
@@ -29,12 +31,16 @@ OUTPUT FORMAT:
         - date: ISO format (YYYY-MM-DD)
         - Temperatures: Converted to degrees Celsius (from tenths)
         - PRCP: Precipitation in mm (from tenths)
+        - <METRIC>_filled: With --smooth, True where the value was missing and gap-filled
 
 INTERMEDIATE FILES:
-    - vaycay/city_data/geocoding_checkpoint.csv: Incremental geocoding progress
+    - vaycay/city_data/geocoding_journal.jsonl: Append-only geocoding progress (replayed on resume)
+    - vaycay/city_data/geocoding_checkpoint.csv: Legacy checkpoint, migrated into the journal on resume
     - vaycay/city_data/geocoding_progress.json: Progress metadata
     - vaycay/city_data/ALL_location_specific_data.csv: Final geocoded locations
     - vaycay/city_data/failed_geocodes.json: Locations that failed geocoding
+    - vaycay/city_data/geocoding_cache.sqlite: Geocoding cache shared across runs and datasets
+    - vaycay/city_data/station_clusters.csv: Location-to-site mapping (with --cluster-radius-m)
     - weather_processing.log: Detailed processing log
 
 This script:
@@ -53,6 +59,7 @@ Improvements:
 - Data validation and quality checks
 """
 
+import numpy as np
 import pandas as pd
 import time
 import sys
@@ -63,8 +70,33 @@ from geopy.extra.rate_limiter import RateLimiter
 from datetime import datetime
 import json
 import logging
+import os
 from typing import Optional
 
+from climatology_smoothing import (
+    DEFAULT_SMOOTHING, filled_columns, parse_smoothing_spec, smooth_climatology, smoothing_config
+)
+from climate_cube import ClimateCube, compile_cube, load_cleaned_output
+from date_codes import day_of_year_to_iso, mmdd_to_day_of_year
+from fast_pivot import PIVOT_INDEX, pivot_factorized
+from geocoding_cache import (
+    DEFAULT_MAX_DISTANCE_KM as DEFAULT_CACHE_DISTANCE_KM, DEFAULT_MAX_ENTRIES as DEFAULT_CACHE_MAX_ENTRIES,
+    DEFAULT_TTL_DAYS as DEFAULT_CACHE_TTL_DAYS, GeocodingCache
+)
+from geocoding_journal import GeocodingJournal, compact_journal, replay_journal, seed_journal
+from geocoding_client import DEFAULT_ENDPOINT, DEFAULT_RETRIES, DEFAULT_WORKERS, ConcurrentReverseGeocoder
+from day_snapshots import write_day_snapshots
+from incremental_update import (
+    MANIFEST_NAME, attach_countries, combine_station_hashes, diff_manifests, hash_station_records,
+    load_manifest, patch_csv_output, patch_parquet_dataset, save_manifest, station_countries
+)
+from offline_geocoder import DEFAULT_MAX_DISTANCE_KM, load_gazetteer, reverse_geocode_offline
+from parallel_pipeline import SHARDS_PER_WORKER, ShardedExecutor, plan_shards
+from pipeline_metrics import PROFILERS, PipelineMetrics, peak_rss_mb
+from quality_report import QualityReport
+from station_catalog import catalog_data_types, load_station_catalog
+from station_clusters import cluster_locations, cluster_sites, fan_out_geocodes, save_clusters
+
 # Settings
 pd.set_option('display.max_columns', None)
 pd.set_option('display.width', 1000)
@@ -89,6 +121,29 @@ CITY_DATA_DIR = PROJECT_ROOT / 'vaycay' / 'city_data'
 # Default processing settings
 DEFAULT_BATCH_SIZE = 100  # Save checkpoint every N locations
 DEFAULT_GEOCODING_DELAY = 1.5  # Seconds between geocoding requests (Nominatim limit)
+DEFAULT_GAZETTEER = CITY_DATA_DIR / 'worldcities.csv'  # Local gazetteer for offline geocoding
+DEFAULT_GEOCODING_CACHE = CITY_DATA_DIR / 'geocoding_cache.sqlite'  # Shared across runs and datasets
+DEFAULT_CHUNK_ROWS = 2_000_000  # Input rows per chunk in --streaming mode
+# Rough peak bytes per input row while a chunk is merged, pivoted and written
+# (strings, the merged copy and the pivot); used to turn --max-memory into a chunk size
+STREAMING_BYTES_PER_ROW = 1200
+
+PARQUET_DATASET_NAME = 'global_weather_data_cleaned.parquet'  # Directory of the partitioned dataset
+
+# Geocoded columns the merge needs (sent once to each --workers process)
+GEOCODED_LOCATION_COLUMNS = ['lat', 'long', 'city', 'state', 'country', 'suburb']
+
+# Input columns and compact dtypes used for every read of the weather CSV
+INPUT_COLUMNS = ['id', 'date', 'data_type', 'lat', 'long', 'name', 'AVG']
+INPUT_DTYPES = {
+    'id': 'str',
+    'date': 'int32',
+    'data_type': 'category',
+    'lat': 'float32',
+    'long': 'float32',
+    'name': 'str',
+    'AVG': 'float32'
+}
 
 
 def parse_arguments():
@@ -112,6 +167,43 @@ Examples:
   
   # Validate data quality
   python CleanData_MatchCities_ExpandDatesAndWeather.py --validate
+  
+  # Write a partitioned Parquet dataset alongside the CSV/JSON output
+  python CleanData_MatchCities_ExpandDatesAndWeather.py --format csv parquet
+  
+  # Render per-day snapshot files straight into the client's static assets
+  python CleanData_MatchCities_ExpandDatesAndWeather.py --snapshots --snapshots-dir ../../../client/public/snapshots
+  
+  # Recompute only stations whose input rows changed since the last run
+  python CleanData_MatchCities_ExpandDatesAndWeather.py --incremental --format csv parquet
+  
+  # Merge, pivot and clean on 32 cores (shards grouped by country)
+  python CleanData_MatchCities_ExpandDatesAndWeather.py --workers 32 --pivot-engine factorized
+  
+  # Smooth the daily climatology and fill gaps (per-metric settings, default TAVG/TMAX/TMIN 15 days, PRCP 7)
+  python CleanData_MatchCities_ExpandDatesAndWeather.py --smooth
+  python CleanData_MatchCities_ExpandDatesAndWeather.py --smooth TAVG=harmonic:3 PRCP=window:7:fill
+  
+  # Profile every stage with cProfile (dumped to <output-dir>/profiles)
+  python CleanData_MatchCities_ExpandDatesAndWeather.py --profile
+  
+  # Stream the input in station-aligned chunks on a memory-limited worker
+  python CleanData_MatchCities_ExpandDatesAndWeather.py --streaming --max-memory 6GB
+  
+  # Compact the geocoding journal into the final location table
+  python CleanData_MatchCities_ExpandDatesAndWeather.py --compact-journal
+  
+  # Keep several Nominatim requests in flight under the same rate limit
+  python CleanData_MatchCities_ExpandDatesAndWeather.py --geocoder concurrent --geocoding-workers 4
+  
+  # Geocode offline against a local worldcities gazetteer
+  python CleanData_MatchCities_ExpandDatesAndWeather.py --geocoder offline --gazetteer worldcities.csv
+  
+  # Reuse cached geocodes from earlier runs up to 2 km away, for at most 90 days
+  python CleanData_MatchCities_ExpandDatesAndWeather.py --geocoding-cache-distance-km 2 --geocoding-cache-ttl-days 90
+  
+  # Geocode one point per cluster of stations within 500 m of each other
+  python CleanData_MatchCities_ExpandDatesAndWeather.py --cluster-radius-m 500
         """
     )
     
@@ -143,6 +235,91 @@ Examples:
         help='Delay in seconds between geocoding requests'
     )
     
+    parser.add_argument(
+        '--geocoder',
+        choices=['nominatim', 'concurrent', 'offline'],
+        default='nominatim',
+        help='Reverse geocoding backend: sequential Nominatim requests, concurrent requests '
+             'sharing one rate limit, or an offline gazetteer lookup'
+    )
+    
+    parser.add_argument(
+        '--geocoding-endpoint',
+        type=str,
+        default=DEFAULT_ENDPOINT,
+        help='Nominatim-compatible base URL used by --geocoder concurrent'
+    )
+    
+    parser.add_argument(
+        '--geocoding-workers',
+        type=int,
+        default=DEFAULT_WORKERS,
+        help='Number of requests kept in flight by --geocoder concurrent'
+    )
+    
+    parser.add_argument(
+        '--geocoding-retries',
+        type=int,
+        default=DEFAULT_RETRIES,
+        help='Retries with exponential backoff for transient geocoding failures'
+    )
+    
+    parser.add_argument(
+        '--gazetteer',
+        type=str,
+        default=str(DEFAULT_GAZETTEER),
+        help='Gazetteer CSV (worldcities format) used by --geocoder offline and for the population in --snapshots'
+    )
+    
+    parser.add_argument(
+        '--offline-max-distance-km',
+        type=float,
+        default=DEFAULT_MAX_DISTANCE_KM,
+        help='Maximum distance to the nearest gazetteer place before a location counts as failed'
+    )
+    
+    parser.add_argument(
+        '--geocoding-cache',
+        type=str,
+        default=str(DEFAULT_GEOCODING_CACHE),
+        help='Persistent Nominatim result cache shared across runs and datasets (kept per geocoder and endpoint)'
+    )
+    
+    parser.add_argument(
+        '--no-geocoding-cache',
+        action='store_true',
+        help='Neither read nor update the geocoding cache'
+    )
+    
+    parser.add_argument(
+        '--geocoding-cache-distance-km',
+        type=float,
+        default=DEFAULT_CACHE_DISTANCE_KM,
+        help='Answer a location from the nearest cached one within this distance'
+    )
+    
+    parser.add_argument(
+        '--geocoding-cache-ttl-days',
+        type=float,
+        default=DEFAULT_CACHE_TTL_DAYS,
+        help='Ignore and prune cached geocodes older than this'
+    )
+    
+    parser.add_argument(
+        '--geocoding-cache-max-entries',
+        type=int,
+        default=DEFAULT_CACHE_MAX_ENTRIES,
+        help='Evict the least recently used cache entries beyond this many'
+    )
+    
+    parser.add_argument(
+        '--cluster-radius-m',
+        type=float,
+        default=0,
+        help='Group locations within this many metres into sites, geocode one point per site and '
+             'copy its result to every member (mapping saved to station_clusters.csv; 0 disables)'
+    )
+    
     parser.add_argument(
         '--skip-geocoding',
         action='store_true',
@@ -155,6 +332,95 @@ Examples:
         help='Only resume incomplete geocoding, exit if complete'
     )
     
+    parser.add_argument(
+        '--snapshots',
+        action='store_true',
+        help='After saving, compile a climate cube and render 366 per-day snapshot files for the map client'
+    )
+    
+    parser.add_argument(
+        '--snapshots-dir',
+        type=str,
+        default=None,
+        help='Where to write the day snapshots (default: <output-dir>/snapshots)'
+    )
+    
+    parser.add_argument(
+        '--pivot-engine',
+        choices=['pivot_table', 'factorized'],
+        default='pivot_table',
+        help='Pivot implementation: pandas pivot_table, or the factorized integer-key engine '
+             '(same output, much less time and memory on large inputs)'
+    )
+    
+    parser.add_argument(
+        '--smooth',
+        nargs='*',
+        type=parse_smoothing_spec,
+        default=None,
+        metavar='METRIC=METHOD:N[:fill]',
+        help='Smooth and gap-fill metrics along the circular day-of-year axis: window:DAYS (moving '
+             'mean) or harmonic:N (annual harmonic fit); :fill keeps observed values. Without '
+             'settings: ' + ' '.join(DEFAULT_SMOOTHING) + '. Adds a <METRIC>_filled flag per metric'
+    )
+    
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Worker processes for the merge/pivot/clean stages; records are sharded by '
+             'country and location and exchanged as shared-memory Arrow files'
+    )
+    
+    parser.add_argument(
+        '--streaming',
+        action='store_true',
+        help='Process the input in chunks grouped by station id, appending results to the outputs'
+    )
+    
+    parser.add_argument(
+        '--chunk-rows',
+        type=int,
+        default=None,
+        help=f'Input rows per chunk in --streaming mode (default: {DEFAULT_CHUNK_ROWS:,})'
+    )
+    
+    parser.add_argument(
+        '--max-memory',
+        type=str,
+        default=None,
+        help='Memory budget for --streaming mode, e.g. 6GB; sets the chunk size when --chunk-rows is not given'
+    )
+    
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='Hash each station\'s input rows, recompute only new or changed stations and patch '
+             'them into the existing outputs (falls back to a full run without a station manifest)'
+    )
+    
+    parser.add_argument(
+        '--patch-database',
+        action='store_true',
+        help='With --incremental, also replace the changed stations\' rows in the weather_data table'
+    )
+    
+    parser.add_argument(
+        '--compact-journal',
+        action='store_true',
+        help='Compact the geocoding journal into ALL_location_specific_data.csv and exit'
+    )
+    
+    parser.add_argument(
+        '--profile',
+        nargs='?',
+        const='cprofile',
+        choices=PROFILERS,
+        default=None,
+        help='Profile each stage (cprofile by default, or pyinstrument) and dump the '
+             'results to <output-dir>/profiles; timings always go to pipeline_metrics.json'
+    )
+    
     parser.add_argument(
         '--validate',
         action='store_true',
@@ -167,6 +433,15 @@ Examples:
         help='Skip JSON output (only save CSV)'
     )
     
+    parser.add_argument(
+        '--format',
+        nargs='+',
+        choices=['csv', 'parquet'],
+        default=['csv'],
+        help='Output formats: csv (CSV plus JSON unless --no-json) and/or parquet '
+             '(Hive-partitioned dataset by country and month)'
+    )
+    
     return parser.parse_args()
 
 
@@ -198,39 +473,35 @@ def read_and_prepare_data(input_csv: str) -> pd.DataFrame:
     logger.info(f"Input file size: {file_size_mb:.1f} MB")
     
     # Read the data with dtype optimization
-    dtype_dict = {
-        'id': 'str',
-        'date': 'int32',
-        'data_type': 'category',
-        'lat': 'float32',
-        'long': 'float32',
-        'name': 'str',
-        'AVG': 'float32'
-    }
-    
     df_weather = pd.read_csv(
         input_csv,
-        usecols=['id', 'date', 'data_type', 'lat', 'long', 'name', 'AVG'],
-        dtype=dtype_dict
+        usecols=INPUT_COLUMNS,
+        dtype=INPUT_DTYPES
     )
     
     logger.info(f"Loaded {len(df_weather):,} weather records")
     
+    return prepare_weather_records(df_weather)
+
+
+def prepare_weather_records(df_weather: pd.DataFrame) -> pd.DataFrame:
+    """Validate raw weather records, rename AVG to value and parse the MMDD date."""
     # Data validation
     null_counts = df_weather.isnull().sum()
     if null_counts.any():
         logger.warning(f"Null values found:\n{null_counts[null_counts > 0]}")
     
-    # Rename and format
+    # Rename and format. Dates stay as int16 day-of-year codes (lookup table, no
+    # string parsing) until pivot_and_clean_data formats them once for output.
     df_weather.rename(columns={'AVG': 'value'}, inplace=True)
-    df_weather['date'] = ((df_weather['date'].astype(str).str.zfill(4)) + '2020')
-    df_weather['date'] = pd.to_datetime(df_weather['date'], format='%m%d%Y', errors='coerce')
+    df_weather['date'] = mmdd_to_day_of_year(df_weather['date'].to_numpy())
     
     # Check for invalid dates
-    invalid_dates = df_weather['date'].isnull().sum()
+    invalid = df_weather['date'].to_numpy() == 0
+    invalid_dates = int(invalid.sum())
     if invalid_dates > 0:
         logger.warning(f"Found {invalid_dates:,} invalid dates, dropping these rows")
-        df_weather = df_weather.dropna(subset=['date'])
+        df_weather = df_weather[~invalid]
     
     return df_weather
 
@@ -262,23 +533,41 @@ def get_unique_locations(df_weather: pd.DataFrame) -> pd.DataFrame:
 
 
 def load_geocoding_progress() -> Optional[pd.DataFrame]:
-    """Load previous geocoding progress if it exists."""
+    """
+    Load previous geocoding progress if it exists.
+    
+    Replays the append-only journal. A legacy geocoding_checkpoint.csv without a
+    journal is loaded once and migrated into a new journal.
+    """
+    journal_path = CITY_DATA_DIR / 'geocoding_journal.jsonl'
     checkpoint_path = CITY_DATA_DIR / 'geocoding_checkpoint.csv'
+    if journal_path.exists():
+        logger.info(f"Found existing geocoding journal: {journal_path}")
+        df_existing = replay_journal(journal_path)
+        logger.info(f"Loaded {len(df_existing):,} previously geocoded locations")
+        return df_existing
     if checkpoint_path.exists():
         logger.info(f"Found existing geocoding checkpoint: {checkpoint_path}")
         df_existing = pd.read_csv(checkpoint_path)
         logger.info(f"Loaded {len(df_existing):,} previously geocoded locations")
+        logger.info(f"Migrating checkpoint into journal: {journal_path}")
+        seed_journal(journal_path, df_existing)
         return df_existing
     return None
 
 
-def save_geocoding_checkpoint(df: pd.DataFrame, progress_info: dict):
-    """Save geocoding progress to allow resumption."""
-    checkpoint_path = CITY_DATA_DIR / 'geocoding_checkpoint.csv'
+def save_geocoding_checkpoint(batch: pd.DataFrame, progress_info: dict, journal: GeocodingJournal):
+    """
+    Save geocoding progress to allow resumption.
+    
+    Only the new batch is appended to the journal (on its writer thread), so
+    checkpoint cost stays proportional to the batch rather than to everything
+    geocoded so far.
+    """
     progress_path = CITY_DATA_DIR / 'geocoding_progress.json'
     
     logger.info(f"Saving checkpoint... ({progress_info['completed']}/{progress_info['total']} locations)")
-    df.to_csv(checkpoint_path, index=False)
+    journal.append(batch)
     
     # Save progress metadata
     with open(progress_path, 'w') as f:
@@ -286,12 +575,18 @@ def save_geocoding_checkpoint(df: pd.DataFrame, progress_info: dict):
 
 
 def reverse_geocode_locations(unique_locs: pd.DataFrame, batch_size: int = DEFAULT_BATCH_SIZE, 
-                              geocoding_delay: float = DEFAULT_GEOCODING_DELAY) -> pd.DataFrame:
+                              geocoding_delay: float = DEFAULT_GEOCODING_DELAY,
+                              client: Optional[ConcurrentReverseGeocoder] = None,
+                              cache: Optional[GeocodingCache] = None) -> pd.DataFrame:
     """
     Reverse geocode locations with checkpoint/resume capability.
     
     Args:
         unique_locs: DataFrame with lat/long columns
+        client: Optional concurrent client; when given, each batch is geocoded with
+                several requests in flight instead of geopy's sequential RateLimiter
+        cache: Optional persistent cache; locations it answers are journaled without
+               a request, and every newly geocoded batch is added to it
     
     Returns:
         DataFrame with geocoded location information
@@ -320,9 +615,10 @@ def reverse_geocode_locations(unique_locs: pd.DataFrame, batch_size: int = DEFAU
             logger.error("Checkpoint appears corrupted. Starting fresh geocoding.")
             existing_geocoded = None
         else:
-            # Round coordinates in existing data to ensure match
-            existing_geocoded['lat'] = existing_geocoded['lat'].round(3)
-            existing_geocoded['long'] = existing_geocoded['long'].round(3)
+            # Round coordinates in existing data to ensure match (and use the same
+            # float width, since float32 and float64 roundings never compare equal)
+            existing_geocoded['lat'] = existing_geocoded['lat'].round(3).astype(unique_locs['lat'].dtype)
+            existing_geocoded['long'] = existing_geocoded['long'].round(3).astype(unique_locs['long'].dtype)
             
             # DATA PROTECTION: Check for coordinate overlap
             checkpoint_coords = set(zip(existing_geocoded['lat'], existing_geocoded['long']))
@@ -377,6 +673,12 @@ def reverse_geocode_locations(unique_locs: pd.DataFrame, batch_size: int = DEFAU
         needs_geocoding = unique_locs.copy()
         already_geocoded = pd.DataFrame()
     
+    cached = None
+    if cache is not None:
+        cached, needs_geocoding = cache.lookup(needs_geocoding)
+        if len(cached) > 0:
+            already_geocoded = pd.concat([already_geocoded, cached], ignore_index=True)
+    
     # Initialize geocoder with increased timeout
     geolocator = Nominatim(user_agent="vaycay_weather_geocoder", timeout=10)
     reverse = RateLimiter(geolocator.reverse, min_delay_seconds=geocoding_delay)
@@ -428,68 +730,84 @@ def reverse_geocode_locations(unique_locs: pd.DataFrame, batch_size: int = DEFAU
     # Calculate which batch we're starting from
     starting_batch = already_completed // batch_size + 1 if already_completed > 0 else 1
     
-    for i in range(0, total_to_geocode, batch_size):
-        batch_end = min(i + batch_size, total_to_geocode)
-        batch = needs_geocoding.iloc[i:batch_end].copy()
-        
-        # Calculate actual batch number (accounting for already completed)
-        current_batch = starting_batch + (i // batch_size)
-        actual_location_start = already_completed + i + 1
-        actual_location_end = already_completed + batch_end
-        
-        logger.info(f"\nProcessing batch {current_batch} (locations {actual_location_start}-{actual_location_end} of {total_locations})")
-        
-        # Geocode batch with failure tracking
-        batch['location'] = batch.apply(safe_reverse, axis=1)
-        batch['city'] = batch['location'].apply(extract_city)
-        batch['state'] = batch['location'].apply(extract_state)
-        batch['country'] = batch['location'].apply(extract_country)
-        batch['suburb'] = batch['location'].apply(extract_suburb)
-        
-        # Track failed geocodes
-        failed_in_batch = batch[batch['city'] == '']
-        if len(failed_in_batch) > 0:
-            failed_geocodes.extend(failed_in_batch[['lat', 'long']].values.tolist())
-        
-        # Combine with already processed data
-        if len(already_geocoded) > 0:
-            combined = pd.concat([already_geocoded, batch], ignore_index=True)
-        else:
-            combined = batch
-        
-        # Save checkpoint
-        progress_info = {
-            'completed': len(combined),
-            'total': total_locations,
-            'failed_count': len(failed_geocodes),
-            'last_updated': datetime.now().isoformat(),
-            'current_batch': current_batch,
-            'estimated_time_remaining_minutes': (
-                (total_to_geocode - batch_end) * geocoding_delay / 60
-            ) if batch_end < total_to_geocode else 0
-        }
-        save_geocoding_checkpoint(combined, progress_info)
-        
-        # Update already_geocoded for next iteration
-        already_geocoded = combined
-        
-        # Progress update
-        elapsed = time.time() - start_time
-        locations_processed_this_session = batch_end
-        rate = locations_processed_this_session / elapsed if elapsed > 0 else 0
-        remaining = total_to_geocode - batch_end
-        eta_seconds = remaining / rate if rate > 0 else 0
+    # Collect batches and concatenate once at the end instead of on every batch
+    geocoded_batches = [already_geocoded] if already_completed > 0 else []
+    completed = already_completed
+    journal = GeocodingJournal(CITY_DATA_DIR / 'geocoding_journal.jsonl')
+    
+    try:
+        if cached is not None and len(cached) > 0:
+            journal.append(cached)
         
-        overall_progress = len(combined)
-        logger.info(f"Overall Progress: {overall_progress}/{total_locations} ({100*overall_progress/total_locations:.1f}%)")
-        logger.info(f"This session: {locations_processed_this_session}/{total_to_geocode} locations")
-        logger.info(f"Rate: {rate:.2f} locations/sec")
-        logger.info(f"ETA for remaining: {eta_seconds/60:.1f} minutes")
+        for i in range(0, total_to_geocode, batch_size):
+            batch_end = min(i + batch_size, total_to_geocode)
+            batch = needs_geocoding.iloc[i:batch_end].copy()
+            
+            # Calculate actual batch number (accounting for already completed)
+            current_batch = starting_batch + (i // batch_size)
+            actual_location_start = already_completed + i + 1
+            actual_location_end = already_completed + batch_end
+            
+            logger.info(f"\nProcessing batch {current_batch} (locations {actual_location_start}-{actual_location_end} of {total_locations})")
+            
+            # Geocode batch with failure tracking
+            if client is not None:
+                batch['location'] = client.reverse_many(zip(batch['lat'], batch['long']))
+            else:
+                batch['location'] = batch.apply(safe_reverse, axis=1)
+            batch['city'] = batch['location'].apply(extract_city)
+            batch['state'] = batch['location'].apply(extract_state)
+            batch['country'] = batch['location'].apply(extract_country)
+            batch['suburb'] = batch['location'].apply(extract_suburb)
+            
+            # Track failed geocodes
+            failed_in_batch = batch[batch['city'] == '']
+            if len(failed_in_batch) > 0:
+                failed_geocodes.extend(failed_in_batch[['lat', 'long']].values.tolist())
+            
+            geocoded_batches.append(batch)
+            completed += len(batch)
+            
+            # Save checkpoint
+            progress_info = {
+                'completed': completed,
+                'total': total_locations,
+                'failed_count': len(failed_geocodes),
+                'last_updated': datetime.now().isoformat(),
+                'current_batch': current_batch,
+                'estimated_time_remaining_minutes': (
+                    (total_to_geocode - batch_end) * geocoding_delay / 60
+                ) if batch_end < total_to_geocode else 0
+            }
+            save_geocoding_checkpoint(batch, progress_info, journal)
+            if cache is not None:
+                cache.store(batch)
+            
+            # Progress update
+            elapsed = time.time() - start_time
+            locations_processed_this_session = batch_end
+            rate = locations_processed_this_session / elapsed if elapsed > 0 else 0
+            remaining = total_to_geocode - batch_end
+            eta_seconds = remaining / rate if rate > 0 else 0
+            
+            overall_progress = completed
+            logger.info(f"Overall Progress: {overall_progress}/{total_locations} ({100*overall_progress/total_locations:.1f}%)")
+            logger.info(f"This session: {locations_processed_this_session}/{total_to_geocode} locations")
+            logger.info(f"Rate: {rate:.2f} locations/sec")
+            logger.info(f"ETA for remaining: {eta_seconds/60:.1f} minutes")
+    finally:
+        journal.close()
     
     # Final save
     logger.info("\nGeocoding complete! Saving final results...")
-    final_result = already_geocoded
+    final_result = pd.concat(geocoded_batches, ignore_index=True) if geocoded_batches else already_geocoded
+    save_geocoding_results(final_result, failed_geocodes)
     
+    return final_result
+
+
+def save_geocoding_results(final_result: pd.DataFrame, failed_geocodes: list):
+    """Save the final geocoded locations and any failed coordinates."""
     # Log failed geocodes
     if failed_geocodes:
         logger.warning(f"Failed to geocode {len(failed_geocodes)} locations")
@@ -508,12 +826,64 @@ def reverse_geocode_locations(unique_locs: pd.DataFrame, batch_size: int = DEFAU
     full_path = CITY_DATA_DIR / 'ALL_location_specific_data.csv'
     final_result[output_cols].to_csv(full_path, index=False)
     logger.info(f"Saved full data to: {full_path}")
+
+
+def reverse_geocode_locations_offline(unique_locs: pd.DataFrame, gazetteer_path: str,
+                                      max_distance_km: float = DEFAULT_MAX_DISTANCE_KM) -> pd.DataFrame:
+    """
+    Reverse geocode all locations at once against a local gazetteer.
+    
+    Writes the same checkpoint and output files as reverse_geocode_locations,
+    so --skip-geocoding and the later stages work unchanged.
+    
+    Args:
+        unique_locs: DataFrame with lat/long columns
+        gazetteer_path: Path to a worldcities-format CSV
+        max_distance_km: Locations with no place within this distance are counted as failed
+    
+    Returns:
+        DataFrame with geocoded location information
+    """
+    start_time = time.time()
+    gazetteer = load_gazetteer(gazetteer_path)
+    final_result = reverse_geocode_offline(unique_locs, gazetteer, max_distance_km=max_distance_km)
+    
+    failed = final_result[final_result['city'] == '']
+    failed_geocodes = failed[['lat', 'long']].values.tolist()
+    
+    elapsed = time.time() - start_time
+    rate = len(final_result) / elapsed if elapsed > 0 else 0
+    logger.info(f"Offline geocoding finished in {elapsed:.1f}s ({rate:,.0f} locations/sec)")
+    
+    progress_info = {
+        'completed': len(final_result),
+        'total': len(final_result),
+        'failed_count': len(failed_geocodes),
+        'last_updated': datetime.now().isoformat(),
+        'current_batch': 1,
+        'estimated_time_remaining_minutes': 0,
+        'geocoder': 'offline'
+    }
+    with GeocodingJournal(CITY_DATA_DIR / 'geocoding_journal.jsonl', truncate=True) as journal:
+        save_geocoding_checkpoint(final_result, progress_info, journal)
+    save_geocoding_results(final_result, failed_geocodes)
     
     return final_result
 
 
-def merge_with_original(df_weather: pd.DataFrame, unique_locs: pd.DataFrame) -> pd.DataFrame:
-    """Merge geocoded location data with original weather data."""
+def merge_with_original(df_weather: pd.DataFrame, unique_locs: pd.DataFrame,
+                        append_unmatched: bool = False, unmatched_path: Optional[Path] = None) -> pd.DataFrame:
+    """
+    Merge geocoded location data with original weather data.
+    
+    Args:
+        df_weather: Weather records with lat/long columns
+        unique_locs: Geocoded locations
+        append_unmatched: Append to unmatched_coordinates.csv instead of overwriting it
+                          (used when merging chunk by chunk)
+        unmatched_path: Where to save unmatched coordinates (default:
+                        city_data/unmatched_coordinates.csv; worker processes use their own file)
+    """
     logger.info("Merging location data with weather data...")
     
     # DATA PROTECTION: Store original row count
@@ -525,8 +895,11 @@ def merge_with_original(df_weather: pd.DataFrame, unique_locs: pd.DataFrame) ->
     df_weather['long'] = df_weather['long'].round(3)
     
     # Select only needed columns for merge
-    location_cols = ['lat', 'long', 'city', 'state', 'country', 'suburb']
-    merge_data = unique_locs[location_cols].copy()
+    merge_data = unique_locs[GEOCODED_LOCATION_COLUMNS].copy()
+    merge_data['lat'] = merge_data['lat'].round(3).astype(df_weather['lat'].dtype)
+    merge_data['long'] = merge_data['long'].round(3).astype(df_weather['long'].dtype)
+    # Optional fields come back as NaN from the checkpoint; the pivot would drop those rows
+    merge_data[['state', 'suburb']] = merge_data[['state', 'suburb']].fillna('')
     
     # DATA PROTECTION: Check for duplicates in merge key before merging
     merge_key_dups = merge_data.duplicated(subset=['lat', 'long']).sum()
@@ -551,24 +924,50 @@ def merge_with_original(df_weather: pd.DataFrame, unique_locs: pd.DataFrame) ->
         
         # Save unmatched coordinates for investigation
         unmatched_coords = df_enriched[df_enriched['city'].isnull()][['lat', 'long']].drop_duplicates()
-        unmatched_path = CITY_DATA_DIR / 'unmatched_coordinates.csv'
-        unmatched_coords.to_csv(unmatched_path, index=False)
+        unmatched_path = unmatched_path or CITY_DATA_DIR / 'unmatched_coordinates.csv'
+        if append_unmatched and unmatched_path.exists():
+            unmatched_coords.to_csv(unmatched_path, mode='a', header=False, index=False)
+        else:
+            unmatched_coords.to_csv(unmatched_path, index=False)
         logger.warning(f"Saved {len(unmatched_coords)} unmatched coordinate pairs to: {unmatched_path}")
     
     logger.info(f"Merged dataset has {len(df_enriched):,} records (verified: no data loss)")
     return df_enriched
 
 
-def pivot_and_clean_data(df: pd.DataFrame) -> pd.DataFrame:
-    """Pivot data and clean weather values with validation."""
-    logger.info("Pivoting data by location and date...")
+def pivot_and_clean_data(df: pd.DataFrame, engine: str = 'pivot_table',
+                         smoothing: Optional[dict] = None, data_types: Optional[list] = None) -> pd.DataFrame:
+    """
+    Pivot data and clean weather values with validation.
     
-    df_pivot = df.pivot_table(
-        index=['city', 'country', 'state', 'suburb', 'lat', 'long', 'date', 'name'],
-        columns='data_type',
-        values='value',
-        aggfunc='first'
-    ).reset_index()
+    Args:
+        df: Merged long-format weather records
+        engine: 'pivot_table' (pandas groupby) or 'factorized' (integer-key scatter,
+                same output, see fast_pivot.py)
+        smoothing: Per-metric smoothing/gap-fill settings (see climatology_smoothing.py)
+        data_types: Every data type of the whole input. Pass it when df is only part of
+                    the input (a chunk, shard or patch), so the output has the same
+                    columns and TAVG fill as pivoting the whole input at once
+    """
+    logger.info(f"Pivoting data by location and date ({engine} engine)...")
+    
+    if engine == 'factorized':
+        df_pivot = pivot_factorized(df, index=PIVOT_INDEX, columns='data_type', values='value')
+    else:
+        df_pivot = df.pivot_table(
+            index=PIVOT_INDEX,
+            columns='data_type',
+            values='value',
+            aggfunc='first'
+        ).reset_index()
+    
+    # Add the input's data types these rows have no values for (empty, in the value dtype)
+    if data_types is not None:
+        missing = [col for col in data_types if col not in df_pivot.columns]
+        if missing:
+            metrics = sorted(set(df_pivot.columns).difference(PIVOT_INDEX).union(missing))
+            df_pivot = df_pivot.reindex(columns=PIVOT_INDEX + metrics)
+            df_pivot = df_pivot.astype({col: df['value'].dtype for col in missing})
     
     logger.info("Processing weather values...")
     
@@ -581,6 +980,10 @@ def pivot_and_clean_data(df: pd.DataFrame) -> pd.DataFrame:
             )
             logger.info(f"Filled {filled_count:,} missing TAVG values using TMAX/TMIN average")
     
+    # Smooth and gap-fill along the day-of-year axis (still in tenths, dates still codes)
+    if smoothing:
+        df_pivot = smooth_climatology(df_pivot, smoothing)
+    
     # Convert temperatures from tenths of degrees to degrees
     for col in ['TMAX', 'TMIN', 'TAVG']:
         if col in df_pivot.columns:
@@ -590,8 +993,8 @@ def pivot_and_clean_data(df: pd.DataFrame) -> pd.DataFrame:
     if 'PRCP' in df_pivot.columns:
         df_pivot['PRCP'] = df_pivot['PRCP'].div(10).round(2)  # Convert to mm
     
-    # Format date
-    df_pivot['date'] = df_pivot['date'].dt.strftime('%Y-%m-%d')
+    # Format date (day-of-year code -> ISO string, one table lookup)
+    df_pivot['date'] = day_of_year_to_iso(df_pivot['date'].to_numpy())
     
     # Data quality checks
     for col in ['TMAX', 'TMIN', 'TAVG']:
@@ -604,81 +1007,632 @@ def pivot_and_clean_data(df: pd.DataFrame) -> pd.DataFrame:
     return df_pivot
 
 
-def validate_data(df: pd.DataFrame):
-    """Run data validation checks."""
-    logger.info("\n=== Data Validation ===")
+def clean_weather_shard(df_weather: pd.DataFrame, geocoded_data: pd.DataFrame, engine: str = 'pivot_table',
+                        append_unmatched: bool = False, unmatched_path: Optional[Path] = None,
+                        track_duplicates: bool = False, smoothing: Optional[dict] = None,
+                        data_types: Optional[list] = None) -> tuple:
+    """
+    Merge, pivot and clean one station-complete shard of weather records.
+    
+    Module-level so worker processes can run it (see parallel_pipeline.py).
+    data_types is the whole input's list, so every shard pivots to the same columns.
+    
+    Returns:
+        Tuple of (cleaned rows, (station manifest rows, QualityReport) for the shard)
+    """
+    station_hashes = hash_station_records(df_weather)
+    df_filled = merge_with_original(df_weather, geocoded_data, append_unmatched=append_unmatched,
+                                    unmatched_path=unmatched_path)
+    station_hashes = attach_countries(station_hashes, station_countries(df_filled))
+    cleaned = pivot_and_clean_data(df_filled, engine=engine, smoothing=smoothing, data_types=data_types)
+    report = QualityReport(track_duplicates=track_duplicates)
+    report.update(cleaned)
+    return cleaned, (station_hashes, report)
+
+
+def clean_weather_parallel(executor: ShardedExecutor, df_weather: pd.DataFrame, geocoded_data: pd.DataFrame,
+                           engine: str = 'pivot_table', append_unmatched: bool = False,
+                           track_duplicates: bool = False, smoothing: Optional[dict] = None,
+                           data_types: Optional[list] = None) -> tuple:
+    """
+    Run clean_weather_shard over shards of the records on a process pool.
     
-    # Check for duplicates
-    duplicates = df.duplicated(subset=['city', 'country', 'lat', 'long', 'date']).sum()
-    if duplicates > 0:
-        logger.warning(f"Found {duplicates:,} duplicate records")
+    Shards are grouped by country, so each one is pivoted against data_types (the
+    whole input's data types, by default those of df_weather) rather than only
+    the types its own stations report.
+    
+    Returns:
+        Tuple of (cleaned rows, station manifest rows, QualityReport merged over the shards)
+    """
+    if data_types is None:
+        data_types = sorted(df_weather['data_type'].dropna().unique())
+    n_shards = executor.workers * SHARDS_PER_WORKER
+    shard_ids = plan_shards(df_weather, geocoded_data, n_shards)
+    order = np.argsort(shard_ids, kind='stable')
+    bounds = np.searchsorted(shard_ids[order], np.arange(n_shards + 1))
+    shards = [df_weather.iloc[order[start:end]] for start, end in zip(bounds[:-1], bounds[1:]) if end > start]
+    logger.info(f"Processing {len(df_weather):,} records in {len(shards)} shards on {executor.workers} workers...")
+    del df_weather, order
+    
+    unmatched_paths = [executor.work_dir / f'unmatched_{index}.csv' for index in range(len(shards))]
+    results = executor.map(
+        clean_weather_shard,
+        shards,
+        shard_kwargs=[{'unmatched_path': path} for path in unmatched_paths],
+        engine=engine,
+        track_duplicates=track_duplicates,
+        smoothing=smoothing,
+        data_types=data_types
+    )
     
-    # Check data completeness
-    completeness = (1 - df.isnull().sum() / len(df)) * 100
-    logger.info("Data completeness by column:")
-    for col, pct in completeness.items():
-        logger.info(f"  {col}: {pct:.1f}%")
+    # Gather the workers' unmatched coordinates into the usual file
+    unmatched = [pd.read_csv(path) for path in unmatched_paths if path.exists()]
+    unmatched_path = CITY_DATA_DIR / 'unmatched_coordinates.csv'
+    if unmatched:
+        unmatched = pd.concat(unmatched, ignore_index=True).drop_duplicates()
+        if append_unmatched and unmatched_path.exists():
+            unmatched.to_csv(unmatched_path, mode='a', header=False, index=False)
+        else:
+            unmatched.to_csv(unmatched_path, index=False)
+        for path in unmatched_paths:
+            path.unlink(missing_ok=True)
+    
+    # Every shard was pivoted against the same data types, so the columns line up
+    cleaned = pd.concat([frame for frame, _ in results], ignore_index=True)
+    station_hashes = combine_station_hashes([hashes for _, (hashes, _) in results])
+    countries = pd.concat([hashes.set_index('id')['country'] for _, (hashes, _) in results])
+    report = QualityReport(track_duplicates=track_duplicates, columns=list(cleaned.columns))
+    for _, (_, shard_report) in results:
+        report.merge(shard_report)
+    return cleaned, attach_countries(station_hashes, countries[~countries.index.duplicated()]), report
+
+
+def validate_data(df: Optional[pd.DataFrame], report: Optional[QualityReport] = None) -> QualityReport:
+    """
+    Run data validation checks.
     
-    # Check geographic coverage
-    logger.info("\nGeographic coverage:")
-    logger.info(f"  Unique countries: {df['country'].nunique()}")
-    logger.info(f"  Unique cities: {df['city'].nunique()}")
-    logger.info(f"  Latitude range: {df['lat'].min():.2f} to {df['lat'].max():.2f}")
-    logger.info(f"  Longitude range: {df['long'].min():.2f} to {df['long'].max():.2f}")
+    All checks come from one pass over df (see quality_report.py), or from a
+    report already accumulated chunk by chunk or across workers.
     
-    # Top countries by record count
-    logger.info("\nTop 10 countries by record count:")
-    top_countries = df['country'].value_counts().head(10)
-    for country, count in top_countries.items():
-        logger.info(f"  {country}: {count:,}")
+    Returns:
+        The QualityReport, for reuse in the processing summary
+    """
+    if report is None:
+        report = QualityReport()
+        report.update(df)
+    report.log_validation()
+    return report
 
 
-def save_final_output(df: pd.DataFrame, output_dir: str, save_json: bool = True):
-    """Save final cleaned data to CSV and optionally JSON."""
+def save_final_output(df: pd.DataFrame, output_dir: str, save_json: bool = True,
+                      output_formats: tuple = ('csv',), report: Optional[QualityReport] = None):
+    """
+    Save final cleaned data to CSV (and optionally JSON) and/or a partitioned Parquet dataset.
+    
+    The processing summary comes from report when validation already built one.
+    """
     logger.info("Saving final output...")
     
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
     
-    # Save CSV
-    csv_path = output_path / 'global_weather_data_cleaned.csv'
-    df.to_csv(csv_path, index=False)
-    logger.info(f"Saved CSV to: {csv_path}")
-    
-    # Save JSON if requested
-    if save_json:
-        json_path = output_path / 'global_weather_data_cleaned.json'
-        df.to_json(json_path, orient='records', force_ascii=False, indent=2)
-        logger.info(f"Saved JSON to: {json_path}")
-    
+    if 'csv' in output_formats:
+        # Save CSV
+        csv_path = output_path / 'global_weather_data_cleaned.csv'
+        df.to_csv(csv_path, index=False)
+        logger.info(f"Saved CSV to: {csv_path}")
+        
+        # Save JSON if requested
+        if save_json:
+            json_path = output_path / 'global_weather_data_cleaned.json'
+            df.to_json(json_path, orient='records', force_ascii=False, indent=2)
+            logger.info(f"Saved JSON to: {json_path}")
+    
+    parquet_summary = None
+    if 'parquet' in output_formats:
+        from parquet_output import reset_dataset, summarize_manifest, write_parquet_dataset
+        
+        dataset_path = output_path / PARQUET_DATASET_NAME
+        reset_dataset(dataset_path)
+        manifest = write_parquet_dataset(df, dataset_path)
+        parquet_summary = summarize_manifest(dataset_path, manifest)
+        logger.info(f"Saved Parquet dataset to: {dataset_path}")
+    
+    if report is None:
+        report = QualityReport(track_duplicates=False)
+        report.update(df)
+    summary = report.summary()
+    if parquet_summary is not None:
+        summary['parquet_dataset'] = parquet_summary
+    write_processing_summary(summary, output_path, report.temperature_range)
+
+
+def write_processing_summary(summary: dict, output_path: Path, temperature_range: Optional[tuple] = None):
+    """Log summary statistics and save them to processing_summary.json."""
     # Print summary statistics
     logger.info("\n=== Summary Statistics ===")
-    logger.info(f"Total records: {len(df):,}")
-    logger.info(f"Unique cities: {df['city'].nunique():,}")
-    logger.info(f"Unique countries: {df['country'].nunique():,}")
-    logger.info(f"Date range: {df['date'].min()} to {df['date'].max()}")
+    logger.info(f"Total records: {summary['total_records']:,}")
+    logger.info(f"Unique cities: {summary['unique_cities']:,}")
+    logger.info(f"Unique countries: {summary['unique_countries']:,}")
+    logger.info(f"Date range: {summary['date_range']['min']} to {summary['date_range']['max']}")
     
-    if 'TAVG' in df.columns:
-        logger.info(f"Temperature range: {df['TAVG'].min():.1f}°C to {df['TAVG'].max():.1f}°C")
+    if temperature_range is not None:
+        logger.info(f"Temperature range: {temperature_range[0]:.1f}°C to {temperature_range[1]:.1f}°C")
     
     # Save summary statistics
-    summary = {
-        'total_records': int(len(df)),
-        'unique_cities': int(df['city'].nunique()),
-        'unique_countries': int(df['country'].nunique()),
-        'date_range': {
-            'min': df['date'].min(),
-            'max': df['date'].max()
-        },
-        'processing_timestamp': datetime.now().isoformat()
-    }
-    
     summary_path = output_path / 'processing_summary.json'
     with open(summary_path, 'w') as f:
         json.dump(summary, f, indent=2)
     logger.info(f"Saved processing summary to: {summary_path}")
 
 
+def build_day_snapshots(output_dir: str, snapshots_dir: Optional[str] = None,
+                        df: Optional[pd.DataFrame] = None, output_formats: tuple = ('csv',),
+                        gazetteer_path: Optional[str] = None) -> dict:
+    """
+    Compile the cleaned output into a climate cube and render the per-day snapshots.
+    
+    Args:
+        output_dir: Pipeline output directory (the cube is written to <output_dir>/climate_cube)
+        snapshots_dir: Snapshot directory (default: <output_dir>/snapshots)
+        df: Cleaned data; when omitted (streaming and incremental runs) it is read back from the saved output
+        output_formats: Formats that were saved, to pick which output to read back
+        gazetteer_path: Worldcities CSV the cube joins station population from (skipped if missing)
+    """
+    logger.info("Rendering per-day snapshots...")
+    output_path = Path(output_dir)
+    if df is None:
+        if 'parquet' in output_formats:
+            df = load_cleaned_output(output_path / PARQUET_DATASET_NAME)
+        else:
+            df = load_cleaned_output(output_path / 'global_weather_data_cleaned.csv')
+    
+    cities = None
+    if gazetteer_path and Path(gazetteer_path).exists():
+        cities = load_gazetteer(gazetteer_path)
+    else:
+        logger.warning(f"No gazetteer at {gazetteer_path}, the climate cube has no station population")
+    cube_dir = compile_cube(df, output_path / 'climate_cube', cities=cities)
+    return write_day_snapshots(ClimateCube(cube_dir), snapshots_dir or output_path / 'snapshots')
+
+
+def parse_memory_size(value: str) -> int:
+    """Parse a size such as '8GB', '512MB' or '2048' (MB) into bytes."""
+    units = {'KB': 1024, 'MB': 1024 ** 2, 'GB': 1024 ** 3, 'TB': 1024 ** 4}
+    text = str(value).strip().upper().replace('IB', 'B')
+    for suffix, multiplier in units.items():
+        if text.endswith(suffix):
+            return int(float(text[:-len(suffix)]) * multiplier)
+    return int(float(text) * units['MB'])
+
+
+def resolve_chunk_rows(chunk_rows: Optional[int], max_memory: Optional[str]) -> int:
+    """Pick the streaming chunk size from --chunk-rows or, failing that, --max-memory."""
+    if chunk_rows:
+        return chunk_rows
+    if max_memory:
+        rows = max(10_000, parse_memory_size(max_memory) // STREAMING_BYTES_PER_ROW)
+        logger.info(f"Using {rows:,} rows per chunk for a {max_memory} memory budget")
+        return rows
+    return DEFAULT_CHUNK_ROWS
+
+
+def scan_input_metadata(input_csv: str) -> tuple:
+    """
+    Collect what streaming needs up front from the input's station catalog.
+    
+    The catalog comes from the cached sidecar index when the input is unchanged
+    since the last run (see station_catalog.py), otherwise from one scan of the
+    station columns.
+    
+    Returns:
+        Tuple of (unique lat/long DataFrame, sorted list of data types)
+    """
+    logger.info("Scanning input for unique locations and data types...")
+    catalog = load_station_catalog(input_csv)
+    # Same float32 coordinates the chunked reads produce
+    locations = catalog[['lat', 'long']].astype('float32').drop_duplicates()
+    return get_unique_locations(locations), catalog_data_types(catalog)
+
+
+def iter_station_chunks(input_csv: str, chunk_rows: int):
+    """
+    Yield raw input chunks of roughly chunk_rows rows that never split a station.
+    
+    Rows of the last station id in each chunk are held back and prepended to the
+    next one, so every station's records are pivoted together. This relies on the
+    input being grouped by id, as the averaged station file is.
+    """
+    reader = pd.read_csv(
+        input_csv,
+        usecols=INPUT_COLUMNS,
+        dtype=INPUT_DTYPES,
+        chunksize=chunk_rows
+    )
+    seen_ids = set()
+    carry = None
+    for chunk in reader:
+        if carry is not None:
+            chunk = pd.concat([carry, chunk], ignore_index=True)
+        last_id = chunk['id'].iloc[-1]
+        tail = (chunk['id'] == last_id).to_numpy()
+        # Only hold back the trailing run of the last id
+        tail_start = len(chunk) - (~tail[::-1]).argmax() if not tail.all() else 0
+        carry = chunk.iloc[tail_start:]
+        chunk = chunk.iloc[:tail_start]
+        if len(chunk) == 0:
+            continue
+        
+        chunk_ids = set(chunk['id'].unique())
+        reappearing = chunk_ids & seen_ids
+        if reappearing:
+            logger.warning(f"{len(reappearing)} station ids reappear in a later chunk; "
+                           f"input is not grouped by id, so those stations may be split")
+        seen_ids |= chunk_ids
+        yield chunk
+    
+    if carry is not None and len(carry) > 0:
+        yield carry
+
+
+class JsonArrayWriter:
+    """Write cleaned chunks as one JSON array of records without holding them all in memory."""
+    
+    def __init__(self, path: Path):
+        self.file = open(path, 'w', encoding='utf-8')
+        self.file.write('[\n')
+        self.records = 0
+    
+    def write(self, df: pd.DataFrame):
+        if len(df) == 0:
+            return
+        records = df.to_json(orient='records', lines=True, force_ascii=False).strip()
+        if self.records > 0:
+            self.file.write(',\n')
+        self.file.write(records.replace('\n', ',\n'))
+        self.records += len(df)
+    
+    def finish(self):
+        """Close the array; an interrupted run leaves it unterminated."""
+        self.file.write('\n]\n')
+    
+    def close(self):
+        self.file.close()
+
+
+def run_streaming_pipeline(args, geocoded_data: pd.DataFrame, data_types: list, chunk_rows: int,
+                           metrics: PipelineMetrics):
+    """
+    Merge, pivot, clean and write the input chunk by chunk.
+    
+    Each chunk's cleaned rows are appended straight to the output files, so peak
+    memory is bounded by the chunk size rather than by the input size.
+    """
+    output_path = Path(args.output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+    csv_path = output_path / 'global_weather_data_cleaned.csv'
+    json_path = output_path / 'global_weather_data_cleaned.json'
+    save_csv = 'csv' in args.format
+    save_json = save_csv and not args.no_json
+    save_parquet = 'parquet' in args.format
+    
+    if save_parquet:
+        from parquet_output import reset_dataset, summarize_manifest, write_parquet_dataset
+        
+        dataset_path = output_path / PARQUET_DATASET_NAME
+        reset_dataset(dataset_path)
+        parquet_manifest = []
+    
+    # Fixed column order so every appended chunk lines up with the header
+    smoothing = smoothing_config(args.smooth)
+    output_columns = PIVOT_INDEX + data_types + filled_columns(smoothing, data_types)
+    unmatched_path = CITY_DATA_DIR / 'unmatched_coordinates.csv'
+    if unmatched_path.exists():
+        unmatched_path.unlink()
+    
+    report = QualityReport(track_duplicates=args.validate, columns=output_columns)
+    hash_parts = []
+    
+    executor = None
+    if args.workers > 1:
+        executor = ShardedExecutor(args.workers, context=geocoded_data[GEOCODED_LOCATION_COLUMNS])
+    
+    json_writer = JsonArrayWriter(json_path) if save_json else None
+    try:
+        chunks = metrics.iterate('read', iter_station_chunks(args.input_csv, chunk_rows))
+        for chunk_number, chunk in enumerate(chunks, start=1):
+            logger.info(f"\nProcessing chunk {chunk_number} ({len(chunk):,} rows, "
+                        f"{chunk['id'].nunique():,} stations)")
+            df_weather = prepare_weather_records(chunk)
+            if executor is not None:
+                with metrics.stage('merge_pivot', rows_in=len(df_weather)) as stage:
+                    df_cleaned, station_hashes, shard_report = clean_weather_parallel(
+                        executor, df_weather, geocoded_data, engine=args.pivot_engine, append_unmatched=True,
+                        track_duplicates=args.validate, smoothing=smoothing, data_types=data_types
+                    )
+                    stage.rows_out = len(df_cleaned)
+                report.merge(shard_report)
+            else:
+                with metrics.stage('merge', rows_in=len(df_weather)) as stage:
+                    station_hashes = hash_station_records(df_weather)
+                    df_filled = merge_with_original(df_weather, geocoded_data, append_unmatched=True)
+                    station_hashes = attach_countries(station_hashes, station_countries(df_filled))
+                    stage.rows_out = len(df_filled)
+                with metrics.stage('pivot', rows_in=len(df_filled)) as stage:
+                    df_cleaned = pivot_and_clean_data(df_filled, engine=args.pivot_engine, smoothing=smoothing,
+                                                      data_types=data_types)
+                    stage.rows_out = len(df_cleaned)
+                del df_filled
+                with metrics.stage('quality', rows_in=len(df_cleaned)):
+                    report.update(df_cleaned)
+            df_cleaned = df_cleaned.reindex(columns=output_columns)
+            hash_parts.append(station_hashes)
+            del df_weather
+            
+            with metrics.stage('save', rows_in=len(df_cleaned)):
+                if save_csv:
+                    df_cleaned.to_csv(csv_path, mode='w' if chunk_number == 1 else 'a',
+                                      header=chunk_number == 1, index=False)
+                if save_parquet and len(df_cleaned) > 0:
+                    parquet_manifest.extend(write_parquet_dataset(
+                        df_cleaned,
+                        dataset_path,
+                        basename_template=f'part-{chunk_number:05d}-{{i}}.parquet',
+                        overwrite=False
+                    ))
+                if json_writer is not None:
+                    json_writer.write(df_cleaned)
+            
+            logger.info(f"Wrote {report.total_records:,} records so far (peak RSS {peak_rss_mb():,.0f} MB)")
+        
+        if json_writer is not None:
+            json_writer.finish()
+    finally:
+        if json_writer is not None:
+            json_writer.close()
+        if executor is not None:
+            executor.close()
+    
+    if save_csv:
+        logger.info(f"Saved CSV to: {csv_path}")
+    if save_json:
+        logger.info(f"Saved JSON to: {json_path}")
+    
+    # Step 6 over the whole output: the report was accumulated chunk by chunk
+    if args.validate:
+        with metrics.stage('validate', rows_in=report.total_records):
+            validate_data(None, report)
+    
+    summary = report.summary()
+    if save_parquet:
+        summary['parquet_dataset'] = summarize_manifest(dataset_path, parquet_manifest)
+        logger.info(f"Saved Parquet dataset to: {dataset_path}")
+    write_processing_summary(summary, output_path, report.temperature_range)
+    
+    save_manifest(combine_station_hashes(hash_parts), output_path / MANIFEST_NAME)
+
+
+def run_incremental_pipeline(args, chunk_rows: int, metrics: PipelineMetrics) -> bool:
+    """
+    Recompute only the stations whose input rows changed and patch them into the outputs.
+    
+    The input is still read once to hash every station, but only new and changed
+    stations are geocoded, merged and pivoted. CSV/JSON outputs are rewritten
+    by streaming, the Parquet dataset only in the affected country partitions,
+    and with --patch-database the changed stations' rows in weather_data are
+    replaced. Removed stations are deleted everywhere.
+    
+    Returns:
+        False when there is no manifest or output to patch yet (the caller then
+        runs the full pipeline, which writes both)
+    """
+    output_path = Path(args.output_dir)
+    manifest_path = output_path / MANIFEST_NAME
+    csv_path = output_path / 'global_weather_data_cleaned.csv'
+    json_path = output_path / 'global_weather_data_cleaned.json'
+    dataset_path = output_path / PARQUET_DATASET_NAME
+    
+    previous = load_manifest(manifest_path)
+    if previous is None:
+        logger.info(f"No station manifest at {manifest_path}, running the full pipeline")
+        return False
+    required = [path for fmt, path in [('csv', csv_path), ('parquet', dataset_path)] if fmt in args.format]
+    missing = [str(path) for path in required if not path.exists()]
+    if missing:
+        logger.info(f"No previous output to patch ({', '.join(missing)}), running the full pipeline")
+        return False
+    
+    # Step 1: Hash every station's rows, keeping only the rows of stations that differ
+    logger.info(f"Hashing station input rows against {manifest_path}...")
+    previous_hashes = set(zip(previous['id'], previous['hash'].tolist()))
+    hash_parts = []
+    changed_parts = []
+    data_types = set()
+    for chunk in metrics.iterate('read', iter_station_chunks(args.input_csv, chunk_rows)):
+        with metrics.stage('hash', rows_in=len(chunk)):
+            df_weather = prepare_weather_records(chunk)
+            hashes = hash_station_records(df_weather)
+            hash_parts.append(hashes)
+            data_types.update(df_weather['data_type'].dropna().unique())
+            differs = [(station, value) not in previous_hashes
+                       for station, value in zip(hashes['id'], hashes['hash'].tolist())]
+            if any(differs):
+                changed_parts.append(df_weather[df_weather['id'].isin(hashes.loc[differs, 'id'])])
+    
+    current = combine_station_hashes(hash_parts)
+    diff = diff_manifests(previous, current)
+    logger.info(f"Stations: {len(current):,} in input, {len(diff['added']):,} added, "
+                f"{len(diff['changed']):,} changed, {len(diff['removed']):,} removed")
+    if not diff['added'] and not diff['changed'] and not diff['removed']:
+        logger.info("No station changes since the last run, outputs are up to date")
+        return True
+    
+    recompute_ids = set(diff['recompute_ids'])
+    df_weather = pd.concat(changed_parts, ignore_index=True) if changed_parts else None
+    held = set(df_weather['id'].unique()) if df_weather is not None else set()
+    if recompute_ids - held:
+        # Unchanged stations sharing an output key with a changed one: read their rows too
+        extra_ids = recompute_ids - held
+        logger.info(f"Reading {len(extra_ids):,} unchanged stations that share an output key")
+        extra = [prepare_weather_records(chunk[chunk['id'].isin(extra_ids)])
+                 for chunk in iter_station_chunks(args.input_csv, chunk_rows)]
+        df_weather = pd.concat(([df_weather] if df_weather is not None else []) + extra, ignore_index=True)
+    
+    # Step 2: Geocode (only locations missing from the journal are looked up)
+    patch = pd.DataFrame(columns=PIVOT_INDEX)
+    countries = pd.Series(dtype='object')
+    if df_weather is not None and len(recompute_ids) > 0:
+        df_weather = df_weather[df_weather['id'].isin(recompute_ids)].reset_index(drop=True)
+        logger.info(f"Recomputing {len(recompute_ids):,} stations ({len(df_weather):,} records)")
+        with metrics.stage('geocode') as stage:
+            unique_locs = get_unique_locations(df_weather)
+            known = load_geocoding_progress() if not args.skip_geocoding else None
+            if known is not None:
+                # Keep every known location so ALL_location_specific_data.csv stays complete
+                known_locs = known[['lat', 'long']].round(3).astype(unique_locs.dtypes.to_dict())
+                unique_locs = pd.concat([known_locs, unique_locs], ignore_index=True).drop_duplicates(ignore_index=True)
+            stage.rows_in = len(unique_locs)
+            geocoded_data = geocode_locations(args, unique_locs)
+            stage.rows_out = len(geocoded_data)
+        
+        # Step 3: Merge and pivot the recomputed stations (against every data type of the
+        # input, so they get the same columns and TAVG fill as in a full run)
+        with metrics.stage('merge', rows_in=len(df_weather)) as stage:
+            df_filled = merge_with_original(df_weather, geocoded_data)
+            countries = station_countries(df_filled)
+            stage.rows_out = len(df_filled)
+        with metrics.stage('pivot', rows_in=len(df_filled)) as stage:
+            patch = pivot_and_clean_data(df_filled, engine=args.pivot_engine,
+                                         smoothing=smoothing_config(args.smooth), data_types=sorted(data_types))
+            stage.rows_out = len(patch)
+        del df_weather, df_filled
+        
+        if args.validate:
+            with metrics.stage('validate', rows_in=len(patch)):
+                validate_data(patch)
+    
+    # Step 4: Patch the outputs in place
+    report = QualityReport(track_duplicates=False)
+    summary_extra = {}
+    with metrics.stage('save', rows_in=len(patch)):
+        if 'csv' in args.format:
+            json_tmp_path = json_path.with_name(json_path.name + '.tmp')
+            json_writer = JsonArrayWriter(json_tmp_path) if not args.no_json else None
+            
+            def on_chunk(df):
+                report.update(df)
+                if json_writer is not None:
+                    json_writer.write(df)
+            
+            try:
+                patch_csv_output(csv_path, patch, diff['stale_keys'], chunk_rows, on_chunk=on_chunk)
+                if json_writer is not None:
+                    json_writer.finish()
+            finally:
+                if json_writer is not None:
+                    json_writer.close()
+            if json_writer is not None:
+                os.replace(json_tmp_path, json_path)
+                logger.info(f"Rewrote JSON: {json_path}")
+        
+        if 'parquet' in args.format:
+            written = patch_parquet_dataset(dataset_path, patch, diff['stale_keys'], diff['stale_countries'])
+            summary_extra['parquet_files_rewritten'] = len(written)
+            if 'csv' not in args.format:
+                import pyarrow.dataset as ds
+                
+                dataset = ds.dataset(dataset_path, format='parquet', partitioning='hive')
+                columns = [col for col in ['city', 'country', 'date', 'TAVG'] if col in dataset.schema.names]
+                for batch in dataset.to_batches(columns=columns):
+                    report.update(batch.to_pandas().astype({'date': 'str'}))
+    
+    if args.patch_database:
+        from bulk_loader import patch_stations
+        
+        with metrics.stage('patch_database', rows_in=len(patch)):
+            summary_extra.update(patch_stations(patch, diff['stale_keys']))
+    
+    # Step 5: Record the new manifest and summary
+    save_manifest(attach_countries(current, countries, previous=previous), manifest_path)
+    summary = report.summary()
+    summary['incremental'] = {
+        'stations_added': len(diff['added']),
+        'stations_changed': len(diff['changed']),
+        'stations_removed': len(diff['removed']),
+        'stations_recomputed': len(recompute_ids),
+        'records_written': int(len(patch)),
+        **summary_extra
+    }
+    write_processing_summary(summary, output_path, report.temperature_range)
+    return True
+
+
+def geocode_locations(args, unique_locs: pd.DataFrame) -> pd.DataFrame:
+    """
+    Geocode the unique locations, one lookup per site when --cluster-radius-m is set.
+    
+    Returns:
+        DataFrame with lat, long, city, state, country, suburb for every location
+    """
+    if args.cluster_radius_m <= 0:
+        return run_geocoder(args, unique_locs)
+    
+    clusters = cluster_locations(unique_locs, args.cluster_radius_m)
+    save_clusters(clusters, CITY_DATA_DIR / 'station_clusters.csv')
+    geocoded_sites = run_geocoder(args, cluster_sites(clusters))
+    return fan_out_geocodes(clusters, geocoded_sites)
+
+
+def run_geocoder(args, unique_locs: pd.DataFrame) -> pd.DataFrame:
+    """Run the configured geocoding backend, or load the checkpoint with --skip-geocoding."""
+    if args.skip_geocoding:
+        logger.info("Skipping geocoding, loading from checkpoint...")
+        geocoded_data = load_geocoding_progress()
+        if geocoded_data is None:
+            raise ValueError("No geocoding checkpoint found. Run without --skip-geocoding first.")
+        return geocoded_data
+    
+    if args.geocoder == 'offline':
+        return reverse_geocode_locations_offline(
+            unique_locs,
+            gazetteer_path=args.gazetteer,
+            max_distance_km=args.offline_max_distance_km
+        )
+    
+    cache = None
+    if not args.no_geocoding_cache:
+        # Tag entries with the backend that answered them (the sequential geocoder always
+        # queries the public server), so a self-hosted or test server never answers for another
+        endpoint = args.geocoding_endpoint if args.geocoder == 'concurrent' else DEFAULT_ENDPOINT
+        cache = GeocodingCache(
+            args.geocoding_cache,
+            source=f"{args.geocoder}:{endpoint.rstrip('/')}",
+            max_distance_km=args.geocoding_cache_distance_km,
+            ttl_days=args.geocoding_cache_ttl_days,
+            max_entries=args.geocoding_cache_max_entries
+        )
+    
+    client = None
+    if args.geocoder == 'concurrent':
+        client = ConcurrentReverseGeocoder(
+            endpoint=args.geocoding_endpoint,
+            geocoding_delay=args.geocoding_delay,
+            workers=args.geocoding_workers,
+            retries=args.geocoding_retries
+        )
+    try:
+        return reverse_geocode_locations(
+            unique_locs, 
+            batch_size=args.batch_size,
+            geocoding_delay=args.geocoding_delay,
+            client=client,
+            cache=cache
+        )
+    finally:
+        if cache is not None:
+            cache.close()
+
+
 def main():
     """Main execution function."""
     args = parse_arguments()
@@ -691,52 +1645,104 @@ def main():
     logger.info(f"  Input CSV: {args.input_csv}")
     logger.info(f"  Output directory: {args.output_dir}")
     logger.info(f"  Batch size: {args.batch_size}")
+    logger.info(f"  Geocoder: {args.geocoder}")
     logger.info(f"  Geocoding delay: {args.geocoding_delay}s")
+    logger.info(f"  Cluster radius: {args.cluster_radius_m:g} m")
     logger.info(f"  Skip geocoding: {args.skip_geocoding}")
     logger.info(f"  Resume only: {args.resume_only}")
+    logger.info(f"  Streaming: {args.streaming}")
+    logger.info(f"  Incremental: {args.incremental}")
+    logger.info(f"  Workers: {args.workers}")
     logger.info("")
     
     start_time = time.time()
+    metrics = PipelineMetrics(profile=args.profile, profile_dir=Path(args.output_dir) / 'profiles')
     
     try:
         # Ensure output directories exist
         ensure_directories()
         
-        # Step 1: Read and prepare weather data
-        df_weather = read_and_prepare_data(args.input_csv)
-        
-        # Step 2: Get unique locations
-        unique_locs = get_unique_locations(df_weather)
-        
-        # Step 3: Reverse geocode locations (with checkpoint support)
-        if args.skip_geocoding:
-            logger.info("Skipping geocoding, loading from checkpoint...")
-            geocoded_data = load_geocoding_progress()
-            if geocoded_data is None:
-                raise ValueError("No geocoding checkpoint found. Run without --skip-geocoding first.")
-        else:
-            geocoded_data = reverse_geocode_locations(
-                unique_locs, 
-                batch_size=args.batch_size,
-                geocoding_delay=args.geocoding_delay
+        if args.compact_journal:
+            compact_journal(
+                CITY_DATA_DIR / 'geocoding_journal.jsonl',
+                CITY_DATA_DIR / 'ALL_location_specific_data.csv'
             )
+            return
+        
+        chunk_rows = resolve_chunk_rows(args.chunk_rows, args.max_memory)
+        df_cleaned = None
+        if not (args.incremental and run_incremental_pipeline(args, chunk_rows, metrics)):
+            # Steps 1-2: Read weather data and get unique locations (streaming mode only
+            # scans the coordinate columns here and reads the full records chunk by chunk later)
+            if args.streaming:
+                with metrics.stage('scan') as stage:
+                    unique_locs, data_types = scan_input_metadata(args.input_csv)
+                    stage.rows_out = len(unique_locs)
+            else:
+                with metrics.stage('read') as stage:
+                    df_weather = read_and_prepare_data(args.input_csv)
+                    stage.rows_out = len(df_weather)
+                with metrics.stage('unique_locations', rows_in=len(df_weather)) as stage:
+                    unique_locs = get_unique_locations(df_weather)
+                    stage.rows_out = len(unique_locs)
             
-            if args.resume_only:
+            # Step 3: Reverse geocode locations (with checkpoint support)
+            with metrics.stage('geocode', rows_in=len(unique_locs)) as stage:
+                geocoded_data = geocode_locations(args, unique_locs)
+                stage.rows_out = len(geocoded_data)
+            
+            if args.resume_only and not args.skip_geocoding:
                 logger.info("Resume-only mode: Geocoding complete, exiting.")
                 return
+            
+            if args.streaming:
+                # Steps 4-7 per chunk, appending to the outputs
+                run_streaming_pipeline(args, geocoded_data, data_types, chunk_rows, metrics)
+            else:
+                if args.workers > 1:
+                    # Steps 4-5 on a process pool, sharded by country and location
+                    with metrics.stage('merge_pivot', rows_in=len(df_weather)) as stage:
+                        with ShardedExecutor(args.workers, context=geocoded_data[GEOCODED_LOCATION_COLUMNS]) as executor:
+                            df_cleaned, station_hashes, report = clean_weather_parallel(
+                                executor, df_weather, geocoded_data, engine=args.pivot_engine,
+                                track_duplicates=args.validate, smoothing=smoothing_config(args.smooth)
+                            )
+                        stage.rows_out = len(df_cleaned)
+                    del df_weather
+                else:
+                    # Step 4: Merge with original weather data (hashing each station's
+                    # rows first, for later --incremental runs)
+                    with metrics.stage('merge', rows_in=len(df_weather)) as stage:
+                        station_hashes = hash_station_records(df_weather)
+                        df_filled = merge_with_original(df_weather, geocoded_data)
+                        station_hashes = attach_countries(station_hashes, station_countries(df_filled))
+                        stage.rows_out = len(df_filled)
+                    
+                    # Step 5: Pivot and clean data
+                    with metrics.stage('pivot', rows_in=len(df_filled)) as stage:
+                        df_cleaned = pivot_and_clean_data(df_filled, engine=args.pivot_engine,
+                                                          smoothing=smoothing_config(args.smooth))
+                        stage.rows_out = len(df_cleaned)
+                    report = None
+                
+                # Step 6: Validate if requested (the workers already built the report)
+                if args.validate:
+                    with metrics.stage('validate', rows_in=len(df_cleaned)):
+                        report = validate_data(df_cleaned, report)
+                
+                # Step 7: Save final output
+                with metrics.stage('save', rows_in=len(df_cleaned)):
+                    save_final_output(df_cleaned, args.output_dir, save_json=not args.no_json,
+                                      output_formats=args.format, report=report)
+                    save_manifest(station_hashes, Path(args.output_dir) / MANIFEST_NAME)
         
-        # Step 4: Merge with original weather data
-        df_filled = merge_with_original(df_weather, geocoded_data)
-        
-        # Step 5: Pivot and clean data
-        df_cleaned = pivot_and_clean_data(df_filled)
-        
-        # Step 6: Validate if requested
-        if args.validate:
-            validate_data(df_cleaned)
-        
-        # Step 7: Save final output
-        save_final_output(df_cleaned, args.output_dir, save_json=not args.no_json)
+        # Step 8: Pre-render per-day snapshots if requested
+        if args.snapshots:
+            with metrics.stage('snapshots'):
+                build_day_snapshots(args.output_dir, args.snapshots_dir,
+                                    df=df_cleaned,
+                                    output_formats=args.format,
+                                    gazetteer_path=args.gazetteer)
         
         # Success!
         elapsed = time.time() - start_time
@@ -752,6 +1758,9 @@ def main():
         import traceback
         traceback.print_exc()
         sys.exit(1)
+    finally:
+        if metrics.stages:
+            metrics.write(Path(args.output_dir) / 'pipeline_metrics.json')
 
 
 if __name__ == "__main__":
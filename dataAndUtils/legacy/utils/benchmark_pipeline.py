@@ -0,0 +1,250 @@
+"""
+Benchmark the weather cleaning pipeline stages on synthetic input.
+
+Runs read_and_prepare_data, get_unique_locations, merge_with_original,
+pivot_and_clean_data, validate_data and save_final_output end to end on
+generated files (synthetic_weather.py) of one or more sizes. Geocoding is
+replaced by a stub that names locations after grid cells, so runs need no
+network, gazetteer or checkpoint files and only the pipeline code is measured.
+
+Each stage is timed with PipelineMetrics over --repeat runs; the best and
+median wall times, rows/sec and peak RSS are appended as one JSON line per
+size to a history file, and compared with the previous entry for the same
+size and settings so regressions show up between commits:
+
+    stage                    best (s)  median (s)    rows/sec  peak MB   vs last
+    read_and_prepare_data       0.512       0.530   1,953,125      310    -3.1%
+    ...
+
+Generated inputs are cached in --data-dir and reused by later runs.
+
+Usage:
+    python benchmark_pipeline.py --rows 1M 10M --repeat 3
+    python benchmark_pipeline.py --input my_weather.csv --label "after pivot change"
+"""
+
+import argparse
+import json
+import logging
+import platform
+import statistics
+import subprocess
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+import CleanData_MatchCities_ExpandDatesAndWeather as pipeline
+from pipeline_metrics import PipelineMetrics
+from synthetic_weather import parse_row_count, write_synthetic_weather
+
+logger = logging.getLogger(__name__)
+
+BENCHMARK_DIR = Path(__file__).parent.parent / 'benchmarks'
+DEFAULT_HISTORY = BENCHMARK_DIR / 'benchmark_history.jsonl'
+DEFAULT_DATA_DIR = BENCHMARK_DIR / 'data'
+STAGES = ['read_and_prepare_data', 'get_unique_locations', 'merge_with_original',
+          'pivot_and_clean_data', 'validate_data', 'save_final_output']
+
+
+def stub_geocode(unique_locs: pd.DataFrame) -> pd.DataFrame:
+    """
+    Stand-in for reverse geocoding: name every location after the grid cells it falls in.
+
+    Cities are 0.5 degree cells, states 5 degree cells and countries 20 degree
+    cells, which keeps the cardinalities the later stages see realistic.
+    """
+    lat = unique_locs['lat'].to_numpy(dtype='float64')
+    long = unique_locs['long'].to_numpy(dtype='float64')
+
+    def cell_names(prefix, size):
+        return np.char.add(
+            np.char.add(f'{prefix} ', np.floor(lat / size).astype(int).astype(str)),
+            np.char.add('_', np.floor(long / size).astype(int).astype(str))
+        ).astype(object)
+
+    return pd.DataFrame({
+        'lat': unique_locs['lat'].round(3),
+        'long': unique_locs['long'].round(3),
+        'city': cell_names('City', 0.5),
+        'state': cell_names('State', 5),
+        'country': cell_names('Country', 20),
+        'suburb': '',
+    })
+
+
+def run_stages(input_csv, output_dir: Path, engine: str, save_json: bool, output_formats: tuple) -> PipelineMetrics:
+    """Run every benchmarked stage once and return the timings."""
+    metrics = PipelineMetrics()
+    with metrics.stage('read_and_prepare_data') as stage:
+        df_weather = pipeline.read_and_prepare_data(input_csv)
+        stage.rows_out = len(df_weather)
+
+    with metrics.stage('get_unique_locations', rows_in=len(df_weather)) as stage:
+        unique_locs = pipeline.get_unique_locations(df_weather)
+        stage.rows_out = len(unique_locs)
+    geocoded_data = stub_geocode(unique_locs)
+
+    with metrics.stage('merge_with_original', rows_in=len(df_weather)) as stage:
+        df_filled = pipeline.merge_with_original(df_weather, geocoded_data)
+        stage.rows_out = len(df_filled)
+    del df_weather
+
+    with metrics.stage('pivot_and_clean_data', rows_in=len(df_filled)) as stage:
+        df_cleaned = pipeline.pivot_and_clean_data(df_filled, engine=engine)
+        stage.rows_out = len(df_cleaned)
+    del df_filled
+
+    with metrics.stage('validate_data', rows_in=len(df_cleaned)):
+        pipeline.validate_data(df_cleaned)
+
+    with metrics.stage('save_final_output', rows_in=len(df_cleaned)):
+        pipeline.save_final_output(df_cleaned, output_dir, save_json=save_json, output_formats=output_formats)
+    return metrics
+
+
+def summarize_runs(runs: list) -> dict:
+    """Best/median wall time, rows/sec and peak RSS per stage across repeated runs."""
+    summary = {}
+    for name in STAGES:
+        entries = [run.stages[name] for run in runs if name in run.stages]
+        if not entries:
+            continue
+        walls = [entry['wall_seconds'] for entry in entries]
+        rows = entries[0]['rows_in'] if entries[0]['rows_in'] is not None else entries[0]['rows_out']
+        best = min(walls)
+        summary[name] = {
+            'best_seconds': round(best, 4),
+            'median_seconds': round(statistics.median(walls), 4),
+            'rows': rows,
+            'rows_per_second': round(rows / best) if rows and best > 0 else None,
+            'peak_rss_mb': round(max(entry['peak_rss_mb'] for entry in entries), 1),
+        }
+    return summary
+
+
+def git_commit() -> str:
+    """Short hash of the checked-out commit (None outside a git checkout)."""
+    try:
+        result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=Path(__file__).parent,
+                                capture_output=True, text=True, check=True)
+        return result.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load_history(history_path: Path) -> list:
+    """Read all earlier benchmark entries."""
+    if not history_path.exists():
+        return []
+    with open(history_path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def previous_entry(history: list, entry: dict) -> dict:
+    """Latest earlier entry benchmarked on the same input size and settings."""
+    keys = ('rows', 'engine', 'formats', 'save_json', 'machine')
+    for candidate in reversed(history):
+        if all(candidate.get(key) == entry.get(key) for key in keys):
+            return candidate
+    return None
+
+
+def log_comparison(entry: dict, previous: dict):
+    """Log the stage table, with the change in best time against the previous entry."""
+    logger.info(f"\n{entry['rows']:,} rows ({entry['input']}), best of {entry['repeat']}:")
+    logger.info(f"  {'stage':<24}{'best (s)':>10}{'median (s)':>12}{'rows/sec':>13}{'peak MB':>9}{'vs last':>9}")
+    for name, stage in entry['stages'].items():
+        change = ''
+        if previous and name in previous['stages'] and previous['stages'][name]['best_seconds'] > 0:
+            ratio = stage['best_seconds'] / previous['stages'][name]['best_seconds'] - 1
+            change = f"{ratio:+.1%}"
+        rate = f"{stage['rows_per_second']:,}" if stage['rows_per_second'] else ''
+        logger.info(f"  {name:<24}{stage['best_seconds']:>10.3f}{stage['median_seconds']:>12.3f}"
+                    f"{rate:>13}{stage['peak_rss_mb']:>9,.0f}{change:>9}")
+    if previous:
+        logger.info(f"  (compared with {previous['commit'] or 'unknown commit'} from {previous['timestamp']})")
+
+
+def benchmark_input(input_csv: Path, rows: int, args) -> dict:
+    """Benchmark one input file and return its history entry."""
+    runs = []
+    with tempfile.TemporaryDirectory(prefix='weather_benchmark_') as output_dir:
+        for repeat in range(args.repeat):
+            logger.info(f"Run {repeat + 1}/{args.repeat} on {input_csv}...")
+            runs.append(run_stages(input_csv, Path(output_dir), args.pivot_engine,
+                                   save_json=not args.no_json, output_formats=tuple(args.format)))
+
+    return {
+        'timestamp': datetime.now().isoformat(),
+        'commit': git_commit(),
+        'label': args.label,
+        'input': str(input_csv),
+        'rows': rows,
+        'repeat': args.repeat,
+        'engine': args.pivot_engine,
+        'formats': sorted(args.format),
+        'save_json': not args.no_json,
+        'machine': platform.node(),
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'numpy': np.__version__,
+        'stages': summarize_runs(runs),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the weather cleaning pipeline stages')
+    parser.add_argument('--rows', type=str, nargs='+', default=['1M'],
+                        help='Synthetic input sizes to benchmark, e.g. 1M 10M 100M')
+    parser.add_argument('--input', type=str, default=None,
+                        help='Benchmark this input CSV instead of synthetic data')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per input size')
+    parser.add_argument('--seed', type=int, default=0, help='Seed for the synthetic data')
+    parser.add_argument('--data-dir', type=str, default=str(DEFAULT_DATA_DIR),
+                        help='Where generated inputs are cached')
+    parser.add_argument('--history', type=str, default=str(DEFAULT_HISTORY),
+                        help='JSON lines file the results are appended to')
+    parser.add_argument('--label', type=str, default=None, help='Free-text note stored with the results')
+    parser.add_argument('--pivot-engine', choices=['pivot_table', 'factorized'], default='pivot_table',
+                        help='Pivot implementation to benchmark')
+    parser.add_argument('--format', nargs='+', choices=['csv', 'parquet'], default=['csv'],
+                        help='Output formats written by save_final_output')
+    parser.add_argument('--no-json', action='store_true', help='Skip the JSON output')
+    parser.add_argument('--verbose', action='store_true', help='Keep the pipeline\'s own logging')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    if not args.verbose:
+        pipeline.logger.setLevel(logging.WARNING)
+
+    if args.input:
+        inputs = [(Path(args.input), None)]
+    else:
+        inputs = []
+        for size in args.rows:
+            rows = parse_row_count(size)
+            input_csv = Path(args.data_dir) / f'synthetic_weather_{rows}_seed{args.seed}.csv'
+            if not input_csv.exists():
+                write_synthetic_weather(input_csv, rows, seed=args.seed)
+            inputs.append((input_csv, rows))
+
+    history_path = Path(args.history)
+    history = load_history(history_path)
+    history_path.parent.mkdir(parents=True, exist_ok=True)
+    for input_csv, rows in inputs:
+        if rows is None:
+            with open(input_csv) as f:
+                rows = sum(1 for _ in f) - 1
+        entry = benchmark_input(input_csv, rows, args)
+        log_comparison(entry, previous_entry(history, entry))
+        with open(history_path, 'a') as f:
+            f.write(json.dumps(entry) + '\n')
+        history.append(entry)
+    logger.info(f"Appended results to: {history_path}")
+
+
+if __name__ == "__main__":
+    main()
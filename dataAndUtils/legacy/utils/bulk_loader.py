@@ -0,0 +1,275 @@
+"""
+Bulk loader for the weather_data table the GraphQL server reads.
+
+utils.import_to_db pushes files through DataFrame.to_sql(if_exists='replace'),
+which is row-batched INSERTs and drops the table on every load. This loader:
+
+    1. streams the cleaned pipeline output (CSV or Parquet dataset) in chunks,
+    2. COPYs each chunk FROM STDIN into an UNLOGGED staging table,
+    3. upserts staging into weather_data with
+       INSERT ... ON CONFLICT (city, date, name) DO UPDATE
+       (the Prisma composite key) in a single transaction.
+
+Readers keep seeing the previous rows until the upsert commits, so a reload
+causes no query downtime.
+
+Usage:
+    python bulk_loader.py --input ../../vaycay/weather_data/global_weather_data_cleaned.csv
+    python bulk_loader.py --input ../../vaycay/weather_data/global_weather_data_cleaned.parquet
+"""
+
+import argparse
+import io
+import logging
+import time
+from pathlib import Path
+
+import pandas as pd
+from psycopg2 import sql
+
+from config import Configuration
+from database import connection
+
+logger = logging.getLogger(__name__)
+
+TARGET_TABLE = 'weather_data'
+STAGING_TABLE = 'weather_data_staging'
+KEY_COLUMNS = ['city', 'date', 'name']
+
+# weather_data columns (see server/prisma/schema.prisma), in table order
+TABLE_COLUMNS = [
+    'city', 'date', 'name', 'country', 'state', 'suburb', 'lat', 'long', 'population',
+    'PRCP', 'SNWD', 'TAVG', 'TMAX', 'TMIN', 'submitter_id'
+]
+# Optional text columns; empty strings are stored as NULL, as server/scripts/import-data.ts does
+NULLABLE_TEXT_COLUMNS = ['country', 'state', 'suburb', 'submitter_id']
+# lat/long are String columns in the Prisma schema
+COORDINATE_COLUMNS = ['lat', 'long']
+
+DEFAULT_CHUNK_ROWS = 500_000
+NULL_MARKER = '\\N'
+
+
+def iter_source_chunks(input_path: str, chunk_rows: int = DEFAULT_CHUNK_ROWS):
+    """Yield DataFrame chunks from a cleaned CSV file or Parquet dataset."""
+    path = Path(input_path)
+    if not path.exists():
+        raise FileNotFoundError(f"Input not found: {input_path}")
+
+    if path.is_dir() or path.suffix == '.parquet':
+        import pyarrow.dataset as ds
+
+        dataset = ds.dataset(path, format='parquet', partitioning='hive')
+        for batch in dataset.to_batches(batch_size=chunk_rows):
+            chunk = batch.to_pandas()
+            yield chunk.drop(columns=['month'], errors='ignore')
+    else:
+        yield from pd.read_csv(
+            path,
+            chunksize=chunk_rows,
+            keep_default_na=False,
+            na_values={col: [''] for col in ['lat', 'long', 'population', 'PRCP', 'SNWD', 'TAVG', 'TMAX', 'TMIN']},
+            dtype={'city': 'str', 'country': 'str', 'state': 'str', 'suburb': 'str', 'name': 'str', 'date': 'str'}
+        )
+
+
+def format_coordinate(value):
+    """
+    The string import-data.ts stores for a coordinate (JS Number.toString of the
+    3-decimal value): '45' not '45.0', '45.1' not '45.100', '0' not '-0'.
+    """
+    if pd.isna(value):
+        return None
+    return f'{round(float(value), 3) + 0.0:.3f}'.rstrip('0').rstrip('.')
+
+
+def to_copy_buffer(chunk: pd.DataFrame, columns: list) -> io.StringIO:
+    """Serialize a chunk as COPY-ready CSV with an explicit NULL marker."""
+    chunk = chunk[columns].copy()
+    for col in NULLABLE_TEXT_COLUMNS:
+        if col in chunk.columns:
+            chunk[col] = chunk[col].astype('object').where(chunk[col].astype(str) != '', None)
+    for col in COORDINATE_COLUMNS:
+        if col in chunk.columns:
+            chunk[col] = chunk[col].map(format_coordinate)
+
+    buffer = io.StringIO()
+    chunk.to_csv(buffer, index=False, header=False, na_rep=NULL_MARKER)
+    buffer.seek(0)
+    return buffer
+
+
+def create_staging_table(cursor):
+    """Create (or empty) the unlogged staging table shaped like weather_data."""
+    cursor.execute(sql.SQL(
+        'CREATE UNLOGGED TABLE IF NOT EXISTS {staging} (LIKE {target} INCLUDING DEFAULTS)'
+    ).format(staging=sql.Identifier(STAGING_TABLE), target=sql.Identifier(TARGET_TABLE)))
+    cursor.execute(sql.SQL('TRUNCATE {staging}').format(staging=sql.Identifier(STAGING_TABLE)))
+
+
+def copy_chunk(cursor, chunk: pd.DataFrame, columns: list):
+    """COPY one chunk into the staging table."""
+    statement = sql.SQL("COPY {staging} ({columns}) FROM STDIN WITH (FORMAT csv, NULL {null})").format(
+        staging=sql.Identifier(STAGING_TABLE),
+        columns=sql.SQL(', ').join(map(sql.Identifier, columns)),
+        null=sql.Literal(NULL_MARKER)
+    )
+    cursor.copy_expert(statement.as_string(cursor), to_copy_buffer(chunk, columns))
+
+
+def upsert_from_staging(cursor, columns: list) -> int:
+    """Upsert the staged rows into weather_data; returns the number of rows written."""
+    update_columns = [col for col in columns if col not in KEY_COLUMNS]
+    identifiers = sql.SQL(', ').join(map(sql.Identifier, columns))
+    keys = sql.SQL(', ').join(map(sql.Identifier, KEY_COLUMNS))
+    if update_columns:
+        conflict_action = sql.SQL('DO UPDATE SET {}').format(sql.SQL(', ').join(
+            sql.SQL('{col} = EXCLUDED.{col}').format(col=sql.Identifier(col)) for col in update_columns
+        ))
+    else:
+        conflict_action = sql.SQL('DO NOTHING')
+
+    # DISTINCT ON: a key may appear twice in the input, and ON CONFLICT cannot
+    # touch the same target row twice in one statement
+    cursor.execute(sql.SQL("""
+        INSERT INTO {target} ({columns})
+        SELECT DISTINCT ON ({keys}) {columns}
+        FROM {staging}
+        ORDER BY {keys}
+        ON CONFLICT ({keys}) {conflict_action}
+    """).format(
+        target=sql.Identifier(TARGET_TABLE),
+        staging=sql.Identifier(STAGING_TABLE),
+        columns=identifiers,
+        keys=keys,
+        conflict_action=conflict_action
+    ))
+    return cursor.rowcount
+
+
+def bulk_load(input_path: str, database_url: str = Configuration.postgres_url,
+              chunk_rows: int = DEFAULT_CHUNK_ROWS) -> dict:
+    """
+    Load cleaned weather data into weather_data via COPY + upsert.
+
+    Args:
+        input_path: Cleaned CSV file or Parquet dataset directory
+        database_url: PostgreSQL connection URL
+        chunk_rows: Rows per COPY chunk
+
+    Returns:
+        Load statistics (rows staged/upserted, timings, rows/sec)
+    """
+    start_time = time.time()
+    with connection(database_url) as conn:
+        with conn.cursor() as cursor:
+            create_staging_table(cursor)
+            conn.commit()
+
+            staged = 0
+            columns = None
+            for chunk in iter_source_chunks(input_path, chunk_rows):
+                if columns is None:
+                    columns = [col for col in TABLE_COLUMNS if col in chunk.columns]
+                    missing_keys = [col for col in KEY_COLUMNS if col not in columns]
+                    if missing_keys:
+                        raise ValueError(f"Input is missing key columns: {missing_keys}")
+                copy_chunk(cursor, chunk, columns)
+                staged += len(chunk)
+                elapsed = time.time() - start_time
+                logger.info(f"Staged {staged:,} rows ({staged / elapsed:,.0f} rows/sec)")
+            conn.commit()
+            copy_seconds = time.time() - start_time
+
+            if columns is None:
+                logger.warning("Input is empty, nothing to load")
+                return {'rows_staged': 0, 'rows_upserted': 0}
+
+            logger.info(f"Upserting {staged:,} staged rows into {TARGET_TABLE}...")
+            upsert_start = time.time()
+            upserted = upsert_from_staging(cursor, columns)
+            cursor.execute(sql.SQL('TRUNCATE {staging}').format(staging=sql.Identifier(STAGING_TABLE)))
+            conn.commit()
+            upsert_seconds = time.time() - upsert_start
+
+    total_seconds = time.time() - start_time
+    stats = {
+        'rows_staged': staged,
+        'rows_upserted': upserted,
+        'copy_seconds': round(copy_seconds, 2),
+        'upsert_seconds': round(upsert_seconds, 2),
+        'total_seconds': round(total_seconds, 2),
+        'rows_per_second': round(staged / total_seconds) if total_seconds > 0 else None,
+    }
+    logger.info(f"Loaded {upserted:,} rows into {TARGET_TABLE} in {total_seconds:.1f}s "
+                f"({stats['rows_per_second']:,} rows/sec; COPY {copy_seconds:.1f}s, upsert {upsert_seconds:.1f}s)")
+    return stats
+
+
+def patch_stations(patch: pd.DataFrame, stale_keys: pd.DataFrame,
+                   database_url: str = Configuration.postgres_url) -> dict:
+    """
+    Replace the rows of a set of stations in weather_data (incremental runs).
+
+    Rows matching the stale (name, lat, long) keys are deleted and the patch is
+    upserted, all in one transaction, so readers switch from the old rows to the
+    new ones at commit.
+
+    Args:
+        patch: Recomputed cleaned rows for the stale stations
+        stale_keys: DataFrame with name, lat, long of every station to replace or remove
+        database_url: PostgreSQL connection URL
+
+    Returns:
+        Patch statistics (rows deleted/upserted)
+    """
+    with connection(database_url) as conn:
+        with conn.cursor() as cursor:
+            cursor.execute(
+                'CREATE TEMPORARY TABLE stale_stations (name text, lat double precision, '
+                'long double precision) ON COMMIT DROP'
+            )
+            keys = stale_keys[['name', 'lat', 'long']].copy()
+            keys['lat'] = keys['lat'].astype('float64').round(3)
+            keys['long'] = keys['long'].astype('float64').round(3)
+            buffer = io.StringIO()
+            keys.to_csv(buffer, index=False, header=False)
+            buffer.seek(0)
+            cursor.copy_expert('COPY stale_stations (name, lat, long) FROM STDIN WITH (FORMAT csv)', buffer)
+
+            # lat/long are stored as text; compare them numerically
+            cursor.execute(sql.SQL("""
+                DELETE FROM {target} AS w
+                USING stale_stations AS s
+                WHERE w.name = s.name
+                  AND CAST(w.lat AS double precision) = s.lat
+                  AND CAST(w.long AS double precision) = s.long
+            """).format(target=sql.Identifier(TARGET_TABLE)))
+            deleted = cursor.rowcount
+
+            upserted = 0
+            if len(patch) > 0:
+                columns = [col for col in TABLE_COLUMNS if col in patch.columns]
+                create_staging_table(cursor)
+                copy_chunk(cursor, patch, columns)
+                upserted = upsert_from_staging(cursor, columns)
+                cursor.execute(sql.SQL('TRUNCATE {staging}').format(staging=sql.Identifier(STAGING_TABLE)))
+
+    logger.info(f"Patched {TARGET_TABLE}: deleted {deleted:,} rows of {len(stale_keys):,} stations, "
+                f"upserted {upserted:,} rows")
+    return {'rows_deleted': deleted, 'rows_upserted': upserted}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Bulk load cleaned weather data into weather_data')
+    parser.add_argument('--input', type=str, required=True, help='Cleaned CSV file or Parquet dataset directory')
+    parser.add_argument('--database-url', type=str, default=Configuration.postgres_url, help='PostgreSQL URL')
+    parser.add_argument('--chunk-rows', type=int, default=DEFAULT_CHUNK_ROWS, help='Rows per COPY chunk')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    bulk_load(args.input, database_url=args.database_url, chunk_rows=args.chunk_rows)
+
+
+if __name__ == "__main__":
+    main()
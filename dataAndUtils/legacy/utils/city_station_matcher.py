@@ -0,0 +1,216 @@
+"""
+Match cities to their k nearest weather stations and interpolate daily climate.
+
+The legacy tables paired each city with a single `nearest_station_id`
+(INTERMEDIATE_*_aigen.csv, via shapely geometries), and utils.create_table
+joins stations to cities on UPPER(name) and ROUND(lat), which only matches
+cities that host a station of the same name. Here every city above a
+population threshold is matched to its k nearest stations within a distance
+cutoff in one vectorized query (SphericalIndex, great-circle distances), and
+each metric is interpolated with inverse-distance weights for all 366 days
+at once:
+
+    value[city, day] = sum_k w[city, k] * v[station_k, day] / sum_k w[city, k]
+    w = 1 / max(distance_km, MIN_DISTANCE_KM) ** power
+
+Stations missing a value on a day drop out of that day's weights, so a gap
+at one station is filled by its neighbours. Cities with no station within
+the cutoff get no rows.
+
+Stations come from a compiled climate cube (climate_cube.py). The output has
+the cleaned pipeline columns (city, country, state, suburb, lat, long, date,
+name, metrics...) plus population, nearest_station_km and stations_used, so
+climate_cube.py, parquet_output.py and bulk_loader.py accept it unchanged.
+`name` is the nearest station and lat/long are the city's own coordinates.
+
+Usage:
+    python city_station_matcher.py --cube climate_cube --cities worldcities.csv --output city_weather.csv
+"""
+
+import argparse
+import logging
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from climate_cube import ClimateCube
+from date_codes import DAYS_IN_YEAR, day_of_year_to_iso
+from offline_geocoder import SphericalIndex, load_gazetteer
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_K = 4
+DEFAULT_MAX_DISTANCE_KM = 50.0
+DEFAULT_POWER = 2.0
+DEFAULT_MIN_POPULATION = 10_000
+# Closer stations are treated as this far away, so one at the city centre
+# does not get an infinite weight
+MIN_DISTANCE_KM = 1.0
+# Cities interpolated per block; bounds the [block, k, 366, metric] gather
+CITY_BLOCK_SIZE = 2048
+
+
+def load_cities(cities_path, min_population: float = DEFAULT_MIN_POPULATION) -> pd.DataFrame:
+    """Load a worldcities-format CSV and keep cities with at least min_population people."""
+    cities = load_gazetteer(cities_path)
+    if 'population' in cities.columns and min_population:
+        population = pd.to_numeric(cities['population'], errors='coerce')
+        cities = cities[population >= min_population].reset_index(drop=True)
+    logger.info(f"Matching {len(cities):,} cities with population >= {min_population:,.0f}")
+    return cities
+
+
+def match_cities_to_stations(cities: pd.DataFrame, stations: np.ndarray, k: int = DEFAULT_K,
+                             max_distance_km: float = DEFAULT_MAX_DISTANCE_KM) -> tuple:
+    """
+    Find the k nearest stations of every city.
+
+    Args:
+        cities: DataFrame with lat/long columns
+        stations: Station table with lat/long fields (ClimateCube.stations)
+        k: Stations per city
+        max_distance_km: Stations further away are ignored
+
+    Returns:
+        Tuple of (distances_km, indices), both [city, k], nearest first. Missing
+        neighbours have an infinite distance and an index equal to the station count.
+    """
+    index = SphericalIndex(stations['lat'], stations['long'])
+    distances, indices = index.query(
+        cities['lat'].to_numpy(),
+        cities['long'].to_numpy(),
+        k=k,
+        max_distance_km=max_distance_km
+    )
+    # cKDTree drops the neighbour axis for k=1
+    return distances.reshape(len(cities), k), indices.reshape(len(cities), k)
+
+
+def idw_weights(distances_km: np.ndarray, power: float = DEFAULT_POWER) -> np.ndarray:
+    """Inverse-distance weights for a [city, k] distance matrix (0 for missing neighbours)."""
+    weights = np.zeros(distances_km.shape, dtype='float32')
+    found = np.isfinite(distances_km)
+    weights[found] = 1.0 / np.maximum(distances_km[found], MIN_DISTANCE_KM) ** power
+    return weights
+
+
+def interpolate_cube(cube: np.ndarray, indices: np.ndarray, weights: np.ndarray,
+                     block_size: int = CITY_BLOCK_SIZE) -> np.ndarray:
+    """
+    Interpolate every metric for every city and day.
+
+    Args:
+        cube: Station cube [station, 366, metric] (NaN where missing)
+        indices: [city, k] station indices (values >= station count are ignored)
+        weights: [city, k] neighbour weights
+
+    Returns:
+        float32 array [city, 366, metric], NaN where no neighbour has a value
+    """
+    n_stations = cube.shape[0]
+    indices = np.where(indices < n_stations, indices, 0)
+    result = np.full((len(indices), cube.shape[1], cube.shape[2]), np.nan, dtype='float32')
+
+    for start in range(0, len(indices), block_size):
+        stop = start + block_size
+        values = cube[indices[start:stop]]                      # [block, k, 366, metric]
+        present = ~np.isnan(values)
+        block_weights = weights[start:stop, :, None, None] * present
+        numerator = np.einsum('bkdm,bkdm->bdm', block_weights, np.where(present, values, 0))
+        denominator = block_weights.sum(axis=1)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            result[start:stop] = np.where(denominator > 0, numerator / denominator, np.nan)
+    return result
+
+
+def interpolate_city_weather(cube: ClimateCube, cities: pd.DataFrame, k: int = DEFAULT_K,
+                             max_distance_km: float = DEFAULT_MAX_DISTANCE_KM,
+                             power: float = DEFAULT_POWER) -> pd.DataFrame:
+    """
+    Build one row per matched city and day with interpolated metrics.
+
+    Args:
+        cube: Opened ClimateCube
+        cities: Cities from load_cities
+        k: Stations per city
+        max_distance_km: Maximum city-station distance
+        power: Inverse-distance weighting exponent
+
+    Returns:
+        DataFrame in the cleaned output layout (see module docstring)
+    """
+    stations = cube.stations
+    distances, indices = match_cities_to_stations(cities, stations, k=k, max_distance_km=max_distance_km)
+    matched = np.isfinite(distances[:, 0])
+    if (~matched).any():
+        logger.warning(f"{(~matched).sum():,} cities have no station within {max_distance_km:g} km")
+
+    cities = cities[matched].reset_index(drop=True)
+    distances, indices = distances[matched], indices[matched]
+    values = interpolate_cube(cube.cube, indices, idw_weights(distances, power))
+
+    n_cities = len(cities)
+    days = np.tile(np.arange(1, DAYS_IN_YEAR + 1, dtype='int16'), n_cities)
+    city_rows = np.repeat(np.arange(n_cities), DAYS_IN_YEAR)
+
+    def per_day(values_per_city):
+        return np.asarray(values_per_city)[city_rows]
+
+    result = pd.DataFrame({
+        'city': per_day(cities['city']),
+        'country': per_day(cities['country']),
+        'state': per_day(cities['state']),
+        'suburb': per_day(cities['suburb']),
+        'lat': per_day(cities['lat'].to_numpy(dtype='float64').round(3)),
+        'long': per_day(cities['long'].to_numpy(dtype='float64').round(3)),
+        'date': day_of_year_to_iso(days),
+        'name': per_day(stations['name'][indices[:, 0]]),
+    })
+    for metric_index, metric in enumerate(cube.metrics):
+        result[metric] = values[:, :, metric_index].reshape(-1).round(2)
+    if 'population' in cities.columns:
+        result['population'] = per_day(pd.to_numeric(cities['population'], errors='coerce').to_numpy())
+    result['nearest_station_km'] = per_day(distances[:, 0].round(2))
+    result['stations_used'] = per_day(np.isfinite(distances).sum(axis=1).astype('int8'))
+
+    # Days on which no neighbouring station reported anything
+    result = result[result[cube.metrics].notna().any(axis=1).to_numpy()].reset_index(drop=True)
+    logger.info(f"Interpolated {len(cube.metrics)} metrics for {n_cities:,} cities x {DAYS_IN_YEAR} days "
+                f"({len(result):,} rows, median nearest station {np.median(distances[:, 0]):.1f} km)")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Interpolate per-city daily climate from the k nearest stations')
+    parser.add_argument('--cube', type=str, required=True, help='Climate cube directory (see climate_cube.py)')
+    parser.add_argument('--cities', type=str, required=True, help='Cities CSV in worldcities format')
+    parser.add_argument('--output', type=str, required=True,
+                        help='Output CSV file, or a directory for a partitioned Parquet dataset when it ends in .parquet')
+    parser.add_argument('--min-population', type=float, default=DEFAULT_MIN_POPULATION,
+                        help='Only cities with at least this population')
+    parser.add_argument('--k', type=int, default=DEFAULT_K, help='Nearest stations per city')
+    parser.add_argument('--max-distance-km', type=float, default=DEFAULT_MAX_DISTANCE_KM,
+                        help='Ignore stations further than this from the city')
+    parser.add_argument('--power', type=float, default=DEFAULT_POWER, help='Inverse-distance weighting exponent')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    cities = load_cities(args.cities, min_population=args.min_population)
+    result = interpolate_city_weather(
+        ClimateCube(args.cube), cities, k=args.k, max_distance_km=args.max_distance_km, power=args.power
+    )
+
+    output = Path(args.output)
+    if output.suffix == '.parquet':
+        from parquet_output import reset_dataset, write_parquet_dataset
+
+        reset_dataset(output)
+        write_parquet_dataset(result, output)
+    else:
+        result.to_csv(output, index=False)
+    logger.info(f"Saved city weather to: {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,267 @@
+"""
+Memory-mapped station x day-of-year climate cube.
+
+The main access pattern is "all stations for one MMDD" (weatherByDate in the
+GraphQL server, utils.access_from_pickle in the legacy code). This module
+compiles the cleaned pipeline output once into raw NumPy arrays on disk:
+
+    <cube_dir>/cube.npy       float32 [station, 366, metric], NaN where missing
+    <cube_dir>/stations.npy   structured array: name, city, country, state, lat, long, population
+    <cube_dir>/meta.json      metric names, shape and provenance
+
+Both .npy files are opened with mmap_mode='r', so loading parses nothing and
+queries return zero-copy views that only page in what they touch:
+
+    cube = ClimateCube('climate_cube')
+    july_4 = cube.day(704)                 # [station, metric] view
+    rome = cube.station_year(cube.find_station('ROMA CIAMPINO'))  # [366, metric] view
+    tavg = cube.metric('TAVG')             # [station, 366] view
+
+The cleaned output has no population column, so station population is joined
+from a worldcities gazetteer on city and country (--cities); without one it is
+left NaN.
+
+Usage:
+    python climate_cube.py --input ../../vaycay/weather_data/global_weather_data_cleaned.csv --output climate_cube \
+        --cities ../../city_data/worldcities.csv
+"""
+
+import argparse
+import json
+import logging
+import os
+import shutil
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from date_codes import DAYS_IN_YEAR, iso_to_day_of_year, mmdd_to_day_of_year
+from fast_pivot import factorize_keys
+from offline_geocoder import load_gazetteer, to_unit_vectors
+
+logger = logging.getLogger(__name__)
+
+CUBE_VERSION = 1
+DEFAULT_METRICS = ['TAVG', 'TMAX', 'TMIN', 'PRCP']
+# Columns that identify a station in the cleaned output
+STATION_KEY = ['name', 'lat', 'long']
+
+
+def load_cleaned_output(input_path) -> pd.DataFrame:
+    """Load the cleaned pipeline output from a CSV file or Parquet dataset."""
+    path = Path(input_path)
+    if not path.exists():
+        raise FileNotFoundError(f"Cleaned output not found: {input_path}")
+    if path.is_dir() or path.suffix == '.parquet':
+        df = pd.read_parquet(path)
+        return df.drop(columns=['month'], errors='ignore')
+    return pd.read_csv(path, keep_default_na=False, na_values={
+        col: [''] for col in ['lat', 'long', 'population'] + DEFAULT_METRICS + ['SNWD']
+    })
+
+
+def station_population(rows: pd.DataFrame, cities: pd.DataFrame) -> np.ndarray:
+    """
+    Population of each station's city, joined on city and country.
+
+    Args:
+        rows: One row per station with city, country, lat and long
+        cities: Gazetteer returned by offline_geocoder.load_gazetteer
+
+    Returns:
+        float32 population per row, NaN where no place matches. Where several
+        places share the city and country name, the one nearest the station is used
+    """
+    population = np.full(len(rows), np.nan, dtype='float32')
+    if 'population' not in cities.columns or not {'city', 'country'} <= set(rows.columns):
+        logger.warning("No city/country or population columns to join, station population left empty")
+        return population
+
+    stations = pd.DataFrame({
+        'row': np.arange(len(rows)),
+        'city': rows['city'].fillna('').astype(str).to_numpy(),
+        'country': rows['country'].fillna('').astype(str).to_numpy(),
+        'lat': rows['lat'].to_numpy(dtype='float64'),
+        'long': rows['long'].to_numpy(dtype='float64'),
+    })
+    places = pd.DataFrame({
+        'city': cities['city'].to_numpy(),
+        'country': cities['country'].to_numpy(),
+        'place_lat': cities['lat'].to_numpy(dtype='float64'),
+        'place_long': cities['long'].to_numpy(dtype='float64'),
+        'population': pd.to_numeric(cities['population'], errors='coerce').to_numpy(),
+    })
+    matched = stations[stations['city'] != ''].merge(places, on=['city', 'country'])
+    # Squared chord length orders candidates like great-circle distance
+    offsets = (to_unit_vectors(matched['lat'].to_numpy(), matched['long'].to_numpy())
+               - to_unit_vectors(matched['place_lat'].to_numpy(), matched['place_long'].to_numpy()))
+    matched['distance'] = (offsets ** 2).sum(axis=1)
+    nearest = matched.sort_values(['row', 'distance'], kind='stable').drop_duplicates(subset='row')
+    population[nearest['row'].to_numpy()] = nearest['population'].to_numpy(dtype='float32')
+    logger.info(f"Joined population for {np.isfinite(population).sum():,} of {len(rows):,} stations")
+    return population
+
+
+def build_station_table(df: pd.DataFrame, station_codes: np.ndarray, cities: pd.DataFrame = None) -> np.ndarray:
+    """
+    Build the structured station array (one row per station code, in code order).
+
+    Population comes from df's population column when it has one, otherwise from
+    cities (see station_population), otherwise it is NaN.
+    """
+    _, first_rows = np.unique(station_codes, return_index=True)
+    rows = df.iloc[first_rows]
+
+    def text_field(col):
+        values = rows[col].fillna('').astype(str).to_numpy() if col in rows.columns else np.full(len(rows), '')
+        width = max(1, max((len(value) for value in values), default=1))
+        return values, f'U{width}'
+
+    fields = {col: text_field(col) for col in ['name', 'city', 'country', 'state']}
+    dtype = [(col, width) for col, (_, width) in fields.items()] + [
+        ('lat', 'f8'), ('long', 'f8'), ('population', 'f4')
+    ]
+    stations = np.zeros(len(rows), dtype=dtype)
+    for col, (values, _) in fields.items():
+        stations[col] = values
+    stations['lat'] = rows['lat'].to_numpy(dtype='float64').round(3)
+    stations['long'] = rows['long'].to_numpy(dtype='float64').round(3)
+    if 'population' in rows.columns:
+        stations['population'] = rows['population'].to_numpy(dtype='float32')
+    elif cities is not None:
+        stations['population'] = station_population(rows, cities)
+    else:
+        stations['population'] = np.nan
+    return stations
+
+
+def compile_cube(df: pd.DataFrame, cube_dir, metrics: list = None, cities: pd.DataFrame = None) -> Path:
+    """
+    Compile cleaned weather rows into the on-disk cube.
+
+    The cube is written to a temporary directory and swapped into place, so
+    readers never see a half-written cube.
+
+    Args:
+        df: Cleaned output (city, country, state, suburb, lat, long, date, name, metrics...)
+        cube_dir: Destination directory
+        metrics: Metric columns to include (default: those of TAVG/TMAX/TMIN/PRCP present)
+        cities: Gazetteer to join station population from (see station_population)
+
+    Returns:
+        Path to the cube directory
+    """
+    cube_dir = Path(cube_dir)
+    metrics = metrics or [metric for metric in DEFAULT_METRICS if metric in df.columns]
+    if not metrics:
+        raise ValueError("No metric columns found to compile")
+
+    df = df.dropna(subset=STATION_KEY).reset_index(drop=True)
+    station_codes = factorize_keys(df, STATION_KEY)
+    n_stations = int(station_codes.max()) + 1 if len(station_codes) else 0
+
+    # Cleaned output has ISO dates; accept MMDD integers too
+    if pd.api.types.is_integer_dtype(df['date']):
+        days = mmdd_to_day_of_year(df['date'].to_numpy())
+    else:
+        days = iso_to_day_of_year(df['date'].to_numpy())
+    valid = days > 0
+    if (~valid).any():
+        logger.warning(f"Skipping {(~valid).sum():,} rows with invalid dates")
+
+    tmp_dir = cube_dir.with_name(cube_dir.name + '.tmp')
+    if tmp_dir.exists():
+        shutil.rmtree(tmp_dir)
+    tmp_dir.mkdir(parents=True)
+
+    cube = np.lib.format.open_memmap(
+        tmp_dir / 'cube.npy', mode='w+', dtype='float32',
+        shape=(n_stations, DAYS_IN_YEAR, len(metrics))
+    )
+    cube[:] = np.nan
+    for metric_index, metric in enumerate(metrics):
+        cube[station_codes[valid], days[valid] - 1, metric_index] = df[metric].to_numpy(dtype='float32')[valid]
+    cube.flush()
+    del cube
+
+    np.save(tmp_dir / 'stations.npy', build_station_table(df, station_codes, cities=cities))
+    with open(tmp_dir / 'meta.json', 'w') as f:
+        json.dump({
+            'version': CUBE_VERSION,
+            'metrics': metrics,
+            'shape': [n_stations, DAYS_IN_YEAR, len(metrics)],
+            'created': datetime.now().isoformat(),
+        }, f, indent=2)
+
+    if cube_dir.exists():
+        old_dir = cube_dir.with_name(cube_dir.name + '.old')
+        os.replace(cube_dir, old_dir)
+        os.replace(tmp_dir, cube_dir)
+        shutil.rmtree(old_dir)
+    else:
+        os.replace(tmp_dir, cube_dir)
+
+    logger.info(f"Compiled climate cube {n_stations:,} stations x {DAYS_IN_YEAR} days x {len(metrics)} metrics: {cube_dir}")
+    return cube_dir
+
+
+class ClimateCube:
+    """Read-only, memory-mapped view of a compiled climate cube."""
+
+    def __init__(self, cube_dir):
+        cube_dir = Path(cube_dir)
+        with open(cube_dir / 'meta.json') as f:
+            meta = json.load(f)
+        if meta.get('version') != CUBE_VERSION:
+            raise ValueError(f"Unsupported cube version {meta.get('version')} in {cube_dir}")
+
+        self.metrics = meta['metrics']
+        self.cube = np.load(cube_dir / 'cube.npy', mmap_mode='r')
+        self.stations = np.load(cube_dir / 'stations.npy', mmap_mode='r')
+        self._metric_index = {metric: i for i, metric in enumerate(self.metrics)}
+
+    def __len__(self):
+        return self.cube.shape[0]
+
+    def day(self, mmdd: int = None, day_of_year: int = None) -> np.ndarray:
+        """All stations for one day as a [station, metric] view (pass MMDD or day-of-year)."""
+        if day_of_year is None:
+            day_of_year = int(mmdd_to_day_of_year([mmdd])[0])
+        if not 1 <= day_of_year <= DAYS_IN_YEAR:
+            raise ValueError(f"Invalid day: mmdd={mmdd}, day_of_year={day_of_year}")
+        return self.cube[:, day_of_year - 1, :]
+
+    def station_year(self, station: int) -> np.ndarray:
+        """One station's full year as a [366, metric] view."""
+        return self.cube[station]
+
+    def metric(self, name: str) -> np.ndarray:
+        """One metric for all stations and days as a [station, 366] view."""
+        return self.cube[:, :, self._metric_index[name]]
+
+    def find_station(self, name: str) -> int:
+        """Index of the first station with this name."""
+        matches = np.flatnonzero(self.stations['name'] == name)
+        if len(matches) == 0:
+            raise KeyError(f"Unknown station: {name}")
+        return int(matches[0])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compile cleaned weather output into a memory-mapped climate cube')
+    parser.add_argument('--input', type=str, required=True, help='Cleaned CSV file or Parquet dataset directory')
+    parser.add_argument('--output', type=str, required=True, help='Cube directory to write')
+    parser.add_argument('--metrics', nargs='+', default=None, help=f'Metrics to include (default: {DEFAULT_METRICS})')
+    parser.add_argument('--cities', type=str, default=None,
+                        help='Worldcities-format CSV to join station population from (on city and country)')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    cities = load_gazetteer(args.cities) if args.cities else None
+    compile_cube(load_cleaned_output(args.input), args.output, metrics=args.metrics, cities=cities)
+
+
+if __name__ == "__main__":
+    main()
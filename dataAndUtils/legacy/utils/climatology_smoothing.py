@@ -0,0 +1,238 @@
+"""
+Climatology smoothing and gap filling on a dense [station, 366] grid.
+
+pivot_and_clean_data only fills a missing TAVG from the TMAX/TMIN mean, so the
+output still has empty PRCP/TAVG/TMIN cells and days with no row at all, and
+day-to-day noise in the multi-year averages makes the map flicker as the date
+slider moves. This stage scatters each metric of the pivoted rows into a
+[station, 366] array and smooths every station at once with batched NumPy:
+
+    window:<days>     centred moving mean over <days> (odd) days; the year is
+                      circular, so Dec 31 averages with Jan 1
+    harmonic:<n>      least-squares fit of a mean plus n annual harmonics
+                      (cos/sin of k * 2*pi*day/366), solved for all stations as
+                      one batch of small normal-equation systems
+
+Metrics are configured separately, e.g. ['TAVG=window:15', 'PRCP=harmonic:2'].
+A ':fill' suffix keeps observed values and only fills gaps. Without it, the
+observed values are replaced by the smoothed series too.
+
+Rules for filling:
+- A cell is only filled when enough observations are nearby: min_periods in
+  the window, or an observation within HARMONIC_REACH_DAYS for a harmonic fit.
+- Filled cells are flagged in a boolean <METRIC>_filled column.
+- Days a station has no row for are added when any metric fills them.
+- Precipitation-like metrics are clipped at zero.
+
+Values are smoothed in their input units (before pivot_and_clean_data converts
+tenths), in blocks of STATION_BLOCK stations to bound memory.
+"""
+
+import logging
+
+import numpy as np
+import pandas as pd
+
+from climate_cube import STATION_KEY
+from date_codes import DAYS_IN_YEAR
+from fast_pivot import PIVOT_INDEX, factorize_keys
+
+logger = logging.getLogger(__name__)
+
+SMOOTHING_METHODS = ('window', 'harmonic')
+DEFAULT_SMOOTHING = ['TAVG=window:15', 'TMAX=window:15', 'TMIN=window:15', 'PRCP=window:7']
+FILLED_SUFFIX = '_filled'
+NON_NEGATIVE_METRICS = {'PRCP', 'SNOW', 'SNWD'}
+HARMONIC_REACH_DAYS = 15  # Harmonic fits only fill days this close to an observation
+STATION_BLOCK = 50_000  # Stations smoothed per batch
+
+
+def parse_smoothing_spec(value: str) -> tuple:
+    """
+    Parse one METRIC=METHOD:PARAM[:fill] setting (argparse type).
+
+    Returns:
+        Tuple of (metric, {'method', 'param', 'fill_only'})
+    """
+    metric, _, spec = value.partition('=')
+    parts = spec.split(':')
+    fill_only = parts[-1] == 'fill'
+    if fill_only:
+        parts = parts[:-1]
+    if not metric or len(parts) != 2 or parts[0] not in SMOOTHING_METHODS or not parts[1].isdigit():
+        raise ValueError(f"Invalid smoothing setting '{value}', expected METRIC=window:DAYS or "
+                         f"METRIC=harmonic:N, optionally followed by :fill")
+    param = int(parts[1])
+    if param < 1:
+        raise ValueError(f"Invalid smoothing setting '{value}': {parts[0]} needs a positive parameter")
+    return metric, {'method': parts[0], 'param': param, 'fill_only': fill_only}
+
+
+def smoothing_config(settings) -> dict:
+    """Per-metric settings from parsed --smooth values (None: off, empty: DEFAULT_SMOOTHING)."""
+    if settings is None:
+        return None
+    settings = settings or [parse_smoothing_spec(value) for value in DEFAULT_SMOOTHING]
+    return dict(settings)
+
+
+def filled_columns(smoothing: dict, metrics: list) -> list:
+    """Flag columns smooth_climatology adds for these metrics."""
+    return [f'{metric}{FILLED_SUFFIX}' for metric in metrics if smoothing and metric in smoothing]
+
+
+def _circular_sums(values: np.ndarray, half: int) -> np.ndarray:
+    # Sum over the circular window [day - half, day + half] of every row
+    padded = np.concatenate([values[:, -half:], values, values[:, :half]], axis=1) if half else values
+    cumulative = np.zeros((len(values), padded.shape[1] + 1))
+    np.cumsum(padded, axis=1, out=cumulative[:, 1:])
+    width = 2 * half + 1
+    return cumulative[:, width:] - cumulative[:, :-width]
+
+
+def circular_window_mean(values: np.ndarray, window: int, min_periods: int = None) -> np.ndarray:
+    """
+    Centred moving mean along the circular day axis, ignoring NaN.
+
+    Args:
+        values: [station, 366] array with NaN for missing days
+        window: Window length in days (rounded up to an odd number)
+        min_periods: Observations needed in the window (default: a quarter of it)
+
+    Returns:
+        [station, 366] means, NaN where the window has fewer than min_periods values
+    """
+    half = min(window // 2, (DAYS_IN_YEAR - 1) // 2)
+    min_periods = min_periods or max(1, (2 * half + 1) // 4)
+    observed = ~np.isnan(values)
+    sums = _circular_sums(np.where(observed, values, 0.0), half)
+    counts = _circular_sums(observed.astype('float64'), half)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(counts >= min_periods, sums / counts, np.nan)
+
+
+def harmonic_basis(harmonics: int) -> np.ndarray:
+    """[366, 1 + 2 * harmonics] design matrix: constant, then cos/sin of each harmonic."""
+    angle = 2 * np.pi * (np.arange(DAYS_IN_YEAR) + 0.5) / DAYS_IN_YEAR
+    columns = [np.ones(DAYS_IN_YEAR)]
+    for k in range(1, harmonics + 1):
+        columns += [np.cos(k * angle), np.sin(k * angle)]
+    return np.column_stack(columns)
+
+
+def harmonic_fit(values: np.ndarray, harmonics: int, reach: int = HARMONIC_REACH_DAYS) -> np.ndarray:
+    """
+    Least-squares annual-harmonic fit of every station, ignoring NaN.
+
+    Stations with fewer than 2 * (1 + 2 * harmonics) observed days are not fit.
+
+    Returns:
+        [station, 366] fitted values, NaN for unfit stations and for days more
+        than reach days from an observation
+    """
+    basis = harmonic_basis(harmonics)
+    n_terms = basis.shape[1]
+    observed = ~np.isnan(values)
+    weights = observed.astype('float64')
+
+    # Normal equations per station: (B' W B) c = B' W y, all stations in two matmuls
+    outer = (basis[:, :, None] * basis[:, None, :]).reshape(DAYS_IN_YEAR, n_terms * n_terms)
+    gram = (weights @ outer).reshape(-1, n_terms, n_terms)
+    rhs = np.where(observed, values, 0.0) @ basis
+    fit = observed.sum(axis=1) >= 2 * n_terms
+    gram[~fit] = np.eye(n_terms)
+    gram += 1e-9 * np.eye(n_terms)
+    coefficients = np.linalg.solve(gram, rhs[:, :, None])[:, :, 0]
+
+    fitted = coefficients @ basis.T
+    near = _circular_sums(weights, min(reach, (DAYS_IN_YEAR - 1) // 2)) > 0
+    fitted[~(fit[:, None] & near)] = np.nan
+    return fitted
+
+
+def smooth_grid(values: np.ndarray, spec: dict, non_negative: bool = False) -> np.ndarray:
+    """Apply one metric's setting to a [station, 366] array (see parse_smoothing_spec)."""
+    smoothed = np.empty_like(values)
+    for start in range(0, len(values), STATION_BLOCK):
+        block = values[start:start + STATION_BLOCK].astype('float64')
+        if spec['method'] == 'window':
+            result = circular_window_mean(block, spec['param'])
+        else:
+            result = harmonic_fit(block, spec['param'])
+        if spec['fill_only']:
+            result = np.where(np.isnan(block), result, block)
+        else:
+            # Never lose an observation to a too-sparse window
+            result = np.where(np.isnan(result), block, result)
+        if non_negative:
+            result = np.maximum(result, 0.0)
+        smoothed[start:start + STATION_BLOCK] = result
+    return smoothed
+
+
+def smooth_climatology(df: pd.DataFrame, smoothing: dict) -> pd.DataFrame:
+    """
+    Smooth and gap-fill the configured metrics of pivoted rows.
+
+    Args:
+        df: Pivoted rows (PIVOT_INDEX columns with day-of-year date codes, one
+            column per metric)
+        smoothing: Per-metric settings (see smoothing_config)
+
+    Returns:
+        Rows with smoothed metrics, a <METRIC>_filled column per configured
+        metric, and added rows for filled days that had none (when rows are
+        added, the frame is re-sorted by station and date)
+    """
+    metrics = [metric for metric in sorted(smoothing) if metric in df.columns]
+    if not metrics or len(df) == 0:
+        for metric in metrics:
+            df[f'{metric}{FILLED_SUFFIX}'] = False
+        return df
+
+    # city/country/state/suburb follow from lat/long, so the cube's station key is enough
+    stations = factorize_keys(df, STATION_KEY)
+    n_stations = int(stations.max()) + 1
+    days = df['date'].to_numpy().astype('int64') - 1
+    # Flat [station, day] cell of every row
+    cells = stations * DAYS_IN_YEAR + days
+    has_row = np.zeros(n_stations * DAYS_IN_YEAR, dtype=bool)
+    has_row[cells] = True
+
+    grids = {}
+    filled = {}
+    for metric in metrics:
+        grid = np.full(n_stations * DAYS_IN_YEAR, np.nan, dtype='float32')
+        grid[cells] = df[metric].to_numpy(dtype='float32')
+        smoothed = smooth_grid(grid.reshape(n_stations, DAYS_IN_YEAR), smoothing[metric],
+                               non_negative=metric in NON_NEGATIVE_METRICS).ravel()
+        filled[metric] = np.isnan(grid) & ~np.isnan(smoothed)
+        grids[metric] = smoothed
+
+    for metric in metrics:
+        df[metric] = grids[metric][cells]
+        df[f'{metric}{FILLED_SUFFIX}'] = filled[metric][cells]
+
+    # Days a station had no row for, filled by at least one metric
+    added = np.logical_or.reduce([filled[metric] for metric in metrics]) & ~has_row
+    new_cells = np.flatnonzero(added)
+    new_stations, new_days = np.divmod(new_cells, DAYS_IN_YEAR)
+    if len(new_cells) > 0:
+        first_rows = np.empty(n_stations, dtype='int64')
+        first_rows[stations[::-1]] = np.arange(len(stations))[::-1]
+        new_rows = df.iloc[first_rows[new_stations]].copy()
+        new_rows['date'] = (new_days + 1).astype(df['date'].dtype)
+        for col in df.columns:
+            if col not in PIVOT_INDEX and col not in metrics and not col.endswith(FILLED_SUFFIX):
+                new_rows[col] = np.nan
+        for metric in metrics:
+            new_rows[metric] = grids[metric][new_cells]
+            new_rows[f'{metric}{FILLED_SUFFIX}'] = filled[metric][new_cells]
+        df = pd.concat([df, new_rows], ignore_index=True)
+        order = np.argsort(np.concatenate([cells, new_cells]), kind='stable')
+        df = df.iloc[order].reset_index(drop=True)
+
+    counts = ', '.join(f"{metric} {int(filled[metric].sum()):,}" for metric in metrics)
+    logger.info(f"Smoothed {len(metrics)} metrics over {n_stations:,} stations; filled cells: {counts}; "
+                f"{len(new_stations):,} rows added")
+    return df
@@ -11,3 +11,7 @@ class Configuration:
 
     # Use DATABASE_URL from environment if available, otherwise construct from parts
     postgres_url = os.getenv('DATABASE_URL', f'postgresql://{username}:{password}@{host}:{port}/{dbname}')
+
+    # Connection pool shared by the Python utilities (see database.py)
+    pool_min_size = int(os.getenv('POSTGRES_POOL_MIN', '1'))
+    pool_max_size = int(os.getenv('POSTGRES_POOL_MAX', '8'))
@@ -0,0 +1,223 @@
+"""
+Pooled PostgreSQL access shared by the Python utilities.
+
+utils.py, bulk_loader.py and table_rebuild.py each opened a fresh
+psycopg2.connect per operation (and utils.py built its SQLAlchemy engine from
+hardcoded credentials). Everything now goes through one bounded pool per
+database URL, configured from config.Configuration:
+
+    with connection() as conn:                   # commit on success, rollback on error
+        with conn.cursor() as cursor:
+            insert_values(cursor, 'INSERT INTO t (a, b) VALUES %s', rows)
+
+    for chunk in stream_frames('SELECT * FROM weather_data'):   # server-side cursor
+        ...
+
+    db = AsyncDatabase()
+    await asyncio.gather(db.run(bulk_load_rows, ...), db.fetch('SELECT count(*) FROM weather_data'))
+
+The pool blocks callers once all Configuration.pool_max_size connections are
+checked out instead of failing. AsyncDatabase runs the same pooled calls on
+worker threads (psycopg2 releases the GIL while waiting on the server), so
+loads and verification queries overlap without a second driver.
+
+Statements are batched with execute_values; psycopg2 has no libpq pipeline
+mode, so batching is the round-trip saving available here.
+"""
+
+import asyncio
+import logging
+import threading
+from contextlib import contextmanager
+from urllib.parse import urlsplit, urlunsplit
+
+import pandas as pd
+from psycopg2 import extensions, extras, pool
+
+from config import Configuration
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_SIZE = 1_000  # Rows per execute_values statement
+DEFAULT_ITERSIZE = 50_000  # Rows per server-side cursor fetch
+
+_pools = {}
+_pools_lock = threading.Lock()
+_engines = {}
+
+
+class BoundedConnectionPool(pool.ThreadedConnectionPool):
+    """ThreadedConnectionPool that waits for a free connection instead of raising PoolError."""
+
+    def __init__(self, minconn: int, maxconn: int, *args, **kwargs):
+        super().__init__(minconn, maxconn, *args, **kwargs)
+        self._slots = threading.BoundedSemaphore(maxconn)
+
+    def getconn(self, key=None):
+        self._slots.acquire()
+        try:
+            return super().getconn(key)
+        except Exception:
+            self._slots.release()
+            raise
+
+    def putconn(self, conn, key=None, close=False):
+        try:
+            super().putconn(conn, key, close)
+        finally:
+            self._slots.release()
+
+
+def database_url_for(dbname: str, database_url: str = None) -> str:
+    """The configured URL pointing at another database on the same server."""
+    parts = urlsplit(database_url or Configuration.postgres_url)
+    return urlunsplit(parts._replace(path=f'/{dbname}'))
+
+
+def get_pool(database_url: str = None) -> BoundedConnectionPool:
+    """The process-wide pool for a database URL (created on first use)."""
+    database_url = database_url or Configuration.postgres_url
+    with _pools_lock:
+        if database_url not in _pools:
+            _pools[database_url] = BoundedConnectionPool(
+                Configuration.pool_min_size, Configuration.pool_max_size, database_url
+            )
+        return _pools[database_url]
+
+
+def close_pools():
+    """Close every pooled connection (e.g. before forking worker processes)."""
+    with _pools_lock:
+        for connection_pool in _pools.values():
+            connection_pool.closeall()
+        _pools.clear()
+
+
+@contextmanager
+def connection(database_url: str = None, autocommit: bool = False):
+    """
+    Borrow a pooled connection.
+
+    The transaction is committed when the block exits normally and rolled back
+    otherwise, including on GeneratorExit (a stream_query/stream_frames caller
+    stopping early) and KeyboardInterrupt. The connection always goes back to
+    the pool; broken ones, and ones that can't be reset, are discarded.
+
+    Args:
+        database_url: PostgreSQL URL (default: Configuration.postgres_url)
+        autocommit: Run statements outside a transaction (e.g. CREATE DATABASE)
+    """
+    connection_pool = get_pool(database_url)
+    conn = connection_pool.getconn()
+    try:
+        conn.autocommit = autocommit
+        yield conn
+        if not autocommit:
+            conn.commit()
+    finally:
+        try:
+            if not conn.closed:
+                # Still in a transaction when the block did not finish (or commit failed)
+                if conn.status != extensions.STATUS_READY:
+                    conn.rollback()
+                conn.autocommit = False
+        except Exception as e:
+            logger.warning(f"Discarding a pooled connection that could not be reset: {e}")
+            conn.close()
+        finally:
+            connection_pool.putconn(conn, close=bool(conn.closed))
+
+
+def insert_values(cursor, statement: str, rows, page_size: int = DEFAULT_PAGE_SIZE, template: str = None):
+    """Run an INSERT ... VALUES %s for many rows, page_size rows per statement."""
+    extras.execute_values(cursor, statement, rows, template=template, page_size=page_size)
+
+
+def execute_values_method(table, conn, keys, data_iter):
+    """DataFrame.to_sql(method=...) callable that inserts with execute_values."""
+    columns = ', '.join(f'"{key}"' for key in keys)
+    name = f'"{table.schema}"."{table.name}"' if table.schema else f'"{table.name}"'
+    with conn.connection.cursor() as cursor:
+        insert_values(cursor, f'INSERT INTO {name} ({columns}) VALUES %s', list(data_iter))
+
+
+def stream_query(query: str, params=None, database_url: str = None, itersize: int = DEFAULT_ITERSIZE):
+    """Yield the rows of a query through a server-side cursor, itersize rows per round trip."""
+    with connection(database_url) as conn:
+        with conn.cursor(name='stream_query') as cursor:
+            cursor.itersize = itersize
+            cursor.execute(query, params)
+            yield from cursor
+
+
+def stream_frames(query: str, params=None, database_url: str = None, chunk_rows: int = DEFAULT_ITERSIZE):
+    """Yield a query's result as DataFrame chunks through a server-side cursor."""
+    with connection(database_url) as conn:
+        with conn.cursor(name='stream_frames') as cursor:
+            cursor.execute(query, params)
+            columns = None
+            while True:
+                rows = cursor.fetchmany(chunk_rows)
+                if not rows:
+                    break
+                if columns is None:
+                    columns = [column.name for column in cursor.description]
+                yield pd.DataFrame(rows, columns=columns)
+
+
+def get_engine(database_url: str = None):
+    """SQLAlchemy engine for pandas I/O, pooled with the configured bounds."""
+    import sqlalchemy
+
+    database_url = database_url or Configuration.postgres_url
+    if database_url not in _engines:
+        _engines[database_url] = sqlalchemy.create_engine(
+            database_url,
+            pool_size=Configuration.pool_max_size,
+            max_overflow=0,
+            pool_pre_ping=True
+        )
+    return _engines[database_url]
+
+
+class AsyncDatabase:
+    """
+    asyncio front end to the pool: each call borrows a pooled connection on a
+    worker thread, so at most Configuration.pool_max_size run at once.
+
+    Args:
+        database_url: PostgreSQL URL (default: Configuration.postgres_url)
+    """
+
+    def __init__(self, database_url: str = None):
+        self.database_url = database_url
+
+    async def run(self, func, *args, **kwargs):
+        """Await func(conn, *args, **kwargs) on a pooled connection in its own transaction."""
+        def call():
+            with connection(self.database_url) as conn:
+                return func(conn, *args, **kwargs)
+        return await asyncio.to_thread(call)
+
+    async def execute(self, query: str, params=None) -> int:
+        """Run a statement; returns the affected row count."""
+        def execute(conn):
+            with conn.cursor() as cursor:
+                cursor.execute(query, params)
+                return cursor.rowcount
+        return await self.run(execute)
+
+    async def fetch(self, query: str, params=None) -> list:
+        """Run a query and return all rows."""
+        def fetch(conn):
+            with conn.cursor() as cursor:
+                cursor.execute(query, params)
+                return cursor.fetchall()
+        return await self.run(fetch)
+
+    async def insert_values(self, statement: str, rows, page_size: int = DEFAULT_PAGE_SIZE) -> None:
+        """Batched INSERT ... VALUES %s (see insert_values)."""
+        def insert(conn):
+            with conn.cursor() as cursor:
+                insert_values(cursor, statement, rows, page_size=page_size)
+        await self.run(insert)
@@ -0,0 +1,72 @@
+"""
+Integer date codes for the MMDD dates in the weather data.
+
+The input stores dates as MMDD integers (e.g. 101 = January 1st). Rather than
+round-tripping every row through strings and pd.to_datetime, dates are kept as
+compact day-of-year codes (1-366, in the 2020 leap year the output uses) that
+are looked up from precomputed tables with a single NumPy take. They are only
+formatted as ISO strings once, when the output is written.
+
+Code 0 marks an invalid MMDD (e.g. 231 or 1301).
+"""
+
+import numpy as np
+
+REFERENCE_YEAR = 2020  # Leap year, so Feb 29 has a day-of-year code
+INVALID_DAY = 0
+DAYS_IN_YEAR = 366
+
+
+def _build_tables():
+    """Build the MMDD -> day-of-year and day-of-year -> date lookup tables."""
+    days = np.arange(
+        np.datetime64(f'{REFERENCE_YEAR}-01-01'),
+        np.datetime64(f'{REFERENCE_YEAR + 1}-01-01'),
+        dtype='datetime64[D]'
+    )
+    months = days.astype('datetime64[M]').astype(int) % 12 + 1
+    day_of_month = (days - days.astype('datetime64[M]')).astype(int) + 1
+    mmdd = months * 100 + day_of_month
+
+    mmdd_to_day = np.full(1232, INVALID_DAY, dtype='int16')
+    mmdd_to_day[mmdd] = np.arange(1, DAYS_IN_YEAR + 1, dtype='int16')
+
+    # Index 0 is the invalid code
+    day_to_datetime = np.concatenate([np.array(['NaT'], dtype='datetime64[D]'), days])
+    day_to_iso = np.concatenate([[None], np.datetime_as_string(days, unit='D').astype(object)])
+    day_to_mmdd = np.concatenate([[0], mmdd]).astype('int16')
+    return mmdd_to_day, day_to_datetime, day_to_iso, day_to_mmdd
+
+
+MMDD_TO_DAY_OF_YEAR, DAY_OF_YEAR_TO_DATETIME, DAY_OF_YEAR_TO_ISO, DAY_OF_YEAR_TO_MMDD = _build_tables()
+_ISO_MONTH_DAY_TO_DAY = {iso[5:]: day for day, iso in enumerate(DAY_OF_YEAR_TO_ISO) if iso is not None}
+
+
+def mmdd_to_day_of_year(mmdd) -> np.ndarray:
+    """Convert MMDD integers to int16 day-of-year codes (0 for invalid dates)."""
+    mmdd = np.asarray(mmdd, dtype='int64')
+    in_range = (mmdd >= 0) & (mmdd < len(MMDD_TO_DAY_OF_YEAR))
+    return np.where(in_range, MMDD_TO_DAY_OF_YEAR.take(np.where(in_range, mmdd, 0)), INVALID_DAY).astype('int16')
+
+
+def iso_to_day_of_year(iso_dates) -> np.ndarray:
+    """Convert 'YYYY-MM-DD' strings to day-of-year codes (0 for invalid dates)."""
+    # At most 366 distinct dates: parse each unique string once, then broadcast back
+    uniques, inverse = np.unique(np.asarray(iso_dates).astype(str), return_inverse=True)
+    lookup = np.array([_ISO_MONTH_DAY_TO_DAY.get(text[5:10], INVALID_DAY) for text in uniques], dtype='int16')
+    return lookup[inverse.reshape(-1)] if len(uniques) else np.zeros(0, dtype='int16')
+
+
+def day_of_year_to_iso(day_of_year) -> np.ndarray:
+    """Format day-of-year codes as 'YYYY-MM-DD' strings (None for invalid codes)."""
+    return DAY_OF_YEAR_TO_ISO.take(np.asarray(day_of_year, dtype='int64'))
+
+
+def day_of_year_to_datetime64(day_of_year) -> np.ndarray:
+    """Convert day-of-year codes to datetime64[D] (NaT for invalid codes)."""
+    return DAY_OF_YEAR_TO_DATETIME.take(np.asarray(day_of_year, dtype='int64'))
+
+
+def day_of_year_to_mmdd(day_of_year) -> np.ndarray:
+    """Convert day-of-year codes back to MMDD integers (0 for invalid codes)."""
+    return DAY_OF_YEAR_TO_MMDD.take(np.asarray(day_of_year, dtype='int64'))
@@ -0,0 +1,149 @@
+"""
+Pre-rendered per-day snapshot files for the map client.
+
+Every slider move in the client currently runs a weatherByDate query against
+Postgres. Since the data only changes when the pipeline runs, all 366 answers
+can be rendered ahead of time as small static files that nginx serves
+directly (see client/nginx/nginx.conf):
+
+    snapshots/stations.json   shared station dictionary (columnar)
+    snapshots/MMDD.json       one file per day, e.g. 0704.json
+    snapshots/*.json.gz       gzip pre-compressed copies (nginx gzip_static)
+    snapshots/*.json.br       brotli pre-compressed copies (if the brotli package is installed)
+
+stations.json:
+    {"version": 1, "count": N, "name": [...], "city": [...], "country": [...], "lat": [...], "long": [...]}
+
+MMDD.json (columnar; `station` indexes into stations.json, null = missing):
+    {"version": 1, "date": "07-04", "station": [0, 3, ...], "TAVG": [21.3, null, ...], "TMAX": [...], ...}
+
+Snapshots are rendered from a compiled climate cube (climate_cube.py), so each
+day is one contiguous slice read.
+
+Usage:
+    python day_snapshots.py --cube climate_cube --output ../../../client/public/snapshots
+"""
+
+import argparse
+import gzip
+import json
+import logging
+import os
+from pathlib import Path
+
+import numpy as np
+
+from climate_cube import ClimateCube
+from date_codes import DAY_OF_YEAR_TO_MMDD, DAYS_IN_YEAR
+
+try:
+    import brotli
+except ImportError:  # Optional: only needed for .br files
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 1
+SNAPSHOT_METRICS = ['TAVG', 'TMAX', 'TMIN', 'PRCP']
+VALUE_DECIMALS = 2
+
+
+def _column(values: np.ndarray) -> list:
+    """Round a float column and convert NaN to None for JSON."""
+    rounded = np.round(values.astype('float64'), VALUE_DECIMALS)
+    return [None if np.isnan(value) else value for value in rounded.tolist()]
+
+
+def _write_compressed(path: Path, payload: bytes, use_brotli: bool):
+    """Write payload plus .gz (and .br) siblings, each atomically."""
+    variants = [(path, payload), (path.with_name(path.name + '.gz'), gzip.compress(payload, compresslevel=9, mtime=0))]
+    if use_brotli:
+        variants.append((path.with_name(path.name + '.br'), brotli.compress(payload, quality=11)))
+
+    for target, data in variants:
+        tmp = target.with_name(target.name + '.tmp')
+        tmp.write_bytes(data)
+        os.replace(tmp, target)
+
+
+def write_day_snapshots(cube: ClimateCube, output_dir, metrics: list = None) -> dict:
+    """
+    Render the station dictionary and one snapshot per day from a climate cube.
+
+    Args:
+        cube: Opened ClimateCube
+        output_dir: Directory to write snapshots into
+        metrics: Metrics to include (default: those of TAVG/TMAX/TMIN/PRCP in the cube)
+
+    Returns:
+        Summary with file count and total raw/gzip sizes
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    metrics = metrics or [metric for metric in SNAPSHOT_METRICS if metric in cube.metrics]
+    metric_indices = [cube.metrics.index(metric) for metric in metrics]
+
+    use_brotli = brotli is not None
+    if not use_brotli:
+        logger.warning("brotli package not installed; writing gzip pre-compressed snapshots only")
+
+    def dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+    stations = cube.stations
+    _write_compressed(output_dir / 'stations.json', dumps({
+        'version': SNAPSHOT_VERSION,
+        'count': len(stations),
+        'name': stations['name'].tolist(),
+        'city': stations['city'].tolist(),
+        'country': stations['country'].tolist(),
+        'lat': stations['lat'].tolist(),
+        'long': stations['long'].tolist(),
+    }), use_brotli)
+
+    raw_bytes = gzip_bytes = 0
+    for day_of_year in range(1, DAYS_IN_YEAR + 1):
+        day = cube.day(day_of_year=day_of_year)[:, metric_indices]
+        present = np.flatnonzero(~np.isnan(day).all(axis=1))
+        mmdd = int(DAY_OF_YEAR_TO_MMDD[day_of_year])
+
+        snapshot = {
+            'version': SNAPSHOT_VERSION,
+            'date': f'{mmdd // 100:02d}-{mmdd % 100:02d}',
+            'station': present.tolist(),
+        }
+        for position, metric in enumerate(metrics):
+            snapshot[metric] = _column(day[present, position])
+
+        payload = dumps(snapshot)
+        path = output_dir / f'{mmdd:04d}.json'
+        _write_compressed(path, payload, use_brotli)
+        raw_bytes += len(payload)
+        gzip_bytes += path.with_name(path.name + '.gz').stat().st_size
+
+    summary = {
+        'path': str(output_dir),
+        'days': DAYS_IN_YEAR,
+        'stations': len(stations),
+        'metrics': metrics,
+        'raw_bytes': raw_bytes,
+        'gzip_bytes': gzip_bytes,
+        'brotli': use_brotli,
+    }
+    logger.info(f"Wrote {DAYS_IN_YEAR} day snapshots for {len(stations):,} stations to {output_dir} "
+                f"({raw_bytes / 1024:,.0f} KB raw, {gzip_bytes / 1024:,.0f} KB gzip)")
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Render per-day snapshot files from a climate cube')
+    parser.add_argument('--cube', type=str, required=True, help='Climate cube directory (see climate_cube.py)')
+    parser.add_argument('--output', type=str, required=True, help='Directory to write snapshots into')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    write_day_snapshots(ClimateCube(args.cube), args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Local stand-in for the Nominatim /reverse endpoint.
+
+Answers reverse geocoding requests from a worldcities gazetteer (via the
+offline geocoder), with optional artificial latency and failure rate, so the
+concurrent geocoding client can be exercised end to end without touching the
+public service.
+
+Usage:
+    python fake_nominatim_server.py --gazetteer worldcities.csv --port 8088 --latency 0.3
+
+    python CleanData_MatchCities_ExpandDatesAndWeather.py --geocoder concurrent \\
+        --geocoding-endpoint http://localhost:8088 --geocoding-delay 0
+"""
+
+import argparse
+import json
+import logging
+import random
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import pandas as pd
+
+from offline_geocoder import DEFAULT_MAX_DISTANCE_KM, SphericalIndex, load_gazetteer
+
+logger = logging.getLogger(__name__)
+
+
+def make_handler(gazetteer: pd.DataFrame, latency: float = 0.0, failure_rate: float = 0.0,
+                 max_distance_km: float = DEFAULT_MAX_DISTANCE_KM):
+    """Build a request handler class bound to a gazetteer and fault settings."""
+    # Indexed once; every request is a single nearest-neighbour query
+    index = SphericalIndex(gazetteer['lat'].to_numpy(), gazetteer['long'].to_numpy())
+    places = {col: gazetteer[col].to_numpy() for col in ['city', 'state', 'country', 'suburb']}
+
+    class FakeNominatimHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urllib.parse.urlparse(self.path)
+            if url.path.rstrip('/') != '/reverse':
+                self.send_error(404)
+                return
+
+            if latency > 0:
+                time.sleep(latency)
+            if failure_rate > 0 and random.random() < failure_rate:
+                self.send_error(503, 'Simulated overload')
+                return
+
+            query = urllib.parse.parse_qs(url.query)
+            try:
+                lat = float(query['lat'][0])
+                long = float(query['lon'][0])
+            except (KeyError, ValueError):
+                self.send_error(400, 'lat and lon are required')
+                return
+
+            distances, nearest = index.query([lat], [long], max_distance_km=max_distance_km)
+
+            if np.isfinite(distances[0]) and places['city'][nearest[0]]:
+                body = {
+                    'lat': str(lat),
+                    'lon': str(long),
+                    'address': {col: values[nearest[0]] for col, values in places.items()},
+                }
+            else:
+                body = {'error': 'Unable to geocode'}
+
+            payload = json.dumps(body).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format, *args):
+            logger.debug(format % args)
+
+    return FakeNominatimHandler
+
+
+def start_server(gazetteer: pd.DataFrame, host: str = '127.0.0.1', port: int = 0,
+                 latency: float = 0.0, failure_rate: float = 0.0) -> ThreadingHTTPServer:
+    """
+    Start the fake server on a background thread.
+
+    Args:
+        gazetteer: DataFrame returned by load_gazetteer
+        port: Port to bind, or 0 to pick a free one (see server.server_address)
+
+    Returns:
+        The running server; call shutdown() to stop it
+    """
+    server = ThreadingHTTPServer((host, port), make_handler(gazetteer, latency, failure_rate))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve a fake Nominatim /reverse endpoint from a gazetteer')
+    parser.add_argument('--gazetteer', type=str, required=True, help='Gazetteer CSV (worldcities format)')
+    parser.add_argument('--host', type=str, default='127.0.0.1', help='Interface to bind')
+    parser.add_argument('--port', type=int, default=8088, help='Port to listen on')
+    parser.add_argument('--latency', type=float, default=0.0, help='Artificial response latency in seconds')
+    parser.add_argument('--failure-rate', type=float, default=0.0, help='Fraction of requests answered with HTTP 503')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    gazetteer = load_gazetteer(args.gazetteer)
+    server = ThreadingHTTPServer(
+        (args.host, args.port),
+        make_handler(gazetteer, args.latency, args.failure_rate)
+    )
+    logger.info(f"Fake Nominatim listening on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
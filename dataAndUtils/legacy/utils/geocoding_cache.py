@@ -0,0 +1,285 @@
+"""
+Persistent geocoding cache shared across runs and datasets.
+
+The geocoding journal only remembers the locations of one run, matched on
+exact 3-decimal coordinates, so a new or slightly shifted station set (another
+dataset, re-surveyed stations) re-geocodes almost everything. This cache is a
+SQLite file keyed by geohash that every run reads from and adds to:
+
+    cache = GeocodingCache(CITY_DATA_DIR / 'geocoding_cache.sqlite', max_distance_km=1.0)
+    hits, misses = cache.lookup(locations)        # hits carry the cached fields
+    ...geocode misses...
+    cache.store(geocoded_misses)
+
+A lookup is answered by the nearest cached location within max_distance_km,
+not only by an exact match. Candidates are fetched with one geohash range scan
+per neighbouring cell (the 3x3 cells around each location, at the longest
+geohash whose cells are at least max_distance_km wide at the equator) and the
+nearest is picked with the offline geocoder's spherical KD-tree. Towards the
+poles cells get narrower, so a neighbour near the edge of the radius can be
+missed there; the location is then geocoded as usual.
+
+Entries record the geocoder they came from (e.g. 'concurrent:<endpoint>') and
+CACHE_VERSION. Each source keeps its own entries, so a self-hosted or test
+server never answers for another. Lookups ignore entries from another source
+or version and entries older than the TTL, and stores evict the least recently
+used entries beyond max_entries. Failed
+geocodes (empty city) are not cached, so they are retried on the next run.
+
+SCHEMA:
+    geocodes(geohash, lat, long, city, state, country, suburb,
+             source, version, created_at, last_used), PRIMARY KEY (geohash, source)
+"""
+
+import logging
+import sqlite3
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from offline_geocoder import SphericalIndex
+
+logger = logging.getLogger(__name__)
+
+CACHE_VERSION = '1'
+GEOHASH_PRECISION = 9  # ~5 m cells: distinct 3-decimal coordinates never share a key
+GEOHASH_ALPHABET = '0123456789bcdefghjkmnpqrstuvwxyz'
+CACHED_FIELDS = ['city', 'state', 'country', 'suburb']
+
+DEFAULT_MAX_DISTANCE_KM = 1.0
+DEFAULT_TTL_DAYS = 365
+DEFAULT_MAX_ENTRIES = 1_000_000
+LOOKUP_BATCH = 500  # Prefix range scans per SQL statement
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS geocodes (
+    geohash TEXT NOT NULL,
+    lat REAL NOT NULL,
+    long REAL NOT NULL,
+    city TEXT NOT NULL,
+    state TEXT NOT NULL,
+    country TEXT NOT NULL,
+    suburb TEXT NOT NULL,
+    source TEXT NOT NULL,
+    version TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (geohash, source)
+);
+CREATE INDEX IF NOT EXISTS geocodes_last_used ON geocodes (last_used);
+"""
+
+
+def _bit_split(precision: int) -> tuple:
+    # Geohash interleaves longitude and latitude bits, longitude first
+    bits = 5 * precision
+    return (bits + 1) // 2, bits // 2
+
+
+def _cell_indices(lat, long, precision: int) -> tuple:
+    long_bits, lat_bits = _bit_split(precision)
+    lat = np.asarray(lat, dtype='float64')
+    long = np.asarray(long, dtype='float64')
+    lat_cells = np.clip(np.floor((lat + 90.0) / 180.0 * (1 << lat_bits)), 0, (1 << lat_bits) - 1)
+    long_cells = np.clip(np.floor((long + 180.0) / 360.0 * (1 << long_bits)), 0, (1 << long_bits) - 1)
+    return lat_cells.astype('int64'), long_cells.astype('int64')
+
+
+def _encode_cells(lat_cells: np.ndarray, long_cells: np.ndarray, precision: int) -> np.ndarray:
+    long_bits, lat_bits = _bit_split(precision)
+    code = np.zeros(len(lat_cells), dtype='int64')
+    for bit in range(5 * precision):
+        # Even positions (from the most significant end) take longitude bits
+        if bit % 2 == 0:
+            value = (long_cells >> (long_bits - 1 - bit // 2)) & 1
+        else:
+            value = (lat_cells >> (lat_bits - 1 - bit // 2)) & 1
+        code = (code << 1) | value
+    characters = np.array(list(GEOHASH_ALPHABET))
+    digits = [characters[(code >> (5 * (precision - 1 - i))) & 31] for i in range(precision)]
+    return np.array([''.join(chars) for chars in zip(*digits)], dtype=object)
+
+
+def geohash_encode(lat, long, precision: int = GEOHASH_PRECISION) -> np.ndarray:
+    """Geohash strings of many coordinates at once."""
+    lat_cells, long_cells = _cell_indices(lat, long, precision)
+    return _encode_cells(lat_cells, long_cells, precision)
+
+
+def geohash_neighbourhood(lat, long, precision: int) -> np.ndarray:
+    """(n, 9) geohashes of each coordinate's cell and its 8 neighbours (longitude wraps)."""
+    long_bits, lat_bits = _bit_split(precision)
+    lat_cells, long_cells = _cell_indices(lat, long, precision)
+    columns = []
+    for d_lat in (-1, 0, 1):
+        for d_long in (-1, 0, 1):
+            columns.append(_encode_cells(
+                np.clip(lat_cells + d_lat, 0, (1 << lat_bits) - 1),
+                (long_cells + d_long) % (1 << long_bits),
+                precision
+            ))
+    return np.column_stack(columns)
+
+
+def neighbourhood_precision(max_distance_km: float) -> int:
+    """Longest geohash whose cells are at least max_distance_km high and wide at the equator."""
+    km_per_degree = 111.32
+    for precision in range(GEOHASH_PRECISION, 0, -1):
+        long_bits, lat_bits = _bit_split(precision)
+        height_km = 180.0 / (1 << lat_bits) * km_per_degree
+        width_km = 360.0 / (1 << long_bits) * km_per_degree
+        if min(height_km, width_km) >= max_distance_km:
+            return precision
+    return 1
+
+
+class GeocodingCache:
+    """
+    SQLite geocoding cache with neighbourhood lookups, TTL, versioning and LRU eviction.
+
+    Args:
+        path: Cache file (created on first use)
+        source: Geocoder the entries come from; entries of other sources are ignored
+        max_distance_km: Reuse a cached location this close to the one looked up
+        ttl_days: Ignore (and prune) entries older than this
+        max_entries: Evict least recently used entries beyond this many
+    """
+
+    def __init__(self, path, source: str = 'nominatim', max_distance_km: float = DEFAULT_MAX_DISTANCE_KM,
+                 ttl_days: float = DEFAULT_TTL_DAYS, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.path = Path(path)
+        self.source = source
+        self.max_distance_km = max_distance_km
+        self.ttl_seconds = ttl_days * 86400
+        self.max_entries = max_entries
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.path, timeout=30)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self._drop_unscoped_table()
+        self.conn.executescript(_SCHEMA)
+        self.prune()
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __len__(self):
+        return self.conn.execute('SELECT count(*) FROM geocodes').fetchone()[0]
+
+    def _drop_unscoped_table(self):
+        # Caches from before entries were keyed by source: one backend's store replaced
+        # another's entry, so their sources can't be trusted
+        key = [row[1] for row in self.conn.execute('PRAGMA table_info(geocodes)') if row[5] > 0]
+        if key and 'source' not in key:
+            logger.info(f"Rebuilding geocoding cache {self.path} (entries were not keyed by source)")
+            with self.conn:
+                self.conn.execute('DROP TABLE geocodes')
+
+    def prune(self) -> int:
+        """Delete expired entries and entries written by other cache versions."""
+        with self.conn:
+            deleted = self.conn.execute(
+                'DELETE FROM geocodes WHERE created_at < ? OR version != ?',
+                (time.time() - self.ttl_seconds, CACHE_VERSION)
+            ).rowcount
+        if deleted > 0:
+            logger.info(f"Pruned {deleted:,} expired geocoding cache entries")
+        return deleted
+
+    def _candidates(self, prefixes) -> pd.DataFrame:
+        rows = []
+        prefixes = sorted(prefixes)
+        for start in range(0, len(prefixes), LOOKUP_BATCH):
+            batch = prefixes[start:start + LOOKUP_BATCH]
+            ranges = ' OR '.join(['(geohash >= ? AND geohash < ?)'] * len(batch))
+            params = [bound for prefix in batch for bound in (prefix, prefix + '~')]
+            rows.extend(self.conn.execute(
+                f'SELECT geohash, lat, long, city, state, country, suburb FROM geocodes '
+                f'WHERE source = ? AND created_at >= ? AND ({ranges})',
+                [self.source, time.time() - self.ttl_seconds] + params
+            ).fetchall())
+        return pd.DataFrame(rows, columns=['geohash', 'lat', 'long'] + CACHED_FIELDS)
+
+    def lookup(self, locations: pd.DataFrame) -> tuple:
+        """
+        Answer locations from the cache.
+
+        Args:
+            locations: DataFrame with lat/long columns
+
+        Returns:
+            Tuple of (hits, misses): hits are the located rows with city, state,
+            country and suburb filled from the nearest cached entry; misses are
+            the remaining rows, unchanged
+        """
+        if len(locations) == 0:
+            return locations.iloc[0:0].assign(**{col: '' for col in CACHED_FIELDS}), locations
+
+        lat = locations['lat'].to_numpy(dtype='float64')
+        long = locations['long'].to_numpy(dtype='float64')
+        precision = neighbourhood_precision(self.max_distance_km)
+        candidates = self._candidates(set(geohash_neighbourhood(lat, long, precision).ravel()))
+        if len(candidates) == 0:
+            logger.info(f"Geocoding cache: 0 of {len(locations):,} locations found")
+            return locations.iloc[0:0].assign(**{col: '' for col in CACHED_FIELDS}), locations
+
+        index = SphericalIndex(candidates['lat'].to_numpy(), candidates['long'].to_numpy())
+        # A hair of slack so a 3-decimal exact match is never lost to float error
+        distances, nearest = index.query(lat, long, max_distance_km=self.max_distance_km + 1e-6)
+        found = np.isfinite(distances)
+
+        hits = locations[found].copy()
+        matched = candidates.iloc[nearest[found]]
+        for col in CACHED_FIELDS:
+            hits[col] = matched[col].to_numpy()
+        with self.conn:
+            self.conn.executemany(
+                'UPDATE geocodes SET last_used = ? WHERE geohash = ? AND source = ?',
+                [(time.time(), geohash, self.source) for geohash in matched['geohash'].unique()]
+            )
+
+        exact = int((distances[found] < 1e-3).sum())
+        logger.info(f"Geocoding cache: {found.sum():,} of {len(locations):,} locations found "
+                    f"({exact:,} exact, {found.sum() - exact:,} from neighbours within "
+                    f"{self.max_distance_km:g} km)")
+        return hits, locations[~found]
+
+    def store(self, geocoded: pd.DataFrame) -> int:
+        """Add geocoded locations (failed ones, with an empty city, are skipped); returns rows stored."""
+        geocoded = geocoded[geocoded['city'].fillna('') != '']
+        if len(geocoded) == 0:
+            return 0
+        now = time.time()
+        geohashes = geohash_encode(geocoded['lat'].to_numpy(), geocoded['long'].to_numpy())
+        fields = geocoded[CACHED_FIELDS].fillna('').astype(str)
+        rows = [
+            (geohash, float(lat), float(long), *values, self.source, CACHE_VERSION, now, now)
+            for geohash, lat, long, values in zip(
+                geohashes, geocoded['lat'], geocoded['long'], fields.itertuples(index=False, name=None)
+            )
+        ]
+        with self.conn:
+            self.conn.executemany('INSERT OR REPLACE INTO geocodes VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', rows)
+        self.evict()
+        return len(rows)
+
+    def evict(self) -> int:
+        """Delete the least recently used entries beyond max_entries."""
+        excess = len(self) - self.max_entries
+        if excess <= 0:
+            return 0
+        with self.conn:
+            self.conn.execute(
+                'DELETE FROM geocodes WHERE rowid IN '
+                '(SELECT rowid FROM geocodes ORDER BY last_used LIMIT ?)',
+                (excess,)
+            )
+        logger.info(f"Evicted {excess:,} least recently used geocoding cache entries")
+        return excess
@@ -0,0 +1,152 @@
+"""
+Concurrent reverse geocoding client for Nominatim-compatible endpoints.
+
+geopy's RateLimiter sleeps for the configured delay *and then* waits for the
+response, so every request costs delay + latency. This client keeps several
+requests in flight on a thread pool and gates request starts with a shared
+token bucket instead, so network latency overlaps with the enforced delay and
+throughput approaches the provider limit (1 / geocoding_delay requests/sec).
+
+The endpoint is configurable, so the same client can talk to the public
+Nominatim service, a self-hosted instance, or fake_nominatim_server.py for
+local testing. Responses are returned as the raw JSON dict, the same shape as
+geopy's `location.raw`, so the existing extract_* helpers work unchanged.
+"""
+
+import http.client
+import json
+import logging
+import random
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ENDPOINT = 'https://nominatim.openstreetmap.org'
+DEFAULT_WORKERS = 4
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF = 2.0  # Seconds before the first retry, doubled on each attempt
+DEFAULT_TIMEOUT = 10
+
+# Status codes worth retrying; anything else is treated as a permanent failure
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+# Transport and decoding errors worth retrying (truncated bodies, dropped
+# connections, garbled responses)
+RETRYABLE_ERRORS = (
+    urllib.error.URLError, http.client.HTTPException, TimeoutError, ConnectionError,
+    json.JSONDecodeError, UnicodeDecodeError
+)
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket limiting how often requests may start.
+
+    With capacity 1 the bucket behaves like a strict minimum delay between
+    request starts, which is what Nominatim's usage policy asks for.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        if rate <= 0:
+            raise ValueError(f"Token bucket rate must be positive, got {rate}")
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then consume it."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class ConcurrentReverseGeocoder:
+    """Reverse geocode many coordinates with bounded concurrency and a shared rate limit."""
+
+    def __init__(self, endpoint: str = DEFAULT_ENDPOINT, geocoding_delay: float = 1.5,
+                 workers: int = DEFAULT_WORKERS, retries: int = DEFAULT_RETRIES,
+                 backoff: float = DEFAULT_BACKOFF, timeout: float = DEFAULT_TIMEOUT,
+                 user_agent: str = 'vaycay_weather_geocoder'):
+        self.endpoint = endpoint.rstrip('/')
+        self.workers = max(1, workers)
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.user_agent = user_agent
+        # A zero delay means "no client-side limit" (e.g. a self-hosted server)
+        self.bucket = TokenBucket(1 / geocoding_delay) if geocoding_delay > 0 else None
+
+    def _request(self, lat: float, long: float) -> dict:
+        """Issue a single reverse request and decode the JSON response."""
+        params = urllib.parse.urlencode({
+            'format': 'jsonv2',
+            'lat': lat,
+            'lon': long,
+            'addressdetails': 1,
+            'accept-language': 'en',
+        })
+        request = urllib.request.Request(
+            f"{self.endpoint}/reverse?{params}",
+            headers={'User-Agent': self.user_agent}
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            return json.loads(response.read().decode('utf-8'))
+
+    def reverse(self, lat: float, long: float) -> dict:
+        """
+        Reverse geocode one coordinate, retrying transient failures with backoff.
+
+        Any other error fails only this location, as geopy's safe_reverse did.
+
+        Returns:
+            Raw Nominatim response dict, or {} if the location could not be geocoded
+        """
+        for attempt in range(self.retries + 1):
+            if self.bucket is not None:
+                self.bucket.acquire()
+            try:
+                result = self._request(lat, long)
+                # Nominatim answers unknown places with 200 and an 'error' key
+                return result if isinstance(result, dict) and 'error' not in result else {}
+            except urllib.error.HTTPError as e:
+                if e.code not in RETRYABLE_STATUS:
+                    logger.warning(f"Error geocoding ({lat}, {long}): HTTP {e.code}")
+                    return {}
+                error = e
+            except RETRYABLE_ERRORS as e:
+                error = e
+            except Exception as e:
+                logger.warning(f"Error geocoding ({lat}, {long}): {e!r}")
+                return {}
+
+            if attempt < self.retries:
+                delay = self.backoff * (2 ** attempt) * (1 + random.random() * 0.25)
+                logger.debug(f"Retrying ({lat}, {long}) in {delay:.1f}s after: {error}")
+                time.sleep(delay)
+
+        logger.warning(f"Error geocoding ({lat}, {long}) after {self.retries + 1} attempts: {error}")
+        return {}
+
+    def reverse_many(self, coordinates) -> list:
+        """
+        Reverse geocode a sequence of (lat, long) pairs concurrently.
+
+        Returns:
+            List of raw response dicts in the same order as the input
+        """
+        coordinates = list(coordinates)
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            return list(executor.map(lambda coord: self.reverse(*coord), coordinates))
@@ -0,0 +1,162 @@
+"""
+Append-only journal for geocoding progress.
+
+The old checkpoint rewrote the full geocoding_checkpoint.csv after every batch,
+so checkpoint cost grew quadratically with the number of stations. The journal
+is a JSONL file that only ever receives the newly geocoded batch. Writes happen
+on a background thread so geocoding never waits on disk.
+
+JOURNAL FORMAT:
+    One JSON object per line:
+        {"lat": 25.333, "long": 55.517, "city": "Sharjah", "state": "Sharjah", "country": "...", "suburb": ""}
+
+    Later lines win when the same coordinate appears more than once (e.g. a
+    failed location that was retried on resume).
+"""
+
+import json
+import logging
+import os
+import queue
+import threading
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_COLUMNS = ['lat', 'long', 'city', 'state', 'country', 'suburb']
+
+_STOP = object()
+
+
+class GeocodingJournal:
+    """
+    Background writer appending geocoded batches to a JSONL journal.
+
+    Usage:
+        with GeocodingJournal(path) as journal:
+            journal.append(batch)
+    """
+
+    def __init__(self, path, truncate: bool = False):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if truncate and self.path.exists():
+            self.path.unlink()
+        self.queue = queue.Queue()
+        self.error = None
+        self.rows_written = 0
+        self.thread = threading.Thread(target=self._run, name='geocoding-journal', daemon=True)
+        self.thread.start()
+
+    def _run(self):
+        """Writer loop: serialize queued batches and append them to the journal."""
+        with open(self.path, 'a', encoding='utf-8') as f:
+            while True:
+                batch = self.queue.get()
+                if batch is _STOP:
+                    break
+                try:
+                    lines = batch.to_json(orient='records', lines=True, force_ascii=False)
+                    f.write(lines if lines.endswith('\n') else lines + '\n')
+                    f.flush()
+                    os.fsync(f.fileno())
+                    self.rows_written += len(batch)
+                except Exception as e:
+                    self.error = e
+                    logger.error(f"Failed to write geocoding journal batch: {e}")
+
+    def append(self, batch: pd.DataFrame):
+        """Queue a batch of geocoded locations for writing."""
+        if self.error is not None:
+            raise IOError(f"Geocoding journal writer failed: {self.error}")
+        if len(batch) == 0:
+            return
+        cols = [col for col in JOURNAL_COLUMNS if col in batch.columns]
+        self.queue.put(batch[cols].copy())
+
+    def close(self):
+        """Flush all queued batches and stop the writer thread."""
+        self.queue.put(_STOP)
+        self.thread.join()
+        if self.error is not None:
+            raise IOError(f"Geocoding journal writer failed: {self.error}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def replay_journal(path) -> Optional[pd.DataFrame]:
+    """
+    Rebuild the geocoded location table from a journal.
+
+    A truncated final line (from a crash mid-write) is skipped rather than
+    failing the whole resume.
+
+    Args:
+        path: Journal path
+
+    Returns:
+        DataFrame with one row per coordinate, or None if there is no journal
+    """
+    path = Path(path)
+    if not path.exists():
+        return None
+
+    records = []
+    with open(path, encoding='utf-8') as f:
+        for line_number, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                logger.warning(f"Skipping unreadable journal line {line_number} in {path}")
+
+    df = pd.DataFrame.from_records(records, columns=JOURNAL_COLUMNS)
+    df = df.drop_duplicates(subset=['lat', 'long'], keep='last').reset_index(drop=True)
+    # Match the old CSV round trip: empty fields come back as missing, so failed
+    # locations are picked up again on resume.
+    text_cols = ['city', 'state', 'country', 'suburb']
+    df[text_cols] = df[text_cols].replace('', np.nan)
+    return df
+
+
+def seed_journal(path, df: pd.DataFrame):
+    """Write an existing checkpoint into a fresh journal (one-time migration)."""
+    with GeocodingJournal(path, truncate=True) as journal:
+        journal.append(df)
+
+
+def compact_journal(path, output_path) -> pd.DataFrame:
+    """
+    Collapse the journal to one row per coordinate and write the final location table.
+
+    The journal itself is rewritten atomically in compacted form.
+
+    Args:
+        path: Journal path
+        output_path: Where to write ALL_location_specific_data.csv
+
+    Returns:
+        The compacted location table
+    """
+    df = replay_journal(path)
+    if df is None:
+        raise FileNotFoundError(f"No geocoding journal found at: {path}")
+
+    df.to_csv(output_path, index=False)
+
+    compacted_path = Path(path).with_suffix('.compacting')
+    df.to_json(compacted_path, orient='records', lines=True, force_ascii=False)
+    os.replace(compacted_path, path)
+
+    logger.info(f"Compacted geocoding journal to {len(df):,} locations: {output_path}")
+    return df
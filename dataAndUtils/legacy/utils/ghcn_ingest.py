@@ -0,0 +1,301 @@
+"""
+Build the pipeline's averaged input from raw GHCN-Daily station files.
+
+AVERAGED_weather_station_data_ALL.csv (one row per station, data type and
+calendar day, holding the mean of that day's value over several years; the
+per-year value2016..value2020 columns it was averaged from are still visible
+in weather_data/INTERMEDIATE_10.0k_population_Italy_aigen.csv) used to come
+from an undocumented step outside this repo. This stage rebuilds it from the
+NOAA GHCN-Daily distribution:
+
+    ghcnd_all/*.dly (or ghcnd_all.tar.gz)   one fixed-width file per station
+    ghcnd-stations.txt                      station coordinates and names
+
+.DLY FORMAT (one line per station, year, month and element, 269 characters):
+    ID 1-11, YEAR 12-15, MONTH 16-17, ELEMENT 18-21, then 31 times
+    VALUE (5, -9999 = missing), MFLAG (1), QFLAG (1), SFLAG (1)
+
+Each file is parsed as a whole: its bytes are viewed as an (n_lines, 269)
+uint8 matrix with np.frombuffer and every field is sliced out of it column-wise,
+so there is no per-line Python. Values with a non-blank QFLAG (failed a NOAA
+quality check) are dropped, the remaining values of the selected years are
+summed and counted per station, element and MMDD with np.bincount, and each
+file reduces to at most 366 rows per element before the next one is read.
+Files are averaged on a process pool with a bounded number in flight and
+written in input order, so memory stays flat however many stations there are.
+
+OUTPUT (see CleanData_MatchCities_ExpandDatesAndWeather.py):
+    id,date,data_type,lat,long,name,AVG
+    ITM00016239,101,TAVG,41.7831,12.5831,ROMA CIAMPINO,75.8
+
+    AVG stays in GHCN units (tenths of a degree C, tenths of a mm); the
+    cleaning pipeline converts them.
+
+Usage:
+    python ghcn_ingest.py --dly ghcnd_all --stations ghcnd-stations.txt \\
+        --output ../../uncleaned_data/AVERAGED_weather_station_data_ALL.csv --workers 8
+    python ghcn_ingest.py --dly ghcnd_all.tar.gz --stations ghcnd-stations.txt --start-year 2011 --end-year 2020
+"""
+
+import argparse
+import logging
+import os
+import tarfile
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+OUTPUT_COLUMNS = ['id', 'date', 'data_type', 'lat', 'long', 'name', 'AVG']
+DEFAULT_ELEMENTS = ['PRCP', 'TAVG', 'TMAX', 'TMIN']
+DEFAULT_START_YEAR = 2016
+DEFAULT_END_YEAR = 2020
+
+DLY_LINE_BYTES = 269
+DLY_VALUES_OFFSET = 21
+DLY_DAY_BYTES = 8  # VALUE(5) MFLAG(1) QFLAG(1) SFLAG(1)
+DAYS_PER_MONTH = 31
+MISSING_VALUE = -9999
+IN_FLIGHT_PER_WORKER = 4  # Files queued per worker; bounds memory when the writer falls behind
+
+# ghcnd-stations.txt columns (0-based, end exclusive)
+STATION_COLSPECS = [(0, 11), (12, 20), (21, 30), (41, 71)]
+STATION_NAMES = ['id', 'lat', 'long', 'name']
+
+_DIGIT_WEIGHTS = np.array([10000, 1000, 100, 10, 1], dtype='int32')
+# Days of each month in a leap year: the 31 slots of a line past the month's end
+# are never output, so Feb 29 is kept and there is no Feb 30 or Apr 31
+_DAYS_IN_MONTH = np.array([31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])
+
+
+def read_station_metadata(stations_path) -> pd.DataFrame:
+    """Station id, lat, long and name from ghcnd-stations.txt, indexed by id."""
+    stations = pd.read_fwf(stations_path, colspecs=STATION_COLSPECS, names=STATION_NAMES,
+                           dtype={'id': 'str', 'name': 'str'}, keep_default_na=False)
+    stations['name'] = stations['name'].str.strip()
+    logger.info(f"Loaded metadata for {len(stations):,} stations from {stations_path}")
+    return stations.drop_duplicates(subset='id').set_index('id')
+
+
+def dly_matrix(data: bytes) -> np.ndarray:
+    """View a .dly file as an (n_lines, 269) uint8 matrix."""
+    stride = DLY_LINE_BYTES + 1
+    if len(data) % stride == 0 and data[DLY_LINE_BYTES::stride] == b'\n' * (len(data) // stride):
+        # Canonical layout: fixed-width lines with \n, no copy
+        return np.frombuffer(data, dtype='uint8').reshape(-1, stride)[:, :DLY_LINE_BYTES]
+    # CRLF line ends or trimmed trailing blanks: pad every line to the full width
+    lines = np.array(data.splitlines(), dtype=f'S{DLY_LINE_BYTES}')
+    matrix = np.frombuffer(lines.tobytes(), dtype='uint8').reshape(-1, DLY_LINE_BYTES).copy()
+    matrix[matrix == 0] = ord(' ')
+    return matrix
+
+
+def _parse_digits(chars: np.ndarray) -> np.ndarray:
+    digits = chars.astype('int32') - ord('0')
+    return np.where((digits >= 0) & (digits <= 9), digits, 0)
+
+
+def parse_dly(data: bytes) -> dict:
+    """
+    Parse all lines of a .dly file at once.
+
+    Returns:
+        Dict of arrays: id (S11), year, month, element (S4) per line, and
+        value (int32) and qflag (uint8) per line and day, shape (n_lines, 31)
+    """
+    matrix = dly_matrix(data)
+    days = matrix[:, DLY_VALUES_OFFSET:DLY_VALUES_OFFSET + DAYS_PER_MONTH * DLY_DAY_BYTES]
+    days = days.reshape(len(matrix), DAYS_PER_MONTH, DLY_DAY_BYTES)
+
+    value_chars = days[:, :, :5]
+    magnitude = _parse_digits(value_chars) @ _DIGIT_WEIGHTS
+    negative = (value_chars == ord('-')).any(axis=2)
+    return {
+        'id': np.ascontiguousarray(matrix[:, 0:11]).view('S11').ravel(),
+        'year': _parse_digits(matrix[:, 11:15]) @ _DIGIT_WEIGHTS[1:],
+        'month': _parse_digits(matrix[:, 15:17]) @ _DIGIT_WEIGHTS[3:],
+        'element': np.ascontiguousarray(matrix[:, 17:21]).view('S4').ravel(),
+        'value': np.where(negative, -magnitude, magnitude),
+        'qflag': days[:, :, 6],
+    }
+
+
+def average_dly(data: bytes, elements=DEFAULT_ELEMENTS, start_year: int = DEFAULT_START_YEAR,
+                end_year: int = DEFAULT_END_YEAR, keep_flagged: bool = False, min_years: int = 1) -> tuple:
+    """
+    Per-MMDD multi-year averages of one .dly file.
+
+    Args:
+        data: File contents
+        elements: Elements (data types) to keep
+        start_year, end_year: Years averaged (inclusive)
+        keep_flagged: Keep values that failed a quality check (non-blank QFLAG)
+        min_years: Minimum number of years with a value for a day to be output
+
+    Returns:
+        Tuple of (DataFrame with id, date (MMDD int), data_type, AVG sorted by id,
+        date and data_type; dict with values used and rejected by QFLAG)
+    """
+    elements = list(elements)
+    parsed = parse_dly(data)
+    lines = (
+        np.isin(parsed['element'], np.array(elements, dtype='S4'))
+        & (parsed['year'] >= start_year) & (parsed['year'] <= end_year)
+        & (parsed['month'] >= 1) & (parsed['month'] <= 12)
+    )
+    station_ids, station = np.unique(parsed['id'][lines], return_inverse=True)
+    element = np.searchsorted(np.array(sorted(elements), dtype='S4'), parsed['element'][lines])
+    month = parsed['month'][lines] - 1
+    values = parsed['value'][lines]
+    qflag = parsed['qflag'][lines]
+
+    present = (values != MISSING_VALUE) & (np.arange(DAYS_PER_MONTH) < _DAYS_IN_MONTH[month][:, None])
+    passed = (qflag == ord(' ')) | keep_flagged
+    valid = present & passed
+    stats = {'values': int(valid.sum()), 'rejected_qflag': int((present & ~passed).sum())}
+
+    # Flat (station, element, month, day) cell of every valid value
+    n_elements = len(elements)
+    cell = ((station * n_elements + element) * 12 + month)[:, None] * DAYS_PER_MONTH + np.arange(DAYS_PER_MONTH)
+    n_cells = len(station_ids) * n_elements * 12 * DAYS_PER_MONTH
+    sums = np.bincount(cell[valid], weights=values[valid], minlength=n_cells)
+    counts = np.bincount(cell[valid], minlength=n_cells)
+
+    output = np.flatnonzero(counts >= max(min_years, 1))
+    rest, day = np.divmod(output, DAYS_PER_MONTH)
+    rest, month = np.divmod(rest, 12)
+    station, element = np.divmod(rest, n_elements)
+    averages = pd.DataFrame({
+        'id': station_ids.astype(str)[station],
+        'date': ((month + 1) * 100 + day + 1).astype('int32'),
+        'data_type': np.array(sorted(elements))[element],
+        'AVG': sums[output] / counts[output],
+    })
+    return averages.sort_values(['id', 'date', 'data_type'], kind='stable', ignore_index=True), stats
+
+
+def iter_dly_sources(dly_path):
+    """Yield (name, path or bytes) for every .dly file in a directory or tar archive, sorted by name."""
+    dly_path = Path(dly_path)
+    if dly_path.is_dir():
+        for path in sorted(dly_path.glob('*.dly')):
+            yield path.name, path
+        return
+    with tarfile.open(dly_path, 'r:*') as archive:
+        # Streaming read: members come in archive order, one at a time
+        for member in archive:
+            if member.isfile() and member.name.endswith('.dly'):
+                yield Path(member.name).name, archive.extractfile(member).read()
+
+
+def _average_source(task) -> tuple:
+    (name, source), options = task
+    data = source.read_bytes() if isinstance(source, Path) else source
+    return (name,) + average_dly(data, **options)
+
+
+def _bounded_map(func, tasks, workers: int):
+    # Like executor.map, in order, but only workers * IN_FLIGHT_PER_WORKER tasks
+    # are submitted ahead of the consumer
+    if workers <= 1:
+        yield from map(func, tasks)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for task in tasks:
+            pending.append(executor.submit(func, task))
+            if len(pending) >= workers * IN_FLIGHT_PER_WORKER:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def ingest_ghcn(dly_path, stations_path, output_path, workers: int = 1, elements=DEFAULT_ELEMENTS,
+                start_year: int = DEFAULT_START_YEAR, end_year: int = DEFAULT_END_YEAR,
+                keep_flagged: bool = False, min_years: int = 1) -> dict:
+    """
+    Average every .dly file into the pipeline's input CSV.
+
+    Args:
+        dly_path: Directory of .dly files or a tar archive of them
+        stations_path: ghcnd-stations.txt
+        output_path: Averaged CSV to write (replaced atomically)
+        workers: Processes parsing files in parallel
+        elements, start_year, end_year, keep_flagged, min_years: See average_dly
+
+    Returns:
+        Dict with files, stations and rows written, values used, values
+        rejected by QFLAG and stations skipped for missing metadata
+    """
+    start_time = time.time()
+    metadata = read_station_metadata(stations_path)
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = output_path.with_name(output_path.name + '.tmp')
+
+    options = {'elements': list(elements), 'start_year': start_year, 'end_year': end_year,
+               'keep_flagged': keep_flagged, 'min_years': min_years}
+    tasks = ((source, options) for source in iter_dly_sources(dly_path))
+    totals = {'files': 0, 'stations': 0, 'rows': 0, 'values': 0, 'rejected_qflag': 0,
+              'stations_without_metadata': 0}
+    with open(temp_path, 'w', newline='') as f:
+        f.write(','.join(OUTPUT_COLUMNS) + '\n')
+        for name, averages, stats in _bounded_map(_average_source, tasks, workers):
+            totals['files'] += 1
+            totals['values'] += stats['values']
+            totals['rejected_qflag'] += stats['rejected_qflag']
+
+            known = averages['id'].isin(metadata.index)
+            if not known.all():
+                missing = averages.loc[~known, 'id'].unique()
+                totals['stations_without_metadata'] += len(missing)
+                logger.warning(f"{name}: no metadata for {', '.join(missing)}, skipping")
+                averages = averages[known]
+            if len(averages) == 0:
+                continue
+
+            station_info = metadata.loc[averages['id'], ['lat', 'long', 'name']].reset_index(drop=True)
+            averages = pd.concat([averages.reset_index(drop=True), station_info], axis=1)
+            averages[OUTPUT_COLUMNS].to_csv(f, header=False, index=False)
+            totals['stations'] += averages['id'].nunique()
+            totals['rows'] += len(averages)
+
+            if totals['files'] % 10_000 == 0:
+                logger.info(f"Averaged {totals['files']:,} files ({totals['rows']:,} rows)")
+    os.replace(temp_path, output_path)
+
+    elapsed = time.time() - start_time
+    logger.info(f"Averaged {totals['files']:,} files from {start_year}-{end_year} into {totals['rows']:,} rows "
+                f"for {totals['stations']:,} stations in {elapsed:.1f}s "
+                f"({totals['files'] / elapsed if elapsed > 0 else 0:,.0f} files/sec)")
+    logger.info(f"Used {totals['values']:,} daily values, rejected {totals['rejected_qflag']:,} by quality flag")
+    logger.info(f"Saved averaged input to: {output_path}")
+    return totals
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Average GHCN-Daily .dly files into the pipeline input CSV')
+    parser.add_argument('--dly', type=str, required=True, help='Directory of .dly files or a tar archive (ghcnd_all.tar.gz)')
+    parser.add_argument('--stations', type=str, required=True, help='ghcnd-stations.txt')
+    parser.add_argument('--output', type=str, default='AVERAGED_weather_station_data_ALL.csv', help='Output CSV')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='Parallel parsing processes')
+    parser.add_argument('--elements', nargs='+', default=DEFAULT_ELEMENTS, help='Elements (data types) to keep')
+    parser.add_argument('--start-year', type=int, default=DEFAULT_START_YEAR, help='First year averaged')
+    parser.add_argument('--end-year', type=int, default=DEFAULT_END_YEAR, help='Last year averaged')
+    parser.add_argument('--min-years', type=int, default=1, help='Years with a value needed to output a day')
+    parser.add_argument('--keep-flagged', action='store_true', help='Keep values that failed a quality check')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    ingest_ghcn(args.dly, args.stations, args.output, workers=args.workers, elements=args.elements,
+                start_year=args.start_year, end_year=args.end_year,
+                keep_flagged=args.keep_flagged, min_years=args.min_years)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,321 @@
+"""
+Station-level incremental reprocessing for the weather pipeline.
+
+Every run records a station manifest next to the outputs:
+
+    <output_dir>/station_manifest.csv   id, hash, rows, name, lat, long, country
+
+`hash` is an order-independent content hash of the station's prepared input
+rows (date, data_type, lat/long rounded to 3 decimals, name, value). On an
+--incremental run the input is hashed again chunk by chunk and compared with
+the manifest; only stations that are new or whose hash changed are geocoded,
+merged and pivoted, and their output rows are patched into the existing
+outputs. Stations that disappeared from the input are deleted.
+
+Output rows carry no station id, so they are identified by the (name, lat,
+long) key the pivot groups on. When several ids share a key, all of them are
+recomputed together.
+
+The hashes only cover the input. After changing the geocoder, gazetteer or the
+cleaning rules, run the pipeline once without --incremental.
+"""
+
+import logging
+import os
+import shutil
+import tempfile
+import urllib.parse
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from climatology_smoothing import FILLED_SUFFIX
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = 'station_manifest.csv'
+MANIFEST_COLUMNS = ['id', 'hash', 'rows', 'name', 'lat', 'long', 'country']
+# Prepared input columns that feed a station's content hash
+HASHED_COLUMNS = ['date', 'data_type', 'lat', 'long', 'name', 'value']
+# Columns identifying a station's rows in the cleaned output
+OUTPUT_KEY = ['name', 'lat', 'long']
+OUTPUT_TEXT_COLUMNS = ['city', 'country', 'state', 'suburb', 'date', 'name']
+
+
+def hash_station_records(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Hash prepared weather records per station id.
+
+    Row hashes are summed (mod 2**64) per id, so the result does not depend on
+    row order and partial results from several chunks can be combined with
+    combine_station_hashes.
+
+    Args:
+        df: Prepared records (output of prepare_weather_records, before or after merging)
+
+    Returns:
+        DataFrame with id, hash, rows, name, lat, long (one row per id)
+    """
+    hashed = df[HASHED_COLUMNS].copy()
+    hashed['lat'] = hashed['lat'].round(3)
+    hashed['long'] = hashed['long'].round(3)
+    row_hashes = pd.util.hash_pandas_object(hashed, index=False).to_numpy()
+
+    codes, ids = pd.factorize(df['id'], sort=True)
+    sums = np.zeros(len(ids), dtype='uint64')
+    np.add.at(sums, codes, row_hashes)
+    _, first_rows = np.unique(codes, return_index=True)
+
+    return pd.DataFrame({
+        'id': ids,
+        'hash': sums,
+        'rows': np.bincount(codes, minlength=len(ids)),
+        'name': df['name'].to_numpy()[first_rows],
+        'lat': hashed['lat'].to_numpy()[first_rows],
+        'long': hashed['long'].to_numpy()[first_rows],
+    })
+
+
+def combine_station_hashes(parts: list) -> pd.DataFrame:
+    """Combine per-chunk hash_station_records results (ids may span chunks)."""
+    parts = [part for part in parts if len(part) > 0]
+    if not parts:
+        return pd.DataFrame(columns=['id', 'hash', 'rows', 'name', 'lat', 'long'])
+    combined = pd.concat(parts, ignore_index=True)
+    if not combined['id'].duplicated().any():
+        return combined.sort_values('id', ignore_index=True)
+
+    codes, ids = pd.factorize(combined['id'], sort=True)
+    sums = np.zeros(len(ids), dtype='uint64')
+    np.add.at(sums, codes, combined['hash'].to_numpy(dtype='uint64'))
+    _, first_rows = np.unique(codes, return_index=True)
+    result = combined.iloc[first_rows].reset_index(drop=True)
+    result['id'] = ids
+    result['hash'] = sums
+    result['rows'] = np.bincount(codes, weights=combined['rows'].to_numpy(), minlength=len(ids)).astype('int64')
+    return result
+
+
+def station_countries(df_merged: pd.DataFrame) -> pd.Series:
+    """Country of each station id in merged records (used to target Parquet partitions)."""
+    return df_merged.groupby('id', sort=False, observed=True)['country'].first()
+
+
+def attach_countries(manifest: pd.DataFrame, countries: pd.Series, previous: pd.DataFrame = None) -> pd.DataFrame:
+    """
+    Fill the manifest's country column from a station id -> country Series.
+
+    Stations missing from `countries` (not recomputed in an incremental run)
+    keep their country from the previous manifest.
+    """
+    manifest = manifest.copy()
+    looked_up = manifest['id'].map(countries)
+    if previous is not None:
+        looked_up = looked_up.fillna(manifest['id'].map(previous.set_index('id')['country']))
+    manifest['country'] = looked_up.fillna('')
+    return manifest
+
+
+def load_manifest(path) -> pd.DataFrame:
+    """Load a station manifest, or return None if there is none."""
+    path = Path(path)
+    if not path.exists():
+        return None
+    manifest = pd.read_csv(
+        path,
+        dtype={'id': 'str', 'hash': 'str', 'name': 'str', 'country': 'str'},
+        keep_default_na=False,
+        na_values={'lat': [''], 'long': ['']}
+    )
+    manifest['hash'] = manifest['hash'].map(lambda value: int(value, 16)).astype('uint64')
+    return manifest
+
+
+def save_manifest(manifest: pd.DataFrame, path):
+    """Write the station manifest atomically (hashes as hex strings)."""
+    path = Path(path)
+    manifest = manifest.reindex(columns=MANIFEST_COLUMNS).copy()
+    manifest['hash'] = [f'{value:016x}' for value in manifest['hash'].to_numpy(dtype='uint64')]
+    manifest['country'] = manifest['country'].fillna('')
+    tmp_path = path.with_name(path.name + '.tmp')
+    manifest.to_csv(tmp_path, index=False)
+    os.replace(tmp_path, path)
+    logger.info(f"Saved station manifest ({len(manifest):,} stations) to: {path}")
+
+
+def output_keys(df: pd.DataFrame) -> pd.MultiIndex:
+    """Normalized (name, lat, long) keys of output or manifest rows."""
+    return pd.MultiIndex.from_arrays([
+        df['name'].astype(str).to_numpy(),
+        df['lat'].to_numpy(dtype='float64').round(3),
+        df['long'].to_numpy(dtype='float64').round(3),
+    ], names=OUTPUT_KEY)
+
+
+def diff_manifests(old: pd.DataFrame, new: pd.DataFrame) -> dict:
+    """
+    Compare the previous manifest with the current input's station hashes.
+
+    Returns:
+        Dict with the added, changed and removed id lists, the ids to recompute
+        (added, changed and any id sharing an output key with a stale one), and
+        stale_keys: a DataFrame of output keys whose rows must be replaced, and
+        stale_countries: the countries those rows were written under
+    """
+    old_hashes = pd.Series(old['hash'].to_numpy(), index=old['id'])
+    new_hashes = pd.Series(new['hash'].to_numpy(), index=new['id'])
+
+    added = new_hashes.index.difference(old_hashes.index)
+    removed = old_hashes.index.difference(new_hashes.index)
+    common = new_hashes.index.intersection(old_hashes.index)
+    changed = common[new_hashes[common].to_numpy() != old_hashes[common].to_numpy()]
+
+    touched = added.union(changed).union(removed)
+    stale = pd.concat([old[old['id'].isin(touched)], new[new['id'].isin(touched)]], ignore_index=True)
+    stale_keys = output_keys(stale).unique()
+
+    # Output rows are keyed by (name, lat, long), not by id
+    recompute = new.loc[output_keys(new).isin(stale_keys), 'id']
+
+    return {
+        'added': added.tolist(),
+        'changed': changed.tolist(),
+        'removed': removed.tolist(),
+        'recompute_ids': recompute.tolist(),
+        'stale_keys': stale_keys.to_frame(index=False),
+        'stale_countries': sorted(set(old.loc[output_keys(old).isin(stale_keys), 'country'].fillna(''))),
+    }
+
+
+def read_cleaned_csv_chunks(csv_path, chunk_rows: int):
+    """Read the cleaned CSV back in chunks without turning '' or 'NA' text into NaN."""
+    header = pd.read_csv(csv_path, nrows=0).columns
+    flags = [col for col in header if col.endswith(FILLED_SUFFIX)]
+    numeric = [col for col in header if col not in OUTPUT_TEXT_COLUMNS and col not in flags]
+    # float32 like the pipeline's own frames, so rewritten rows serialize identically
+    dtypes = {col: 'str' for col in OUTPUT_TEXT_COLUMNS if col in header}
+    dtypes.update({col: 'float32' for col in numeric})
+    dtypes.update({col: 'bool' for col in flags})
+    return pd.read_csv(
+        csv_path,
+        chunksize=chunk_rows,
+        keep_default_na=False,
+        na_values={col: [''] for col in numeric},
+        dtype=dtypes
+    )
+
+
+def patch_csv_output(csv_path, patch: pd.DataFrame, stale_keys: pd.DataFrame, chunk_rows: int,
+                     on_chunk=None) -> list:
+    """
+    Rewrite the cleaned CSV without the stale stations' rows, then append the patch.
+
+    The file is streamed chunk by chunk into a temporary file and swapped into
+    place, so memory stays bounded and readers never see a partial file.
+
+    Args:
+        csv_path: Cleaned CSV to patch
+        patch: Recomputed rows for the stale stations
+        stale_keys: (name, lat, long) keys whose existing rows are dropped
+        chunk_rows: Rows per chunk while streaming the existing file
+        on_chunk: Optional callable receiving every kept or appended chunk (for
+                  JSON output and summary statistics)
+
+    Returns:
+        Output column order
+    """
+    csv_path = Path(csv_path)
+    stale_index = output_keys(stale_keys)
+    columns = list(pd.read_csv(csv_path, nrows=0).columns)
+    columns += [col for col in patch.columns if col not in columns]
+
+    tmp_path = csv_path.with_name(csv_path.name + '.tmp')
+    kept = dropped = 0
+    with open(tmp_path, 'w', encoding='utf-8', newline='') as out:
+        out.write(','.join(columns) + '\n')
+        for chunk in read_cleaned_csv_chunks(csv_path, chunk_rows):
+            stale = output_keys(chunk).isin(stale_index)
+            chunk = chunk[~stale].reindex(columns=columns)
+            dropped += int(stale.sum())
+            kept += len(chunk)
+            chunk.to_csv(out, header=False, index=False)
+            if on_chunk is not None:
+                on_chunk(chunk)
+        patch = patch.reindex(columns=columns)
+        patch.to_csv(out, header=False, index=False)
+        if on_chunk is not None:
+            on_chunk(patch)
+    os.replace(tmp_path, csv_path)
+
+    logger.info(f"Patched CSV {csv_path}: kept {kept:,} rows, replaced {dropped:,} with {len(patch):,}")
+    return columns
+
+
+def _country_partition_dirs(dataset_path: Path, countries: set) -> list:
+    """Partition directories (country=<name>, URI-encoded on disk) for the given countries."""
+    dirs = []
+    for child in dataset_path.iterdir():
+        name = urllib.parse.unquote(child.name)
+        if child.is_dir() and name.startswith('country=') and name[len('country='):] in countries:
+            dirs.append(child)
+    return dirs
+
+
+def patch_parquet_dataset(dataset_path, patch: pd.DataFrame, stale_keys: pd.DataFrame,
+                          stale_countries: list) -> list:
+    """
+    Rewrite only the country partitions touched by the stale or recomputed stations.
+
+    The new partitions are written to a temporary directory next to the dataset
+    and swapped in with os.replace once the write has succeeded; the old ones are
+    only deleted after that, so a failed or killed run leaves them in place.
+
+    Args:
+        dataset_path: Partitioned dataset written by parquet_output.write_parquet_dataset
+        patch: Recomputed rows for the stale stations
+        stale_keys: (name, lat, long) keys whose existing rows are dropped
+        stale_countries: Countries the stale stations were previously written under
+
+    Returns:
+        Manifest entries of the rewritten files
+    """
+    import pyarrow.dataset as ds
+
+    from parquet_output import write_parquet_dataset
+
+    dataset_path = Path(dataset_path)
+    countries = set(stale_countries) | set(patch['country'].dropna().astype(str))
+    stale_index = output_keys(stale_keys)
+
+    frames = [patch]
+    partition_dirs = _country_partition_dirs(dataset_path, countries)
+    if partition_dirs:
+        dataset = ds.dataset(dataset_path, format='parquet', partitioning='hive')
+        existing = dataset.to_table(filter=ds.field('country').isin(sorted(countries))).to_pandas()
+        existing = existing.drop(columns=['month'])
+        for col in existing.columns:
+            if isinstance(existing[col].dtype, pd.CategoricalDtype):
+                existing[col] = existing[col].astype(object)
+        frames.insert(0, existing[~output_keys(existing).isin(stale_index)])
+
+    rewritten = pd.concat(frames, ignore_index=True)
+
+    staging_path = Path(tempfile.mkdtemp(prefix=f'.{dataset_path.name}.patch-', dir=dataset_path.parent))
+    try:
+        manifest = []
+        if len(rewritten) > 0:
+            manifest = write_parquet_dataset(rewritten, staging_path, overwrite=False)
+
+        # Move the old partitions aside, then the new ones in (renames on the same filesystem)
+        replaced_path = Path(tempfile.mkdtemp(prefix=f'.{dataset_path.name}.replaced-', dir=dataset_path.parent))
+        for partition_dir in partition_dirs:
+            os.replace(partition_dir, replaced_path / partition_dir.name)
+        for partition_dir in staging_path.iterdir():
+            os.replace(partition_dir, dataset_path / partition_dir.name)
+        shutil.rmtree(replaced_path)
+    finally:
+        shutil.rmtree(staging_path, ignore_errors=True)
+    logger.info(f"Patched Parquet dataset {dataset_path}: rewrote {len(countries)} countries "
+                f"({len(rewritten):,} rows)")
+    return manifest
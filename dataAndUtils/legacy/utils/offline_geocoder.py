@@ -0,0 +1,177 @@
+"""
+Offline reverse geocoding against a local gazetteer.
+
+Instead of one rate-limited Nominatim request per weather station, every station
+is matched to its nearest gazetteer entry in a single vectorized query against a
+KD-tree built on the unit sphere. Coordinates are converted to 3D unit vectors,
+so the straight-line (chord) distance in the tree maps exactly onto great-circle
+distance and there is no distortion near the poles or the antimeridian.
+
+GAZETTEER FORMAT:
+    The worldcities CSV that utils.import_to_db loads into `cities_population`:
+        city,city_ascii,lat,lng,country,iso2,iso3,admin_name,capital,population,id
+
+    `long` is accepted in place of `lng`, and an optional `suburb` column is used
+    when present (worldcities itself has no suburb level, so it is left empty).
+
+OUTPUT:
+    Same columns as the Nominatim path writes to geocoding_checkpoint.csv:
+        lat, long, city, state, country, suburb
+"""
+
+import logging
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from scipy.spatial import cKDTree
+
+logger = logging.getLogger(__name__)
+
+EARTH_RADIUS_KM = 6371.0088
+
+# Stations further than this from any gazetteer entry are treated as failed
+# geocodes (open ocean, polar stations, ...), mirroring an empty Nominatim answer.
+DEFAULT_MAX_DISTANCE_KM = 50.0
+
+GEOCODED_COLUMNS = ['lat', 'long', 'city', 'state', 'country', 'suburb']
+
+
+def to_unit_vectors(lat, long) -> np.ndarray:
+    """Convert decimal-degree coordinates to an (n, 3) array of unit vectors."""
+    lat_rad = np.radians(np.asarray(lat, dtype='float64'))
+    long_rad = np.radians(np.asarray(long, dtype='float64'))
+    cos_lat = np.cos(lat_rad)
+    return np.column_stack([
+        cos_lat * np.cos(long_rad),
+        cos_lat * np.sin(long_rad),
+        np.sin(lat_rad),
+    ])
+
+
+def chord_to_km(chord) -> np.ndarray:
+    """Convert unit-sphere chord length to great-circle distance in km."""
+    chord = np.clip(np.asarray(chord, dtype='float64'), 0.0, 2.0)
+    return 2.0 * EARTH_RADIUS_KM * np.arcsin(chord / 2.0)
+
+
+def km_to_chord(distance_km: float) -> float:
+    """Convert great-circle distance in km to unit-sphere chord length."""
+    angle = min(distance_km / EARTH_RADIUS_KM, np.pi)
+    return float(2.0 * np.sin(angle / 2.0))
+
+
+class SphericalIndex:
+    """
+    Nearest-neighbour index over lat/long points on the sphere.
+
+    Thin wrapper around scipy's cKDTree that takes and returns geographic
+    quantities (degrees in, kilometres out).
+    """
+
+    def __init__(self, lat, long):
+        self.size = len(lat)
+        self.tree = cKDTree(to_unit_vectors(lat, long))
+
+    def query(self, lat, long, k: int = 1, max_distance_km: float = np.inf):
+        """
+        Find the k nearest indexed points for every query coordinate.
+
+        Args:
+            lat: Query latitudes (decimal degrees)
+            long: Query longitudes (decimal degrees)
+            k: Number of neighbours to return
+            max_distance_km: Neighbours further away than this are not returned
+
+        Returns:
+            Tuple of (distances_km, indices). Missing neighbours have an infinite
+            distance and an index equal to the index size, as in cKDTree.
+        """
+        upper_bound = km_to_chord(max_distance_km) if np.isfinite(max_distance_km) else np.inf
+        chord, indices = self.tree.query(
+            to_unit_vectors(lat, long),
+            k=k,
+            distance_upper_bound=upper_bound,
+            workers=-1
+        )
+        distances = np.full(chord.shape, np.inf)
+        found = np.isfinite(chord)
+        distances[found] = chord_to_km(chord[found])
+        return distances, indices
+
+    def query_pairs(self, max_distance_km: float) -> np.ndarray:
+        """Return an (n, 2) array of index pairs closer than max_distance_km."""
+        return self.tree.query_pairs(km_to_chord(max_distance_km), output_type='ndarray')
+
+
+def load_gazetteer(gazetteer_path: str) -> pd.DataFrame:
+    """
+    Load a worldcities-style gazetteer and normalise its columns.
+
+    Args:
+        gazetteer_path: Path to the gazetteer CSV
+
+    Returns:
+        DataFrame with lat, long, city, state, country, suburb columns
+    """
+    path = Path(gazetteer_path)
+    if not path.exists():
+        raise FileNotFoundError(f"Gazetteer file not found: {gazetteer_path}")
+
+    gazetteer = pd.read_csv(path, keep_default_na=False, na_values=[''])
+    gazetteer = gazetteer.rename(columns={'lng': 'long', 'admin_name': 'state'})
+
+    missing_cols = [col for col in ['lat', 'long', 'city', 'country'] if col not in gazetteer.columns]
+    if missing_cols:
+        raise ValueError(f"Gazetteer missing required columns: {missing_cols}")
+
+    for col in ['state', 'suburb']:
+        if col not in gazetteer.columns:
+            gazetteer[col] = ''
+
+    gazetteer = gazetteer.dropna(subset=['lat', 'long', 'city']).reset_index(drop=True)
+    for col in ['city', 'state', 'country', 'suburb']:
+        gazetteer[col] = gazetteer[col].fillna('').astype(str)
+
+    logger.info(f"Loaded gazetteer with {len(gazetteer):,} places from {path}")
+    return gazetteer
+
+
+def reverse_geocode_offline(unique_locs: pd.DataFrame, gazetteer: pd.DataFrame,
+                            max_distance_km: float = DEFAULT_MAX_DISTANCE_KM) -> pd.DataFrame:
+    """
+    Assign city, state, country and suburb to every location in one query.
+
+    Args:
+        unique_locs: DataFrame with lat/long columns
+        gazetteer: DataFrame returned by load_gazetteer
+        max_distance_km: Locations with no place within this distance get empty fields
+
+    Returns:
+        DataFrame with lat, long, city, state, country, suburb columns
+    """
+    logger.info(f"Offline geocoding {len(unique_locs):,} locations against {len(gazetteer):,} places...")
+
+    index = SphericalIndex(gazetteer['lat'].to_numpy(), gazetteer['long'].to_numpy())
+    distances, nearest = index.query(
+        unique_locs['lat'].to_numpy(),
+        unique_locs['long'].to_numpy(),
+        max_distance_km=max_distance_km
+    )
+
+    matched = np.isfinite(distances)
+    # Out-of-range rows point one past the end; clamp them and blank the fields below.
+    nearest = np.where(matched, nearest, 0)
+
+    result = unique_locs[['lat', 'long']].reset_index(drop=True)
+    for col in ['city', 'state', 'country', 'suburb']:
+        values = gazetteer[col].to_numpy()[nearest]
+        result[col] = np.where(matched, values, '')
+
+    unmatched = int((~matched).sum())
+    if unmatched > 0:
+        logger.warning(f"{unmatched:,} locations have no place within {max_distance_km:g} km")
+    if matched.any():
+        logger.info(f"Median distance to matched place: {np.median(distances[matched]):.1f} km")
+
+    return result[GEOCODED_COLUMNS]
@@ -0,0 +1,171 @@
+"""
+Process-pool execution of the per-station pipeline stages.
+
+Everything after geocoding (merge, pivot, cleaning, quality checks) only ever
+combines rows of the same rounded station location, so the records can be cut
+into independent shards and processed on all cores:
+
+    shard_ids = plan_shards(df_weather, geocoded_data, n_shards)
+    with ShardedExecutor(workers, context=geocoded_data) as executor:
+        results = executor.map(clean_shard, [df_weather[shard_ids == i] for i in ...])
+
+Shards are cut from locations ordered by (country, lat, long), so each one is
+a contiguous region, and balanced by row count so one large country does not
+serialize the run.
+
+Frames travel as Arrow IPC files in a shared-memory directory (/dev/shm when
+available) instead of pickles: the parent writes each shard once and workers
+memory-map it. The context frame (the geocoded locations) is loaded once per
+worker process rather than once per task.
+"""
+
+import logging
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from fast_pivot import factorize_keys
+
+logger = logging.getLogger(__name__)
+
+SHARDS_PER_WORKER = 4  # More shards than workers keeps the pool busy when shard costs differ
+SHARED_MEMORY_DIR = Path('/dev/shm')
+
+# Context frame loaded by each worker process (see ShardedExecutor)
+_worker_context = None
+
+
+def write_frame(df: pd.DataFrame, path):
+    """Write a DataFrame as an Arrow IPC file."""
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    with pa.OSFile(str(path), 'wb') as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
+
+def read_frame(path) -> pd.DataFrame:
+    """Memory-map an Arrow IPC file and convert it to a DataFrame."""
+    with pa.memory_map(str(path)) as source:
+        return pa.ipc.open_file(source).read_all().to_pandas()
+
+
+def plan_shards(df_weather: pd.DataFrame, geocoded_data: pd.DataFrame, n_shards: int) -> np.ndarray:
+    """
+    Assign every record to a shard so that no rounded location is split.
+
+    Args:
+        df_weather: Prepared weather records with lat/long
+        geocoded_data: Geocoded locations (used to group shards by country)
+        n_shards: Number of shards
+
+    Returns:
+        int32 shard id per record
+    """
+    locations = pd.DataFrame({
+        'lat': df_weather['lat'].round(3).to_numpy(),
+        'long': df_weather['long'].round(3).to_numpy(),
+    })
+    location_codes = factorize_keys(locations, ['lat', 'long'])
+    _, first_rows = np.unique(location_codes, return_index=True)
+    unique_locs = locations.iloc[first_rows].reset_index(drop=True)
+
+    countries = geocoded_data[['lat', 'long', 'country']].copy()
+    countries['lat'] = countries['lat'].round(3).astype(unique_locs['lat'].dtype)
+    countries['long'] = countries['long'].round(3).astype(unique_locs['long'].dtype)
+    countries = countries.drop_duplicates(subset=['lat', 'long'])
+    unique_locs = unique_locs.merge(countries, on=['lat', 'long'], how='left')
+    unique_locs['country'] = unique_locs['country'].fillna('').astype(str)
+
+    # Walk locations in (country, lat, long) order and cut at equal row counts
+    order = np.lexsort((unique_locs['long'].to_numpy(), unique_locs['lat'].to_numpy(),
+                        unique_locs['country'].to_numpy()))
+    rows = np.bincount(location_codes, minlength=len(unique_locs))[order]
+    cumulative = np.cumsum(rows) - rows
+    shard_of_loc = np.empty(len(unique_locs), dtype='int32')
+    shard_of_loc[order] = np.minimum(cumulative * n_shards // max(1, len(df_weather)), n_shards - 1)
+    return shard_of_loc[location_codes]
+
+
+def _init_worker(context_path):
+    global _worker_context
+    _worker_context = read_frame(context_path) if context_path is not None else None
+
+
+def _run_task(func, shard_path, result_path, kwargs):
+    df = read_frame(shard_path)
+    result, extra = func(df, _worker_context, **kwargs)
+    write_frame(result, result_path)
+    return extra
+
+
+class ShardedExecutor:
+    """
+    ProcessPoolExecutor that exchanges DataFrames as shared-memory Arrow files.
+
+    Args:
+        workers: Number of worker processes
+        context: Optional DataFrame every task needs (loaded once per worker)
+    """
+
+    def __init__(self, workers: int, context: pd.DataFrame = None):
+        base_dir = SHARED_MEMORY_DIR if SHARED_MEMORY_DIR.is_dir() else None
+        self.work_dir = Path(tempfile.mkdtemp(prefix='weather_shards_', dir=base_dir))
+        context_path = None
+        if context is not None:
+            context_path = self.work_dir / 'context.arrow'
+            write_frame(context, context_path)
+        self.workers = workers
+        self.pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(context_path,))
+        self._batch = 0
+
+    def map(self, func, shards: list, shard_kwargs: list = None, **kwargs) -> list:
+        """
+        Run func(shard_df, context_df, **kwargs) on every shard.
+
+        func must be a module-level function returning (DataFrame, extra); the
+        DataFrames come back through Arrow files, `extra` is pickled.
+
+        Args:
+            func: Shard function
+            shards: DataFrames to process; the list is emptied as shards are written
+            shard_kwargs: Optional per-shard keyword arguments
+            **kwargs: Keyword arguments passed to every call
+
+        Returns:
+            List of (DataFrame, extra) in shard order
+        """
+        self._batch += 1
+        futures = []
+        for index in range(len(shards)):
+            shard_path = self.work_dir / f'batch{self._batch}_shard{index}.arrow'
+            result_path = self.work_dir / f'batch{self._batch}_result{index}.arrow'
+            write_frame(shards[index], shard_path)
+            shards[index] = None  # Release the parent's copy once it is in shared memory
+            task_kwargs = dict(kwargs, **(shard_kwargs[index] if shard_kwargs else {}))
+            futures.append((self.pool.submit(_run_task, func, shard_path, result_path, task_kwargs),
+                            shard_path, result_path))
+
+        results = []
+        for future, shard_path, result_path in futures:
+            extra = future.result()
+            results.append((read_frame(result_path), extra))
+            os.remove(shard_path)
+            os.remove(result_path)
+        return results
+
+    def close(self):
+        self.pool.shutdown(wait=True, cancel_futures=True)
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+        return False
@@ -0,0 +1,132 @@
+"""
+Partitioned Parquet output for the cleaned weather data.
+
+Writes a Hive-partitioned dataset (country=<name>/month=<MM>/part-*.parquet) so
+consumers can read only the countries, months and columns they need instead of
+parsing one giant CSV or JSON file:
+
+    import pyarrow.dataset as ds
+    italy_july = ds.dataset(path, partitioning='hive').to_table(
+        columns=['city', 'date', 'TAVG'],
+        filter=(ds.field('country') == 'Italy') & (ds.field('month') == 7)
+    )
+
+Metric columns are stored as float32, repeated strings (city, name, ...) are
+dictionary-encoded, and every row group carries min/max statistics.
+"""
+
+import logging
+import shutil
+import urllib.parse
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+
+logger = logging.getLogger(__name__)
+
+PARTITION_COLUMNS = ['country', 'month']
+STRING_COLUMNS = ['city', 'state', 'suburb', 'name', 'date']
+ROW_GROUP_SIZE = 128 * 1024
+
+
+def to_arrow_table(df) -> pa.Table:
+    """Convert a cleaned DataFrame to an Arrow table with compact column types."""
+    table = pa.Table.from_pandas(df, preserve_index=False)
+
+    columns = {}
+    for field in table.schema:
+        column = table.column(field.name)
+        if field.name in STRING_COLUMNS or field.name == 'country':
+            column = column.cast(pa.string())
+            if field.name in STRING_COLUMNS:
+                column = pc.dictionary_encode(column)
+        elif field.name in ('lat', 'long'):
+            # Coordinates are rounded to 3 decimals; keep them exact in float64
+            column = pc.round(column.cast(pa.float64()), 3)
+        elif pa.types.is_floating(field.type) or pa.types.is_integer(field.type):
+            column = column.cast(pa.float32())
+        columns[field.name] = column
+
+    # Month partition key from the ISO date ('2020-07-14' -> 7)
+    dates = table.column('date').cast(pa.string())
+    columns['month'] = pc.cast(pc.utf8_slice_codeunits(dates, 5, 7), pa.int8())
+    return pa.table(columns)
+
+
+def write_parquet_dataset(df, dataset_dir, basename_template: str = 'part-{i}.parquet',
+                          overwrite: bool = True) -> list:
+    """
+    Write cleaned rows into the partitioned dataset.
+
+    Args:
+        df: Cleaned weather DataFrame (output of pivot_and_clean_data)
+        dataset_dir: Root directory of the dataset
+        basename_template: File name pattern; use a unique one per call when
+                           appending several chunks to the same dataset
+        overwrite: Replace partitions touched by this write (False appends files)
+
+    Returns:
+        Manifest entries, one per written file: partition values, path, rows,
+        row groups and size in bytes
+    """
+    dataset_dir = Path(dataset_dir)
+    table = to_arrow_table(df)
+    written = []
+
+    ds.write_dataset(
+        table,
+        dataset_dir,
+        format='parquet',
+        partitioning=PARTITION_COLUMNS,
+        partitioning_flavor='hive',
+        basename_template=basename_template,
+        existing_data_behavior='delete_matching' if overwrite else 'overwrite_or_ignore',
+        max_rows_per_group=ROW_GROUP_SIZE,
+        min_rows_per_group=min(ROW_GROUP_SIZE, max(1, len(df))),
+        file_options=ds.ParquetFileFormat().make_write_options(
+            compression='zstd',
+            write_statistics=True
+        ),
+        file_visitor=written.append
+    )
+
+    manifest = []
+    for written_file in written:
+        path = Path(written_file.path)
+        # Partition directory names are URI-encoded by pyarrow
+        partition = dict(
+            urllib.parse.unquote(part).split('=', 1)
+            for part in path.relative_to(dataset_dir).parent.parts
+        )
+        metadata = written_file.metadata
+        manifest.append({
+            'country': partition.get('country', ''),
+            'month': int(partition['month']) if partition.get('month') else None,
+            'path': str(path.relative_to(dataset_dir)),
+            'rows': metadata.num_rows,
+            'row_groups': metadata.num_row_groups,
+            'bytes': path.stat().st_size,
+        })
+
+    logger.info(f"Wrote {len(df):,} rows to {len(manifest)} Parquet files under {dataset_dir}")
+    return manifest
+
+
+def reset_dataset(dataset_dir):
+    """Remove a previous dataset so partitions that no longer exist don't linger."""
+    dataset_dir = Path(dataset_dir)
+    if dataset_dir.exists():
+        shutil.rmtree(dataset_dir)
+
+
+def summarize_manifest(dataset_dir, manifest: list) -> dict:
+    """Build the processing_summary.json entry describing the dataset."""
+    return {
+        'path': str(dataset_dir),
+        'partitioning': PARTITION_COLUMNS,
+        'total_rows': sum(entry['rows'] for entry in manifest),
+        'total_bytes': sum(entry['bytes'] for entry in manifest),
+        'files': sorted(manifest, key=lambda entry: (entry['country'], entry['month'] or 0, entry['path'])),
+    }
@@ -0,0 +1,219 @@
+"""
+Per-stage instrumentation for the weather cleaning pipeline.
+
+Wrap each step in a stage to record wall time, CPU time (this process and
+finished worker processes), peak RSS and row counts:
+
+    metrics = PipelineMetrics(profile='cprofile', profile_dir=output_dir / 'profiles')
+    with metrics.stage('pivot', rows_in=len(df_filled)) as stage:
+        df_cleaned = pivot_and_clean_data(df_filled)
+        stage.rows_out = len(df_cleaned)
+    metrics.write(output_dir / 'pipeline_metrics.json')
+
+A stage entered several times (once per chunk in --streaming mode) accumulates
+into one entry. Peak RSS is per stage on Linux, where the kernel's high-water
+mark can be reset; elsewhere it is the process peak so far.
+
+With profiling enabled, each stage gets its own profiler, dumped on write():
+cProfile as <NN>_<stage>.prof plus a text summary, pyinstrument (if installed)
+as HTML and text.
+"""
+
+import cProfile
+import io
+import json
+import logging
+import pstats
+import resource
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+PROFILERS = ['cprofile', 'pyinstrument']
+PROFILE_SUMMARY_LINES = 40
+
+
+def reset_peak_rss() -> bool:
+    """Reset the kernel's RSS high-water mark (Linux only); returns whether it worked."""
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+        return True
+    except OSError:
+        return False
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB (since the last reset on Linux)."""
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes on Linux
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def _children_cpu_seconds() -> float:
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+class StageRecord:
+    """Handle yielded by PipelineMetrics.stage; set rows_out (and rows_in) on it."""
+
+    def __init__(self, name: str, rows_in: int = None):
+        self.name = name
+        self.rows_in = rows_in
+        self.rows_out = None
+
+
+class PipelineMetrics:
+    """
+    Collects per-stage timings and resource usage.
+
+    Args:
+        profile: None, 'cprofile' or 'pyinstrument'
+        profile_dir: Where write() dumps the per-stage profiles
+    """
+
+    def __init__(self, profile: str = None, profile_dir=None):
+        if profile == 'pyinstrument':
+            try:
+                import pyinstrument  # noqa: F401
+            except ImportError:
+                logger.warning("pyinstrument is not installed, profiling with cProfile instead")
+                profile = 'cprofile'
+        self.profile = profile
+        self.profile_dir = Path(profile_dir) if profile_dir else None
+        self.started = datetime.now()
+        self._start_time = time.perf_counter()
+        self.stages = {}
+        self._profilers = {}
+
+    def _profiler(self, name: str):
+        if name not in self._profilers:
+            if self.profile == 'pyinstrument':
+                import pyinstrument
+                self._profilers[name] = pyinstrument.Profiler()
+            else:
+                self._profilers[name] = cProfile.Profile()
+        return self._profilers[name]
+
+    @contextmanager
+    def stage(self, name: str, rows_in: int = None):
+        """Time a pipeline stage; yields a StageRecord for row counts."""
+        record = StageRecord(name, rows_in)
+        reset_peak_rss()
+        profiler = self._profiler(name) if self.profile else None
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        children_start = _children_cpu_seconds()
+        if profiler is not None:
+            profiler.start() if self.profile == 'pyinstrument' else profiler.enable()
+        try:
+            yield record
+        finally:
+            if profiler is not None:
+                profiler.stop() if self.profile == 'pyinstrument' else profiler.disable()
+            self._add(
+                record,
+                wall=time.perf_counter() - wall_start,
+                cpu=time.process_time() - cpu_start,
+                children_cpu=_children_cpu_seconds() - children_start,
+                peak_rss=peak_rss_mb()
+            )
+
+    def _add(self, record: StageRecord, wall: float, cpu: float, children_cpu: float, peak_rss: float):
+        entry = self.stages.setdefault(record.name, {
+            'stage': record.name,
+            'calls': 0,
+            'wall_seconds': 0.0,
+            'cpu_seconds': 0.0,
+            'children_cpu_seconds': 0.0,
+            'peak_rss_mb': 0.0,
+            'rows_in': None,
+            'rows_out': None,
+        })
+        entry['calls'] += 1
+        entry['wall_seconds'] += wall
+        entry['cpu_seconds'] += cpu
+        entry['children_cpu_seconds'] += children_cpu
+        entry['peak_rss_mb'] = max(entry['peak_rss_mb'], peak_rss)
+        for key, value in (('rows_in', record.rows_in), ('rows_out', record.rows_out)):
+            if value is not None:
+                entry[key] = (entry[key] or 0) + int(value)
+
+        rows = record.rows_in if record.rows_in is not None else record.rows_out
+        rate = f", {rows / wall:,.0f} rows/sec" if rows and wall > 0 else ""
+        logger.debug(f"[{record.name}] {wall:.2f}s wall, {cpu:.2f}s CPU, peak RSS {peak_rss:,.0f} MB{rate}")
+
+    def iterate(self, name: str, iterable):
+        """Yield from iterable, timing each step (e.g. reading one chunk) as a call of stage `name`."""
+        iterator = iter(iterable)
+        done = object()
+        while True:
+            with self.stage(name) as record:
+                item = next(iterator, done)
+                if item is not done and hasattr(item, '__len__'):
+                    record.rows_out = len(item)
+            if item is done:
+                return
+            yield item
+
+    def report(self) -> dict:
+        """Metrics in the pipeline_metrics.json layout."""
+        stages = []
+        for entry in self.stages.values():
+            entry = dict(entry)
+            rows = entry['rows_in'] if entry['rows_in'] is not None else entry['rows_out']
+            entry['rows_per_second'] = round(rows / entry['wall_seconds']) if rows and entry['wall_seconds'] > 0 else None
+            for key in ('wall_seconds', 'cpu_seconds', 'children_cpu_seconds', 'peak_rss_mb'):
+                entry[key] = round(entry[key], 3)
+            stages.append(entry)
+        return {
+            'started': self.started.isoformat(),
+            'total_wall_seconds': round(time.perf_counter() - self._start_time, 3),
+            'command': sys.argv,
+            'stages': stages,
+        }
+
+    def write(self, path):
+        """Write pipeline_metrics.json and dump any stage profiles."""
+        report = self.report()
+        for entry in report['stages']:
+            rate = f", {entry['rows_per_second']:,} rows/sec" if entry['rows_per_second'] else ""
+            logger.info(f"[{entry['stage']}] {entry['calls']} call(s), {entry['wall_seconds']:.2f}s wall, "
+                        f"{entry['cpu_seconds'] + entry['children_cpu_seconds']:.2f}s CPU, "
+                        f"peak RSS {entry['peak_rss_mb']:,.0f} MB{rate}")
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(report, f, indent=2)
+        logger.info(f"Saved pipeline metrics to: {path}")
+
+        if self.profile and self._profilers:
+            self._dump_profiles()
+
+    def _dump_profiles(self):
+        profile_dir = self.profile_dir or Path('profiles')
+        profile_dir.mkdir(parents=True, exist_ok=True)
+        for number, (name, profiler) in enumerate(self._profilers.items(), start=1):
+            stem = profile_dir / f'{number:02d}_{name}'
+            if self.profile == 'pyinstrument':
+                stem.with_suffix('.html').write_text(profiler.output_html())
+                stem.with_suffix('.txt').write_text(profiler.output_text())
+            else:
+                profiler.dump_stats(stem.with_suffix('.prof'))
+                summary = io.StringIO()
+                pstats.Stats(profiler, stream=summary).sort_stats('cumulative').print_stats(PROFILE_SUMMARY_LINES)
+                stem.with_suffix('.txt').write_text(summary.getvalue())
+        logger.info(f"Saved {len(self._profilers)} stage profiles to: {profile_dir}")
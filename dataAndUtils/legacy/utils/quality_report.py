@@ -0,0 +1,297 @@
+"""
+Single-pass, mergeable data-quality report for the cleaned weather output.
+
+validate_data and the processing summary used to make a dozen full passes over
+a materialized frame (duplicated, isnull().sum(), nunique, min/max,
+value_counts, extreme-temperature checks). QualityReport accumulates all of
+them chunk by chunk in one pass, and two reports built on different chunks or
+worker shards merge into the report of the combined rows:
+
+    report = QualityReport()
+    for chunk in chunks:
+        report.update(chunk)          # or: report.merge(report_from_worker)
+    report.log_validation()
+    summary = report.summary()        # processing_summary.json fields
+
+Per-chunk aggregates:
+    - records, per-column value and null counts (completeness)
+    - min/max per column (dates, coordinates, metrics)
+    - distinct cities and countries: exact hash sets that fold into a
+      HyperLogLog sketch once they outgrow DISTINCT_EXACT_LIMIT
+    - duplicate (city, country, lat, long, date) keys: 64-bit key hashes kept
+      as sorted runs, so a key repeated in a later chunk or another worker's
+      shard is still counted
+    - records per country (top countries) and extreme temperatures
+"""
+
+import logging
+from collections import Counter
+from datetime import datetime
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+DUPLICATE_KEY = ['city', 'country', 'lat', 'long', 'date']
+TEMPERATURE_COLUMNS = ['TMAX', 'TMIN', 'TAVG']
+EXTREME_TEMPERATURE_RANGE = (-90, 60)  # °C
+HLL_PRECISION = 14  # 16,384 registers, ~0.8% standard error
+DISTINCT_EXACT_LIMIT = 50_000  # Distinct values counted exactly before switching to the sketch
+MAX_KEY_RUNS = 8  # Sorted key-hash runs kept before they are compacted into one
+TOP_COUNTRIES = 10
+
+
+def hash_values(values: pd.Series) -> np.ndarray:
+    """64-bit hashes of the non-null values of a column."""
+    values = values.dropna()
+    return pd.util.hash_pandas_object(values.astype(str), index=False).to_numpy()
+
+
+def _bit_length(values: np.ndarray) -> np.ndarray:
+    # Exact for uint64: split into 32-bit halves, which float64 represents exactly
+    high = (values >> np.uint64(32)).astype('float64')
+    low = (values & np.uint64(0xFFFFFFFF)).astype('float64')
+    return np.where(high > 0, 32 + np.frexp(high)[1], np.frexp(low)[1])
+
+
+class HyperLogLog:
+    """HyperLogLog cardinality sketch over 64-bit hashes; merging takes the register maximum."""
+
+    def __init__(self, precision: int = HLL_PRECISION):
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype='uint8')
+
+    def add_hashes(self, hashes: np.ndarray):
+        hashes = np.asarray(hashes, dtype='uint64')
+        if len(hashes) == 0:
+            return
+        suffix_bits = 64 - self.precision
+        index = (hashes >> np.uint64(suffix_bits)).astype('int64')
+        suffix = hashes & np.uint64((1 << suffix_bits) - 1)
+        # Position of the leftmost 1 bit in the suffix
+        rank = (suffix_bits - _bit_length(suffix) + 1).astype('uint8')
+        np.maximum.at(self.registers, index, rank)
+
+    def merge(self, other: 'HyperLogLog'):
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def estimate(self) -> float:
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype('int64')))
+        empty = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * m and empty > 0:
+            return m * np.log(m / empty)  # Linear counting for small cardinalities
+        return raw
+
+
+class DistinctCounter:
+    """Distinct-value counter: exact up to exact_limit values, a HyperLogLog sketch beyond."""
+
+    def __init__(self, exact_limit: int = DISTINCT_EXACT_LIMIT):
+        self.exact_limit = exact_limit
+        self.hashes = set()
+        self.sketch = None
+
+    def add_hashes(self, hashes: np.ndarray):
+        if self.sketch is not None:
+            self.sketch.add_hashes(hashes)
+            return
+        self.hashes.update(np.unique(hashes).tolist())
+        if len(self.hashes) > self.exact_limit:
+            self.sketch = HyperLogLog()
+            self.sketch.add_hashes(np.fromiter(self.hashes, dtype='uint64', count=len(self.hashes)))
+            self.hashes = set()
+
+    def merge(self, other: 'DistinctCounter'):
+        if other.sketch is not None:
+            if self.sketch is None:
+                self.sketch = HyperLogLog(other.sketch.precision)
+                self.sketch.add_hashes(np.fromiter(self.hashes, dtype='uint64', count=len(self.hashes)))
+                self.hashes = set()
+            self.sketch.merge(other.sketch)
+        else:
+            self.add_hashes(np.fromiter(other.hashes, dtype='uint64', count=len(other.hashes)))
+
+    def count(self) -> int:
+        return int(round(self.sketch.estimate())) if self.sketch is not None else len(self.hashes)
+
+    @property
+    def exact(self) -> bool:
+        return self.sketch is None
+
+
+class KeyHashSet:
+    """Set of 64-bit key hashes kept as disjoint sorted runs; counts keys that were already present."""
+
+    def __init__(self):
+        self.runs = []
+
+    def _present(self, hashes: np.ndarray) -> np.ndarray:
+        seen = np.zeros(len(hashes), dtype=bool)
+        for run in self.runs:
+            positions = np.minimum(np.searchsorted(run, hashes), len(run) - 1)
+            seen |= run[positions] == hashes
+        return seen
+
+    def add(self, hashes: np.ndarray) -> int:
+        """Add key hashes; returns how many of them are repeats (within the batch or of earlier keys)."""
+        hashes = np.asarray(hashes, dtype='uint64')
+        unique = np.unique(hashes)
+        seen = self._present(unique)
+        repeats = len(hashes) - len(unique) + int(seen.sum())
+        if not seen.all():
+            self.runs.append(unique[~seen])
+        if len(self.runs) > MAX_KEY_RUNS:
+            self.runs = [np.sort(np.concatenate(self.runs))]
+        return repeats
+
+    def merge(self, other: 'KeyHashSet') -> int:
+        """Merge another set; returns how many of its keys were already present here."""
+        if not other.runs:
+            return 0
+        return self.add(np.concatenate(other.runs))
+
+    def __len__(self):
+        return sum(len(run) for run in self.runs)
+
+
+class QualityReport:
+    """
+    Mergeable quality statistics over cleaned weather rows.
+
+    Args:
+        track_duplicates: Keep key hashes for the duplicate count (8 bytes per
+                          distinct key); off for summaries that do not need it
+        columns: Expected columns, fixing their order in the completeness report
+    """
+
+    def __init__(self, track_duplicates: bool = True, columns: list = None):
+        self.total_records = 0
+        self.columns = list(columns or [])
+        self.rows_seen = Counter()
+        self.nulls = Counter()
+        self.minimums = {}
+        self.maximums = {}
+        self.cities = DistinctCounter()
+        self.countries = DistinctCounter()
+        self.country_records = Counter()
+        self.extreme_temperatures = Counter()
+        self.duplicates = 0
+        self.keys = KeyHashSet() if track_duplicates else None
+
+    def _add_column(self, col: str):
+        if col not in self.columns:
+            self.columns.append(col)
+
+    def _add_range(self, col: str, low, high):
+        if low is None or (isinstance(low, float) and np.isnan(low)):
+            return
+        self.minimums[col] = low if col not in self.minimums else min(self.minimums[col], low)
+        self.maximums[col] = high if col not in self.maximums else max(self.maximums[col], high)
+
+    def update(self, df: pd.DataFrame):
+        """Add one chunk of cleaned rows."""
+        if len(df) == 0:
+            for col in df.columns:
+                self._add_column(col)
+            return
+        self.total_records += len(df)
+        null_counts = df.isna().sum()
+        for col in df.columns:
+            self._add_column(col)
+            self.rows_seen[col] += len(df)
+            self.nulls[col] += int(null_counts[col])
+            values = df[col]
+            if col in ('city', 'country', 'state', 'suburb', 'name') or int(null_counts[col]) == len(df):
+                continue
+            self._add_range(col, values.min(), values.max())
+
+        if 'city' in df.columns:
+            self.cities.add_hashes(hash_values(df['city']))
+        if 'country' in df.columns:
+            self.countries.add_hashes(hash_values(df['country']))
+            self.country_records.update(df['country'].value_counts().to_dict())
+        for col in TEMPERATURE_COLUMNS:
+            if col in df.columns:
+                low, high = EXTREME_TEMPERATURE_RANGE
+                self.extreme_temperatures[col] += int(((df[col] < low) | (df[col] > high)).sum())
+        if self.keys is not None and all(col in df.columns for col in DUPLICATE_KEY):
+            key_hashes = pd.util.hash_pandas_object(df[DUPLICATE_KEY], index=False).to_numpy()
+            self.duplicates += self.keys.add(key_hashes)
+
+    def merge(self, other: 'QualityReport') -> 'QualityReport':
+        """Fold in a report built on other rows (another chunk or worker shard)."""
+        self.total_records += other.total_records
+        for col in other.columns:
+            self._add_column(col)
+        self.rows_seen.update(other.rows_seen)
+        self.nulls.update(other.nulls)
+        for col in other.minimums:
+            self._add_range(col, other.minimums[col], other.maximums[col])
+        self.cities.merge(other.cities)
+        self.countries.merge(other.countries)
+        self.country_records.update(other.country_records)
+        self.extreme_temperatures.update(other.extreme_temperatures)
+        self.duplicates += other.duplicates
+        if self.keys is not None and other.keys is not None:
+            self.duplicates += self.keys.merge(other.keys)
+        return self
+
+    def completeness(self) -> dict:
+        """Percentage of non-null values per column; rows of chunks without a column count as null."""
+        if self.total_records == 0:
+            return {col: 0.0 for col in self.columns}
+        return {
+            col: 100.0 * (1 - (self.nulls[col] + self.total_records - self.rows_seen[col]) / self.total_records)
+            for col in self.columns
+        }
+
+    @property
+    def temperature_range(self) -> Optional[tuple]:
+        return (self.minimums['TAVG'], self.maximums['TAVG']) if 'TAVG' in self.minimums else None
+
+    def summary(self) -> dict:
+        """Summary in the processing_summary.json layout."""
+        summary = {
+            'total_records': int(self.total_records),
+            'unique_cities': self.cities.count(),
+            'unique_countries': self.countries.count(),
+            'date_range': {
+                'min': self.minimums.get('date'),
+                'max': self.maximums.get('date')
+            },
+            'processing_timestamp': datetime.now().isoformat()
+        }
+        if not (self.cities.exact and self.countries.exact):
+            summary['unique_counts_estimated'] = True
+        return summary
+
+    def log_validation(self):
+        """Log the checks validate_data reports."""
+        logger.info("\n=== Data Validation ===")
+
+        if self.keys is not None and self.duplicates > 0:
+            logger.warning(f"Found {self.duplicates:,} duplicate records")
+        for col, count in self.extreme_temperatures.items():
+            if count > 0:
+                logger.warning(f"Found {count} extreme {col} values (< -90°C or > 60°C)")
+
+        logger.info("Data completeness by column:")
+        for col, pct in self.completeness().items():
+            logger.info(f"  {col}: {pct:.1f}%")
+
+        estimated = '' if self.cities.exact and self.countries.exact else ' (estimated)'
+        logger.info("\nGeographic coverage:")
+        logger.info(f"  Unique countries: {self.countries.count()}{estimated}")
+        logger.info(f"  Unique cities: {self.cities.count()}{estimated}")
+        if 'lat' in self.minimums:
+            logger.info(f"  Latitude range: {self.minimums['lat']:.2f} to {self.maximums['lat']:.2f}")
+        if 'long' in self.minimums:
+            logger.info(f"  Longitude range: {self.minimums['long']:.2f} to {self.maximums['long']:.2f}")
+
+        logger.info("\nTop 10 countries by record count:")
+        for country, count in self.country_records.most_common(TOP_COUNTRIES):
+            logger.info(f"  {country}: {count:,}")
@@ -1,16 +1,17 @@
-import pandas as pd
+from station_catalog import load_station_catalog
 
 filename = '/Users/ashlenlaurakurre/Documents/GitHub/vaycay_v2/uncleaned_data/AVERAGED_weather_station_data_ALL.csv'
 
-# Load the data (removing the limit of 50 rows)
-train = pd.read_csv(filename)
+# Station index of the file: scans only the station columns once, then reuses
+# the cached <file>.stations.parquet until the file changes
+stations = load_station_catalog(filename)
 
-num_rows = len(train)
+num_rows = int(stations['rows'].sum())
 # Print the number of rows
 print(f"Number of rows: {num_rows}")
 
 # Get all unique names in the 'name' column
-unique_names = train['name'].unique()
+unique_names = stations['name'].unique()
 
 
 
@@ -19,4 +20,4 @@ print("Unique station names:")
 print(unique_names)
 
 # Optional: print the number of unique names as well
-print(f"Number of unique station names: {len(unique_names)}")
\ No newline at end of file
+print(f"Number of unique station names: {len(unique_names)}")
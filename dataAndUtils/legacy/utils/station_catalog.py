@@ -0,0 +1,205 @@
+"""
+Station catalog of a raw weather input file, cached in a sidecar index.
+
+Listing the stations in the averaged input (readdatatemp.py) used to mean
+reading the whole multi-GB CSV with default pandas settings. Here only the
+id, name, lat, long and data_type columns are scanned, with pyarrow's
+multithreaded CSV reader in blocks, and reduced to one row per station:
+
+    id, name, lat, long, rows, data_types
+    IT000000000, STATION 0, 43.096, 11.236, 1464, "PRCP,TAVG,TMAX,TMIN"
+
+The result is written next to the input as <input>.stations.parquet, tagged
+with the input's size and modification time. Later calls (the pipeline's
+--streaming metadata scan, ad-hoc inspection) reuse it as long as the input
+is unchanged and rescan it otherwise.
+
+Usage:
+    python station_catalog.py --input AVERAGED_weather_station_data_ALL.csv
+    python station_catalog.py --input AVERAGED_weather_station_data_ALL.csv --names --output stations.csv
+"""
+
+import argparse
+import logging
+import os
+import time
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+
+logger = logging.getLogger(__name__)
+
+CATALOG_SUFFIX = '.stations.parquet'
+CATALOG_VERSION = '1'
+STATION_COLUMNS = ['id', 'name', 'lat', 'long']
+SCAN_COLUMN_TYPES = {
+    'id': pa.string(),
+    'name': pa.string(),
+    'lat': pa.float64(),
+    'long': pa.float64(),
+    'data_type': pa.string(),
+}
+SCAN_BLOCK_BYTES = 64 * 1024 * 1024
+
+
+def catalog_path_for(input_csv, cache_dir=None) -> Path:
+    """Sidecar path of an input's catalog (next to the input unless cache_dir is given)."""
+    input_path = Path(input_csv)
+    directory = Path(cache_dir) if cache_dir else input_path.parent
+    return directory / (input_path.name + CATALOG_SUFFIX)
+
+
+def source_signature(input_csv) -> dict:
+    """Size and modification time that identify one version of the input file."""
+    stat = Path(input_csv).stat()
+    return {'source_size': str(stat.st_size), 'source_mtime_ns': str(stat.st_mtime_ns),
+            'catalog_version': CATALOG_VERSION}
+
+
+def scan_station_catalog(input_csv) -> pd.DataFrame:
+    """
+    Scan an input CSV into one row per station.
+
+    Returns:
+        DataFrame with id, name, lat, long, rows (record count) and data_types
+        (comma-separated, sorted)
+    """
+    start_time = time.time()
+    reader = pa_csv.open_csv(
+        str(input_csv),
+        read_options=pa_csv.ReadOptions(use_threads=True, block_size=SCAN_BLOCK_BYTES),
+        convert_options=pa_csv.ConvertOptions(column_types=SCAN_COLUMN_TYPES,
+                                              include_columns=list(SCAN_COLUMN_TYPES))
+    )
+    # Each block shrinks to one row per station and data type
+    partials = []
+    scanned = 0
+    for batch in reader:
+        scanned += batch.num_rows
+        partials.append(
+            pa.Table.from_batches([batch])
+            .group_by(STATION_COLUMNS + ['data_type'], use_threads=False)
+            .aggregate([([], 'count_all')])
+        )
+    if not partials:
+        return pd.DataFrame(columns=STATION_COLUMNS + ['rows', 'data_types'])
+
+    per_type = (
+        pa.concat_tables(partials)
+        .group_by(STATION_COLUMNS + ['data_type'], use_threads=False)
+        .aggregate([('count_all', 'sum')])
+        .to_pandas()
+    )
+    per_type = per_type.sort_values(STATION_COLUMNS + ['data_type'])
+    catalog = per_type.groupby(STATION_COLUMNS, sort=False, dropna=False).agg(
+        rows=('count_all_sum', 'sum'),
+        data_types=('data_type', lambda types: ','.join(types.dropna())),
+    ).reset_index()
+    catalog = catalog.sort_values('id', kind='stable').reset_index(drop=True)
+
+    elapsed = time.time() - start_time
+    logger.info(f"Scanned {scanned:,} records into {len(catalog):,} stations in {elapsed:.1f}s "
+                f"({scanned / elapsed if elapsed > 0 else 0:,.0f} rows/sec)")
+    return catalog
+
+
+def write_catalog(catalog: pd.DataFrame, catalog_path: Path, signature: dict):
+    """Write the catalog with the source signature in its Parquet metadata (atomically)."""
+    table = pa.Table.from_pandas(catalog, preserve_index=False)
+    metadata = dict(table.schema.metadata or {})
+    metadata.update({key.encode(): value.encode() for key, value in signature.items()})
+    table = table.replace_schema_metadata(metadata)
+
+    catalog_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = catalog_path.with_name(catalog_path.name + '.tmp')
+    pq.write_table(table, temp_path)
+    os.replace(temp_path, catalog_path)
+
+
+def read_cached_catalog(catalog_path: Path, signature: dict):
+    """The cached catalog if it exists and matches the signature, else None."""
+    if not catalog_path.exists():
+        return None
+    try:
+        metadata = pq.read_schema(catalog_path).metadata or {}
+    except (OSError, pa.ArrowInvalid):
+        return None
+    cached = {key: metadata.get(key.encode(), b'').decode() for key in signature}
+    if cached != signature:
+        return None
+    return pq.read_table(catalog_path).to_pandas()
+
+
+def load_station_catalog(input_csv, cache_dir=None, refresh: bool = False) -> pd.DataFrame:
+    """
+    Station catalog of an input CSV, from the sidecar index when it is current.
+
+    Args:
+        input_csv: Raw weather input (id,date,data_type,lat,long,name,AVG)
+        cache_dir: Where to keep the index (default: next to the input)
+        refresh: Rescan even if the index is current
+
+    Returns:
+        Catalog DataFrame (see scan_station_catalog)
+    """
+    input_path = Path(input_csv)
+    if not input_path.exists():
+        raise FileNotFoundError(f"Weather data file not found: {input_csv}")
+
+    catalog_path = catalog_path_for(input_path, cache_dir)
+    signature = source_signature(input_path)
+    if not refresh:
+        catalog = read_cached_catalog(catalog_path, signature)
+        if catalog is not None:
+            logger.info(f"Using station index {catalog_path} ({len(catalog):,} stations)")
+            return catalog
+
+    catalog = scan_station_catalog(input_path)
+    try:
+        write_catalog(catalog, catalog_path, signature)
+        logger.info(f"Saved station index to: {catalog_path}")
+    except OSError as e:
+        logger.warning(f"Could not save station index to {catalog_path}: {e}")
+    return catalog
+
+
+def catalog_data_types(catalog: pd.DataFrame) -> list:
+    """Sorted data types present anywhere in the catalog."""
+    data_types = set()
+    for types in catalog['data_types'].dropna().unique():
+        data_types.update(filter(None, types.split(',')))
+    return sorted(data_types)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='List the stations in a raw weather input file')
+    parser.add_argument('--input', type=str, required=True, help='Raw weather CSV (id,date,data_type,lat,long,name,AVG)')
+    parser.add_argument('--cache-dir', type=str, default=None, help='Where to keep the station index')
+    parser.add_argument('--refresh', action='store_true', help='Rescan even if the index is current')
+    parser.add_argument('--names', action='store_true', help='Print every unique station name')
+    parser.add_argument('--output', type=str, default=None, help='Also export the catalog as CSV')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    catalog = load_station_catalog(args.input, cache_dir=args.cache_dir, refresh=args.refresh)
+
+    print(f"Number of rows: {int(catalog['rows'].sum()):,}")
+    print(f"Number of stations: {catalog['id'].nunique():,}")
+    print(f"Number of unique station names: {catalog['name'].nunique():,}")
+    for data_type in catalog_data_types(catalog):
+        reporting = catalog['data_types'].str.split(',').map(lambda types: data_type in types).sum()
+        print(f"  {data_type}: {reporting:,} stations")
+    if args.names:
+        print("Unique station names:")
+        for name in catalog['name'].dropna().unique():
+            print(name)
+    if args.output:
+        catalog.to_csv(args.output, index=False)
+        print(f"Saved catalog to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
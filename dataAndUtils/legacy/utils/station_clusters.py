@@ -0,0 +1,140 @@
+"""
+Spatial clustering of near-duplicate station locations before geocoding.
+
+get_unique_locations only merges stations whose coordinates round to the same
+value at 3 decimal places, so stations a few hundred metres apart (or one site
+reported under several IDs with slightly different coordinates) each cost a
+full reverse-geocoding call. Here locations within a radius of each other are
+grouped into sites; only one representative point per site is geocoded and its
+result is fanned back out to every member:
+
+    clusters = cluster_locations(unique_locs, radius_m=500)
+    geocoded_sites = geocode(cluster_sites(clusters))
+    geocoded = fan_out_geocodes(clusters, geocoded_sites)   # one row per member
+
+Clustering is greedy on the same unit-sphere KD-tree the offline geocoder uses
+(no distortion near the poles or the antimeridian): locations with the most
+neighbours within the radius become representatives first, and each claims
+every still-unassigned location within the radius. Every member is therefore
+within radius_m of a representative, and representatives are real station
+coordinates, not centroids.
+
+OUTPUT (city_data/station_clusters.csv):
+    lat, long, cluster, site_lat, site_long, distance_m
+"""
+
+import logging
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from offline_geocoder import EARTH_RADIUS_KM, SphericalIndex, km_to_chord, to_unit_vectors
+
+logger = logging.getLogger(__name__)
+
+CLUSTER_COLUMNS = ['lat', 'long', 'cluster', 'site_lat', 'site_long', 'distance_m']
+GEOCODED_FIELDS = ['city', 'state', 'country', 'suburb']
+
+
+def _coordinate_key(lat, long) -> pd.MultiIndex:
+    # Geocoded coordinates come back as float64 from the journal and as float32
+    # from the input; compare them at the 3 decimals both are rounded to
+    return pd.MultiIndex.from_arrays([
+        pd.Series(lat).astype('float64').round(3).to_numpy(),
+        pd.Series(long).astype('float64').round(3).to_numpy(),
+    ])
+
+
+def cluster_locations(unique_locs: pd.DataFrame, radius_m: float) -> pd.DataFrame:
+    """
+    Group locations into sites whose members lie within radius_m of the site.
+
+    Args:
+        unique_locs: DataFrame with lat/long columns (one row per location)
+        radius_m: Maximum distance from a member to its site's representative
+
+    Returns:
+        DataFrame with CLUSTER_COLUMNS, one row per input location in input order
+    """
+    lat = unique_locs['lat'].to_numpy()
+    long = unique_locs['long'].to_numpy()
+    count = len(unique_locs)
+    cluster = np.full(count, -1, dtype='int64')
+    site = np.zeros(count, dtype='int64')
+
+    if count > 0:
+        index = SphericalIndex(lat, long)
+        vectors = to_unit_vectors(lat, long)
+        chord = km_to_chord(radius_m / 1000.0)
+        # Densest locations first, ties by coordinate so the result is deterministic
+        neighbours = index.tree.query_ball_point(vectors, chord, return_length=True, workers=-1)
+        order = np.lexsort((long, lat, -neighbours))
+
+        next_cluster = 0
+        for leader in order:
+            if cluster[leader] >= 0:
+                continue
+            members = np.asarray(index.tree.query_ball_point(vectors[leader], chord), dtype='int64')
+            members = members[cluster[members] < 0]
+            cluster[members] = next_cluster
+            site[members] = leader
+            next_cluster += 1
+
+    # Great-circle distance from each member to its representative
+    chord_lengths = np.linalg.norm(to_unit_vectors(lat, long) - to_unit_vectors(lat[site], long[site]), axis=1)
+    distance_m = 2000.0 * EARTH_RADIUS_KM * np.arcsin(np.clip(chord_lengths / 2.0, 0.0, 1.0))
+
+    clusters = pd.DataFrame({
+        'lat': lat,
+        'long': long,
+        'cluster': cluster,
+        'site_lat': lat[site],
+        'site_long': long[site],
+        'distance_m': distance_m.round(1),
+    })
+    sites = clusters['cluster'].nunique()
+    logger.info(f"Clustered {count:,} locations into {sites:,} sites within {radius_m:g} m "
+                f"({count - sites:,} fewer geocoding lookups)")
+    return clusters
+
+
+def cluster_sites(clusters: pd.DataFrame) -> pd.DataFrame:
+    """One lat/long row per site: the representative locations to geocode."""
+    sites = clusters.drop_duplicates(subset='cluster')[['site_lat', 'site_long']]
+    return sites.rename(columns={'site_lat': 'lat', 'site_long': 'long'}).reset_index(drop=True)
+
+
+def fan_out_geocodes(clusters: pd.DataFrame, geocoded_sites: pd.DataFrame) -> pd.DataFrame:
+    """
+    Copy each site's geocoded fields to all of its members.
+
+    Args:
+        clusters: DataFrame returned by cluster_locations
+        geocoded_sites: Geocoded representatives (lat, long, city, state, country, suburb)
+
+    Returns:
+        DataFrame with lat, long, city, state, country, suburb for every member
+        whose site was geocoded
+    """
+    sites = geocoded_sites.copy()
+    sites.index = _coordinate_key(sites['lat'], sites['long'])
+    sites = sites[~sites.index.duplicated(keep='first')]
+
+    position = sites.index.get_indexer(_coordinate_key(clusters['site_lat'], clusters['site_long']))
+    found = position >= 0
+    members = clusters.loc[found, ['lat', 'long']].reset_index(drop=True)
+    for col in GEOCODED_FIELDS:
+        members[col] = sites[col].to_numpy()[position[found]]
+
+    missing_sites = clusters.loc[~found, 'cluster'].nunique()
+    if missing_sites > 0:
+        logger.warning(f"{missing_sites:,} sites have no geocoding result; their members stay unmatched")
+    logger.info(f"Fanned {len(sites):,} geocoded sites out to {len(members):,} locations")
+    return members
+
+
+def save_clusters(clusters: pd.DataFrame, output_path: Path):
+    """Record the location-to-site mapping."""
+    clusters[CLUSTER_COLUMNS].to_csv(output_path, index=False)
+    logger.info(f"Saved station cluster mapping to: {output_path}")
@@ -0,0 +1,218 @@
+"""
+Synthetic weather station input for benchmarking the cleaning pipeline.
+
+Writes files in the pipeline's input format (id,date,data_type,lat,long,name,AVG,
+see CleanData_MatchCities_ExpandDatesAndWeather.py) at any size, e.g. 1M, 10M
+or 100M rows, so the stages can be measured at scales the Italy sample files
+in weather_data/ never reach.
+
+The data is shaped like the GHCN-Daily per-day averages it stands in for:
+    - Station density: stations are drawn from weighted regions, dense in North
+      America, Europe and Australia and sparse elsewhere, and a small share of
+      stations sit on the same rounded coordinates as another one.
+    - Data types: almost every station reports PRCP, about half report
+      TMAX/TMIN (always together) and a quarter TAVG.
+    - Missing values: most stations cover all 366 days, some have gaps; a few
+      rows have an invalid MMDD date or an empty AVG.
+    - Values: seasonal temperatures from latitude and hemisphere in tenths of
+      a degree, and non-negative precipitation in tenths of a mm.
+
+Rows are written station by station in blocks, so memory stays flat at any
+size, and the same seed always produces the same file.
+
+Usage:
+    python synthetic_weather.py --rows 10M --output synthetic_weather_10M.csv
+"""
+
+import argparse
+import logging
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from date_codes import DAYS_IN_YEAR, day_of_year_to_mmdd
+
+logger = logging.getLogger(__name__)
+
+DATA_TYPES = ['PRCP', 'TMAX', 'TMIN', 'TAVG']
+STATIONS_PER_BLOCK = 5_000
+
+# (lat_min, lat_max, long_min, long_max, share of stations), roughly following
+# where GHCN-Daily stations are
+STATION_REGIONS = [
+    (25.0, 49.0, -125.0, -67.0, 0.40),    # Contiguous US
+    (49.0, 60.0, -140.0, -55.0, 0.05),    # Canada
+    (36.0, 70.0, -10.0, 40.0, 0.15),      # Europe
+    (-44.0, -11.0, 113.0, 154.0, 0.12),   # Australia
+    (20.0, 55.0, 60.0, 145.0, 0.08),      # Asia
+    (-35.0, 12.0, -80.0, -35.0, 0.08),    # South America
+    (-35.0, 35.0, -17.0, 50.0, 0.07),     # Africa
+    (-60.0, 75.0, -180.0, 180.0, 0.05),   # Anywhere else
+]
+
+# Share of stations reporting each data type (TMIN always follows TMAX)
+PRCP_SHARE = 0.95
+TEMPERATURE_SHARE = 0.5
+TAVG_SHARE = 0.25
+GAPPY_STATION_SHARE = 0.1  # Stations missing some days
+COLOCATED_STATION_SHARE = 0.02  # Stations on the same rounded coordinates as another
+INVALID_DATE_SHARE = 1e-5
+MISSING_VALUE_SHARE = 1e-4
+
+
+def parse_row_count(value: str) -> int:
+    """Parse a row count like '1M', '250k' or '100000000'."""
+    text = value.strip().upper().replace('_', '')
+    multipliers = {'K': 1_000, 'M': 1_000_000, 'B': 1_000_000_000}
+    if text and text[-1] in multipliers:
+        return int(float(text[:-1]) * multipliers[text[-1]])
+    return int(text)
+
+
+def generate_stations(n_stations: int, rng: np.random.Generator, first_id: int = 0) -> pd.DataFrame:
+    """
+    Draw station metadata and climate parameters.
+
+    Returns:
+        DataFrame with id, name, lat, long, the data types each station reports
+        (boolean columns) and the parameters of its seasonal cycle
+    """
+    shares = np.array([region[4] for region in STATION_REGIONS])
+    regions = rng.choice(len(STATION_REGIONS), size=n_stations, p=shares / shares.sum())
+    bounds = np.array([region[:4] for region in STATION_REGIONS])[regions]
+    lat = rng.uniform(bounds[:, 0], bounds[:, 1])
+    long = rng.uniform(bounds[:, 2], bounds[:, 3])
+
+    # Co-located stations (e.g. an airport and its replacement sensor)
+    colocated = np.flatnonzero(rng.random(n_stations) < COLOCATED_STATION_SHARE)
+    colocated = colocated[colocated > 0]
+    lat[colocated] = lat[colocated - 1]
+    long[colocated] = long[colocated - 1]
+
+    numbers = np.arange(first_id, first_id + n_stations)
+    stations = pd.DataFrame({
+        'id': [f'SY{number:09d}' for number in numbers],
+        'name': [f'SYNTHETIC {number}' for number in numbers],
+        'lat': lat.round(4),
+        'long': long.round(4),
+    })
+
+    has_temperature = rng.random(n_stations) < TEMPERATURE_SHARE
+    stations['PRCP'] = rng.random(n_stations) < PRCP_SHARE
+    stations['TMAX'] = has_temperature
+    stations['TMIN'] = has_temperature
+    stations['TAVG'] = rng.random(n_stations) < TAVG_SHARE
+    # Every station reports something
+    stations.loc[~stations[DATA_TYPES].any(axis=1), 'PRCP'] = True
+
+    # Seasonal cycle: colder and more seasonal towards the poles, with the
+    # warmest day in July north of the equator and in January south of it
+    abs_lat = np.abs(lat)
+    stations['mean_temp'] = 28.0 - 0.45 * abs_lat + rng.normal(0, 2.0, n_stations)
+    stations['amplitude'] = 1.5 + 0.3 * abs_lat + rng.normal(0, 1.0, n_stations).clip(-1.0, None)
+    stations['warmest_day'] = np.where(lat >= 0, 200, 17) + rng.integers(-10, 11, n_stations)
+    stations['day_range'] = rng.uniform(6.0, 14.0, n_stations)
+    stations['wet_mm'] = rng.gamma(2.0, 1.2, n_stations)
+    stations['coverage'] = np.where(rng.random(n_stations) < GAPPY_STATION_SHARE,
+                                    rng.uniform(0.6, 0.98, n_stations), 1.0)
+    return stations
+
+
+def station_records(stations: pd.DataFrame, rng: np.random.Generator) -> pd.DataFrame:
+    """Expand stations into one row per station, day and reported data type."""
+    n_stations = len(stations)
+    days = np.arange(1, DAYS_IN_YEAR + 1)
+    covered = rng.random((n_stations, DAYS_IN_YEAR)) < stations['coverage'].to_numpy()[:, None]
+    reported = stations[DATA_TYPES].to_numpy()
+    # [station, day, data_type], in the station/date order of the real input files
+    station_index, day_index, type_index = np.nonzero(covered[:, :, None] & reported[:, None, :])
+    day = days[day_index]
+
+    season = np.cos(2 * np.pi * (day - stations['warmest_day'].to_numpy()[station_index]) / DAYS_IN_YEAR)
+    mean_temp = (stations['mean_temp'].to_numpy()[station_index]
+                 + stations['amplitude'].to_numpy()[station_index] * season
+                 + rng.normal(0, 1.0, len(day)))
+    half_range = stations['day_range'].to_numpy()[station_index] / 2
+    wet = stations['wet_mm'].to_numpy()[station_index] * (1 + 0.4 * season) * rng.gamma(4.0, 0.25, len(day))
+
+    # Values in tenths, as in the GHCN-derived input
+    value = np.select(
+        [type_index == 0, type_index == 1, type_index == 2],
+        [wet * 10, (mean_temp + half_range) * 10, (mean_temp - half_range) * 10],
+        mean_temp * 10
+    ).round(2)
+    value[rng.random(len(value)) < MISSING_VALUE_SHARE] = np.nan
+
+    mmdd = day_of_year_to_mmdd(day).astype('int32')
+    invalid = rng.random(len(mmdd)) < INVALID_DATE_SHARE
+    mmdd[invalid] = 230  # February 30th
+
+    return pd.DataFrame({
+        'id': stations['id'].to_numpy()[station_index],
+        'date': mmdd,
+        'data_type': np.array(DATA_TYPES)[type_index],
+        'lat': stations['lat'].to_numpy()[station_index],
+        'long': stations['long'].to_numpy()[station_index],
+        'name': stations['name'].to_numpy()[station_index],
+        'AVG': value,
+    })
+
+
+def expected_rows_per_station() -> float:
+    """Average rows a generated station contributes."""
+    types = PRCP_SHARE + 2 * TEMPERATURE_SHARE + TAVG_SHARE
+    coverage = 1 - GAPPY_STATION_SHARE + GAPPY_STATION_SHARE * 0.79
+    return DAYS_IN_YEAR * types * coverage
+
+
+def write_synthetic_weather(output_path, rows: int, seed: int = 0) -> dict:
+    """
+    Write a synthetic input CSV with exactly `rows` records.
+
+    Args:
+        output_path: CSV file to write
+        rows: Number of records
+        seed: Random seed
+
+    Returns:
+        Dict with the number of rows and stations written
+    """
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    rng = np.random.default_rng(seed)
+
+    written = 0
+    n_stations = 0
+    block_size = max(1, min(STATIONS_PER_BLOCK, int(rows / expected_rows_per_station()) + 1))
+    logger.info(f"Writing {rows:,} synthetic records to: {output_path}")
+    with open(output_path, 'w', newline='') as f:
+        while written < rows:
+            stations = generate_stations(block_size, rng, first_id=n_stations)
+            records = station_records(stations, rng)
+            if written + len(records) > rows:
+                records = records.iloc[:rows - written]
+            records.to_csv(f, index=False, header=(written == 0))
+            written += len(records)
+            n_stations += records['id'].nunique()
+            logger.info(f"  {written:,} / {rows:,} records ({n_stations:,} stations)")
+
+    logger.info(f"Wrote {written:,} records from {n_stations:,} stations")
+    return {'rows': written, 'stations': n_stations}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate synthetic weather station input for benchmarks')
+    parser.add_argument('--rows', type=str, default='1M', help='Number of records, e.g. 1M, 10M, 100M')
+    parser.add_argument('--output', type=str, default=None,
+                        help='Output CSV (default: synthetic_weather_<rows>.csv)')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    output = args.output or f'synthetic_weather_{args.rows}.csv'
+    write_synthetic_weather(output, parse_row_count(args.rows), seed=args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,255 @@
+"""
+Zero-downtime rebuild of dates_cities_population.
+
+utils.create_table used to DROP the table and re-create it with CREATE TABLE AS,
+joining all_dates_2019 to cities_population on
+UPPER(D.name) = UPPER(P.city) AND ROUND(D.lat) = ROUND(P.lat) and casting the
+'NA' strings with a CASE per column. The join keys are expressions no index can
+serve, and readers see no table at all while the rebuild runs. This rebuild:
+
+    1. loads both sources into keyed temporary tables, turning 'NA' into NULL
+       while loading (COPY ... NULL 'NA' from the source CSVs, or one NULLIF
+       pass over the existing tables) so every metric is a real double column,
+    2. stores the normalized join keys as generated columns (UPPER(name),
+       ROUND(lat)) and indexes them, so the join is a plain equi-join,
+    3. builds the result into a shadow table and creates its indexes there,
+    4. swaps it in with ALTER TABLE ... RENAME inside one short transaction and
+       drops the previous table afterwards.
+
+Readers keep querying the old table until the swap commits; the swap only takes
+a brief exclusive lock for the renames.
+
+Usage:
+    python table_rebuild.py
+    python table_rebuild.py --dates-csv all_dates_2019.csv --cities-csv worldcities.csv
+"""
+
+import argparse
+import io
+import logging
+import time
+
+import pandas as pd
+from psycopg2 import sql
+
+from bulk_loader import NULL_MARKER
+from config import Configuration
+from database import connection
+
+logger = logging.getLogger(__name__)
+
+TARGET_TABLE = 'dates_cities_population'
+SHADOW_TABLE = f'{TARGET_TABLE}_shadow'
+OLD_TABLE = f'{TARGET_TABLE}_old'
+DATES_SOURCE_TABLE = 'all_dates_2019'
+CITIES_SOURCE_TABLE = 'cities_population'
+
+METRIC_COLUMNS = ['prcp', 'snow', 'tavg', 'tmax', 'tmin']
+DATES_COLUMNS = ['id', 'name', 'lat', 'long', 'date'] + METRIC_COLUMNS
+CITIES_COLUMNS = ['city', 'lat', 'country', 'population']
+# Index name suffix -> indexed columns of the rebuilt table
+TARGET_INDEXES = {
+    'date_idx': ['date'],
+    'name_lat_idx': ['name', 'lat'],
+    'country_idx': ['country'],
+}
+MISSING_MARKER = 'NA'
+SWAP_LOCK_TIMEOUT = '10s'
+DEFAULT_CHUNK_ROWS = 500_000
+
+
+def drop_keyed_sources(cursor):
+    """Drop the temporary keyed source tables if this session has them."""
+    cursor.execute('DROP TABLE IF EXISTS pg_temp.dates_keyed, pg_temp.cities_keyed')
+
+
+def create_keyed_sources(cursor):
+    """Create the temporary keyed source tables."""
+    drop_keyed_sources(cursor)
+    metrics = sql.SQL(', ').join(sql.SQL('{} double precision').format(sql.Identifier(col)) for col in METRIC_COLUMNS)
+    cursor.execute(sql.SQL("""
+        CREATE TEMPORARY TABLE dates_keyed (
+            id text,
+            name text,
+            lat double precision,
+            long double precision,
+            date text,
+            {metrics},
+            name_key text GENERATED ALWAYS AS (UPPER(name)) STORED,
+            lat_key double precision GENERATED ALWAYS AS (ROUND(lat)) STORED
+        )
+    """).format(metrics=metrics))
+    cursor.execute("""
+        CREATE TEMPORARY TABLE cities_keyed (
+            city text,
+            lat double precision,
+            country text,
+            population double precision,
+            city_key text GENERATED ALWAYS AS (UPPER(city)) STORED,
+            lat_key double precision GENERATED ALWAYS AS (ROUND(lat)) STORED
+        )
+    """)
+
+
+def copy_csv(cursor, csv_path: str, table: str, columns: list, chunk_rows: int = DEFAULT_CHUNK_ROWS) -> int:
+    """COPY the given columns of a CSV into a keyed table, loading 'NA' and empty fields as NULL."""
+    statement = sql.SQL("COPY {table} ({columns}) FROM STDIN WITH (FORMAT csv, NULL {null})").format(
+        table=sql.Identifier(table),
+        columns=sql.SQL(', ').join(map(sql.Identifier, columns)),
+        null=sql.Literal(NULL_MARKER)
+    ).as_string(cursor)
+    loaded = 0
+    # Source headers are not consistently cased (e.g. PRCP vs prcp)
+    for chunk in pd.read_csv(csv_path, usecols=lambda col: col.lower() in columns, chunksize=chunk_rows,
+                             dtype=str, keep_default_na=False, na_values=[MISSING_MARKER, '']):
+        chunk.columns = [col.lower() for col in chunk.columns]
+        buffer = io.StringIO()
+        chunk.reindex(columns=columns).to_csv(buffer, index=False, header=False, na_rep=NULL_MARKER)
+        buffer.seek(0)
+        cursor.copy_expert(statement, buffer)
+        loaded += len(chunk)
+    logger.info(f"Loaded {loaded:,} rows from {csv_path} into {table}")
+    return loaded
+
+
+def copy_from_table(cursor, source_table: str, table: str, columns: list, numeric_columns: list) -> int:
+    """Fill a keyed table from an existing source table, casting 'NA' to NULL in one pass."""
+    def cast(col):
+        if col in numeric_columns:
+            return sql.SQL("CAST(NULLIF(CAST({col} AS text), {na}) AS double precision)").format(
+                col=sql.Identifier(col), na=sql.Literal(MISSING_MARKER))
+        return sql.SQL("CAST({col} AS text)").format(col=sql.Identifier(col))
+
+    cursor.execute(sql.SQL("INSERT INTO {table} ({columns}) SELECT {values} FROM {source}").format(
+        table=sql.Identifier(table),
+        columns=sql.SQL(', ').join(map(sql.Identifier, columns)),
+        values=sql.SQL(', ').join(cast(col) for col in columns),
+        source=sql.Identifier(source_table)
+    ))
+    logger.info(f"Loaded {cursor.rowcount:,} rows from table {source_table} into {table}")
+    return cursor.rowcount
+
+
+def build_shadow_table(cursor) -> int:
+    """Join the keyed sources into the shadow table and index it; returns its row count."""
+    cursor.execute('CREATE INDEX ON cities_keyed (city_key, lat_key)')
+    cursor.execute('ANALYZE dates_keyed')
+    cursor.execute('ANALYZE cities_keyed')
+
+    cursor.execute(sql.SQL('DROP TABLE IF EXISTS {shadow}').format(shadow=sql.Identifier(SHADOW_TABLE)))
+    cursor.execute(sql.SQL("""
+        CREATE TABLE {shadow} AS
+        SELECT
+            D.id, D.name, D.lat, D.long, D.date,
+            D.prcp, D.snow, D.tavg, D.tmax, D.tmin,
+            P.population AS population,
+            P.country AS country
+        FROM dates_keyed AS D
+        INNER JOIN cities_keyed AS P ON D.name_key = P.city_key AND D.lat_key = P.lat_key
+        WHERE D.tavg IS NOT NULL OR D.tmax IS NOT NULL OR D.tmin IS NOT NULL
+    """).format(shadow=sql.Identifier(SHADOW_TABLE)))
+    rows = cursor.rowcount
+
+    # Built under the shadow names; renamed to the target names in the swap
+    for suffix, columns in TARGET_INDEXES.items():
+        cursor.execute(sql.SQL('CREATE INDEX {index} ON {shadow} ({columns})').format(
+            index=sql.Identifier(f'{SHADOW_TABLE}_{suffix}'),
+            shadow=sql.Identifier(SHADOW_TABLE),
+            columns=sql.SQL(', ').join(map(sql.Identifier, columns))
+        ))
+    cursor.execute(sql.SQL('ANALYZE {shadow}').format(shadow=sql.Identifier(SHADOW_TABLE)))
+    return rows
+
+
+def swap_shadow_table(cursor):
+    """Rename the shadow table (and its indexes) into place in the current transaction."""
+    cursor.execute(sql.SQL('SET LOCAL lock_timeout = {}').format(sql.Literal(SWAP_LOCK_TIMEOUT)))
+    cursor.execute(sql.SQL('DROP TABLE IF EXISTS {old}').format(old=sql.Identifier(OLD_TABLE)))
+    cursor.execute('SELECT to_regclass(%s) IS NOT NULL', (TARGET_TABLE,))
+    if cursor.fetchone()[0]:
+        cursor.execute(sql.SQL('ALTER TABLE {target} RENAME TO {old}').format(
+            target=sql.Identifier(TARGET_TABLE), old=sql.Identifier(OLD_TABLE)))
+        for suffix in TARGET_INDEXES:
+            cursor.execute(sql.SQL('ALTER INDEX IF EXISTS {index} RENAME TO {old_index}').format(
+                index=sql.Identifier(f'{TARGET_TABLE}_{suffix}'),
+                old_index=sql.Identifier(f'{OLD_TABLE}_{suffix}')))
+
+    cursor.execute(sql.SQL('ALTER TABLE {shadow} RENAME TO {target}').format(
+        shadow=sql.Identifier(SHADOW_TABLE), target=sql.Identifier(TARGET_TABLE)))
+    for suffix in TARGET_INDEXES:
+        cursor.execute(sql.SQL('ALTER INDEX {index} RENAME TO {target_index}').format(
+            index=sql.Identifier(f'{SHADOW_TABLE}_{suffix}'),
+            target_index=sql.Identifier(f'{TARGET_TABLE}_{suffix}')))
+
+
+def rebuild_table(database_url: str = Configuration.postgres_url, dates_csv: str = None,
+                  cities_csv: str = None) -> dict:
+    """
+    Rebuild dates_cities_population in a shadow table and swap it in.
+
+    Args:
+        database_url: PostgreSQL connection URL
+        dates_csv: Load station dates from this CSV instead of the all_dates_2019 table
+        cities_csv: Load cities from this worldcities CSV instead of the cities_population table
+
+    Returns:
+        Rebuild statistics (rows, timings)
+    """
+    start_time = time.time()
+    with connection(database_url) as conn:
+        with conn.cursor() as cursor:
+            create_keyed_sources(cursor)
+            if dates_csv:
+                copy_csv(cursor, dates_csv, 'dates_keyed', DATES_COLUMNS)
+            else:
+                copy_from_table(cursor, DATES_SOURCE_TABLE, 'dates_keyed', DATES_COLUMNS,
+                                numeric_columns=['lat', 'long'] + METRIC_COLUMNS)
+            if cities_csv:
+                copy_csv(cursor, cities_csv, 'cities_keyed', CITIES_COLUMNS)
+            else:
+                copy_from_table(cursor, CITIES_SOURCE_TABLE, 'cities_keyed', CITIES_COLUMNS,
+                                numeric_columns=['lat', 'population'])
+            load_seconds = time.time() - start_time
+
+            logger.info(f"Building {SHADOW_TABLE}...")
+            build_start = time.time()
+            rows = build_shadow_table(cursor)
+            conn.commit()
+            build_seconds = time.time() - build_start
+
+            swap_start = time.time()
+            swap_shadow_table(cursor)
+            conn.commit()
+            swap_seconds = time.time() - swap_start
+
+            cursor.execute(sql.SQL('DROP TABLE IF EXISTS {old}').format(old=sql.Identifier(OLD_TABLE)))
+            # Pooled connections outlive the rebuild; do not leave the temporary tables behind
+            drop_keyed_sources(cursor)
+
+    stats = {
+        'rows': rows,
+        'load_seconds': round(load_seconds, 2),
+        'build_seconds': round(build_seconds, 2),
+        'swap_seconds': round(swap_seconds, 3),
+        'total_seconds': round(time.time() - start_time, 2),
+    }
+    logger.info(f"Rebuilt {TARGET_TABLE} with {rows:,} rows in {stats['total_seconds']:.1f}s "
+                f"(load {load_seconds:.1f}s, build {build_seconds:.1f}s, swap {swap_seconds * 1000:.0f} ms)")
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=f'Rebuild {TARGET_TABLE} without query downtime')
+    parser.add_argument('--database-url', type=str, default=Configuration.postgres_url, help='PostgreSQL URL')
+    parser.add_argument('--dates-csv', type=str, default=None,
+                        help=f'Station dates CSV to load instead of the {DATES_SOURCE_TABLE} table')
+    parser.add_argument('--cities-csv', type=str, default=None,
+                        help=f'worldcities CSV to load instead of the {CITIES_SOURCE_TABLE} table')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    rebuild_table(args.database_url, dates_csv=args.dates_csv, cities_csv=args.cities_csv)
+
+
+if __name__ == "__main__":
+    main()
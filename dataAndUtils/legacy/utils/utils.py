@@ -1,23 +1,99 @@
+from collections import OrderedDict
+
+import numpy as np
 import pandas as pd
-import sqlalchemy
 from sqlalchemy import inspect
-import psycopg2
 from psycopg2 import sql
 import logging
 
+from config import Configuration
+from database import connection, database_url_for, execute_values_method, get_engine
+from table_rebuild import rebuild_table
+
+
+# Pooled, built from Configuration (POSTGRES_* / DATABASE_URL)
+engine = get_engine()
+
+
+DEFAULT_PICKLE_PATH = '/Users/ashlenkurre/Documents/GitHub/vaycay/other/data/cleaned_data/combined_noyear_3indexed_2019.pkl'
+
+
+class DateLookup:
+    """
+    Long-lived lookup of the rows for one value of an index level (e.g. one date).
+
+    The frame is loaded once. Per level, it is stably sorted by that level and an
+    offset table maps every value to a contiguous row slice, so a lookup is a dict
+    get plus an iloc slice instead of a load and a full boolean scan. Values that
+    are not an exact key (e.g. '2019-01-01' on a datetime level) are resolved to
+    the level's own value first, as comparing the level to them would. The last
+    `maxsize` results are kept in an LRU; hits and misses are counted.
+
+    Returned frames are shared with the cache, so treat them as read-only.
+    """
+
+    def __init__(self, df: pd.DataFrame = None, pickle_path=DEFAULT_PICKLE_PATH, maxsize: int = 128):
+        self.df = df if df is not None else pd.read_pickle(pickle_path)
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._levels = {}
+        self._cache = OrderedDict()
+
+    def _level(self, index_name):
+        # (frame sorted by the level, level values, {value: (start, stop)})
+        if index_name not in self._levels:
+            codes, uniques = pd.factorize(self.df.index.get_level_values(index_name))
+            order = np.argsort(codes, kind='stable')
+            # Code -1 (missing values) sorts first and gets no entry
+            counts = np.bincount(codes + 1, minlength=len(uniques) + 1)
+            offsets = np.concatenate([[0], np.cumsum(counts)])
+            slices = {value: (offsets[code + 1], offsets[code + 2]) for code, value in enumerate(uniques)}
+            self._levels[index_name] = (self.df.iloc[order], uniques, slices)
+        return self._levels[index_name]
 
-host = 'localhost'
-port = 5432
-dbname = 'date_data'
-username = 'vaycay_user'
-password = 'password123'
-engine = sqlalchemy.create_engine(f'postgresql://{username}:{password}@{host}:{port}/{dbname}')
+    def get(self, select_date, index_name) -> pd.DataFrame:
+        df_sorted, uniques, slices = self._level(index_name)
+        if select_date not in slices:
+            # Let the level convert the value to its own type, then cache under that
+            position = uniques.get_indexer([select_date])[0]
+            if position >= 0:
+                select_date = uniques[position]
+        key = (index_name, select_date)
+        if key in self._cache:
+            self.hits += 1
+            self._cache.move_to_end(key)
+            return self._cache[key]
 
+        self.misses += 1
+        start, stop = slices.get(select_date, (0, 0))
+        data_needed = df_sorted.iloc[start:stop]
+        self._cache[key] = data_needed
+        if len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+        return data_needed
 
-def access_from_pickle(select_date, index_name, pickle_path='/Users/ashlenkurre/Documents/GitHub/vaycay/other/data/cleaned_data/combined_noyear_3indexed_2019.pkl'):
-    df = pd.read_pickle(pickle_path)
-    data_needed = df.iloc[df.index.get_level_values(index_name) == select_date]
-    return data_needed
+    def cache_info(self) -> dict:
+        return {'hits': self.hits, 'misses': self.misses, 'maxsize': self.maxsize, 'currsize': len(self._cache)}
+
+    def cache_clear(self):
+        self._cache.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+_date_lookups = {}
+
+
+def get_date_lookup(pickle_path=DEFAULT_PICKLE_PATH) -> DateLookup:
+    # One lookup per pickle for the life of the process
+    if pickle_path not in _date_lookups:
+        _date_lookups[pickle_path] = DateLookup(pickle_path=pickle_path)
+    return _date_lookups[pickle_path]
+
+
+def access_from_pickle(select_date, index_name, pickle_path=DEFAULT_PICKLE_PATH):
+    return get_date_lookup(pickle_path).get(select_date, index_name)
 
 def fetch_schemas():
     inspector = inspect(engine)
@@ -33,105 +109,57 @@ def import_to_db(pickle_path, table_name):
     print('reading')
     pickle = pd.read_csv(pickle_path)
     print('pickle read')
-    pickle.to_sql(name=table_name, con=engine, if_exists='replace', schema=None)
+    pickle.to_sql(name=table_name, con=engine, if_exists='replace', schema=None,
+                  chunksize=10_000, method=execute_values_method)
     print('done')
 
 
 def createDB(dbName, drop_db=False):
-    connString=f'postgresql://{username}:{password}@{host}:{port}/{dbname}'
-    conn = psycopg2.connect(connString)
-    conn.set_session(autocommit =True) # autocommit must be True sein, else CREATE DATABASE will fail https://www.psycopg.org/docs/usage.html#transactions-control
-    cursor = conn.cursor()
-    if drop_db:
-        dropDB = sql.SQL('DROP DATABASE {} WITH (FORCE);').format(sql.Identifier(dbName))
+    # autocommit must be True, else CREATE DATABASE will fail https://www.psycopg.org/docs/usage.html#transactions-control
+    with connection(autocommit=True) as conn:
+        cursor = conn.cursor()
+        if drop_db:
+            dropDB = sql.SQL('DROP DATABASE {} WITH (FORCE);').format(sql.Identifier(dbName))
+            try:
+                cursor.execute(dropDB)
+            except Exception as e:
+                print('drop DB failed')
+                logging.error(e)
+                exit()
+        else:
+            createDB = sql.SQL('CREATE DATABASE IF NOT EXISTS {};').format(sql.Identifier(dbName))
+            try:
+                cursor.execute(createDB)
+            except Exception as e:
+                print('create DB failed')
+                logging.error(e)
+                exit()
+
+
+def create_schema(schema_name, db_name):
+    with connection(database_url_for(db_name), autocommit=True) as conn:
+        cursor = conn.cursor()
+        createSchema = sql.SQL(f'CREATE SCHEMA IF NOT EXISTS {schema_name};')
+        searchpath = sql.SQL('ALTER DATABASE {} SET search_path TO public, schema2;').format(sql.Identifier(db_name))
         try:
-            cursor.execute(dropDB)
+            cursor.execute(createSchema)
+            print('schema created')
         except Exception as e:
-            print('drop DB failed')
+            print('create schema failed')
             logging.error(e)
-            conn.close()
             exit()
-    else:
-        createDB = sql.SQL('CREATE DATABASE IF NOT EXISTS {};').format(sql.Identifier(dbName))
         try:
-            cursor.execute(createDB)
+            cursor.execute(searchpath)
         except Exception as e:
-            print('create DB failed')
+            print('set searchpath failed')
             logging.error(e)
-            conn.close()
             exit()
 
 
-def create_schema(schema_name, db_name):
-    connString=f'postgresql://{username}:{password}@{host}:{port}/{db_name}'
-    conn = psycopg2.connect(connString)
-    conn.set_session(autocommit =True) # autocommit must be True sein, else CREATE DATABASE will fail https://www.psycopg.org/docs/usage.html#transactions-control
-    cursor = conn.cursor()
-    createSchema = sql.SQL(f'CREATE SCHEMA IF NOT EXISTS {schema_name};')
-    searchpath = sql.SQL('ALTER DATABASE {} SET search_path TO public, schema2;').format(sql.Identifier(db_name))
-    try:
-        cursor.execute(createSchema)
-        print('schema created')
-    except Exception as e:
-        print('create schema failed')
-        logging.error(e)
-        conn.close()
-        exit()
-    try:
-        cursor.execute(searchpath)
-    except Exception as e:
-        print('set searchpath failed')
-        logging.error(e)
-        conn.close()
-        exit()
-    conn.close()
-
-
-def create_table():
-    connString=f'postgresql://{username}:{password}@{host}:{port}/{dbname}'
-    conn = psycopg2.connect(connString)
-    conn.set_session(autocommit =True) # autocommit must be True sein, else CREATE DATABASE will fail https://www.psycopg.org/docs/usage.html#transactions-control
-    cursor = conn.cursor()
-    command = """
-        DROP TABLE IF EXISTS dates_cities_population;
-        CREATE TABLE dates_cities_population AS 
-        SELECT  
-            D.id
-            ,D.name
-            ,D.lat
-            ,D.long
-            ,D.date
-            ,CAST((CASE WHEN D.prcp = 'NA' then null ELSE D.prcp END) as DOUBLE PRECISION) as prcp
-            ,CAST((CASE WHEN D.snow = 'NA' then null ELSE D.snow END) as DOUBLE PRECISION) as snow
-            ,CAST((CASE WHEN D.tavg = 'NA' then null ELSE D.tavg END) as DOUBLE PRECISION) as tavg
-            ,CAST((CASE WHEN D.tmax = 'NA' then null ELSE D.tmax END) as DOUBLE PRECISION) as tmax
-            ,CAST((CASE WHEN D.tmin = 'NA' then null ELSE D.tmin END) as DOUBLE PRECISION) as tmin
-            ,P.population as Population
-			,P.country as Country
-        FROM 
-            all_dates_2019 as D 
-            INNER JOIN cities_population as P on        UPPER(D.name) = UPPER(P.city)
-                                                    AND ROUND(D.lat) = ROUND(P.lat)
-													
-		WHERE 
-			 ( 
-			D.tavg != 'NA' OR
-			D.tmax != 'NA' OR
-			D.tmin != 'NA'
-			)
-    """
-    command2 = """
-    UPDATE dates_cities_population
-    SET snow = NULL
-    WHERE UPPER(snow) LIKE '%NA%'"""
-    createDB = sql.SQL(command)
-    try:
-        cursor.execute(createDB)
-    except Exception as e:
-        print('create DB failed')
-        logging.error(e)
-        conn.close()
-        exit()
+def create_table(dates_csv=None, cities_csv=None):
+    # Builds into a shadow table and renames it into place, so readers never
+    # see the table missing (see table_rebuild.py)
+    return rebuild_table(database_url=Configuration.postgres_url, dates_csv=dates_csv, cities_csv=cities_csv)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,64 @@
+"""
+Lazily loaded sample of the cleaned weather output.
+
+The sample (1,000 rows of city, country, lat, long, population, date, name,
+PRCP, TAVG, TMAX, TMIN) is stored in sample_weather_data.parquet instead of a
+JSON string literal in Python source. Nothing is read when this module is
+imported; pandas/pyarrow are only imported on the first load, and date/city
+filters are pushed down into the Parquet read so only matching rows are
+materialized:
+
+    from weather_data.sample_data import load_sample_data, sample_records
+
+    january = load_sample_data(start_date='2020-01-01', end_date='2020-01-31')
+    aalborg = sample_records(cities=['Aalborg'])
+
+weather_data_json.SAMPLE_DATA still returns the original JSON string for old
+callers, built on first access.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+
+SAMPLE_DATA_PATH = Path(__file__).parent / 'sample_weather_data.parquet'
+
+
+def load_sample_data(start_date: str = None, end_date: str = None, cities=None, columns: list = None,
+                     path=SAMPLE_DATA_PATH):
+    """
+    Read (part of) the sample as a DataFrame.
+
+    Args:
+        start_date: First ISO date to include (e.g. '2020-01-01')
+        end_date: Last ISO date to include
+        cities: Only rows for these city names
+        columns: Only these columns (default: all)
+        path: Sample file
+
+    Returns:
+        DataFrame in the sample's row order
+    """
+    import pyarrow.parquet as pq
+
+    filters = []
+    if start_date is not None:
+        filters.append(('date', '>=', start_date))
+    if end_date is not None:
+        filters.append(('date', '<=', end_date))
+    if cities is not None:
+        filters.append(('city', 'in', list(cities)))
+    table = pq.read_table(path, columns=columns, filters=filters or None)
+    return table.to_pandas()
+
+
+def sample_records(start_date: str = None, end_date: str = None, cities=None, columns: list = None) -> list:
+    """The sample as a list of row dicts (what json.loads(SAMPLE_DATA) used to return)."""
+    df = load_sample_data(start_date=start_date, end_date=end_date, cities=cities, columns=columns)
+    # NaN -> None, as JSON null would decode
+    return df.astype(object).where(df.notna(), None).to_dict(orient='records')
+
+
+@lru_cache(maxsize=1)
+def sample_json() -> str:
+    """The whole sample as the JSON string weather_data_json.SAMPLE_DATA used to hold."""
+    return load_sample_data().to_json(orient='records', indent=4, force_ascii=False)
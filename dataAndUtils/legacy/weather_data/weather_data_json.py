@@ -1 +1,17 @@
-SAMPLE_DATA = "[\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-01-01\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":19.6,\n        \"TAVG\":10.44,\n        \"TMAX\":13.48,\n        \"TMIN\":7.66\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-01-02\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":12.4,\n        \"TAVG\":11.46,\n        \"TMAX\":14.2,\n        \"TMIN\":8.96\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-01-03\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":31.6,\n        \"TAVG\":12.64,\n        \"TMAX\":15.04,\n        \"TMIN\":10.54\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-01-04\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":69.2,\n        \"TAVG\":11.6,\n        \"TMAX\":14.94,\n        \"TMIN\":8.98\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-01-05\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":23.6,\n        \"TAVG\":9.54,\n        \"TMAX\":13.62,\n        \"TMIN\":6.28\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-01-06\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":34.4,\n        \"TAVG\":9.24,\n        \"TMAX\":13.52,\n        \"TMIN\":5.98\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-01-07\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":198.8,\n        \"TAVG\":9.98,\n        \"TMAX\":13.5,\n        \"TMIN\":6.84\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-01-08\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":15.2,\n        \"TAVG\":10.72,\n        \"TMAX\":14.42,\n        \"TMIN\":8.04\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-01-09\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":57.2,\n        \"TAVG\":11.0,\n        \"TMAX\":13.96,\n        \"TMIN\":8.48\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-01-10\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":69.6,\n        \"TAVG\":10.74,\n        \"TMAX\":12.66,\n        \"TMIN\":8.6\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-01-11\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":21.6,\n        \"TAVG\":10.1,\n        \"TMAX\":12.98,\n        \"TMIN\":8.24\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-01-12\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":13.0,\n        \"TAVG\":10.06,\n        \"TMAX\":12.58,\n        \"TMIN\":7.46\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-01-13\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":91.6,\n        \"TAVG\":10.42,\n        \"TMAX\":12.62,\n        \"TMIN\":8.1\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-01-14\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":24.8,\n        \"TAVG\":10.62,\n        \"TMAX\":13.6,\n        \"TMIN\":8.04\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-01-15\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":9.2,\n        \"TAVG\":10.3,\n        \"TMAX\":13.26,\n        \"TMIN\":7.36\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-01-16\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":109.2,\n        \"TAVG\":11.12,\n        \"TMAX\":13.72,\n        \"TMIN\":8.88\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-01-17\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":36.4,\n        \"TAVG\":10.42,\n        \"TMAX\":12.9,\n        \"TMIN\":8.52\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-01-18\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":50.0,\n        \"TAVG\":10.02,\n        \"TMAX\":12.2,\n        \"TMIN\":8.6\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-01-19\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":41.2,\n        \"TAVG\":10.22,\n        \"TMAX\":12.24,\n        \"TMIN\":8.46\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-01-20\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":4.4,\n        \"TAVG\":10.42,\n        \"TMAX\":13.34,\n        \"TMIN\":8.12\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-01-21\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":8.4,\n        \"TAVG\":11.2,\n        \"TMAX\":13.86,\n        \"TMIN\":8.9\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-01-22\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":39.6,\n        \"TAVG\":12.0,\n        \"TMAX\":14.08,\n        \"TMIN\":9.96\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-01-23\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":16.0,\n        \"TAVG\":12.24,\n        \"TMAX\":14.94,\n        \"TMIN\":9.94\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-01-24\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":34.0,\n        \"TAVG\":11.94,\n        \"TMAX\":15.18,\n        \"TMIN\":9.14\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-01-25\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":30.0,\n        \"TAVG\":10.7,\n        \"TMAX\":14.28,\n        \"TMIN\":7.62\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-01-26\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":17.6,\n        \"TAVG\":10.88,\n        \"TMAX\":13.56,\n        \"TMIN\":8.02\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-01-27\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":102.0,\n        \"TAVG\":11.28,\n        \"TMAX\":13.28,\n        \"TMIN\":9.82\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-01-28\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":28.8,\n        \"TAVG\":11.38,\n        \"TMAX\":13.46,\n        \"TMIN\":9.48\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-01-29\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":46.4,\n        \"TAVG\":11.82,\n        \"TMAX\":15.04,\n        \"TMIN\":9.0\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-01-30\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":50.0,\n        \"TAVG\":12.32,\n        \"TMAX\":14.86,\n        \"TMIN\":10.22\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-01-31\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":71.2,\n        \"TAVG\":12.58,\n        \"TMAX\":14.38,\n        \"TMIN\":10.66\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-02-01\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":50.0,\n        \"TAVG\":12.06,\n        \"TMAX\":13.88,\n        \"TMIN\":10.32\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-02-02\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":56.8,\n        \"TAVG\":11.9,\n        \"TMAX\":14.68,\n        \"TMIN\":9.64\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-02-03\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":57.6,\n        \"TAVG\":11.7,\n        \"TMAX\":14.96,\n        \"TMIN\":8.6\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-02-04\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":58.0,\n        \"TAVG\":10.76,\n        \"TMAX\":13.58,\n        \"TMIN\":7.6\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-02-05\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":1.6,\n        \"TAVG\":10.68,\n        \"TMAX\":14.08,\n        \"TMIN\":8.18\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-02-06\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":79.6,\n        \"TAVG\":11.52,\n        \"TMAX\":14.46,\n        \"TMIN\":8.76\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-02-07\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":14.4,\n        \"TAVG\":10.74,\n        \"TMAX\":13.16,\n        \"TMIN\":8.5\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-02-08\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":18.4,\n        \"TAVG\":10.78,\n        \"TMAX\":13.36,\n        \"TMIN\":8.16\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-02-09\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":78.0,\n        \"TAVG\":11.86,\n        \"TMAX\":14.28,\n        \"TMIN\":9.44\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-02-10\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":65.2,\n        \"TAVG\":11.5,\n        \"TMAX\":14.46,\n        \"TMIN\":8.92\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-02-11\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":61.8,\n        \"TAVG\":10.76,\n        \"TMAX\":13.0,\n        \"TMIN\":8.54\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-02-12\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":55.2,\n        \"TAVG\":10.66,\n        \"TMAX\":13.34,\n        \"TMIN\":8.32\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-02-13\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":54.8,\n        \"TAVG\":12.04,\n        \"TMAX\":15.14,\n        \"TMIN\":8.94\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-02-14\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":54.0,\n        \"TAVG\":12.92,\n        \"TMAX\":16.18,\n        \"TMIN\":10.02\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-02-15\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":38.8,\n        \"TAVG\":13.46,\n        \"TMAX\":16.22,\n        \"TMIN\":10.94\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-02-16\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":79.2,\n        \"TAVG\":12.64,\n        \"TMAX\":16.96,\n        \"TMIN\":9.08\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-02-17\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":73.2,\n        \"TAVG\":10.82,\n        \"TMAX\":14.02,\n        \"TMIN\":8.08\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-02-18\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":18.4,\n        \"TAVG\":9.78,\n        \"TMAX\":12.72,\n        \"TMIN\":7.3\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-02-19\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":0.8,\n        \"TAVG\":10.0,\n        \"TMAX\":13.58,\n        \"TMIN\":6.7\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-02-20\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":0.0,\n        \"TAVG\":11.24,\n        \"TMAX\":14.9,\n        \"TMIN\":8.52\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-02-21\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":0.0,\n        \"TAVG\":12.38,\n        \"TMAX\":15.76,\n        \"TMIN\":9.94\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-02-22\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":0.8,\n        \"TAVG\":12.0,\n        \"TMAX\":16.38,\n        \"TMIN\":8.7\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-02-23\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":3.6,\n        \"TAVG\":11.38,\n        \"TMAX\":14.56,\n        \"TMIN\":8.96\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-02-24\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":29.2,\n        \"TAVG\":11.62,\n        \"TMAX\":15.7,\n        \"TMIN\":8.6\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-02-25\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":29.6,\n        \"TAVG\":11.84,\n        \"TMAX\":16.38,\n        \"TMIN\":8.74\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-02-26\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":23.0,\n        \"TAVG\":11.78,\n        \"TMAX\":15.62,\n        \"TMIN\":9.06\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-02-27\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":39.2,\n        \"TAVG\":10.98,\n        \"TMAX\":13.38,\n        \"TMIN\":8.68\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-02-28\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":100.8,\n        \"TAVG\":10.34,\n        \"TMAX\":13.06,\n        \"TMIN\":8.08\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-02-29\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":10.0,\n        \"TAVG\":11.1,\n        \"TMAX\":13.1,\n        \"TMIN\":9.2\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-03-01\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":155.6,\n        \"TAVG\":11.6,\n        \"TMAX\":15.06,\n        \"TMIN\":8.76\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-03-02\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":42.8,\n        \"TAVG\":11.58,\n        \"TMAX\":14.78,\n        \"TMIN\":9.22\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-03-03\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":71.2,\n        \"TAVG\":11.98,\n        \"TMAX\":14.96,\n        \"TMIN\":9.56\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-03-04\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":63.6,\n        \"TAVG\":11.66,\n        \"TMAX\":14.4,\n        \"TMIN\":8.9\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-03-05\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":101.2,\n        \"TAVG\":11.7,\n        \"TMAX\":14.56,\n        \"TMIN\":9.6\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-03-06\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":38.8,\n        \"TAVG\":11.12,\n        \"TMAX\":13.54,\n        \"TMIN\":9.14\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-03-07\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":27.6,\n        \"TAVG\":11.42,\n        \"TMAX\":13.92,\n        \"TMIN\":9.32\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-03-08\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":23.2,\n        \"TAVG\":12.32,\n        \"TMAX\":15.08,\n        \"TMIN\":9.32\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-03-09\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":15.6,\n        \"TAVG\":13.42,\n        \"TMAX\":17.12,\n        \"TMIN\":10.62\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-03-10\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":30.0,\n        \"TAVG\":13.72,\n        \"TMAX\":17.72,\n        \"TMIN\":10.66\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-03-11\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":10.4,\n        \"TAVG\":12.34,\n        \"TMAX\":14.96,\n        \"TMIN\":10.14\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-03-12\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":30.8,\n        \"TAVG\":11.22,\n        \"TMAX\":14.44,\n        \"TMIN\":8.2\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-03-13\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":2.8,\n        \"TAVG\":11.3,\n        \"TMAX\":14.8,\n        \"TMIN\":8.6\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-03-14\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":39.2,\n        \"TAVG\":11.98,\n        \"TMAX\":15.5,\n        \"TMIN\":8.9\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-03-15\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":38.0,\n        \"TAVG\":11.38,\n        \"TMAX\":15.22,\n        \"TMIN\":8.38\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-03-16\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":56.8,\n        \"TAVG\":10.8,\n        \"TMAX\":15.0,\n        \"TMIN\":7.68\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-03-17\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":0.4,\n        \"TAVG\":11.14,\n        \"TMAX\":14.74,\n        \"TMIN\":8.34\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-03-18\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":20.2,\n        \"TAVG\":10.78,\n        \"TMAX\":14.08,\n        \"TMIN\":8.1\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-03-19\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":35.2,\n        \"TAVG\":10.8,\n        \"TMAX\":13.26,\n        \"TMIN\":8.82\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-03-20\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":54.2,\n        \"TAVG\":11.4,\n        \"TMAX\":14.0,\n        \"TMIN\":9.76\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-03-21\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":20.4,\n        \"TAVG\":11.26,\n        \"TMAX\":14.8,\n        \"TMIN\":9.08\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-03-22\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":34.0,\n        \"TAVG\":10.42,\n        \"TMAX\":13.82,\n        \"TMIN\":7.34\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-03-23\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":49.6,\n        \"TAVG\":10.96,\n        \"TMAX\":14.08,\n        \"TMIN\":8.0\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-03-24\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":22.8,\n        \"TAVG\":11.28,\n        \"TMAX\":15.22,\n        \"TMIN\":7.7\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-03-25\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":22.4,\n        \"TAVG\":11.52,\n        \"TMAX\":14.38,\n        \"TMIN\":9.16\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-03-26\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":19.6,\n        \"TAVG\":11.98,\n        \"TMAX\":15.6,\n        \"TMIN\":8.94\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-03-27\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":18.8,\n        \"TAVG\":12.52,\n        \"TMAX\":16.54,\n        \"TMIN\":9.44\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-03-28\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":57.2,\n        \"TAVG\":13.3,\n        \"TMAX\":17.44,\n        \"TMIN\":9.66\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-03-29\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":143.6,\n        \"TAVG\":12.62,\n        \"TMAX\":16.54,\n        \"TMIN\":9.4\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-03-30\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":95.6,\n        \"TAVG\":10.62,\n        \"TMAX\":13.9,\n        \"TMIN\":8.12\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-03-31\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":22.0,\n        \"TAVG\":11.06,\n        \"TMAX\":14.44,\n        \"TMIN\":7.98\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-04-01\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":19.6,\n        \"TAVG\":12.28,\n        \"TMAX\":15.96,\n        \"TMIN\":9.2\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-04-02\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":16.4,\n        \"TAVG\":12.32,\n        \"TMAX\":15.16,\n        \"TMIN\":10.14\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-04-03\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":23.6,\n        \"TAVG\":11.38,\n        \"TMAX\":14.88,\n        \"TMIN\":8.32\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-04-04\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":49.6,\n        \"TAVG\":12.3,\n        \"TMAX\":15.56,\n        \"TMIN\":9.1\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-04-05\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":62.8,\n        \"TAVG\":12.5,\n        \"TMAX\":16.06,\n        \"TMIN\":9.66\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-04-06\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":24.8,\n        \"TAVG\":12.32,\n        \"TMAX\":16.22,\n        \"TMIN\":9.24\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-04-07\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":38.8,\n        \"TAVG\":13.02,\n        \"TMAX\":16.7,\n        \"TMIN\":10.0\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-04-08\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":34.0,\n        \"TAVG\":12.7,\n        \"TMAX\":16.66,\n        \"TMIN\":10.0\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-04-09\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":85.2,\n        \"TAVG\":12.92,\n        \"TMAX\":16.36,\n        \"TMIN\":10.0\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-04-10\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":52.8,\n        \"TAVG\":12.08,\n        \"TMAX\":14.8,\n        \"TMIN\":9.48\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-04-11\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":13.6,\n        \"TAVG\":11.74,\n        \"TMAX\":15.28,\n        \"TMIN\":8.8\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-04-12\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":38.0,\n        \"TAVG\":12.3,\n        \"TMAX\":16.16,\n        \"TMIN\":8.98\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-04-13\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":21.6,\n        \"TAVG\":13.22,\n        \"TMAX\":17.06,\n        \"TMIN\":9.74\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-04-14\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":5.2,\n        \"TAVG\":15.06,\n        \"TMAX\":19.66,\n        \"TMIN\":11.88\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-04-15\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":64.0,\n        \"TAVG\":13.26,\n        \"TMAX\":16.2,\n        \"TMIN\":11.16\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-04-16\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":51.2,\n        \"TAVG\":13.5,\n        \"TMAX\":17.76,\n        \"TMIN\":9.94\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-04-17\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":17.2,\n        \"TAVG\":14.74,\n        \"TMAX\":18.64,\n        \"TMIN\":11.68\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-04-18\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":24.8,\n        \"TAVG\":14.42,\n        \"TMAX\":19.28,\n        \"TMIN\":10.82\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-04-19\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":4.4,\n        \"TAVG\":14.66,\n        \"TMAX\":18.28,\n        \"TMIN\":12.3\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-04-20\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":0.0,\n        \"TAVG\":14.2,\n        \"TMAX\":17.94,\n        \"TMIN\":11.66\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-04-21\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":6.8,\n        \"TAVG\":14.82,\n        \"TMAX\":18.42,\n        \"TMIN\":11.62\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-04-22\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":4.8,\n        \"TAVG\":14.1,\n        \"TMAX\":17.62,\n        \"TMIN\":11.4\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-04-23\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":28.4,\n        \"TAVG\":13.32,\n        \"TMAX\":16.66,\n        \"TMIN\":10.16\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-04-24\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":23.2,\n        \"TAVG\":12.98,\n        \"TMAX\":16.86,\n        \"TMIN\":10.66\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-04-25\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":19.6,\n        \"TAVG\":12.66,\n        \"TMAX\":15.44,\n        \"TMIN\":10.36\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-04-26\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":0.8,\n        \"TAVG\":12.48,\n        \"TMAX\":16.06,\n        \"TMIN\":10.06\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-04-27\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":5.6,\n        \"TAVG\":12.26,\n        \"TMAX\":15.4,\n        \"TMIN\":9.68\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-04-28\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":8.0,\n        \"TAVG\":12.64,\n        \"TMAX\":16.48,\n        \"TMIN\":9.26\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-04-29\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":43.2,\n        \"TAVG\":12.56,\n        \"TMAX\":16.0,\n        \"TMIN\":9.8\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-04-30\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":18.4,\n        \"TAVG\":12.38,\n        \"TMAX\":14.86,\n        \"TMIN\":9.94\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-05-01\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":5.2,\n        \"TAVG\":13.38,\n        \"TMAX\":16.34,\n        \"TMIN\":10.44\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-05-02\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":12.4,\n        \"TAVG\":14.24,\n        \"TMAX\":17.96,\n        \"TMIN\":11.34\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-05-03\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":0.0,\n        \"TAVG\":14.86,\n        \"TMAX\":18.92,\n        \"TMIN\":10.86\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-05-04\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":8.4,\n        \"TAVG\":16.4,\n        \"TMAX\":21.2,\n        \"TMIN\":12.22\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-05-05\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":16.4,\n        \"TAVG\":15.7,\n        \"TMAX\":20.24,\n        \"TMIN\":12.52\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-05-06\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":6.0,\n        \"TAVG\":15.92,\n        \"TMAX\":19.6,\n        \"TMIN\":12.7\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-05-07\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":9.6,\n        \"TAVG\":15.76,\n        \"TMAX\":18.92,\n        \"TMIN\":13.66\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-05-08\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":5.2,\n        \"TAVG\":15.48,\n        \"TMAX\":19.38,\n        \"TMIN\":13.14\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-05-09\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":101.6,\n        \"TAVG\":15.08,\n        \"TMAX\":18.96,\n        \"TMIN\":13.04\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-05-10\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":40.4,\n        \"TAVG\":14.88,\n        \"TMAX\":18.16,\n        \"TMIN\":12.2\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-05-11\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":9.6,\n        \"TAVG\":14.4,\n        \"TMAX\":17.86,\n        \"TMIN\":11.34\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-05-12\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":37.2,\n        \"TAVG\":14.52,\n        \"TMAX\":18.18,\n        \"TMIN\":11.74\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-05-13\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":41.2,\n        \"TAVG\":14.88,\n        \"TMAX\":18.7,\n        \"TMIN\":11.84\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-05-14\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":7.2,\n        \"TAVG\":15.76,\n        \"TMAX\":18.76,\n        \"TMIN\":12.96\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-05-15\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":1.6,\n        \"TAVG\":15.18,\n        \"TMAX\":18.42,\n        \"TMIN\":13.54\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-05-16\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":7.2,\n        \"TAVG\":15.1,\n        \"TMAX\":18.66,\n        \"TMIN\":12.58\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-05-17\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":8.4,\n        \"TAVG\":14.54,\n        \"TMAX\":17.84,\n        \"TMIN\":11.62\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-05-18\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":6.8,\n        \"TAVG\":14.92,\n        \"TMAX\":18.42,\n        \"TMIN\":12.16\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-05-19\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":0.0,\n        \"TAVG\":15.88,\n        \"TMAX\":19.88,\n        \"TMIN\":12.18\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-05-20\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":0.0,\n        \"TAVG\":15.32,\n        \"TMAX\":18.02,\n        \"TMIN\":12.18\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-05-21\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":32.4,\n        \"TAVG\":16.42,\n        \"TMAX\":20.92,\n        \"TMIN\":12.82\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-05-22\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":1.6,\n        \"TAVG\":15.92,\n        \"TMAX\":19.14,\n        \"TMIN\":13.06\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-05-23\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":0.8,\n        \"TAVG\":16.42,\n        \"TMAX\":20.2,\n        \"TMIN\":12.7\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-05-24\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":4.0,\n        \"TAVG\":17.62,\n        \"TMAX\":21.94,\n        \"TMIN\":14.44\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-05-25\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":18.0,\n        \"TAVG\":16.38,\n        \"TMAX\":19.52,\n        \"TMIN\":13.98\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-05-26\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":24.0,\n        \"TAVG\":16.12,\n        \"TMAX\":19.62,\n        \"TMIN\":13.78\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-05-27\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":18.0,\n        \"TAVG\":17.3,\n        \"TMAX\":20.94,\n        \"TMIN\":14.24\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-05-28\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":29.6,\n        \"TAVG\":17.36,\n        \"TMAX\":21.08,\n        \"TMIN\":14.8\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-05-29\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":4.4,\n        \"TAVG\":16.6,\n        \"TMAX\":19.62,\n        \"TMIN\":14.3\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-05-30\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":0.0,\n        \"TAVG\":17.18,\n        \"TMAX\":20.44,\n        \"TMIN\":14.58\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-05-31\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":3.2,\n        \"TAVG\":17.9,\n        \"TMAX\":22.08,\n        \"TMIN\":14.84\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-06-01\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":1.6,\n        \"TAVG\":17.38,\n        \"TMAX\":21.38,\n        \"TMIN\":14.28\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-06-02\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":18.8,\n        \"TAVG\":17.12,\n        \"TMAX\":21.3,\n        \"TMIN\":14.06\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-06-03\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":15.6,\n        \"TAVG\":16.28,\n        \"TMAX\":18.82,\n        \"TMIN\":14.32\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-06-04\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":43.6,\n        \"TAVG\":15.9,\n        \"TMAX\":18.86,\n        \"TMIN\":13.66\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-06-05\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":22.8,\n        \"TAVG\":15.88,\n        \"TMAX\":19.14,\n        \"TMIN\":13.12\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-06-06\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":56.4,\n        \"TAVG\":15.6,\n        \"TMAX\":18.82,\n        \"TMIN\":13.74\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-06-07\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":11.6,\n        \"TAVG\":15.88,\n        \"TMAX\":19.3,\n        \"TMIN\":13.16\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-06-08\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":34.0,\n        \"TAVG\":15.88,\n        \"TMAX\":18.96,\n        \"TMIN\":13.48\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-06-09\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":52.8,\n        \"TAVG\":16.06,\n        \"TMAX\":19.16,\n        \"TMIN\":14.06\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-06-10\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":12.4,\n        \"TAVG\":16.72,\n        \"TMAX\":20.04,\n        \"TMIN\":13.4\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-06-11\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":26.4,\n        \"TAVG\":16.2,\n        \"TMAX\":18.62,\n        \"TMIN\":13.9\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-06-12\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":34.4,\n        \"TAVG\":16.58,\n        \"TMAX\":19.58,\n        \"TMIN\":14.84\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-06-13\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":3.2,\n        \"TAVG\":16.48,\n        \"TMAX\":19.68,\n        \"TMIN\":14.2\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-06-14\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":19.2,\n        \"TAVG\":16.54,\n        \"TMAX\":19.54,\n        \"TMIN\":14.04\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-06-15\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":54.4,\n        \"TAVG\":15.84,\n        \"TMAX\":18.24,\n        \"TMIN\":13.8\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-06-16\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":23.6,\n        \"TAVG\":16.96,\n        \"TMAX\":20.64,\n        \"TMIN\":13.7\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-06-17\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":24.0,\n        \"TAVG\":17.58,\n        \"TMAX\":21.1,\n        \"TMIN\":14.58\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-06-18\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":3.6,\n        \"TAVG\":18.34,\n        \"TMAX\":21.68,\n        \"TMIN\":15.04\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-06-19\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":0.0,\n        \"TAVG\":18.1,\n        \"TMAX\":22.06,\n        \"TMIN\":14.9\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-06-20\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":0.0,\n        \"TAVG\":19.2,\n        \"TMAX\":23.0,\n        \"TMIN\":15.54\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-06-21\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":3.2,\n        \"TAVG\":18.68,\n        \"TMAX\":21.66,\n        \"TMIN\":15.7\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-06-22\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":0.4,\n        \"TAVG\":19.14,\n        \"TMAX\":22.66,\n        \"TMIN\":16.34\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-06-23\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":0.4,\n        \"TAVG\":19.5,\n        \"TMAX\":23.04,\n        \"TMIN\":16.72\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-06-24\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":0.0,\n        \"TAVG\":18.68,\n        \"TMAX\":21.64,\n        \"TMIN\":16.06\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-06-25\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":1.0,\n        \"TAVG\":17.86,\n        \"TMAX\":20.54,\n        \"TMIN\":15.52\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-06-26\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":0.0,\n        \"TAVG\":17.96,\n        \"TMAX\":20.46,\n        \"TMIN\":16.32\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-06-27\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":26.0,\n        \"TAVG\":18.22,\n        \"TMAX\":21.24,\n        \"TMIN\":16.06\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-06-28\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":18.0,\n        \"TAVG\":17.54,\n        \"TMAX\":20.16,\n        \"TMIN\":14.9\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-06-29\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":28.0,\n        \"TAVG\":17.8,\n        \"TMAX\":20.8,\n        \"TMIN\":15.62\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-06-30\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":62.0,\n        \"TAVG\":17.58,\n        \"TMAX\":20.04,\n        \"TMIN\":15.64\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-07-01\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":27.6,\n        \"TAVG\":17.78,\n        \"TMAX\":20.4,\n        \"TMIN\":16.08\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-07-02\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":6.0,\n        \"TAVG\":17.56,\n        \"TMAX\":20.0,\n        \"TMIN\":15.86\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-07-03\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":0.8,\n        \"TAVG\":18.6,\n        \"TMAX\":22.16,\n        \"TMIN\":15.34\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-07-04\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":0.0,\n        \"TAVG\":19.82,\n        \"TMAX\":24.46,\n        \"TMIN\":16.46\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-07-05\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":0.0,\n        \"TAVG\":18.44,\n        \"TMAX\":21.04,\n        \"TMIN\":16.64\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-07-06\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":0.0,\n        \"TAVG\":18.9,\n        \"TMAX\":21.88,\n        \"TMIN\":16.28\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-07-07\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":0.0,\n        \"TAVG\":19.1,\n        \"TMAX\":22.36,\n        \"TMIN\":16.54\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-07-08\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":0.0,\n        \"TAVG\":18.36,\n        \"TMAX\":21.3,\n        \"TMIN\":16.62\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-07-09\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":2.8,\n        \"TAVG\":18.72,\n        \"TMAX\":22.06,\n        \"TMIN\":16.26\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-07-10\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":0.2,\n        \"TAVG\":18.68,\n        \"TMAX\":22.2,\n        \"TMIN\":16.28\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-07-11\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":3.2,\n        \"TAVG\":19.04,\n        \"TMAX\":22.8,\n        \"TMIN\":16.14\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-07-12\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":0.0,\n        \"TAVG\":19.36,\n        \"TMAX\":23.1,\n        \"TMIN\":16.88\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-07-13\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":1.2,\n        \"TAVG\":19.12,\n        \"TMAX\":22.34,\n        \"TMIN\":16.68\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-07-14\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":4.0,\n        \"TAVG\":19.08,\n        \"TMAX\":22.7,\n        \"TMIN\":16.54\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-07-15\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":0.8,\n        \"TAVG\":18.86,\n        \"TMAX\":22.6,\n        \"TMIN\":16.7\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-07-16\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":0.0,\n        \"TAVG\":20.0,\n        \"TMAX\":24.58,\n        \"TMIN\":16.56\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-07-17\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":0.0,\n        \"TAVG\":20.2,\n        \"TMAX\":24.14,\n        \"TMIN\":16.98\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-07-18\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":0.0,\n        \"TAVG\":20.98,\n        \"TMAX\":25.98,\n        \"TMIN\":16.78\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-07-19\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":4.0,\n        \"TAVG\":19.0,\n        \"TMAX\":21.8,\n        \"TMIN\":16.7\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-07-20\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":0.0,\n        \"TAVG\":18.96,\n        \"TMAX\":21.72,\n        \"TMIN\":16.74\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-07-21\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":3.6,\n        \"TAVG\":19.16,\n        \"TMAX\":23.0,\n        \"TMIN\":16.28\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-07-22\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":0.0,\n        \"TAVG\":19.38,\n        \"TMAX\":22.74,\n        \"TMIN\":16.8\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-07-23\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":3.2,\n        \"TAVG\":19.32,\n        \"TMAX\":23.28,\n        \"TMIN\":16.82\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-07-24\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":0.4,\n        \"TAVG\":19.42,\n        \"TMAX\":22.8,\n        \"TMIN\":16.86\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-07-25\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":0.4,\n        \"TAVG\":19.88,\n        \"TMAX\":23.46,\n        \"TMIN\":17.66\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-07-26\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":9.6,\n        \"TAVG\":19.62,\n        \"TMAX\":22.88,\n        \"TMIN\":17.6\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-07-27\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":19.6,\n        \"TAVG\":19.18,\n        \"TMAX\":22.48,\n        \"TMIN\":16.82\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-07-28\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":0.0,\n        \"TAVG\":19.14,\n        \"TMAX\":22.44,\n        \"TMIN\":16.3\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-07-29\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":3.2,\n        \"TAVG\":20.12,\n        \"TMAX\":23.8,\n        \"TMIN\":16.86\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-07-30\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":7.2,\n        \"TAVG\":19.2,\n        \"TMAX\":22.54,\n        \"TMIN\":17.1\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-07-31\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":0.0,\n        \"TAVG\":18.84,\n        \"TMAX\":22.56,\n        \"TMIN\":16.26\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-08-01\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":0.0,\n        \"TAVG\":18.94,\n        \"TMAX\":21.96,\n        \"TMIN\":16.1\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-08-02\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":1.2,\n        \"TAVG\":20.54,\n        \"TMAX\":24.88,\n        \"TMIN\":16.52\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-08-03\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":2.4,\n        \"TAVG\":20.98,\n        \"TMAX\":24.68,\n        \"TMIN\":18.12\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-08-04\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":9.2,\n        \"TAVG\":20.44,\n        \"TMAX\":23.72,\n        \"TMIN\":17.7\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-08-05\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":0.0,\n        \"TAVG\":20.36,\n        \"TMAX\":24.34,\n        \"TMIN\":16.96\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-08-06\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":0.4,\n        \"TAVG\":20.52,\n        \"TMAX\":24.18,\n        \"TMIN\":17.42\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-08-07\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":4.8,\n        \"TAVG\":19.92,\n        \"TMAX\":23.7,\n        \"TMIN\":17.48\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-08-08\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":70.0,\n        \"TAVG\":19.76,\n        \"TMAX\":23.7,\n        \"TMIN\":17.3\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-08-09\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":0.8,\n        \"TAVG\":19.2,\n        \"TMAX\":22.28,\n        \"TMIN\":16.72\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-08-10\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":0.8,\n        \"TAVG\":18.6,\n        \"TMAX\":21.56,\n        \"TMIN\":16.3\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-08-11\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":128.0,\n        \"TAVG\":18.88,\n        \"TMAX\":22.44,\n        \"TMIN\":16.0\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-08-12\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":23.2,\n        \"TAVG\":19.24,\n        \"TMAX\":23.56,\n        \"TMIN\":16.26\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-08-13\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":0.8,\n        \"TAVG\":18.96,\n        \"TMAX\":22.68,\n        \"TMIN\":15.96\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-08-14\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":1.2,\n        \"TAVG\":19.44,\n        \"TMAX\":22.78,\n        \"TMIN\":16.92\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-08-15\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":8.0,\n        \"TAVG\":19.08,\n        \"TMAX\":22.48,\n        \"TMIN\":16.56\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-08-16\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":27.6,\n        \"TAVG\":19.88,\n        \"TMAX\":23.68,\n        \"TMIN\":16.84\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-08-17\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":52.8,\n        \"TAVG\":20.86,\n        \"TMAX\":24.02,\n        \"TMIN\":18.7\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-08-18\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":14.4,\n        \"TAVG\":20.18,\n        \"TMAX\":24.12,\n        \"TMIN\":17.12\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-08-19\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":16.0,\n        \"TAVG\":19.88,\n        \"TMAX\":23.86,\n        \"TMIN\":16.92\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-08-20\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":1.2,\n        \"TAVG\":20.06,\n        \"TMAX\":23.98,\n        \"TMIN\":16.74\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-08-21\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":0.0,\n        \"TAVG\":21.02,\n        \"TMAX\":26.24,\n        \"TMIN\":16.88\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-08-22\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":0.0,\n        \"TAVG\":21.04,\n        \"TMAX\":25.48,\n        \"TMIN\":17.28\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-08-23\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":0.8,\n        \"TAVG\":20.04,\n        \"TMAX\":24.16,\n        \"TMIN\":17.54\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-08-24\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":3.2,\n        \"TAVG\":19.1,\n        \"TMAX\":22.98,\n        \"TMIN\":16.58\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-08-25\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":2.0,\n        \"TAVG\":19.32,\n        \"TMAX\":22.22,\n        \"TMIN\":16.8\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-08-26\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":0.2,\n        \"TAVG\":19.8,\n        \"TMAX\":22.92,\n        \"TMIN\":17.36\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-08-27\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":23.6,\n        \"TAVG\":19.98,\n        \"TMAX\":23.2,\n        \"TMIN\":17.56\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-08-28\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":14.4,\n        \"TAVG\":19.64,\n        \"TMAX\":23.46,\n        \"TMIN\":17.18\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-08-29\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":6.8,\n        \"TAVG\":18.42,\n        \"TMAX\":20.98,\n        \"TMIN\":16.26\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-08-30\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":0.8,\n        \"TAVG\":18.62,\n        \"TMAX\":21.96,\n        \"TMIN\":15.78\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-08-31\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":1.6,\n        \"TAVG\":18.24,\n        \"TMAX\":21.32,\n        \"TMIN\":15.74\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-09-01\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":0.0,\n        \"TAVG\":19.18,\n        \"TMAX\":23.4,\n        \"TMIN\":15.76\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-09-02\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":1.2,\n        \"TAVG\":19.74,\n        \"TMAX\":24.78,\n        \"TMIN\":16.36\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-09-03\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":4.8,\n        \"TAVG\":20.14,\n        \"TMAX\":25.1,\n        \"TMIN\":16.32\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-09-04\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":1.2,\n        \"TAVG\":19.12,\n        \"TMAX\":22.64,\n        \"TMIN\":17.08\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-09-05\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":2.4,\n        \"TAVG\":18.24,\n        \"TMAX\":21.46,\n        \"TMIN\":16.56\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-09-06\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":0.0,\n        \"TAVG\":18.54,\n        \"TMAX\":22.9,\n        \"TMIN\":15.96\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-09-07\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":4.0,\n        \"TAVG\":18.62,\n        \"TMAX\":22.74,\n        \"TMIN\":15.88\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-09-08\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":2.6,\n        \"TAVG\":18.72,\n        \"TMAX\":23.82,\n        \"TMIN\":15.12\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-09-09\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":6.8,\n        \"TAVG\":18.28,\n        \"TMAX\":22.6,\n        \"TMIN\":15.18\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-09-10\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":9.8,\n        \"TAVG\":18.44,\n        \"TMAX\":22.44,\n        \"TMIN\":15.78\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-09-11\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":4.0,\n        \"TAVG\":18.36,\n        \"TMAX\":22.82,\n        \"TMIN\":15.46\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-09-12\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":76.0,\n        \"TAVG\":19.76,\n        \"TMAX\":24.3,\n        \"TMIN\":16.18\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-09-13\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":46.4,\n        \"TAVG\":20.0,\n        \"TMAX\":25.0,\n        \"TMIN\":16.6\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-09-14\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":24.4,\n        \"TAVG\":17.98,\n        \"TMAX\":21.1,\n        \"TMIN\":15.96\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-09-15\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":3.6,\n        \"TAVG\":18.42,\n        \"TMAX\":22.12,\n        \"TMIN\":15.98\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-09-16\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":0.4,\n        \"TAVG\":17.94,\n        \"TMAX\":21.62,\n        \"TMIN\":15.54\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-09-17\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":49.2,\n        \"TAVG\":18.32,\n        \"TMAX\":23.08,\n        \"TMIN\":15.4\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-09-18\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":1.2,\n        \"TAVG\":18.84,\n        \"TMAX\":23.2,\n        \"TMIN\":16.52\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-09-19\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":2.0,\n        \"TAVG\":18.02,\n        \"TMAX\":22.34,\n        \"TMIN\":14.92\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-09-20\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":11.6,\n        \"TAVG\":17.58,\n        \"TMAX\":21.16,\n        \"TMIN\":14.46\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-09-21\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":18.8,\n        \"TAVG\":17.88,\n        \"TMAX\":20.56,\n        \"TMIN\":15.54\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-09-22\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":6.8,\n        \"TAVG\":18.34,\n        \"TMAX\":21.86,\n        \"TMIN\":15.62\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-09-23\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":18.8,\n        \"TAVG\":18.38,\n        \"TMAX\":21.88,\n        \"TMIN\":15.48\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-09-24\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":36.0,\n        \"TAVG\":17.64,\n        \"TMAX\":20.7,\n        \"TMIN\":15.2\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-09-25\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":1.6,\n        \"TAVG\":17.22,\n        \"TMAX\":20.74,\n        \"TMIN\":14.78\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-09-26\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":16.4,\n        \"TAVG\":18.26,\n        \"TMAX\":22.28,\n        \"TMIN\":14.38\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-09-27\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":6.8,\n        \"TAVG\":18.42,\n        \"TMAX\":21.48,\n        \"TMIN\":16.0\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-09-28\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":0.0,\n        \"TAVG\":17.42,\n        \"TMAX\":21.1,\n        \"TMIN\":14.32\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-09-29\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":7.2,\n        \"TAVG\":17.22,\n        \"TMAX\":20.94,\n        \"TMIN\":14.78\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-09-30\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":15.6,\n        \"TAVG\":17.8,\n        \"TMAX\":20.82,\n        \"TMIN\":15.42\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-10-01\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":26.0,\n        \"TAVG\":17.62,\n        \"TMAX\":20.72,\n        \"TMIN\":15.5\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-10-02\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":31.6,\n        \"TAVG\":16.46,\n        \"TMAX\":20.24,\n        \"TMIN\":13.68\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-10-03\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":8.0,\n        \"TAVG\":17.08,\n        \"TMAX\":21.24,\n        \"TMIN\":13.54\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-10-04\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":12.0,\n        \"TAVG\":17.14,\n        \"TMAX\":21.36,\n        \"TMIN\":14.14\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-10-05\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":8.8,\n        \"TAVG\":16.72,\n        \"TMAX\":19.88,\n        \"TMIN\":13.9\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-10-06\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":10.8,\n        \"TAVG\":17.02,\n        \"TMAX\":20.06,\n        \"TMIN\":14.66\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-10-07\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":2.0,\n        \"TAVG\":16.92,\n        \"TMAX\":20.7,\n        \"TMIN\":13.36\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-10-08\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":11.6,\n        \"TAVG\":16.34,\n        \"TMAX\":20.34,\n        \"TMIN\":12.72\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-10-09\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":0.0,\n        \"TAVG\":16.4,\n        \"TMAX\":21.0,\n        \"TMIN\":13.16\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-10-10\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":15.6,\n        \"TAVG\":16.38,\n        \"TMAX\":20.9,\n        \"TMIN\":12.78\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-10-11\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":16.8,\n        \"TAVG\":16.04,\n        \"TMAX\":19.12,\n        \"TMIN\":13.58\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-10-12\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":48.0,\n        \"TAVG\":17.14,\n        \"TMAX\":20.18,\n        \"TMIN\":14.42\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-10-13\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":103.2,\n        \"TAVG\":16.28,\n        \"TMAX\":19.52,\n        \"TMIN\":13.08\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-10-14\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":64.0,\n        \"TAVG\":14.62,\n        \"TMAX\":18.04,\n        \"TMIN\":12.18\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-10-15\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":18.4,\n        \"TAVG\":17.16,\n        \"TMAX\":20.94,\n        \"TMIN\":14.0\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-10-16\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":59.6,\n        \"TAVG\":15.9,\n        \"TMAX\":20.08,\n        \"TMIN\":12.9\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-10-17\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":29.6,\n        \"TAVG\":15.46,\n        \"TMAX\":18.52,\n        \"TMIN\":13.46\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-10-18\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":21.2,\n        \"TAVG\":15.88,\n        \"TMAX\":19.26,\n        \"TMIN\":13.6\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-10-19\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":30.4,\n        \"TAVG\":15.98,\n        \"TMAX\":18.86,\n        \"TMIN\":13.96\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-10-20\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":39.6,\n        \"TAVG\":16.52,\n        \"TMAX\":19.96,\n        \"TMIN\":13.88\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-10-21\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":10.0,\n        \"TAVG\":15.1,\n        \"TMAX\":18.5,\n        \"TMIN\":12.54\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-10-22\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":52.4,\n        \"TAVG\":15.0,\n        \"TMAX\":18.58,\n        \"TMIN\":12.18\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-10-23\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":13.6,\n        \"TAVG\":15.26,\n        \"TMAX\":18.86,\n        \"TMIN\":12.32\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-10-24\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":60.0,\n        \"TAVG\":16.08,\n        \"TMAX\":21.18,\n        \"TMIN\":12.9\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-10-25\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":39.6,\n        \"TAVG\":15.98,\n        \"TMAX\":21.64,\n        \"TMIN\":12.22\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-10-26\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":2.4,\n        \"TAVG\":16.32,\n        \"TMAX\":20.42,\n        \"TMIN\":13.36\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-10-27\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":33.2,\n        \"TAVG\":16.46,\n        \"TMAX\":20.34,\n        \"TMIN\":13.3\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-10-28\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":22.4,\n        \"TAVG\":15.78,\n        \"TMAX\":19.18,\n        \"TMIN\":13.1\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-10-29\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":20.8,\n        \"TAVG\":15.54,\n        \"TMAX\":18.94,\n        \"TMIN\":12.94\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-10-30\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":23.2,\n        \"TAVG\":15.58,\n        \"TMAX\":19.54,\n        \"TMIN\":13.04\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-10-31\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":8.8,\n        \"TAVG\":16.2,\n        \"TMAX\":20.06,\n        \"TMIN\":13.08\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-11-01\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":38.0,\n        \"TAVG\":17.32,\n        \"TMAX\":19.98,\n        \"TMIN\":14.62\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-11-02\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":48.4,\n        \"TAVG\":15.96,\n        \"TMAX\":19.14,\n        \"TMIN\":13.6\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-11-03\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":26.0,\n        \"TAVG\":14.7,\n        \"TMAX\":16.96,\n        \"TMIN\":12.7\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-11-04\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":125.2,\n        \"TAVG\":13.7,\n        \"TMAX\":16.18,\n        \"TMIN\":11.64\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-11-05\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":24.4,\n        \"TAVG\":13.2,\n        \"TMAX\":15.26,\n        \"TMIN\":11.4\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-11-06\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":80.0,\n        \"TAVG\":13.08,\n        \"TMAX\":15.98,\n        \"TMIN\":10.66\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-11-07\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":65.0,\n        \"TAVG\":12.12,\n        \"TMAX\":14.74,\n        \"TMIN\":9.26\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-11-08\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":75.2,\n        \"TAVG\":12.72,\n        \"TMAX\":15.36,\n        \"TMIN\":10.28\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-11-09\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":91.4,\n        \"TAVG\":13.24,\n        \"TMAX\":15.4,\n        \"TMIN\":11.18\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-11-10\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":33.6,\n        \"TAVG\":13.72,\n        \"TMAX\":15.94,\n        \"TMIN\":11.8\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-11-11\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":19.2,\n        \"TAVG\":13.82,\n        \"TMAX\":16.04,\n        \"TMIN\":11.58\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-11-12\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":75.6,\n        \"TAVG\":14.04,\n        \"TMAX\":17.02,\n        \"TMIN\":11.88\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-11-13\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":16.0,\n        \"TAVG\":13.26,\n        \"TMAX\":16.3,\n        \"TMIN\":10.32\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-11-14\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":17.6,\n        \"TAVG\":13.42,\n        \"TMAX\":17.08,\n        \"TMIN\":10.42\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-11-15\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":44.4,\n        \"TAVG\":13.34,\n        \"TMAX\":17.38,\n        \"TMIN\":10.64\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-11-16\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":12.8,\n        \"TAVG\":12.92,\n        \"TMAX\":16.88,\n        \"TMIN\":9.8\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-11-17\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":13.6,\n        \"TAVG\":13.68,\n        \"TMAX\":17.82,\n        \"TMIN\":10.44\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-11-18\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":22.4,\n        \"TAVG\":13.92,\n        \"TMAX\":17.26,\n        \"TMIN\":10.72\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-11-19\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":76.0,\n        \"TAVG\":12.38,\n        \"TMAX\":15.84,\n        \"TMIN\":10.1\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-11-20\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":38.4,\n        \"TAVG\":12.42,\n        \"TMAX\":15.72,\n        \"TMIN\":9.4\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-11-21\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":31.2,\n        \"TAVG\":12.28,\n        \"TMAX\":16.44,\n        \"TMIN\":9.22\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-11-22\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":70.0,\n        \"TAVG\":12.22,\n        \"TMAX\":15.92,\n        \"TMIN\":9.86\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-11-23\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":13.2,\n        \"TAVG\":12.16,\n        \"TMAX\":15.44,\n        \"TMIN\":9.5\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-11-24\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":208.4,\n        \"TAVG\":11.96,\n        \"TMAX\":13.78,\n        \"TMIN\":9.94\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-11-25\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":44.8,\n        \"TAVG\":11.32,\n        \"TMAX\":13.68,\n        \"TMIN\":9.04\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-11-26\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":20.4,\n        \"TAVG\":11.8,\n        \"TMAX\":14.7,\n        \"TMIN\":9.34\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-11-27\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":1.2,\n        \"TAVG\":11.58,\n        \"TMAX\":14.88,\n        \"TMIN\":9.36\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-11-28\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":56.4,\n        \"TAVG\":12.18,\n        \"TMAX\":15.96,\n        \"TMIN\":9.6\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-11-29\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":16.4,\n        \"TAVG\":12.18,\n        \"TMAX\":14.82,\n        \"TMIN\":9.88\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-11-30\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":12.0,\n        \"TAVG\":12.04,\n        \"TMAX\":15.78,\n        \"TMIN\":9.28\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-12-01\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":5.6,\n        \"TAVG\":12.62,\n        \"TMAX\":14.98,\n        \"TMIN\":10.24\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-12-02\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":35.2,\n        \"TAVG\":12.0,\n        \"TMAX\":14.3,\n        \"TMIN\":10.2\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-12-03\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":48.2,\n        \"TAVG\":11.84,\n        \"TMAX\":14.62,\n        \"TMIN\":8.94\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-12-04\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":19.6,\n        \"TAVG\":11.42,\n        \"TMAX\":14.7,\n        \"TMIN\":8.62\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-12-05\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":15.6,\n        \"TAVG\":11.96,\n        \"TMAX\":15.14,\n        \"TMIN\":9.4\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-12-06\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":18.8,\n        \"TAVG\":12.12,\n        \"TMAX\":15.46,\n        \"TMIN\":9.46\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-12-07\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":40.0,\n        \"TAVG\":13.3,\n        \"TMAX\":15.72,\n        \"TMIN\":10.6\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-12-08\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":31.2,\n        \"TAVG\":12.86,\n        \"TMAX\":15.4,\n        \"TMIN\":10.62\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-12-09\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":34.0,\n        \"TAVG\":12.78,\n        \"TMAX\":15.74,\n        \"TMIN\":9.48\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-12-10\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":168.0,\n        \"TAVG\":13.4,\n        \"TMAX\":16.2,\n        \"TMIN\":10.24\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-12-11\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":31.6,\n        \"TAVG\":12.76,\n        \"TMAX\":15.16,\n        \"TMIN\":10.56\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-12-12\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":50.8,\n        \"TAVG\":12.48,\n        \"TMAX\":14.78,\n        \"TMIN\":10.28\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-12-13\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":55.6,\n        \"TAVG\":13.58,\n        \"TMAX\":16.12,\n        \"TMIN\":11.6\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-12-14\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":80.8,\n        \"TAVG\":12.74,\n        \"TMAX\":14.54,\n        \"TMIN\":10.8\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-12-15\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":125.2,\n        \"TAVG\":11.9,\n        \"TMAX\":13.96,\n        \"TMIN\":10.1\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-12-16\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":44.4,\n        \"TAVG\":10.62,\n        \"TMAX\":12.6,\n        \"TMIN\":9.1\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-12-17\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":0.0,\n        \"TAVG\":10.44,\n        \"TMAX\":13.34,\n        \"TMIN\":7.58\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-12-18\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":191.2,\n        \"TAVG\":11.9,\n        \"TMAX\":14.6,\n        \"TMIN\":9.48\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-12-19\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":51.2,\n        \"TAVG\":11.54,\n        \"TMAX\":14.14,\n        \"TMIN\":8.62\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-12-20\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":36.0,\n        \"TAVG\":11.64,\n        \"TMAX\":14.28,\n        \"TMIN\":9.56\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-12-21\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":25.2,\n        \"TAVG\":13.84,\n        \"TMAX\":16.6,\n        \"TMIN\":11.66\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-12-22\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":26.0,\n        \"TAVG\":13.56,\n        \"TMAX\":15.58,\n        \"TMIN\":11.26\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-12-23\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":8.4,\n        \"TAVG\":12.8,\n        \"TMAX\":15.48,\n        \"TMIN\":10.64\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-12-24\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":10.0,\n        \"TAVG\":12.4,\n        \"TMAX\":15.68,\n        \"TMIN\":10.08\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-12-25\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":11.2,\n        \"TAVG\":11.74,\n        \"TMAX\":15.26,\n        \"TMIN\":9.18\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-12-26\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":19.6,\n        \"TAVG\":11.16,\n        \"TMAX\":14.72,\n        \"TMIN\":7.94\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-12-27\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":40.4,\n        \"TAVG\":10.56,\n        \"TMAX\":14.0,\n        \"TMIN\":8.02\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-12-28\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":26.6,\n        \"TAVG\":11.1,\n        \"TMAX\":14.4,\n        \"TMIN\":8.28\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-12-29\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":6.8,\n        \"TAVG\":11.4,\n        \"TMAX\":14.98,\n        \"TMIN\":8.42\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-12-30\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":34.8,\n        \"TAVG\":10.94,\n        \"TMAX\":15.0,\n        \"TMIN\":8.46\n    },\n    {\n        \"city\":\"A Coru\u00f1a\",\n        \"country\":\"Spain\",\n        \"lat\":43.3713,\n        \"long\":-8.4188,\n        \"population\":370610.0,\n        \"date\":\"2020-12-31\",\n        \"name\":\"A CORUNA\",\n        \"PRCP\":60.0,\n        \"TAVG\":10.62,\n        \"TMAX\":14.06,\n        \"TMIN\":7.64\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-01-01\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":13.6,\n        \"TAVG\":3.3,\n        \"TMAX\":5.56,\n        \"TMIN\":0.98\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-01-02\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":16.6,\n        \"TAVG\":3.96,\n        \"TMAX\":6.36,\n        \"TMIN\":1.66\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-01-03\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":49.2,\n        \"TAVG\":5.58,\n        \"TMAX\":7.42,\n        \"TMIN\":3.0\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-01-04\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":20.4,\n        \"TAVG\":5.1,\n        \"TMAX\":7.24,\n        \"TMIN\":3.0\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-01-05\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":6.0,\n        \"TAVG\":5.08,\n        \"TMAX\":6.62,\n        \"TMIN\":2.42\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-01-06\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":3.0,\n        \"TAVG\":3.46,\n        \"TMAX\":5.62,\n        \"TMIN\":1.5\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-01-07\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":35.0,\n        \"TAVG\":3.76,\n        \"TMAX\":6.08,\n        \"TMIN\":1.26\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-01-08\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":17.2,\n        \"TAVG\":5.12,\n        \"TMAX\":7.24,\n        \"TMIN\":3.04\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-01-09\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":15.2,\n        \"TAVG\":5.66,\n        \"TMAX\":7.78,\n        \"TMIN\":2.98\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-01-10\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":33.4,\n        \"TAVG\":5.32,\n        \"TMAX\":7.32,\n        \"TMIN\":2.52\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-01-11\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":23.6,\n        \"TAVG\":5.04,\n        \"TMAX\":7.52,\n        \"TMIN\":2.8\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-01-12\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":26.4,\n        \"TAVG\":5.32,\n        \"TMAX\":7.1,\n        \"TMIN\":3.26\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-01-13\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":45.6,\n        \"TAVG\":4.88,\n        \"TMAX\":7.08,\n        \"TMIN\":2.34\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-01-14\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":14.4,\n        \"TAVG\":4.44,\n        \"TMAX\":6.66,\n        \"TMIN\":2.44\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-01-15\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":11.2,\n        \"TAVG\":4.68,\n        \"TMAX\":6.44,\n        \"TMIN\":2.08\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-01-16\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":6.6,\n        \"TAVG\":4.08,\n        \"TMAX\":6.4,\n        \"TMIN\":1.2\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-01-17\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":32.6,\n        \"TAVG\":2.12,\n        \"TMAX\":4.06,\n        \"TMIN\":-0.98\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-01-18\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":15.0,\n        \"TAVG\":0.66,\n        \"TMAX\":3.74,\n        \"TMIN\":-2.26\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-01-19\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":4.0,\n        \"TAVG\":-0.18,\n        \"TMAX\":3.5,\n        \"TMIN\":-3.2\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-01-20\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":13.0,\n        \"TAVG\":-0.08,\n        \"TMAX\":2.8,\n        \"TMIN\":-3.02\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-01-21\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":7.6,\n        \"TAVG\":-0.64,\n        \"TMAX\":3.86,\n        \"TMIN\":-4.14\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-01-22\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":19.6,\n        \"TAVG\":0.48,\n        \"TMAX\":3.54,\n        \"TMIN\":-3.3\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-01-23\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":0.2,\n        \"TAVG\":2.16,\n        \"TMAX\":3.92,\n        \"TMIN\":-0.74\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-01-24\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":2.0,\n        \"TAVG\":3.32,\n        \"TMAX\":4.66,\n        \"TMIN\":1.44\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-01-25\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":16.8,\n        \"TAVG\":3.64,\n        \"TMAX\":6.36,\n        \"TMIN\":1.24\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-01-26\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":3.6,\n        \"TAVG\":4.74,\n        \"TMAX\":7.36,\n        \"TMIN\":1.72\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-01-27\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":33.0,\n        \"TAVG\":6.36,\n        \"TMAX\":8.86,\n        \"TMIN\":3.14\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-01-28\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":31.6,\n        \"TAVG\":5.64,\n        \"TMAX\":8.52,\n        \"TMIN\":2.28\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-01-29\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":11.4,\n        \"TAVG\":5.4,\n        \"TMAX\":7.46,\n        \"TMIN\":2.56\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-01-30\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":52.6,\n        \"TAVG\":4.92,\n        \"TMAX\":7.38,\n        \"TMIN\":1.84\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-01-31\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":22.6,\n        \"TAVG\":5.04,\n        \"TMAX\":7.28,\n        \"TMIN\":2.02\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-02-01\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":47.4,\n        \"TAVG\":6.0,\n        \"TMAX\":8.62,\n        \"TMIN\":2.9\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-02-02\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":70.6,\n        \"TAVG\":6.28,\n        \"TMAX\":8.52,\n        \"TMIN\":4.08\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-02-03\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":26.0,\n        \"TAVG\":5.6,\n        \"TMAX\":7.92,\n        \"TMIN\":2.9\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-02-04\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":41.0,\n        \"TAVG\":3.34,\n        \"TMAX\":5.74,\n        \"TMIN\":0.88\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-02-05\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":1.2,\n        \"TAVG\":3.92,\n        \"TMAX\":6.54,\n        \"TMIN\":0.8\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-02-06\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":3.8,\n        \"TAVG\":4.06,\n        \"TMAX\":6.92,\n        \"TMIN\":1.1\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-02-07\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":9.8,\n        \"TAVG\":4.5,\n        \"TMAX\":7.6,\n        \"TMIN\":1.32\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-02-08\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":16.4,\n        \"TAVG\":4.98,\n        \"TMAX\":7.52,\n        \"TMIN\":1.62\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-02-09\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":30.0,\n        \"TAVG\":4.78,\n        \"TMAX\":7.92,\n        \"TMIN\":2.14\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-02-10\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":78.4,\n        \"TAVG\":4.04,\n        \"TMAX\":6.16,\n        \"TMIN\":1.5\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-02-11\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":17.6,\n        \"TAVG\":3.52,\n        \"TMAX\":6.36,\n        \"TMIN\":1.16\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-02-12\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":1.8,\n        \"TAVG\":3.14,\n        \"TMAX\":6.58,\n        \"TMIN\":-0.34\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-02-13\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":17.4,\n        \"TAVG\":2.94,\n        \"TMAX\":6.58,\n        \"TMIN\":-0.36\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-02-14\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":8.4,\n        \"TAVG\":4.36,\n        \"TMAX\":8.92,\n        \"TMIN\":-0.06\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-02-15\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":21.2,\n        \"TAVG\":6.56,\n        \"TMAX\":12.02,\n        \"TMIN\":1.32\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-02-16\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":22.6,\n        \"TAVG\":6.4,\n        \"TMAX\":11.32,\n        \"TMIN\":2.18\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-02-17\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":1.4,\n        \"TAVG\":5.32,\n        \"TMAX\":9.5,\n        \"TMIN\":1.64\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-02-18\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":0.2,\n        \"TAVG\":5.4,\n        \"TMAX\":9.74,\n        \"TMIN\":1.52\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-02-19\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":16.2,\n        \"TAVG\":4.5,\n        \"TMAX\":7.88,\n        \"TMIN\":0.98\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-02-20\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":39.8,\n        \"TAVG\":6.38,\n        \"TMAX\":9.54,\n        \"TMIN\":3.0\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-02-21\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":11.6,\n        \"TAVG\":7.16,\n        \"TMAX\":9.78,\n        \"TMIN\":4.2\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-02-22\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":64.2,\n        \"TAVG\":6.68,\n        \"TMAX\":9.24,\n        \"TMIN\":3.74\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-02-23\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":39.4,\n        \"TAVG\":5.48,\n        \"TMAX\":9.14,\n        \"TMIN\":1.58\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-02-24\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":12.8,\n        \"TAVG\":4.12,\n        \"TMAX\":9.04,\n        \"TMIN\":-0.44\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-02-25\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":6.8,\n        \"TAVG\":3.76,\n        \"TMAX\":8.38,\n        \"TMIN\":-0.76\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-02-26\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":9.8,\n        \"TAVG\":4.0,\n        \"TMAX\":7.78,\n        \"TMIN\":0.2\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-02-27\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":42.2,\n        \"TAVG\":4.2,\n        \"TMAX\":8.54,\n        \"TMIN\":-0.1\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-02-28\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":22.0,\n        \"TAVG\":2.48,\n        \"TMAX\":6.34,\n        \"TMIN\":-0.88\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-02-29\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":10.5,\n        \"TAVG\":5.05,\n        \"TMAX\":10.45,\n        \"TMIN\":1.0\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-03-01\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":36.8,\n        \"TAVG\":3.42,\n        \"TMAX\":6.84,\n        \"TMIN\":0.24\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-03-02\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":30.2,\n        \"TAVG\":4.88,\n        \"TMAX\":7.42,\n        \"TMIN\":2.12\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-03-03\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":10.8,\n        \"TAVG\":5.24,\n        \"TMAX\":8.52,\n        \"TMIN\":2.0\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-03-04\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":35.2,\n        \"TAVG\":7.04,\n        \"TMAX\":10.82,\n        \"TMIN\":2.7\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-03-05\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":31.6,\n        \"TAVG\":5.7,\n        \"TMAX\":8.98,\n        \"TMIN\":3.2\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-03-06\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":50.4,\n        \"TAVG\":6.08,\n        \"TMAX\":8.88,\n        \"TMIN\":3.72\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-03-07\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":20.0,\n        \"TAVG\":5.74,\n        \"TMAX\":8.96,\n        \"TMIN\":2.3\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-03-08\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":50.8,\n        \"TAVG\":5.76,\n        \"TMAX\":9.1,\n        \"TMIN\":2.76\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-03-09\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":31.8,\n        \"TAVG\":7.38,\n        \"TMAX\":10.78,\n        \"TMIN\":4.02\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-03-10\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":50.2,\n        \"TAVG\":8.0,\n        \"TMAX\":12.2,\n        \"TMIN\":3.42\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-03-11\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":52.0,\n        \"TAVG\":8.14,\n        \"TMAX\":12.24,\n        \"TMIN\":4.16\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-03-12\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":9.8,\n        \"TAVG\":7.7,\n        \"TMAX\":12.6,\n        \"TMIN\":2.86\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-03-13\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":32.0,\n        \"TAVG\":5.98,\n        \"TMAX\":10.42,\n        \"TMIN\":2.36\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-03-14\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":19.2,\n        \"TAVG\":6.76,\n        \"TMAX\":11.76,\n        \"TMIN\":2.44\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-03-15\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":63.6,\n        \"TAVG\":8.14,\n        \"TMAX\":12.16,\n        \"TMIN\":4.16\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-03-16\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":27.4,\n        \"TAVG\":8.08,\n        \"TMAX\":12.64,\n        \"TMIN\":3.04\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-03-17\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":10.2,\n        \"TAVG\":5.64,\n        \"TMAX\":9.56,\n        \"TMIN\":1.56\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-03-18\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":29.75,\n        \"TAVG\":5.2,\n        \"TMAX\":8.45,\n        \"TMIN\":1.75\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-03-19\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":1.4,\n        \"TAVG\":6.2,\n        \"TMAX\":9.78,\n        \"TMIN\":2.72\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-03-20\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":6.6,\n        \"TAVG\":6.72,\n        \"TMAX\":10.38,\n        \"TMIN\":2.92\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-03-21\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":4.2,\n        \"TAVG\":6.48,\n        \"TMAX\":10.88,\n        \"TMIN\":2.38\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-03-22\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":7.6,\n        \"TAVG\":7.0,\n        \"TMAX\":12.04,\n        \"TMIN\":1.2\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-03-23\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":0.2,\n        \"TAVG\":6.9,\n        \"TMAX\":10.86,\n        \"TMIN\":3.48\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-03-24\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":0.0,\n        \"TAVG\":7.32,\n        \"TMAX\":11.88,\n        \"TMIN\":2.94\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-03-25\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":13.8,\n        \"TAVG\":7.2,\n        \"TMAX\":11.92,\n        \"TMIN\":1.44\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-03-26\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":0.4,\n        \"TAVG\":7.22,\n        \"TMAX\":12.32,\n        \"TMIN\":1.46\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-03-27\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":13.8,\n        \"TAVG\":8.42,\n        \"TMAX\":13.34,\n        \"TMIN\":2.62\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-03-28\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":22.0,\n        \"TAVG\":9.58,\n        \"TMAX\":14.22,\n        \"TMIN\":4.66\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-03-29\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":5.2,\n        \"TAVG\":8.22,\n        \"TMAX\":12.34,\n        \"TMIN\":3.58\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-03-30\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":6.0,\n        \"TAVG\":10.18,\n        \"TMAX\":15.16,\n        \"TMIN\":5.1\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-03-31\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":12.2,\n        \"TAVG\":8.84,\n        \"TMAX\":13.32,\n        \"TMIN\":5.0\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-04-01\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":4.4,\n        \"TAVG\":7.74,\n        \"TMAX\":12.36,\n        \"TMIN\":2.66\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-04-02\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":12.2,\n        \"TAVG\":9.4,\n        \"TMAX\":14.3,\n        \"TMIN\":4.04\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-04-03\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":4.0,\n        \"TAVG\":10.16,\n        \"TMAX\":14.2,\n        \"TMIN\":6.44\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-04-04\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":3.8,\n        \"TAVG\":9.86,\n        \"TMAX\":14.3,\n        \"TMIN\":4.76\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-04-05\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":11.0,\n        \"TAVG\":9.34,\n        \"TMAX\":13.8,\n        \"TMIN\":3.34\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-04-06\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":1.6,\n        \"TAVG\":10.64,\n        \"TMAX\":15.96,\n        \"TMIN\":5.96\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-04-07\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":5.0,\n        \"TAVG\":11.82,\n        \"TMAX\":17.64,\n        \"TMIN\":5.3\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-04-08\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":2.6,\n        \"TAVG\":12.54,\n        \"TMAX\":17.74,\n        \"TMIN\":7.76\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-04-09\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":0.0,\n        \"TAVG\":12.68,\n        \"TMAX\":18.38,\n        \"TMIN\":6.3\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-04-10\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":10.4,\n        \"TAVG\":11.54,\n        \"TMAX\":16.92,\n        \"TMIN\":6.1\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-04-11\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":8.8,\n        \"TAVG\":10.5,\n        \"TMAX\":16.68,\n        \"TMIN\":4.22\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-04-12\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":13.6,\n        \"TAVG\":10.56,\n        \"TMAX\":16.46,\n        \"TMIN\":5.14\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-04-13\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":1.6,\n        \"TAVG\":8.12,\n        \"TMAX\":11.9,\n        \"TMIN\":3.12\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-04-14\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":6.0,\n        \"TAVG\":8.5,\n        \"TMAX\":13.78,\n        \"TMIN\":2.84\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-04-15\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":13.8,\n        \"TAVG\":10.56,\n        \"TMAX\":16.22,\n        \"TMIN\":4.38\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-04-16\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":5.8,\n        \"TAVG\":11.52,\n        \"TMAX\":17.34,\n        \"TMIN\":5.46\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-04-17\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":16.6,\n        \"TAVG\":10.54,\n        \"TMAX\":15.98,\n        \"TMIN\":5.04\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-04-18\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":0.6,\n        \"TAVG\":11.56,\n        \"TMAX\":17.5,\n        \"TMIN\":4.94\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-04-19\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":0.0,\n        \"TAVG\":12.52,\n        \"TMAX\":18.3,\n        \"TMIN\":6.24\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-04-20\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":0.0,\n        \"TAVG\":12.9,\n        \"TMAX\":19.58,\n        \"TMIN\":5.08\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-04-21\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":0.0,\n        \"TAVG\":13.68,\n        \"TMAX\":20.72,\n        \"TMIN\":5.4\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-04-22\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":2.4,\n        \"TAVG\":14.36,\n        \"TMAX\":20.12,\n        \"TMIN\":8.0\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-04-23\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":4.0,\n        \"TAVG\":11.9,\n        \"TMAX\":16.76,\n        \"TMIN\":5.66\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-04-24\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":21.8,\n        \"TAVG\":11.06,\n        \"TMAX\":16.76,\n        \"TMIN\":5.02\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-04-25\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":29.2,\n        \"TAVG\":9.28,\n        \"TMAX\":13.26,\n        \"TMIN\":5.02\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-04-26\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":14.6,\n        \"TAVG\":8.22,\n        \"TMAX\":13.46,\n        \"TMIN\":2.94\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-04-27\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":18.4,\n        \"TAVG\":9.18,\n        \"TMAX\":14.48,\n        \"TMIN\":3.54\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-04-28\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":19.2,\n        \"TAVG\":9.22,\n        \"TMAX\":14.18,\n        \"TMIN\":4.1\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-04-29\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":75.8,\n        \"TAVG\":9.98,\n        \"TMAX\":15.5,\n        \"TMIN\":3.94\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-04-30\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":37.6,\n        \"TAVG\":10.46,\n        \"TMAX\":14.86,\n        \"TMIN\":5.84\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-05-01\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":13.0,\n        \"TAVG\":9.68,\n        \"TMAX\":14.54,\n        \"TMIN\":5.46\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-05-02\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":49.6,\n        \"TAVG\":10.06,\n        \"TMAX\":15.54,\n        \"TMIN\":3.98\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-05-03\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":18.2,\n        \"TAVG\":10.52,\n        \"TMAX\":15.36,\n        \"TMIN\":5.6\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-05-04\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":26.2,\n        \"TAVG\":10.08,\n        \"TMAX\":15.06,\n        \"TMIN\":4.9\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-05-05\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":0.4,\n        \"TAVG\":10.56,\n        \"TMAX\":16.18,\n        \"TMIN\":4.94\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-05-06\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":0.0,\n        \"TAVG\":13.26,\n        \"TMAX\":20.04,\n        \"TMIN\":5.14\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-05-07\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":2.4,\n        \"TAVG\":14.84,\n        \"TMAX\":20.22,\n        \"TMIN\":8.0\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-05-08\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":7.0,\n        \"TAVG\":15.02,\n        \"TMAX\":19.6,\n        \"TMIN\":9.7\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-05-09\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":5.6,\n        \"TAVG\":15.38,\n        \"TMAX\":21.4,\n        \"TMIN\":8.96\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-05-10\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":24.6,\n        \"TAVG\":13.46,\n        \"TMAX\":18.04,\n        \"TMIN\":7.98\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-05-11\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":10.0,\n        \"TAVG\":13.46,\n        \"TMAX\":19.36,\n        \"TMIN\":6.84\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-05-12\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":22.8,\n        \"TAVG\":13.8,\n        \"TMAX\":19.6,\n        \"TMIN\":7.62\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-05-13\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":8.0,\n        \"TAVG\":12.92,\n        \"TMAX\":17.78,\n        \"TMIN\":7.14\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-05-14\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":1.8,\n        \"TAVG\":11.92,\n        \"TMAX\":17.64,\n        \"TMIN\":6.3\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-05-15\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":0.2,\n        \"TAVG\":12.58,\n        \"TMAX\":18.28,\n        \"TMIN\":5.88\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-05-16\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":2.2,\n        \"TAVG\":13.86,\n        \"TMAX\":19.28,\n        \"TMIN\":7.98\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-05-17\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":2.8,\n        \"TAVG\":14.44,\n        \"TMAX\":19.7,\n        \"TMIN\":8.44\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-05-18\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":15.0,\n        \"TAVG\":14.58,\n        \"TMAX\":20.14,\n        \"TMIN\":9.86\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-05-19\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":16.0,\n        \"TAVG\":13.74,\n        \"TMAX\":19.7,\n        \"TMIN\":8.42\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-05-20\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":0.4,\n        \"TAVG\":14.12,\n        \"TMAX\":19.28,\n        \"TMIN\":9.18\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-05-21\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":35.0,\n        \"TAVG\":16.64,\n        \"TMAX\":22.78,\n        \"TMIN\":10.76\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-05-22\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":118.0,\n        \"TAVG\":16.92,\n        \"TMAX\":23.12,\n        \"TMIN\":11.62\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-05-23\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":39.6,\n        \"TAVG\":15.48,\n        \"TMAX\":20.26,\n        \"TMIN\":10.84\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-05-24\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":5.0,\n        \"TAVG\":15.42,\n        \"TMAX\":20.36,\n        \"TMIN\":9.9\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-05-25\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":0.0,\n        \"TAVG\":15.96,\n        \"TMAX\":21.76,\n        \"TMIN\":9.58\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-05-26\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":3.6,\n        \"TAVG\":18.42,\n        \"TMAX\":24.48,\n        \"TMIN\":10.8\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-05-27\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":62.6,\n        \"TAVG\":18.92,\n        \"TMAX\":25.38,\n        \"TMIN\":12.94\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-05-28\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":32.8,\n        \"TAVG\":17.88,\n        \"TMAX\":23.2,\n        \"TMIN\":11.82\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-05-29\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":17.2,\n        \"TAVG\":18.5,\n        \"TMAX\":23.88,\n        \"TMIN\":12.28\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-05-30\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":49.0,\n        \"TAVG\":18.28,\n        \"TMAX\":22.58,\n        \"TMIN\":13.34\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-05-31\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":3.0,\n        \"TAVG\":18.02,\n        \"TMAX\":23.3,\n        \"TMIN\":12.86\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-06-01\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":143.4,\n        \"TAVG\":18.38,\n        \"TMAX\":22.8,\n        \"TMIN\":12.68\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-06-02\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":11.8,\n        \"TAVG\":20.66,\n        \"TMAX\":26.42,\n        \"TMIN\":13.98\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-06-03\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":25.0,\n        \"TAVG\":18.56,\n        \"TMAX\":23.7,\n        \"TMIN\":13.88\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-06-04\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":14.2,\n        \"TAVG\":16.92,\n        \"TMAX\":21.74,\n        \"TMIN\":11.94\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-06-05\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":57.8,\n        \"TAVG\":16.32,\n        \"TMAX\":21.22,\n        \"TMIN\":11.44\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-06-06\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":21.8,\n        \"TAVG\":16.34,\n        \"TMAX\":21.44,\n        \"TMIN\":11.3\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-06-07\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":14.6,\n        \"TAVG\":16.82,\n        \"TMAX\":22.86,\n        \"TMIN\":12.3\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-06-08\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":7.6,\n        \"TAVG\":16.98,\n        \"TMAX\":21.92,\n        \"TMIN\":12.58\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-06-09\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":11.8,\n        \"TAVG\":16.74,\n        \"TMAX\":21.14,\n        \"TMIN\":11.86\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-06-10\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":10.0,\n        \"TAVG\":17.08,\n        \"TMAX\":22.84,\n        \"TMIN\":11.6\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-06-11\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":0.2,\n        \"TAVG\":18.02,\n        \"TMAX\":23.16,\n        \"TMIN\":13.72\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-06-12\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":69.4,\n        \"TAVG\":16.44,\n        \"TMAX\":21.2,\n        \"TMIN\":12.82\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-06-13\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":35.8,\n        \"TAVG\":16.36,\n        \"TMAX\":21.3,\n        \"TMIN\":11.82\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-06-14\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":8.2,\n        \"TAVG\":17.46,\n        \"TMAX\":23.68,\n        \"TMIN\":11.62\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-06-15\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":42.8,\n        \"TAVG\":18.58,\n        \"TMAX\":23.92,\n        \"TMIN\":13.76\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-06-16\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":4.8,\n        \"TAVG\":16.9,\n        \"TMAX\":21.64,\n        \"TMIN\":12.32\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-06-17\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":92.4,\n        \"TAVG\":17.5,\n        \"TMAX\":22.26,\n        \"TMIN\":12.22\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-06-18\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":41.4,\n        \"TAVG\":18.52,\n        \"TMAX\":23.76,\n        \"TMIN\":13.64\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-06-19\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":5.8,\n        \"TAVG\":19.08,\n        \"TMAX\":24.74,\n        \"TMIN\":13.74\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-06-20\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":15.8,\n        \"TAVG\":19.4,\n        \"TMAX\":24.42,\n        \"TMIN\":13.78\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-06-21\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":15.0,\n        \"TAVG\":18.48,\n        \"TMAX\":23.72,\n        \"TMIN\":12.22\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-06-22\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":0.0,\n        \"TAVG\":19.08,\n        \"TMAX\":24.78,\n        \"TMIN\":12.86\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-06-23\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":71.2,\n        \"TAVG\":20.42,\n        \"TMAX\":26.32,\n        \"TMIN\":13.06\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-06-24\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":0.0,\n        \"TAVG\":20.6,\n        \"TMAX\":25.52,\n        \"TMIN\":14.86\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-06-25\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":12.8,\n        \"TAVG\":20.7,\n        \"TMAX\":25.28,\n        \"TMIN\":15.88\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-06-26\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":9.0,\n        \"TAVG\":19.42,\n        \"TMAX\":25.14,\n        \"TMIN\":14.48\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-06-27\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":9.8,\n        \"TAVG\":18.8,\n        \"TMAX\":24.36,\n        \"TMIN\":14.0\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-06-28\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":17.2,\n        \"TAVG\":19.18,\n        \"TMAX\":24.08,\n        \"TMIN\":13.22\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-06-29\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":4.8,\n        \"TAVG\":19.72,\n        \"TMAX\":25.24,\n        \"TMIN\":13.76\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-06-30\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":5.2,\n        \"TAVG\":19.84,\n        \"TMAX\":24.44,\n        \"TMIN\":14.74\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-07-01\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":98.2,\n        \"TAVG\":18.66,\n        \"TMAX\":22.28,\n        \"TMIN\":14.44\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-07-02\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":5.8,\n        \"TAVG\":17.24,\n        \"TMAX\":22.18,\n        \"TMIN\":11.78\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-07-03\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":0.2,\n        \"TAVG\":17.64,\n        \"TMAX\":23.28,\n        \"TMIN\":11.36\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-07-04\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":8.8,\n        \"TAVG\":18.68,\n        \"TMAX\":24.04,\n        \"TMIN\":12.74\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-07-05\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":1.4,\n        \"TAVG\":19.78,\n        \"TMAX\":25.28,\n        \"TMIN\":13.3\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-07-06\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":5.6,\n        \"TAVG\":18.4,\n        \"TMAX\":24.7,\n        \"TMIN\":12.56\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-07-07\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":0.2,\n        \"TAVG\":18.76,\n        \"TMAX\":24.32,\n        \"TMIN\":12.62\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-07-08\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":21.6,\n        \"TAVG\":17.9,\n        \"TMAX\":22.72,\n        \"TMIN\":12.42\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-07-09\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":0.6,\n        \"TAVG\":18.8,\n        \"TMAX\":24.14,\n        \"TMIN\":13.4\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-07-10\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":1.4,\n        \"TAVG\":18.84,\n        \"TMAX\":23.64,\n        \"TMIN\":13.18\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-07-11\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":0.4,\n        \"TAVG\":18.06,\n        \"TMAX\":23.18,\n        \"TMIN\":13.26\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-07-12\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":67.4,\n        \"TAVG\":17.22,\n        \"TMAX\":22.82,\n        \"TMIN\":12.26\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-07-13\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":27.4,\n        \"TAVG\":16.94,\n        \"TMAX\":22.8,\n        \"TMIN\":10.86\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-07-14\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":13.0,\n        \"TAVG\":16.68,\n        \"TMAX\":22.06,\n        \"TMIN\":11.4\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-07-15\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":0.0,\n        \"TAVG\":17.22,\n        \"TMAX\":22.28,\n        \"TMIN\":10.96\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-07-16\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":3.6,\n        \"TAVG\":18.14,\n        \"TMAX\":22.66,\n        \"TMIN\":13.84\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-07-17\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":4.0,\n        \"TAVG\":19.22,\n        \"TMAX\":24.34,\n        \"TMIN\":13.8\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-07-18\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":0.0,\n        \"TAVG\":21.04,\n        \"TMAX\":27.38,\n        \"TMIN\":13.3\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-07-19\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":5.6,\n        \"TAVG\":22.1,\n        \"TMAX\":28.6,\n        \"TMIN\":16.16\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-07-20\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":63.6,\n        \"TAVG\":21.52,\n        \"TMAX\":27.7,\n        \"TMIN\":14.9\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-07-21\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":0.0,\n        \"TAVG\":20.1,\n        \"TMAX\":25.98,\n        \"TMIN\":14.18\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-07-22\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":28.4,\n        \"TAVG\":20.36,\n        \"TMAX\":26.32,\n        \"TMIN\":14.36\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-07-23\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":6.0,\n        \"TAVG\":21.22,\n        \"TMAX\":26.78,\n        \"TMIN\":14.64\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-07-24\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":29.8,\n        \"TAVG\":22.28,\n        \"TMAX\":28.28,\n        \"TMIN\":16.48\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-07-25\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":11.2,\n        \"TAVG\":22.84,\n        \"TMAX\":28.72,\n        \"TMIN\":16.76\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-07-26\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":18.2,\n        \"TAVG\":22.28,\n        \"TMAX\":28.84,\n        \"TMIN\":16.82\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-07-27\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":41.2,\n        \"TAVG\":21.42,\n        \"TMAX\":26.2,\n        \"TMIN\":16.52\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-07-28\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":32.2,\n        \"TAVG\":19.26,\n        \"TMAX\":22.92,\n        \"TMIN\":14.96\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-07-29\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":1.2,\n        \"TAVG\":20.1,\n        \"TMAX\":25.92,\n        \"TMIN\":14.76\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-07-30\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":0.0,\n        \"TAVG\":21.66,\n        \"TMAX\":27.54,\n        \"TMIN\":14.68\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-07-31\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":4.2,\n        \"TAVG\":21.22,\n        \"TMAX\":27.14,\n        \"TMIN\":14.26\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-08-01\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":6.0,\n        \"TAVG\":20.42,\n        \"TMAX\":25.9,\n        \"TMIN\":14.94\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-08-02\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":34.4,\n        \"TAVG\":19.14,\n        \"TMAX\":24.16,\n        \"TMIN\":14.1\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-08-03\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":25.4,\n        \"TAVG\":19.9,\n        \"TMAX\":24.82,\n        \"TMIN\":15.28\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-08-04\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":0.0,\n        \"TAVG\":20.0,\n        \"TMAX\":25.28,\n        \"TMIN\":14.74\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-08-05\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":56.0,\n        \"TAVG\":19.66,\n        \"TMAX\":25.1,\n        \"TMIN\":14.06\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-08-06\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":3.8,\n        \"TAVG\":20.56,\n        \"TMAX\":27.02,\n        \"TMIN\":13.68\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-08-07\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":2.6,\n        \"TAVG\":22.12,\n        \"TMAX\":28.6,\n        \"TMIN\":14.06\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-08-08\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":22.2,\n        \"TAVG\":20.36,\n        \"TMAX\":24.82,\n        \"TMIN\":15.0\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-08-09\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":62.6,\n        \"TAVG\":19.12,\n        \"TMAX\":23.86,\n        \"TMIN\":14.88\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-08-10\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":23.0,\n        \"TAVG\":18.64,\n        \"TMAX\":22.98,\n        \"TMIN\":13.82\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-08-11\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":21.4,\n        \"TAVG\":18.06,\n        \"TMAX\":23.2,\n        \"TMIN\":13.22\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-08-12\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":31.0,\n        \"TAVG\":19.1,\n        \"TMAX\":25.26,\n        \"TMIN\":14.6\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-08-13\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":41.8,\n        \"TAVG\":18.8,\n        \"TMAX\":24.36,\n        \"TMIN\":14.76\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-08-14\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":4.0,\n        \"TAVG\":19.18,\n        \"TMAX\":24.32,\n        \"TMIN\":14.1\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-08-15\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":11.8,\n        \"TAVG\":18.78,\n        \"TMAX\":23.3,\n        \"TMIN\":15.02\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-08-16\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":12.0,\n        \"TAVG\":19.18,\n        \"TMAX\":25.38,\n        \"TMIN\":13.32\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-08-17\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":34.6,\n        \"TAVG\":18.92,\n        \"TMAX\":23.58,\n        \"TMIN\":14.58\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-08-18\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":78.2,\n        \"TAVG\":17.64,\n        \"TMAX\":22.74,\n        \"TMIN\":12.54\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-08-19\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":12.2,\n        \"TAVG\":18.38,\n        \"TMAX\":24.08,\n        \"TMIN\":12.94\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-08-20\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":1.8,\n        \"TAVG\":18.96,\n        \"TMAX\":23.88,\n        \"TMIN\":14.58\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-08-21\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":11.0,\n        \"TAVG\":19.1,\n        \"TMAX\":24.16,\n        \"TMIN\":14.26\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-08-22\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":12.8,\n        \"TAVG\":19.3,\n        \"TMAX\":25.12,\n        \"TMIN\":13.96\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-08-23\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":2.4,\n        \"TAVG\":20.0,\n        \"TMAX\":25.72,\n        \"TMIN\":13.9\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-08-24\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":0.2,\n        \"TAVG\":19.74,\n        \"TMAX\":25.32,\n        \"TMIN\":14.02\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-08-25\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":15.4,\n        \"TAVG\":19.86,\n        \"TMAX\":25.82,\n        \"TMIN\":13.14\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-08-26\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":4.4,\n        \"TAVG\":20.32,\n        \"TMAX\":25.62,\n        \"TMIN\":14.66\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-08-27\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":12.6,\n        \"TAVG\":20.68,\n        \"TMAX\":26.86,\n        \"TMIN\":15.06\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-08-28\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":0.0,\n        \"TAVG\":20.32,\n        \"TMAX\":26.06,\n        \"TMIN\":14.68\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-08-29\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":null,\n        \"TAVG\":19.02,\n        \"TMAX\":24.14,\n        \"TMIN\":13.42\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-08-30\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":65.0,\n        \"TAVG\":17.46,\n        \"TMAX\":23.1,\n        \"TMIN\":11.66\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-08-31\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":23.0,\n        \"TAVG\":16.92,\n        \"TMAX\":22.9,\n        \"TMIN\":11.1\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-09-01\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":0.0,\n        \"TAVG\":15.72,\n        \"TMAX\":20.82,\n        \"TMIN\":9.94\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-09-02\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":0.0,\n        \"TAVG\":16.06,\n        \"TMAX\":22.08,\n        \"TMIN\":9.64\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-09-03\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":2.2,\n        \"TAVG\":16.86,\n        \"TMAX\":21.2,\n        \"TMIN\":11.64\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-09-04\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":29.4,\n        \"TAVG\":17.94,\n        \"TMAX\":22.28,\n        \"TMIN\":14.32\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-09-05\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":26.0,\n        \"TAVG\":17.16,\n        \"TMAX\":22.22,\n        \"TMIN\":12.42\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-09-06\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":4.2,\n        \"TAVG\":15.96,\n        \"TMAX\":21.16,\n        \"TMIN\":10.84\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-09-07\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":2.4,\n        \"TAVG\":15.84,\n        \"TMAX\":21.1,\n        \"TMIN\":10.9\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-09-08\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":57.8,\n        \"TAVG\":15.88,\n        \"TMAX\":20.34,\n        \"TMIN\":11.1\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-09-09\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":22.2,\n        \"TAVG\":16.0,\n        \"TMAX\":21.56,\n        \"TMIN\":11.12\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-09-10\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":0.0,\n        \"TAVG\":15.86,\n        \"TMAX\":21.7,\n        \"TMIN\":9.94\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-09-11\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":2.4,\n        \"TAVG\":17.2,\n        \"TMAX\":22.52,\n        \"TMIN\":12.3\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-09-12\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":20.4,\n        \"TAVG\":17.68,\n        \"TMAX\":23.08,\n        \"TMIN\":13.34\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-09-13\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":7.0,\n        \"TAVG\":17.92,\n        \"TMAX\":23.16,\n        \"TMIN\":12.66\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-09-14\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":31.2,\n        \"TAVG\":17.56,\n        \"TMAX\":24.34,\n        \"TMIN\":10.64\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-09-15\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":18.6,\n        \"TAVG\":17.84,\n        \"TMAX\":24.8,\n        \"TMIN\":11.86\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-09-16\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":3.2,\n        \"TAVG\":16.68,\n        \"TMAX\":22.24,\n        \"TMIN\":11.58\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-09-17\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":1.0,\n        \"TAVG\":15.44,\n        \"TMAX\":21.02,\n        \"TMIN\":9.76\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-09-18\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":11.6,\n        \"TAVG\":15.48,\n        \"TMAX\":21.48,\n        \"TMIN\":9.7\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-09-19\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":0.0,\n        \"TAVG\":15.56,\n        \"TMAX\":21.54,\n        \"TMIN\":10.14\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-09-20\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":0.0,\n        \"TAVG\":15.5,\n        \"TMAX\":21.42,\n        \"TMIN\":9.48\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-09-21\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":9.2,\n        \"TAVG\":15.56,\n        \"TMAX\":22.46,\n        \"TMIN\":8.9\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-09-22\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":13.2,\n        \"TAVG\":15.5,\n        \"TMAX\":22.12,\n        \"TMIN\":9.48\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-09-23\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":56.6,\n        \"TAVG\":14.48,\n        \"TMAX\":19.1,\n        \"TMIN\":10.38\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-09-24\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":19.8,\n        \"TAVG\":13.86,\n        \"TMAX\":19.48,\n        \"TMIN\":8.98\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-09-25\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":12.8,\n        \"TAVG\":13.3,\n        \"TMAX\":18.54,\n        \"TMIN\":8.94\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-09-26\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":44.8,\n        \"TAVG\":13.42,\n        \"TMAX\":18.46,\n        \"TMIN\":8.9\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-09-27\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":20.4,\n        \"TAVG\":14.26,\n        \"TMAX\":20.2,\n        \"TMIN\":8.58\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-09-28\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":25.2,\n        \"TAVG\":14.08,\n        \"TMAX\":17.58,\n        \"TMIN\":10.88\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-09-29\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":33.4,\n        \"TAVG\":14.94,\n        \"TMAX\":19.62,\n        \"TMIN\":10.86\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-09-30\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":51.4,\n        \"TAVG\":13.7,\n        \"TMAX\":18.0,\n        \"TMIN\":9.78\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-10-01\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":52.4,\n        \"TAVG\":13.16,\n        \"TMAX\":16.64,\n        \"TMIN\":9.22\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-10-02\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":24.0,\n        \"TAVG\":12.16,\n        \"TMAX\":15.88,\n        \"TMIN\":8.84\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-10-03\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":18.8,\n        \"TAVG\":11.9,\n        \"TMAX\":15.72,\n        \"TMIN\":8.12\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-10-04\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":16.6,\n        \"TAVG\":11.9,\n        \"TMAX\":15.34,\n        \"TMIN\":8.9\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-10-05\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":8.4,\n        \"TAVG\":11.62,\n        \"TMAX\":15.88,\n        \"TMIN\":7.58\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-10-06\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":38.6,\n        \"TAVG\":11.58,\n        \"TMAX\":16.14,\n        \"TMIN\":7.64\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-10-07\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":18.6,\n        \"TAVG\":11.2,\n        \"TMAX\":14.04,\n        \"TMIN\":8.02\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-10-08\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":45.0,\n        \"TAVG\":11.7,\n        \"TMAX\":15.54,\n        \"TMIN\":7.76\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-10-09\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":5.4,\n        \"TAVG\":11.5,\n        \"TMAX\":16.0,\n        \"TMIN\":7.66\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-10-10\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":12.6,\n        \"TAVG\":11.88,\n        \"TMAX\":16.2,\n        \"TMIN\":7.94\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-10-11\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":2.8,\n        \"TAVG\":12.62,\n        \"TMAX\":16.68,\n        \"TMIN\":8.7\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-10-12\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":7.0,\n        \"TAVG\":13.5,\n        \"TMAX\":16.78,\n        \"TMIN\":9.96\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-10-13\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":2.0,\n        \"TAVG\":14.66,\n        \"TMAX\":19.36,\n        \"TMIN\":9.7\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-10-14\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":3.6,\n        \"TAVG\":14.38,\n        \"TMAX\":18.92,\n        \"TMIN\":10.12\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-10-15\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":14.6,\n        \"TAVG\":14.16,\n        \"TMAX\":18.54,\n        \"TMIN\":9.86\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-10-16\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":9.8,\n        \"TAVG\":14.44,\n        \"TMAX\":19.48,\n        \"TMIN\":9.96\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-10-17\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":5.4,\n        \"TAVG\":12.98,\n        \"TMAX\":16.28,\n        \"TMIN\":9.72\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-10-18\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":16.6,\n        \"TAVG\":12.14,\n        \"TMAX\":16.34,\n        \"TMIN\":8.1\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-10-19\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":27.8,\n        \"TAVG\":11.78,\n        \"TMAX\":15.62,\n        \"TMIN\":8.44\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-10-20\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":31.8,\n        \"TAVG\":11.02,\n        \"TMAX\":13.94,\n        \"TMIN\":7.62\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-10-21\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":12.0,\n        \"TAVG\":11.8,\n        \"TMAX\":15.86,\n        \"TMIN\":8.44\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-10-22\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":32.4,\n        \"TAVG\":11.12,\n        \"TMAX\":14.58,\n        \"TMIN\":7.66\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-10-23\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":55.6,\n        \"TAVG\":10.48,\n        \"TMAX\":13.78,\n        \"TMIN\":6.7\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-10-24\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":11.2,\n        \"TAVG\":13.06,\n        \"TMAX\":15.56,\n        \"TMIN\":10.68\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-10-25\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":7.0,\n        \"TAVG\":12.64,\n        \"TMAX\":14.16,\n        \"TMIN\":10.68\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-10-26\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":13.8,\n        \"TAVG\":11.74,\n        \"TMAX\":14.48,\n        \"TMIN\":8.96\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-10-27\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":15.8,\n        \"TAVG\":9.34,\n        \"TMAX\":12.9,\n        \"TMIN\":5.86\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-10-28\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":14.8,\n        \"TAVG\":8.86,\n        \"TMAX\":12.1,\n        \"TMIN\":5.9\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-10-29\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":23.6,\n        \"TAVG\":8.66,\n        \"TMAX\":12.04,\n        \"TMIN\":5.14\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-10-30\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":null,\n        \"TAVG\":8.12,\n        \"TMAX\":null,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-10-31\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":1.2,\n        \"TAVG\":8.72,\n        \"TMAX\":12.66,\n        \"TMIN\":4.76\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-11-01\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":15.4,\n        \"TAVG\":10.76,\n        \"TMAX\":14.46,\n        \"TMIN\":6.72\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-11-02\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":22.0,\n        \"TAVG\":10.96,\n        \"TMAX\":13.8,\n        \"TMIN\":6.84\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-11-03\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":8.6,\n        \"TAVG\":8.04,\n        \"TMAX\":12.1,\n        \"TMIN\":4.96\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-11-04\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":9.6,\n        \"TAVG\":8.2,\n        \"TMAX\":12.92,\n        \"TMIN\":4.22\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-11-05\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":14.6,\n        \"TAVG\":7.48,\n        \"TMAX\":11.66,\n        \"TMIN\":3.52\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-11-06\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":7.4,\n        \"TAVG\":7.74,\n        \"TMAX\":11.52,\n        \"TMIN\":4.34\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-11-07\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":25.4,\n        \"TAVG\":7.38,\n        \"TMAX\":10.76,\n        \"TMIN\":3.72\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-11-08\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":5.0,\n        \"TAVG\":7.08,\n        \"TMAX\":10.46,\n        \"TMIN\":3.62\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-11-09\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":27.6,\n        \"TAVG\":7.8,\n        \"TMAX\":10.64,\n        \"TMIN\":4.8\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-11-10\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":21.0,\n        \"TAVG\":8.64,\n        \"TMAX\":11.76,\n        \"TMIN\":5.4\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-11-11\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":15.6,\n        \"TAVG\":7.66,\n        \"TMAX\":10.04,\n        \"TMIN\":4.92\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-11-12\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":8.8,\n        \"TAVG\":6.76,\n        \"TMAX\":8.96,\n        \"TMIN\":4.36\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-11-13\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":8.2,\n        \"TAVG\":7.18,\n        \"TMAX\":9.88,\n        \"TMIN\":4.28\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-11-14\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":6.0,\n        \"TAVG\":6.98,\n        \"TMAX\":10.46,\n        \"TMIN\":3.24\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-11-15\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":23.8,\n        \"TAVG\":7.58,\n        \"TMAX\":11.16,\n        \"TMIN\":4.1\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-11-16\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":46.2,\n        \"TAVG\":7.58,\n        \"TMAX\":10.64,\n        \"TMIN\":4.76\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-11-17\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":29.4,\n        \"TAVG\":6.94,\n        \"TMAX\":9.68,\n        \"TMIN\":3.9\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-11-18\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":73.8,\n        \"TAVG\":6.12,\n        \"TMAX\":9.62,\n        \"TMIN\":2.7\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-11-19\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":6.0,\n        \"TAVG\":5.44,\n        \"TMAX\":9.02,\n        \"TMIN\":1.88\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-11-20\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":12.2,\n        \"TAVG\":4.98,\n        \"TMAX\":8.44,\n        \"TMIN\":1.48\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-11-21\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":8.2,\n        \"TAVG\":6.86,\n        \"TMAX\":9.22,\n        \"TMIN\":4.02\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-11-22\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":4.4,\n        \"TAVG\":7.74,\n        \"TMAX\":10.3,\n        \"TMIN\":5.52\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-11-23\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":0.6,\n        \"TAVG\":7.96,\n        \"TMAX\":11.46,\n        \"TMIN\":4.52\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-11-24\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":37.0,\n        \"TAVG\":6.52,\n        \"TMAX\":9.36,\n        \"TMIN\":3.32\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-11-25\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":4.6,\n        \"TAVG\":5.4,\n        \"TMAX\":8.08,\n        \"TMIN\":2.34\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-11-26\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":2.2,\n        \"TAVG\":6.26,\n        \"TMAX\":8.32,\n        \"TMIN\":3.72\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-11-27\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":34.6,\n        \"TAVG\":5.8,\n        \"TMAX\":8.26,\n        \"TMIN\":3.36\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-11-28\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":27.6,\n        \"TAVG\":5.24,\n        \"TMAX\":8.08,\n        \"TMIN\":2.52\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-11-29\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":4.4,\n        \"TAVG\":3.58,\n        \"TMAX\":5.72,\n        \"TMIN\":0.56\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-11-30\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":20.0,\n        \"TAVG\":3.04,\n        \"TMAX\":6.08,\n        \"TMIN\":-0.4\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-12-01\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":21.0,\n        \"TAVG\":4.22,\n        \"TMAX\":6.2,\n        \"TMIN\":1.82\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-12-02\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":32.0,\n        \"TAVG\":5.14,\n        \"TMAX\":6.96,\n        \"TMIN\":2.14\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-12-03\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":9.8,\n        \"TAVG\":4.4,\n        \"TMAX\":6.38,\n        \"TMIN\":1.82\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-12-04\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":3.8,\n        \"TAVG\":3.52,\n        \"TMAX\":6.58,\n        \"TMIN\":-0.4\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-12-05\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":0.2,\n        \"TAVG\":3.24,\n        \"TMAX\":6.72,\n        \"TMIN\":-0.22\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-12-06\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":16.2,\n        \"TAVG\":5.32,\n        \"TMAX\":8.1,\n        \"TMIN\":2.28\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-12-07\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":35.4,\n        \"TAVG\":6.52,\n        \"TMAX\":8.7,\n        \"TMIN\":3.72\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-12-08\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":23.2,\n        \"TAVG\":5.72,\n        \"TMAX\":7.82,\n        \"TMIN\":3.2\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-12-09\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":38.0,\n        \"TAVG\":4.9,\n        \"TMAX\":7.02,\n        \"TMIN\":2.28\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-12-10\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":18.6,\n        \"TAVG\":3.92,\n        \"TMAX\":6.84,\n        \"TMIN\":1.3\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-12-11\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":56.6,\n        \"TAVG\":4.56,\n        \"TMAX\":7.4,\n        \"TMIN\":1.92\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-12-12\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":6.8,\n        \"TAVG\":4.04,\n        \"TMAX\":5.58,\n        \"TMIN\":2.0\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-12-13\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":41.8,\n        \"TAVG\":4.54,\n        \"TMAX\":6.54,\n        \"TMIN\":2.46\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-12-14\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":36.8,\n        \"TAVG\":5.28,\n        \"TMAX\":7.52,\n        \"TMIN\":2.52\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-12-15\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":27.2,\n        \"TAVG\":4.76,\n        \"TMAX\":7.04,\n        \"TMIN\":2.18\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-12-16\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":9.6,\n        \"TAVG\":4.96,\n        \"TMAX\":7.88,\n        \"TMIN\":2.14\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-12-17\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":18.0,\n        \"TAVG\":6.76,\n        \"TMAX\":8.82,\n        \"TMIN\":4.1\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-12-18\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":12.2,\n        \"TAVG\":6.4,\n        \"TMAX\":8.8,\n        \"TMIN\":4.1\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-12-19\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":1.0,\n        \"TAVG\":7.84,\n        \"TMAX\":10.24,\n        \"TMIN\":4.92\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-12-20\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":10.0,\n        \"TAVG\":7.04,\n        \"TMAX\":8.98,\n        \"TMIN\":4.22\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-12-21\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":44.4,\n        \"TAVG\":7.64,\n        \"TMAX\":10.26,\n        \"TMIN\":5.3\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-12-22\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":67.6,\n        \"TAVG\":8.98,\n        \"TMAX\":10.08,\n        \"TMIN\":7.68\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-12-23\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":56.6,\n        \"TAVG\":8.2,\n        \"TMAX\":9.76,\n        \"TMIN\":6.54\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-12-24\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":17.8,\n        \"TAVG\":6.76,\n        \"TMAX\":8.72,\n        \"TMIN\":4.38\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-12-25\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":9.0,\n        \"TAVG\":5.0,\n        \"TMAX\":7.22,\n        \"TMIN\":2.48\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-12-26\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":15.0,\n        \"TAVG\":4.2,\n        \"TMAX\":6.58,\n        \"TMIN\":1.44\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-12-27\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":16.4,\n        \"TAVG\":4.0,\n        \"TMAX\":6.56,\n        \"TMIN\":1.9\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-12-28\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":6.8,\n        \"TAVG\":1.98,\n        \"TMAX\":4.18,\n        \"TMIN\":-1.22\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-12-29\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":5.2,\n        \"TAVG\":1.56,\n        \"TMAX\":5.48,\n        \"TMIN\":-1.7\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-12-30\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":14.6,\n        \"TAVG\":4.7,\n        \"TMAX\":8.14,\n        \"TMIN\":0.72\n    },\n    {\n        \"city\":\"Aachen\",\n        \"country\":\"Germany\",\n        \"lat\":50.7762,\n        \"long\":6.0838,\n        \"population\":247380.0,\n        \"date\":\"2020-12-31\",\n        \"name\":\"MAASTRICHT\",\n        \"PRCP\":42.0,\n        \"TAVG\":4.64,\n        \"TMAX\":6.7,\n        \"TMIN\":2.46\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-01-01\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":35.5,\n        \"TAVG\":5.46,\n        \"TMAX\":7.2,\n        \"TMIN\":2.2\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-01-02\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":null,\n        \"TAVG\":3.14,\n        \"TMAX\":null,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-01-03\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":4.2,\n        \"TAVG\":2.7,\n        \"TMAX\":4.35,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-01-04\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":28.0,\n        \"TAVG\":2.98,\n        \"TMAX\":null,\n        \"TMIN\":0.2\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-01-05\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":3.6,\n        \"TAVG\":0.46,\n        \"TMAX\":null,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-01-06\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":2.6,\n        \"TAVG\":0.04,\n        \"TMAX\":3.02,\n        \"TMIN\":-8.2\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-01-07\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":null,\n        \"TAVG\":2.26,\n        \"TMAX\":3.35,\n        \"TMIN\":-1.2\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-01-08\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":26.75,\n        \"TAVG\":2.22,\n        \"TMAX\":5.57,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-01-09\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":3.75,\n        \"TAVG\":2.94,\n        \"TMAX\":null,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-01-10\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":32.25,\n        \"TAVG\":2.98,\n        \"TMAX\":5.35,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-01-11\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":33.0,\n        \"TAVG\":4.7,\n        \"TMAX\":null,\n        \"TMIN\":1.0\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-01-12\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":43.8,\n        \"TAVG\":3.64,\n        \"TMAX\":5.58,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-01-13\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":15.4,\n        \"TAVG\":2.52,\n        \"TMAX\":2.95,\n        \"TMIN\":0.3\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-01-14\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":17.8,\n        \"TAVG\":1.92,\n        \"TMAX\":null,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-01-15\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":10.2,\n        \"TAVG\":1.66,\n        \"TMAX\":2.73,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-01-16\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":21.8,\n        \"TAVG\":1.74,\n        \"TMAX\":3.3,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-01-17\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":5.0,\n        \"TAVG\":0.0,\n        \"TMAX\":2.3,\n        \"TMIN\":-3.85\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-01-18\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":null,\n        \"TAVG\":1.56,\n        \"TMAX\":null,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-01-19\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":null,\n        \"TAVG\":1.88,\n        \"TMAX\":null,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-01-20\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":1.2,\n        \"TAVG\":1.36,\n        \"TMAX\":4.8,\n        \"TMIN\":-4.43\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-01-21\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":5.0,\n        \"TAVG\":1.46,\n        \"TMAX\":2.1,\n        \"TMIN\":-1.5\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-01-22\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":null,\n        \"TAVG\":1.58,\n        \"TMAX\":2.6,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-01-23\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":8.2,\n        \"TAVG\":2.1,\n        \"TMAX\":null,\n        \"TMIN\":-1.57\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-01-24\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":15.2,\n        \"TAVG\":3.54,\n        \"TMAX\":null,\n        \"TMIN\":0.75\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-01-25\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":15.4,\n        \"TAVG\":3.56,\n        \"TMAX\":null,\n        \"TMIN\":0.78\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-01-26\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":4.8,\n        \"TAVG\":3.42,\n        \"TMAX\":6.23,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-01-27\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":12.0,\n        \"TAVG\":3.6,\n        \"TMAX\":5.27,\n        \"TMIN\":2.9\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-01-28\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":29.0,\n        \"TAVG\":3.64,\n        \"TMAX\":null,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-01-29\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":30.8,\n        \"TAVG\":3.76,\n        \"TMAX\":null,\n        \"TMIN\":1.32\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-01-30\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":12.8,\n        \"TAVG\":3.28,\n        \"TMAX\":5.8,\n        \"TMIN\":1.34\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-01-31\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":0.6,\n        \"TAVG\":3.36,\n        \"TMAX\":5.3,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-02-01\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":16.4,\n        \"TAVG\":3.72,\n        \"TMAX\":null,\n        \"TMIN\":0.43\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-02-02\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":2.0,\n        \"TAVG\":2.62,\n        \"TMAX\":null,\n        \"TMIN\":1.63\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-02-03\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":null,\n        \"TAVG\":2.04,\n        \"TMAX\":null,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-02-04\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":16.4,\n        \"TAVG\":1.74,\n        \"TMAX\":null,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-02-05\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":13.6,\n        \"TAVG\":2.18,\n        \"TMAX\":null,\n        \"TMIN\":-2.35\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-02-06\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":8.2,\n        \"TAVG\":2.58,\n        \"TMAX\":null,\n        \"TMIN\":-2.33\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-02-07\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":16.0,\n        \"TAVG\":2.9,\n        \"TMAX\":4.88,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-02-08\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":12.2,\n        \"TAVG\":2.94,\n        \"TMAX\":6.75,\n        \"TMIN\":1.37\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-02-09\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":null,\n        \"TAVG\":3.2,\n        \"TMAX\":6.62,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-02-10\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":null,\n        \"TAVG\":2.68,\n        \"TMAX\":6.05,\n        \"TMIN\":-0.57\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-02-11\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":null,\n        \"TAVG\":2.36,\n        \"TMAX\":3.77,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-02-12\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":37.6,\n        \"TAVG\":1.92,\n        \"TMAX\":3.0,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-02-13\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":4.0,\n        \"TAVG\":1.74,\n        \"TMAX\":null,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-02-14\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":0.6,\n        \"TAVG\":1.24,\n        \"TMAX\":4.2,\n        \"TMIN\":-3.7\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-02-15\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":1.6,\n        \"TAVG\":2.42,\n        \"TMAX\":5.5,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-02-16\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":29.6,\n        \"TAVG\":3.8,\n        \"TMAX\":null,\n        \"TMIN\":-2.27\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-02-17\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":40.4,\n        \"TAVG\":3.82,\n        \"TMAX\":6.23,\n        \"TMIN\":2.27\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-02-18\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":3.6,\n        \"TAVG\":3.52,\n        \"TMAX\":null,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-02-19\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":22.8,\n        \"TAVG\":4.12,\n        \"TMAX\":null,\n        \"TMIN\":1.6\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-02-20\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":13.2,\n        \"TAVG\":4.62,\n        \"TMAX\":7.0,\n        \"TMIN\":3.2\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-02-21\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":null,\n        \"TAVG\":4.58,\n        \"TMAX\":null,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-02-22\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":null,\n        \"TAVG\":3.96,\n        \"TMAX\":6.65,\n        \"TMIN\":3.25\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-02-23\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":null,\n        \"TAVG\":3.48,\n        \"TMAX\":6.46,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-02-24\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":0.0,\n        \"TAVG\":2.52,\n        \"TMAX\":4.7,\n        \"TMIN\":0.1\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-02-25\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":37.8,\n        \"TAVG\":1.68,\n        \"TMAX\":3.3,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-02-26\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":21.4,\n        \"TAVG\":2.48,\n        \"TMAX\":5.58,\n        \"TMIN\":-1.47\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-02-27\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":1.6,\n        \"TAVG\":2.0,\n        \"TMAX\":5.67,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-02-28\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":20.4,\n        \"TAVG\":1.4,\n        \"TMAX\":null,\n        \"TMIN\":-3.0\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-02-29\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":0.0,\n        \"TAVG\":1.45,\n        \"TMAX\":1.5,\n        \"TMIN\":-0.6\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-03-01\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":24.4,\n        \"TAVG\":1.26,\n        \"TMAX\":null,\n        \"TMIN\":-1.82\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-03-02\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":null,\n        \"TAVG\":2.18,\n        \"TMAX\":3.77,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-03-03\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":null,\n        \"TAVG\":3.68,\n        \"TMAX\":null,\n        \"TMIN\":0.95\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-03-04\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":31.25,\n        \"TAVG\":3.2,\n        \"TMAX\":6.53,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-03-05\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":24.4,\n        \"TAVG\":2.4,\n        \"TMAX\":4.73,\n        \"TMIN\":-0.45\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-03-06\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":54.0,\n        \"TAVG\":2.24,\n        \"TMAX\":4.53,\n        \"TMIN\":0.52\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-03-07\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":31.0,\n        \"TAVG\":2.58,\n        \"TMAX\":1.85,\n        \"TMIN\":0.98\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-03-08\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":22.75,\n        \"TAVG\":3.04,\n        \"TMAX\":6.27,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-03-09\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":12.6,\n        \"TAVG\":3.74,\n        \"TMAX\":6.38,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-03-10\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":11.5,\n        \"TAVG\":3.04,\n        \"TMAX\":4.47,\n        \"TMIN\":-1.9\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-03-11\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":9.6,\n        \"TAVG\":3.52,\n        \"TMAX\":7.12,\n        \"TMIN\":0.92\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-03-12\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":48.8,\n        \"TAVG\":3.46,\n        \"TMAX\":null,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-03-13\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":null,\n        \"TAVG\":3.42,\n        \"TMAX\":null,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-03-14\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":21.3333333333,\n        \"TAVG\":4.66,\n        \"TMAX\":null,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-03-15\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":8.2,\n        \"TAVG\":5.54,\n        \"TMAX\":7.33,\n        \"TMIN\":1.25\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-03-16\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":20.4,\n        \"TAVG\":5.26,\n        \"TMAX\":6.7,\n        \"TMIN\":4.5\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-03-17\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":6.2,\n        \"TAVG\":4.16,\n        \"TMAX\":6.4,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-03-18\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":24.0,\n        \"TAVG\":3.9,\n        \"TMAX\":7.82,\n        \"TMIN\":-2.75\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-03-19\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":null,\n        \"TAVG\":3.08,\n        \"TMAX\":null,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-03-20\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":3.6,\n        \"TAVG\":5.36,\n        \"TMAX\":9.6,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-03-21\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":13.2,\n        \"TAVG\":5.14,\n        \"TMAX\":9.43,\n        \"TMIN\":-0.8\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-03-22\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":18.2,\n        \"TAVG\":4.64,\n        \"TMAX\":8.9,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-03-23\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":0.0,\n        \"TAVG\":4.26,\n        \"TMAX\":8.42,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-03-24\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":0.6,\n        \"TAVG\":4.68,\n        \"TMAX\":9.6,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-03-25\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":12.2,\n        \"TAVG\":5.9,\n        \"TMAX\":9.57,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-03-26\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":1.0,\n        \"TAVG\":6.02,\n        \"TMAX\":11.7,\n        \"TMIN\":1.45\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-03-27\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":1.2,\n        \"TAVG\":5.56,\n        \"TMAX\":null,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-03-28\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":10.2,\n        \"TAVG\":5.94,\n        \"TMAX\":null,\n        \"TMIN\":4.95\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-03-29\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":1.6,\n        \"TAVG\":5.28,\n        \"TMAX\":9.57,\n        \"TMIN\":1.8\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-03-30\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":1.2,\n        \"TAVG\":5.02,\n        \"TMAX\":8.05,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-03-31\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":31.0,\n        \"TAVG\":5.68,\n        \"TMAX\":7.22,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-04-01\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":0.0,\n        \"TAVG\":5.78,\n        \"TMAX\":8.33,\n        \"TMIN\":-2.35\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-04-02\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":0.6,\n        \"TAVG\":6.68,\n        \"TMAX\":null,\n        \"TMIN\":1.42\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-04-03\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":3.6,\n        \"TAVG\":6.32,\n        \"TMAX\":10.3,\n        \"TMIN\":3.2\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-04-04\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":33.0,\n        \"TAVG\":8.12,\n        \"TMAX\":null,\n        \"TMIN\":3.65\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-04-05\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":19.4,\n        \"TAVG\":8.54,\n        \"TMAX\":11.9,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-04-06\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":6.6,\n        \"TAVG\":8.28,\n        \"TMAX\":12.24,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-04-07\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":7.2,\n        \"TAVG\":8.48,\n        \"TMAX\":null,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-04-08\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":5.0,\n        \"TAVG\":8.38,\n        \"TMAX\":13.2,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-04-09\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":2.2,\n        \"TAVG\":6.98,\n        \"TMAX\":10.65,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-04-10\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":0.0,\n        \"TAVG\":5.78,\n        \"TMAX\":9.42,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-04-11\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":0.0,\n        \"TAVG\":5.78,\n        \"TMAX\":null,\n        \"TMIN\":1.14\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-04-12\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":19.8,\n        \"TAVG\":7.32,\n        \"TMAX\":11.76,\n        \"TMIN\":3.63\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-04-13\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":3.6,\n        \"TAVG\":7.68,\n        \"TMAX\":12.78,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-04-14\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":0.6,\n        \"TAVG\":7.48,\n        \"TMAX\":11.06,\n        \"TMIN\":2.17\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-04-15\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":13.4,\n        \"TAVG\":7.48,\n        \"TMAX\":11.35,\n        \"TMIN\":4.05\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-04-16\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":22.8,\n        \"TAVG\":7.0,\n        \"TMAX\":10.86,\n        \"TMIN\":2.7\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-04-17\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":10.2,\n        \"TAVG\":7.26,\n        \"TMAX\":11.5,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-04-18\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":8.2,\n        \"TAVG\":8.34,\n        \"TMAX\":12.84,\n        \"TMIN\":3.35\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-04-19\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":0.0,\n        \"TAVG\":9.1,\n        \"TMAX\":15.04,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-04-20\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":0.0,\n        \"TAVG\":9.96,\n        \"TMAX\":14.32,\n        \"TMIN\":4.0\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-04-21\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":0.0,\n        \"TAVG\":9.68,\n        \"TMAX\":14.78,\n        \"TMIN\":3.13\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-04-22\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":1.0,\n        \"TAVG\":9.48,\n        \"TMAX\":14.55,\n        \"TMIN\":3.72\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-04-23\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":0.0,\n        \"TAVG\":9.66,\n        \"TMAX\":12.5,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-04-24\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":12.8,\n        \"TAVG\":8.48,\n        \"TMAX\":12.45,\n        \"TMIN\":4.2\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-04-25\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":4.2,\n        \"TAVG\":7.98,\n        \"TMAX\":12.2,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-04-26\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":9.2,\n        \"TAVG\":8.62,\n        \"TMAX\":12.84,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-04-27\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":17.0,\n        \"TAVG\":8.0,\n        \"TMAX\":11.62,\n        \"TMIN\":2.45\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-04-28\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":24.4,\n        \"TAVG\":7.76,\n        \"TMAX\":10.68,\n        \"TMIN\":5.37\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-04-29\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":40.6,\n        \"TAVG\":8.68,\n        \"TMAX\":null,\n        \"TMIN\":3.3\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-04-30\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":19.4,\n        \"TAVG\":8.82,\n        \"TMAX\":11.12,\n        \"TMIN\":5.08\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-05-01\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":81.2,\n        \"TAVG\":8.94,\n        \"TMAX\":null,\n        \"TMIN\":2.45\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-05-02\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":17.4,\n        \"TAVG\":9.98,\n        \"TMAX\":15.12,\n        \"TMIN\":5.5\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-05-03\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":6.6,\n        \"TAVG\":9.08,\n        \"TMAX\":12.77,\n        \"TMIN\":2.9\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-05-04\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":8.2,\n        \"TAVG\":8.74,\n        \"TMAX\":null,\n        \"TMIN\":3.17\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-05-05\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":0.0,\n        \"TAVG\":9.7,\n        \"TMAX\":15.58,\n        \"TMIN\":2.35\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-05-06\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":0.6,\n        \"TAVG\":10.92,\n        \"TMAX\":14.95,\n        \"TMIN\":4.04\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-05-07\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":10.2,\n        \"TAVG\":11.9,\n        \"TMAX\":16.12,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-05-08\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":0.0,\n        \"TAVG\":11.48,\n        \"TMAX\":16.42,\n        \"TMIN\":6.28\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-05-09\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":15.2,\n        \"TAVG\":12.7,\n        \"TMAX\":null,\n        \"TMIN\":7.82\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-05-10\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":4.0,\n        \"TAVG\":11.58,\n        \"TMAX\":20.27,\n        \"TMIN\":6.5\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-05-11\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":20.8,\n        \"TAVG\":10.56,\n        \"TMAX\":14.82,\n        \"TMIN\":6.83\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-05-12\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":0.0,\n        \"TAVG\":10.88,\n        \"TMAX\":null,\n        \"TMIN\":6.08\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-05-13\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":3.2,\n        \"TAVG\":11.38,\n        \"TMAX\":14.3,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-05-14\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":6.6,\n        \"TAVG\":11.86,\n        \"TMAX\":17.8,\n        \"TMIN\":5.28\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-05-15\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":0.0,\n        \"TAVG\":12.78,\n        \"TMAX\":null,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-05-16\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":19.4,\n        \"TAVG\":12.76,\n        \"TMAX\":16.7,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-05-17\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":15.2,\n        \"TAVG\":12.08,\n        \"TMAX\":15.45,\n        \"TMIN\":9.18\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-05-18\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":39.25,\n        \"TAVG\":13.4,\n        \"TMAX\":17.0,\n        \"TMIN\":5.9\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-05-19\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":1.6,\n        \"TAVG\":14.02,\n        \"TMAX\":19.0,\n        \"TMIN\":7.54\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-05-20\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":3.0,\n        \"TAVG\":13.54,\n        \"TMAX\":19.8,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-05-21\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":3.0,\n        \"TAVG\":14.3,\n        \"TMAX\":null,\n        \"TMIN\":8.45\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-05-22\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":42.6,\n        \"TAVG\":14.58,\n        \"TMAX\":null,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-05-23\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":23.5,\n        \"TAVG\":14.24,\n        \"TMAX\":19.24,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-05-24\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":null,\n        \"TAVG\":13.52,\n        \"TMAX\":null,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-05-25\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":5.6,\n        \"TAVG\":14.42,\n        \"TMAX\":null,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-05-26\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":null,\n        \"TAVG\":14.84,\n        \"TMAX\":null,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-05-27\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":2.0,\n        \"TAVG\":14.54,\n        \"TMAX\":20.7,\n        \"TMIN\":9.85\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-05-28\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":10.2,\n        \"TAVG\":14.22,\n        \"TMAX\":null,\n        \"TMIN\":10.4\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-05-29\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":0.0,\n        \"TAVG\":14.26,\n        \"TMAX\":16.47,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-05-30\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":27.0,\n        \"TAVG\":16.32,\n        \"TMAX\":null,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-05-31\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":17.25,\n        \"TAVG\":16.56,\n        \"TMAX\":22.1,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-06-01\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":1.6,\n        \"TAVG\":17.5,\n        \"TMAX\":20.62,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-06-02\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":0.0,\n        \"TAVG\":17.94,\n        \"TMAX\":22.27,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-06-03\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":4.6,\n        \"TAVG\":18.66,\n        \"TMAX\":22.68,\n        \"TMIN\":14.07\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-06-04\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":15.8,\n        \"TAVG\":16.84,\n        \"TMAX\":null,\n        \"TMIN\":10.4\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-06-05\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":33.0,\n        \"TAVG\":15.92,\n        \"TMAX\":20.58,\n        \"TMIN\":11.57\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-06-06\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":15.8,\n        \"TAVG\":17.1,\n        \"TMAX\":19.97,\n        \"TMIN\":10.85\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-06-07\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":34.0,\n        \"TAVG\":15.62,\n        \"TMAX\":20.96,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-06-08\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":16.8,\n        \"TAVG\":15.84,\n        \"TMAX\":20.52,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-06-09\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":13.2,\n        \"TAVG\":15.66,\n        \"TMAX\":null,\n        \"TMIN\":10.03\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-06-10\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":59.0,\n        \"TAVG\":15.36,\n        \"TMAX\":20.48,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-06-11\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":13.2,\n        \"TAVG\":15.9,\n        \"TMAX\":19.32,\n        \"TMIN\":11.98\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-06-12\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":7.0,\n        \"TAVG\":16.0,\n        \"TMAX\":19.92,\n        \"TMIN\":11.73\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-06-13\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":8.25,\n        \"TAVG\":15.98,\n        \"TMAX\":20.08,\n        \"TMIN\":10.93\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-06-14\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":0.0,\n        \"TAVG\":16.54,\n        \"TMAX\":21.25,\n        \"TMIN\":11.83\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-06-15\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":24.25,\n        \"TAVG\":17.28,\n        \"TMAX\":21.92,\n        \"TMIN\":11.62\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-06-16\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":0.75,\n        \"TAVG\":16.78,\n        \"TMAX\":20.88,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-06-17\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":null,\n        \"TAVG\":16.86,\n        \"TMAX\":21.02,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-06-18\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":5.75,\n        \"TAVG\":17.76,\n        \"TMAX\":21.98,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-06-19\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":2.0,\n        \"TAVG\":17.54,\n        \"TMAX\":21.96,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-06-20\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":10.75,\n        \"TAVG\":15.5,\n        \"TMAX\":null,\n        \"TMIN\":11.05\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-06-21\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":79.6666666667,\n        \"TAVG\":15.18,\n        \"TMAX\":null,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-06-22\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":12.2,\n        \"TAVG\":14.98,\n        \"TMAX\":18.6,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-06-23\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":26.8,\n        \"TAVG\":16.08,\n        \"TMAX\":19.73,\n        \"TMIN\":12.52\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-06-24\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":31.0,\n        \"TAVG\":17.88,\n        \"TMAX\":null,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-06-25\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":1.0,\n        \"TAVG\":18.28,\n        \"TMAX\":22.68,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-06-26\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":26.0,\n        \"TAVG\":18.28,\n        \"TMAX\":24.7,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-06-27\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":0.0,\n        \"TAVG\":17.86,\n        \"TMAX\":22.44,\n        \"TMIN\":12.58\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-06-28\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":1.0,\n        \"TAVG\":17.7,\n        \"TMAX\":22.82,\n        \"TMIN\":12.42\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-06-29\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":13.2,\n        \"TAVG\":16.44,\n        \"TMAX\":20.48,\n        \"TMIN\":12.15\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-06-30\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":null,\n        \"TAVG\":16.78,\n        \"TMAX\":22.88,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-07-01\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":null,\n        \"TAVG\":16.96,\n        \"TMAX\":20.3,\n        \"TMIN\":11.9\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-07-02\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":null,\n        \"TAVG\":15.38,\n        \"TMAX\":17.7,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-07-03\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":null,\n        \"TAVG\":15.06,\n        \"TMAX\":19.08,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-07-04\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":29.4,\n        \"TAVG\":15.2,\n        \"TMAX\":18.1,\n        \"TMIN\":11.05\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-07-05\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":23.0,\n        \"TAVG\":15.16,\n        \"TMAX\":19.0,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-07-06\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":30.0,\n        \"TAVG\":15.08,\n        \"TMAX\":null,\n        \"TMIN\":11.88\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-07-07\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":17.8,\n        \"TAVG\":15.68,\n        \"TMAX\":19.76,\n        \"TMIN\":12.25\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-07-08\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":12.6,\n        \"TAVG\":15.96,\n        \"TMAX\":18.9,\n        \"TMIN\":12.57\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-07-09\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":1.6,\n        \"TAVG\":16.16,\n        \"TMAX\":20.2,\n        \"TMIN\":12.43\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-07-10\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":8.2,\n        \"TAVG\":16.92,\n        \"TMAX\":20.9,\n        \"TMIN\":12.7\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-07-11\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":0.0,\n        \"TAVG\":17.44,\n        \"TMAX\":22.1,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-07-12\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":null,\n        \"TAVG\":17.32,\n        \"TMAX\":21.62,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-07-13\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":null,\n        \"TAVG\":16.04,\n        \"TMAX\":20.08,\n        \"TMIN\":12.3\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-07-14\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":null,\n        \"TAVG\":15.88,\n        \"TMAX\":20.52,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-07-15\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":55.4,\n        \"TAVG\":16.38,\n        \"TMAX\":null,\n        \"TMIN\":11.3\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-07-16\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":1.6,\n        \"TAVG\":17.02,\n        \"TMAX\":21.58,\n        \"TMIN\":12.55\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-07-17\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":2.6,\n        \"TAVG\":17.2,\n        \"TMAX\":22.57,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-07-18\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":3.0,\n        \"TAVG\":17.66,\n        \"TMAX\":21.9,\n        \"TMIN\":12.85\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-07-19\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":3.6,\n        \"TAVG\":17.16,\n        \"TMAX\":20.7,\n        \"TMIN\":14.25\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-07-20\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":25.4,\n        \"TAVG\":17.98,\n        \"TMAX\":null,\n        \"TMIN\":13.07\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-07-21\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":64.4,\n        \"TAVG\":17.84,\n        \"TMAX\":21.6,\n        \"TMIN\":14.68\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-07-22\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":15.2,\n        \"TAVG\":17.8,\n        \"TMAX\":21.45,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-07-23\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":10.6,\n        \"TAVG\":18.58,\n        \"TMAX\":22.86,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-07-24\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":68.0,\n        \"TAVG\":19.44,\n        \"TMAX\":27.8,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-07-25\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":7.2,\n        \"TAVG\":20.26,\n        \"TMAX\":null,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-07-26\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":19.8,\n        \"TAVG\":20.2,\n        \"TMAX\":26.25,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-07-27\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":9.2,\n        \"TAVG\":19.82,\n        \"TMAX\":25.52,\n        \"TMIN\":14.72\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-07-28\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":49.2,\n        \"TAVG\":19.2,\n        \"TMAX\":24.92,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-07-29\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":31.0,\n        \"TAVG\":18.44,\n        \"TMAX\":null,\n        \"TMIN\":14.5\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-07-30\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":37.0,\n        \"TAVG\":18.3,\n        \"TMAX\":null,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-07-31\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":63.6,\n        \"TAVG\":18.3,\n        \"TMAX\":23.08,\n        \"TMIN\":13.0\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-08-01\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":12.2,\n        \"TAVG\":17.68,\n        \"TMAX\":22.1,\n        \"TMIN\":12.52\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-08-02\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":10.75,\n        \"TAVG\":17.38,\n        \"TMAX\":22.24,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-08-03\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":2.0,\n        \"TAVG\":17.28,\n        \"TMAX\":22.04,\n        \"TMIN\":11.5\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-08-04\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":35.6,\n        \"TAVG\":17.5,\n        \"TMAX\":21.02,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-08-05\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":42.6,\n        \"TAVG\":17.18,\n        \"TMAX\":21.35,\n        \"TMIN\":12.73\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-08-06\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":19.8,\n        \"TAVG\":17.68,\n        \"TMAX\":21.7,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-08-07\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":5.6,\n        \"TAVG\":18.3,\n        \"TMAX\":23.73,\n        \"TMIN\":12.9\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-08-08\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":null,\n        \"TAVG\":19.08,\n        \"TMAX\":22.58,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-08-09\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":21.0,\n        \"TAVG\":18.02,\n        \"TMAX\":21.13,\n        \"TMIN\":13.5\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-08-10\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":null,\n        \"TAVG\":17.2,\n        \"TMAX\":null,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-08-11\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":null,\n        \"TAVG\":16.32,\n        \"TMAX\":19.94,\n        \"TMIN\":11.07\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-08-12\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":4.0,\n        \"TAVG\":16.42,\n        \"TMAX\":19.98,\n        \"TMIN\":10.35\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-08-13\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":35.4,\n        \"TAVG\":16.48,\n        \"TMAX\":21.87,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-08-14\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":4.2,\n        \"TAVG\":16.58,\n        \"TMAX\":19.65,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-08-15\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":9.8,\n        \"TAVG\":17.46,\n        \"TMAX\":22.37,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-08-16\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":0.0,\n        \"TAVG\":18.18,\n        \"TMAX\":23.47,\n        \"TMIN\":9.2\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-08-17\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":2.5,\n        \"TAVG\":18.14,\n        \"TMAX\":23.22,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-08-18\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":34.0,\n        \"TAVG\":17.28,\n        \"TMAX\":null,\n        \"TMIN\":13.8\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-08-19\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":null,\n        \"TAVG\":16.92,\n        \"TMAX\":null,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-08-20\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":48.8,\n        \"TAVG\":16.3,\n        \"TMAX\":19.05,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-08-21\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":21.5,\n        \"TAVG\":16.9,\n        \"TMAX\":20.8,\n        \"TMIN\":11.6\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-08-22\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":12.0,\n        \"TAVG\":17.74,\n        \"TMAX\":22.08,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-08-23\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":16.8,\n        \"TAVG\":17.04,\n        \"TMAX\":21.12,\n        \"TMIN\":13.97\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-08-24\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":30.0,\n        \"TAVG\":16.84,\n        \"TMAX\":21.26,\n        \"TMIN\":13.45\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-08-25\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":9.0,\n        \"TAVG\":17.34,\n        \"TMAX\":22.85,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-08-26\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":27.0,\n        \"TAVG\":17.42,\n        \"TMAX\":22.24,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-08-27\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":24.4,\n        \"TAVG\":16.88,\n        \"TMAX\":21.7,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-08-28\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":null,\n        \"TAVG\":16.78,\n        \"TMAX\":null,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-08-29\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":null,\n        \"TAVG\":17.08,\n        \"TMAX\":21.38,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-08-30\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":11.2,\n        \"TAVG\":15.82,\n        \"TMAX\":20.36,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-08-31\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":5.6,\n        \"TAVG\":16.26,\n        \"TMAX\":22.3,\n        \"TMIN\":11.53\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-09-01\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":0.0,\n        \"TAVG\":15.58,\n        \"TMAX\":19.47,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-09-02\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":6.0,\n        \"TAVG\":14.78,\n        \"TMAX\":19.37,\n        \"TMIN\":9.3\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-09-03\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":10.2,\n        \"TAVG\":15.18,\n        \"TMAX\":null,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-09-04\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":11.8,\n        \"TAVG\":15.5,\n        \"TMAX\":21.8,\n        \"TMIN\":11.15\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-09-05\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":36.2,\n        \"TAVG\":15.34,\n        \"TMAX\":19.64,\n        \"TMIN\":10.97\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-09-06\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":8.2,\n        \"TAVG\":15.92,\n        \"TMAX\":19.6,\n        \"TMIN\":12.5\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-09-07\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":78.2,\n        \"TAVG\":15.64,\n        \"TMAX\":null,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-09-08\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":27.0,\n        \"TAVG\":15.26,\n        \"TMAX\":null,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-09-09\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":47.4,\n        \"TAVG\":16.0,\n        \"TMAX\":19.5,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-09-10\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":42.2,\n        \"TAVG\":15.44,\n        \"TMAX\":18.66,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-09-11\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":null,\n        \"TAVG\":14.66,\n        \"TMAX\":17.15,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-09-12\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":null,\n        \"TAVG\":14.78,\n        \"TMAX\":null,\n        \"TMIN\":10.67\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-09-13\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":null,\n        \"TAVG\":14.78,\n        \"TMAX\":null,\n        \"TMIN\":12.23\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-09-14\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":22.4,\n        \"TAVG\":15.76,\n        \"TMAX\":20.06,\n        \"TMIN\":11.85\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-09-15\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":41.2,\n        \"TAVG\":15.6,\n        \"TMAX\":22.25,\n        \"TMIN\":12.85\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-09-16\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":3.75,\n        \"TAVG\":14.36,\n        \"TMAX\":18.03,\n        \"TMIN\":11.35\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-09-17\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":9.6,\n        \"TAVG\":13.34,\n        \"TMAX\":16.58,\n        \"TMIN\":null\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-09-18\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":0.0,\n        \"TAVG\":13.56,\n        \"TMAX\":19.73,\n        \"TMIN\":8.75\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-09-19\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":2.6,\n        \"TAVG\":14.18,\n        \"TMAX\":16.5,\n        \"TMIN\":7.5\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-09-20\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":3.25,\n        \"TAVG\":13.66,\n        \"TMAX\":17.98,\n        \"TMIN\":9.26\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-09-21\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":14.2,\n        \"TAVG\":13.94,\n        \"TMAX\":18.15,\n        \"TMIN\":10.55\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-09-22\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":16.8,\n        \"TAVG\":13.08,\n        \"TMAX\":null,\n        \"TMIN\":9.32\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-09-23\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":17.2,\n        \"TAVG\":13.7,\n        \"TMAX\":15.67,\n        \"TMIN\":10.85\n    },\n    {\n        \"city\":\"Aalborg\",\n        \"country\":\"Denmark\",\n        \"lat\":57.0337,\n        \"long\":9.9166,\n        \"population\":122219.0,\n        \"date\":\"2020-09-24\",\n        \"name\":\"FLYVESTATION AALBORG\",\n        \"PRCP\":3.6,\n        \"TAVG\":13.46,\n        \"TMAX\":16.8,\n        \"TMIN\":9.0\n    }\n]"
\ No newline at end of file
+"""
+Backward-compatible access to the sample weather data.
+
+SAMPLE_DATA used to be a 333 KB JSON string literal compiled on import. The
+data now lives in sample_weather_data.parquet (see sample_data.py); the
+string is only built when SAMPLE_DATA is first accessed. New code should use
+sample_data.load_sample_data or sample_records, which can filter by date and
+city without materializing the whole sample.
+"""
+
+from .sample_data import load_sample_data, sample_json, sample_records  # noqa: F401
+
+
+def __getattr__(name):
+    if name == 'SAMPLE_DATA':
+        return sample_json()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")